@@ -0,0 +1,196 @@
+# ai_cache.py — FRAGMENTIA: NPC CEVAP ÖNBELLEĞİ + PROMPT ŞABLONU
+# =============================================================================
+# generate_npc_response her mesajda tüm rol yapma promptunu yeniden kuruyor
+# ve aynı soruya aynı NPC'den tekrar tekrar API cevabı bekliyordu.
+#
+#   • NPCPromptTemplate — NPC başına statik önek (isim, kişilik, rol, kurallar)
+#     bir kez hesaplanır; her mesajda sadece geçmiş + oyuncu satırı eklenir.
+#   • ResponseCache — LRU + TTL. Anahtar normalize edilmiş
+#     (npc adı, kişilik, geçmiş penceresi, oyuncu metni) tuple'ıdır; büyük/küçük
+#     harf, noktalama ve boşluk farkları aynı anahtara düşer.
+#     Oturumlar arası ai_cache.json'da saklanır (atomik yazım).
+#
+# MİMARİ KURALLARI:
+#   • Önbellek sadece oyun thread'inden kullanılır (poll_ai teslimi dahil).
+#   • Hata / zaman aşımı cevapları önbelleğe GİRMEZ.
+# =============================================================================
+
+from __future__ import annotations
+import atexit
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Optional, Sequence
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+AI_CACHE_FILE     = "ai_cache.json"
+AI_CACHE_CAPACITY = 512
+AI_CACHE_TTL      = 24 * 60 * 60    # sn
+NPC_HISTORY_WINDOW = 5              # prompta giren son mesaj sayısı
+
+_KEY_SEP   = "\x1f"
+_PUNCT_RE  = re.compile(r"[^\w\s]", re.UNICODE)
+_SPACE_RE  = re.compile(r"\s+")
+_TR_LOWER  = str.maketrans("Iİ", "ıi")
+
+
+def normalize_text(text: str) -> str:
+    """Türkçe küçük harf, noktalama yok, tek boşluk."""
+    text = text.translate(_TR_LOWER).lower()
+    text = _PUNCT_RE.sub(" ", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def npc_cache_key(npc, user_text: str, history: Sequence[dict]) -> str:
+    window = history[-NPC_HISTORY_WINDOW:]
+    hist = "|".join(f"{m['speaker']}:{normalize_text(m['text'])}" for m in window)
+    return _KEY_SEP.join((npc.name, npc.personality_type, hist, normalize_text(user_text)))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. PROMPT ŞABLONU
+# ─────────────────────────────────────────────────────────────────────────────
+
+class NPCPromptTemplate:
+    """NPC'ye özel sistem promptu; statik kısım kurulurken bir kez üretilir."""
+
+    def __init__(self, npc):
+        self.source = (npc.name, npc.personality_type, npc.prompt)
+        self.prefix = f"""
+        Rol Yapma Oyunu Modu:
+        Senin Adın: {npc.name}
+        Kişilik Tipin: {npc.personality_type}
+        Görevin/Rolün: "{npc.prompt}"
+
+        Bulunduğun Evren: Fragmentia (Siberpunk, distopik bir dijital dünya).
+
+        Kural: Oyuncu ile konuşuyorsun. Rolünün dışına ASLA çıkma.
+        Kısa, öz ve karakterine uygun cevaplar ver (Maksimum 2-3 cümle).
+
+        Şu ana kadar konuşulanlar:
+        """
+        self.suffix = f"""
+
+        {npc.name} olarak cevabın:
+        """
+
+    def matches(self, npc) -> bool:
+        return self.source == (npc.name, npc.personality_type, npc.prompt)
+
+    def render(self, user_text: str, history: Sequence[dict]) -> str:
+        history_text = "".join(f"{m['speaker']}: {m['text']}\n"
+                               for m in history[-NPC_HISTORY_WINDOW:])
+        return (f"{self.prefix}{history_text}\n"
+                f"        Oyuncu son olarak dedi ki: \"{user_text}\"{self.suffix}")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. LRU + TTL ÖNBELLEK
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ResponseCache:
+    """
+    Kullanım (StoryManager):
+        key = npc_cache_key(npc, text, history)
+        hit = response_cache.get(key)
+        ...
+        response_cache.put(key, reply)
+    """
+
+    def __init__(self, path: Optional[str] = AI_CACHE_FILE,
+                 capacity: int = AI_CACHE_CAPACITY, ttl: float = AI_CACHE_TTL):
+        self.path = path
+        self.capacity = capacity
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()   # key → (zaman, metin)
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        if path:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        stamp, text = entry
+        if time.time() - stamp > self.ttl:
+            del self._entries[key]
+            self._dirty = True
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return text
+
+    def put(self, key: str, text: str):
+        self._entries[key] = (time.time(), text)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def clear(self):
+        self._entries.clear()
+        self._dirty = True
+
+    # ── Disk ───────────────────────────────────────────────
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                rows = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"AI önbelleği okunamadı, sıfırdan başlıyor: {e}")
+            return
+        if not isinstance(rows, list):
+            print("AI önbelleği beklenen biçimde değil, sıfırdan başlıyor.")
+            return
+        now = time.time()
+        skipped = 0
+        for row in rows:
+            # Bozuk / elle düzenlenmiş satır → atla (tüm önbelleği kaybetme)
+            if (not isinstance(row, list) or len(row) != 3
+                    or not isinstance(row[0], str) or not isinstance(row[2], str)
+                    or not isinstance(row[1], (int, float)) or isinstance(row[1], bool)):
+                skipped += 1
+                continue
+            key, stamp, text = row
+            if now - stamp <= self.ttl:
+                self._entries[key] = (stamp, text)
+        if skipped:
+            print(f"AI önbelleği: {skipped} bozuk kayıt atlandı.")
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def save(self):
+        """Değişiklik varsa ai_cache.json'u atomik olarak yeniler."""
+        if not self.path or not self._dirty:
+            return
+        rows = [[k, stamp, text] for k, (stamp, text) in self._entries.items()]
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(rows, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except IOError as e:
+            print(f"AI önbelleği yazılamadı: {e}")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 4. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+response_cache = ResponseCache()
+atexit.register(response_cache.save)
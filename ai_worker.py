@@ -0,0 +1,283 @@
+# ai_worker.py — FRAGMENTIA: ARKA PLAN AI İSTEK İŞÇİSİ
+# =============================================================================
+# StoryManager'ın Gemini çağrıları (NPC generate_content, Vasi chat
+# send_message) ağ gidiş-dönüşü boyunca oyun döngüsünü donduruyordu.
+#
+# Bu modül istekleri sınırlı bir kuyruğa alır ve arka plan thread'lerinde
+# çalıştırır. Oyun döngüsü her frame poll() ile biten istekleri toplar.
+#
+# MİMARİ KURALLARI:
+#   • Backend takılabilir: generate(prompt) / chat(prompt) → str.
+#       GeminiBackend — gerçek API (model + chat oturumu)
+#       StubBackend   — ağsız, deterministik (test / benchmark)
+#   • Kuyruk dolu ya da anahtarın (NPC adı) eşzamanlı istek sınırı dolmuşsa
+#     submit() None döner — oyun asla bloklanmaz.
+#   • Zaman aşımı poll()'da uygulanır: süresi dolan istek hata ile döner,
+#     geç gelen cevap atılır. cancel(key) bekleyenleri iptal eder.
+#   • KIND_CHAT anahtar başına sıralıdır: zaman aşımına uğrayan/iptal edilen
+#     sohbet isteği, thread'deki send_message dönene kadar in_flight'ta
+#     sayılmaya devam eder. Geç gelen cevap oturum geçmişinden geri alınır
+#     (backend.discard_chat_turn) — oyuncunun görmediği tur geçmişe girmez.
+#     Anahtar ancak geri alma bittikten sonra serbest kalır.
+#   • shutdown() bekleyenleri iptal eder ve thread'leri sonlandırır
+#     (backend değişiminde eski işçi sızmaz).
+#   • Sonuçlar SADECE poll() ile, oyun thread'inde teslim edilir.
+# =============================================================================
+
+from __future__ import annotations
+import abc
+import queue
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+AI_QUEUE_SIZE      = 8       # bekleyen en fazla istek
+AI_WORKER_THREADS  = 2       # takılan bir çağrı diğerlerini durdurmasın
+AI_PER_KEY_LIMIT   = 1       # NPC başına aynı anda en fazla istek
+AI_REQUEST_TIMEOUT = 20.0    # sn
+
+KIND_GENERATE = "generate"   # tek seferlik içerik (NPC)
+KIND_CHAT     = "chat"       # oturumlu sohbet (Vasi)
+
+STATUS_PENDING   = "pending"
+STATUS_DONE      = "done"
+STATUS_ERROR     = "error"
+STATUS_TIMEOUT   = "timeout"
+STATUS_CANCELLED = "cancelled"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. BACKEND'LER
+# ─────────────────────────────────────────────────────────────────────────────
+
+class AIBackend(abc.ABC):
+    """Backend arayüzü. Alt sınıflar generate() sağlar; chat() isteğe bağlı."""
+    name = "base"
+
+    @abc.abstractmethod
+    def generate(self, prompt: str) -> str:
+        ...
+
+    def chat(self, prompt: str) -> str:
+        return self.generate(prompt)
+
+    def discard_chat_turn(self):
+        """Teslim edilmeyen (geç gelen) son sohbet turunu geçmişten siler."""
+
+
+class GeminiBackend(AIBackend):
+    """google.generativeai modeli + Vasi chat oturumu."""
+    name = "gemini"
+
+    def __init__(self, model, chat_session=None):
+        self.model = model
+        self.chat_session = chat_session
+
+    def generate(self, prompt: str) -> str:
+        return self.model.generate_content(prompt).text
+
+    def chat(self, prompt: str) -> str:
+        if self.chat_session is None:
+            return self.generate(prompt)
+        return self.chat_session.send_message(prompt).text
+
+    def discard_chat_turn(self):
+        if self.chat_session is not None:
+            self.chat_session.rewind()
+
+
+class StubBackend(AIBackend):
+    """
+    Ağsız, deterministik backend. Aynı prompt → aynı cevap.
+    latency: yapay gecikme (sn) — gecikme yolunu ölçmek için.
+    """
+    name = "stub"
+
+    REPLIES = (
+        "Veri akışı bulanık... ama seni duyuyorum.",
+        "Bu şehirde her soru bir bedel ister.",
+        "Sistem seni izliyor. Dikkatli ol.",
+        "Hakikat, parçaların arasında saklı.",
+        "Cevabım kısa: henüz değil.",
+    )
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = float(latency)
+        self.calls = 0
+
+    def generate(self, prompt: str) -> str:
+        self.calls += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return self.REPLIES[zlib.crc32(prompt.encode("utf-8")) % len(self.REPLIES)]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. İSTEK + İŞÇİ
+# ─────────────────────────────────────────────────────────────────────────────
+
+class AIRequest:
+    __slots__ = ("key", "kind", "prompt", "tag", "status", "result", "error",
+                 "submitted_at", "deadline", "finished_at", "running")
+
+    def __init__(self, key: str, kind: str, prompt: str, timeout: float, tag=None):
+        self.key    = key
+        self.kind   = kind
+        self.prompt = prompt
+        self.tag    = tag              # çağıranın ek verisi (ör. önbellek anahtarı)
+        self.status = STATUS_PENDING
+        self.result: Optional[str] = None
+        self.error:  Optional[str] = None
+        self.submitted_at = time.monotonic()
+        self.deadline     = self.submitted_at + timeout
+        self.finished_at  = 0.0
+        self.running      = False      # thread backend çağrısında mı
+
+    @property
+    def latency(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.submitted_at
+
+
+class AIRequestWorker:
+    """
+    Kullanım (StoryManager):
+        req = worker.submit(npc.name, KIND_GENERATE, prompt)
+        ...
+        for req in worker.poll():            # her frame, oyun thread'i
+            if req.status == STATUS_DONE: ...
+    """
+
+    def __init__(self, backend: AIBackend, queue_size: int = AI_QUEUE_SIZE,
+                 threads: int = AI_WORKER_THREADS, per_key_limit: int = AI_PER_KEY_LIMIT,
+                 timeout: float = AI_REQUEST_TIMEOUT):
+        self.backend = backend
+        self.per_key_limit = per_key_limit
+        self.timeout = timeout
+
+        self._queue: "queue.Queue[AIRequest]" = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._in_flight: List[AIRequest] = []      # gönderilmiş, teslim edilmemiş
+        self._finished: List[AIRequest] = []       # thread'lerden gelen sonuçlar
+        self._stop = threading.Event()
+
+        self._threads = []
+        for i in range(max(1, threads)):
+            t = threading.Thread(target=self._run, name=f"AIWorker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    # ── Oyun thread'i API'si ───────────────────────────────
+    def submit(self, key: str, kind: str, prompt: str, tag=None) -> Optional[AIRequest]:
+        with self._lock:
+            if self.in_flight(key) >= self.per_key_limit:
+                return None
+            req = AIRequest(key, kind, prompt, self.timeout, tag)
+            try:
+                self._queue.put_nowait(req)
+            except queue.Full:
+                return None
+            self._in_flight.append(req)
+        return req
+
+    def cancel(self, key: Optional[str] = None) -> int:
+        """key'in (None → hepsinin) bekleyen isteklerini iptal eder."""
+        n = 0
+        with self._lock:
+            for req in self._in_flight:
+                if req.status == STATUS_PENDING and (key is None or req.key == key):
+                    req.status = STATUS_CANCELLED
+                    n += 1
+            self._in_flight = [r for r in self._in_flight if self._holds_slot(r)]
+        return n
+
+    def shutdown(self):
+        """Tüm istekleri iptal eder, kuyruğu boşaltır ve thread'leri durdurur."""
+        self.cancel()
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)   # backend'de bekleyen thread dönünce _stop'u görür
+            except queue.Full:
+                break
+
+    @staticmethod
+    def _holds_slot(req: AIRequest) -> bool:
+        """Bekleyen istek ya da hâlâ çalışan sohbet turu anahtarın yerini tutar."""
+        return req.status == STATUS_PENDING or (req.kind == KIND_CHAT and req.running)
+
+    def in_flight(self, key: Optional[str] = None) -> int:
+        if key is None:
+            return len(self._in_flight)
+        return sum(1 for r in self._in_flight if r.key == key)
+
+    def poll(self) -> List[AIRequest]:
+        """Biten / zaman aşımına uğrayan istekleri döndürür (her frame çağrılır)."""
+        with self._lock:
+            if not self._in_flight and not self._finished:
+                return []
+            now = time.monotonic()
+            out = [r for r in self._finished if r.status != STATUS_CANCELLED]
+            self._finished.clear()
+            for req in self._in_flight:
+                if req.status == STATUS_PENDING and now > req.deadline:
+                    req.status = STATUS_TIMEOUT
+                    req.error = "zaman aşımı"
+                    req.finished_at = now
+                    out.append(req)
+            self._in_flight = [r for r in self._in_flight if self._holds_slot(r)]
+        return out
+
+    # ── Arka plan thread'leri ──────────────────────────────
+    def _run(self):
+        while not self._stop.is_set():
+            req = self._queue.get()
+            if req is None or self._stop.is_set():
+                return
+            with self._lock:
+                if req.status != STATUS_PENDING:
+                    continue                  # kuyrukta beklerken iptal/zaman aşımı
+                req.running = True
+            try:
+                if req.kind == KIND_CHAT:
+                    text, err = self.backend.chat(req.prompt), None
+                else:
+                    text, err = self.backend.generate(req.prompt), None
+            except Exception as e:
+                text, err = None, str(e)
+            with self._lock:
+                # Geç kalan sohbet turu geri alınana kadar anahtarın yerini
+                # tutar (running, in_flight): sıradaki tur rewind ile yarışmaz
+                rewind = (req.status != STATUS_PENDING
+                          and req.kind == KIND_CHAT and err is None)
+                if not rewind:
+                    req.running = False
+                    if req.status != STATUS_PENDING:
+                        # Geç kaldı / arada iptal edildi → at
+                        if req in self._in_flight:
+                            self._in_flight.remove(req)
+                    else:
+                        req.finished_at = time.monotonic()
+                        req.result = text
+                        req.error  = err
+                        req.status = STATUS_DONE if err is None else STATUS_ERROR
+                        self._finished.append(req)
+            if rewind:
+                try:
+                    self.backend.discard_chat_turn()
+                except Exception as e:
+                    print(f"[ai_worker] geç sohbet turu geri alınamadı: {e}")
+                with self._lock:
+                    req.running = False
+                    if req in self._in_flight:
+                        self._in_flight.remove(req)
@@ -705,12 +705,10 @@ class TrailEffect:
                 'alpha': random.randint(120, 200)
             })
 
-    def update(self, camera_speed, dt=None):
+    def update(self, dt=None):
         if dt is None:
-            self.x -= camera_speed * 0.016
             self.life -= 1
         else:
-            self.x -= camera_speed * dt
             self.life -= dt * 12.0
 
         self.alpha = int(255 * clamp(self.life / max(1, self.max_life), 0.0, 1.0))
@@ -720,14 +718,15 @@ class TrailEffect:
         for s in self.sparkles:
             s['angle'] += s['speed'] * 0.02
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
         # [PLACEHOLDER] Tek sönümleyen nokta — Pixel artist burayı sprite trail ile değiştirir
         if self.life <= 0:
             return
+        ox, oy = camera_offset
         life_ratio = clamp(self.life / max(1, self.max_life), 0.0, 1.0)
         alpha = int(180 * life_ratio)
         size  = int(max(1, self.size))
-        pygame.draw.circle(surface, (*self.color, alpha), (int(self.x), int(self.y)), size)
+        pygame.draw.circle(surface, (*self.color, alpha), (int(self.x) + ox, int(self.y) + oy), size)
 
 # ---------- GLOBAL ANIMATION MANAGER ----------
 class AnimationManager:
@@ -737,13 +736,13 @@ class AnimationManager:
         self.particles = []
         self.screen_shake = ScreenShakeLite()
 
-    def update(self, dt, player_state, is_grounded, velocity_y, is_dashing, is_slamming, camera_speed):
+    def update(self, dt, player_state, is_grounded, velocity_y, is_dashing, is_slamming):
         # Update character animator
         self.character_animator.update(dt, player_state, is_grounded, velocity_y, is_dashing, is_slamming)
 
         # Update trails
         for trail in self.trails[:]:
-            trail.update(camera_speed, dt)
+            trail.update(dt)
             if trail.life <= 0:
                 self.trails.remove(trail)
 
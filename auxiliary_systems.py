@@ -69,8 +69,7 @@ class WarpLine(pygame.sprite.Sprite):
         self.alpha = 255
 
     def update(self, *args):
-        camera_speed = args[0] if args else 0
-        self.x -= camera_speed
+        # Dünya uzayı — kamera kayması çizimde (camera_offset) uygulanır
         self.x += self.vx * 0.8
         self.y += self.vy * 0.8
         self.life -= 1
@@ -78,11 +77,13 @@ class WarpLine(pygame.sprite.Sprite):
         if self.life <= 0:
             self.kill()
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
         # [PLACEHOLDER] WarpLine — tek renkli çizgi
         if self.alpha > 10:
+            ox, oy = camera_offset
+            x, y = self.x + ox, self.y + oy
             draw_color = self.theme_color if self.theme_color else self.color
-            end_x = self.x - (self.vx * self.length_multiplier * 1.5)
-            end_y = self.y - (self.vy * self.length_multiplier * 1.5)
+            end_x = x - (self.vx * self.length_multiplier * 1.5)
+            end_y = y - (self.vy * self.length_multiplier * 1.5)
             pygame.draw.line(surface, (*draw_color, self.alpha),
-                             (int(self.x), int(self.y)), (int(end_x), int(end_y)), self.width)
\ No newline at end of file
+                             (int(x), int(y)), (int(end_x), int(end_y)), self.width)
\ No newline at end of file
@@ -0,0 +1,539 @@
+# bench.py — FRAGMENTIA: HEADLESS DETERMİNİSTİK BENCHMARK
+# =============================================================================
+# Seçili bölümleri pencere açmadan (SDL dummy video/ses sürücüsü) sabit
+# zaman adımı, sabit random tohumu ve senaryolu girdi ile oynatır.
+# Entity / VFX / UI değişikliklerinin maliyetini tekrar edilebilir biçimde
+# karşılaştırmak içindir.
+#
+# KULLANIM:
+#   python bench.py                          # varsayılan senaryolar
+#   python bench.py --levels 1 3 --frames 900
+#   python bench.py --out bench_results.json # sonuçları JSON'a yaz
+#   python bench.py --profile                # profiler kovalarını da dök
+#   python bench.py --present                # sadece sunum (scale+blit) ölçümü
+#   python bench.py --ai                     # AI işçisi gecikme yolu (stub backend)
+#
+# ÖLÇÜMLER (bölüm başına):
+#   • fps         : işlenen frame / duvar saati (vsync / tick beklemesi yok)
+#   • frame_ms    : frame süresi ortalama / p95 / max
+#   • surfaces/f  : frame başına pygame.Surface(...) kurucu çağrısı (yüzey
+#                   ayırma churn'ü; transform / font.render çıktıları sayılmaz)
+#   • live_blocks : frame başına NET canlı Python bloğu değişimi
+#                   (sys.getallocatedblocks farkı — yalnızca sızıntı / birikim
+#                   göstergesi; frame içinde ayrılıp bırakılan nesneler 0'a
+#                   netleşir, pygame yüzeylerini hiç görmez → churn ÖLÇMEZ)
+#   • peak_rss_mb : bölüm kendi alt sürecinde koştuğu için o bölümün tepe RSS'i
+#
+# MİMARİ KURALLARI:
+#   • Her bölüm AYRI alt süreçte koşar (RSS ve global durum izolasyonu).
+#   • pygame.time.get_ticks ve main.clock sabit adımlı saate bağlanır;
+#     dt her frame tam 1/60 sn olur.
+#   • Girdi tamamen senaryodan gelir (klavye + fare); gerçek cihaz okunmaz.
+#   • Alt süreç kayıt olarak bench_save.json fixture'ının geçici bir
+#     kopyasını kullanır (FRAGMENTIA_SAVE_FILE): geliştiricinin
+#     save_data.json'u değişmez, karma vb. önceki koşulara bağlı olmaz.
+#   • Bölüm god_mode ile koşar (can / stamina dolu, düşünce platforma
+#     ışınlanır). Oyun PLAYING'den çıkarsa (GAME_OVER, NPC_CHAT...) koşu o
+#     frame'de kesilir ve sonuç GEÇERSİZ işaretlenir; koordinatör sıfırdan
+#     farklı çıkış koduyla döner.
+# =============================================================================
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Görüntü / ses aygıtı olmadan çalış — pygame import edilmeden ÖNCE.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+BENCH_FPS        = 60
+BENCH_FRAMES     = 600     # bölüm başına (~10 sn oyun süresi)
+BENCH_SEED       = 1337
+RESULT_PREFIX    = "BENCH_RESULT "
+BENCH_SAVE       = "bench_save.json"   # sabit kayıt fixture'ı (karma 0)
+
+# Varsayılan bölüm id'leri — her tipten bir tane. Sonuç tablosundaki TİP
+# elle yazılmaz: main.py'nin okuduğu game_config.EASY_MODE_LEVELS'ten gelir
+# (settings.EASY_MODE_LEVELS eski bir kopyadır; 10 / 15 tipleri farklıdır).
+BENCH_LEVELS = [
+    0,      # intro_boss
+    1,      # normal
+    3,      # beat_arena
+    16,     # manor_stealth
+    15,     # scrolling_boss
+    10,     # boss_fight
+    999,    # debug_arena
+]
+
+# --present: (etiket, pencere boyutu, tam ekran low_res) — 4K ve 640×360
+PRESENT_TARGETS = [
+    ("4k_window",        (3840, 2160), None),
+    ("640x360_window",   (640, 360),   None),
+    ("1080p_fs_640x360", (1920, 1080), (640, 360)),
+    ("1080p_native",     (1920, 1080), None),
+]
+
+# Senaryo: CYCLE frame'lik döngü içinde (başlangıç, bitiş, tuş) basılı tut
+INPUT_CYCLE = 240
+INPUT_HOLDS = [
+    (0,   240, "K_d"),        # sürekli sağa koş
+    (30,  34,  "K_w"),        # zıpla
+    (90,  94,  "K_w"),
+    (150, 154, "K_SPACE"),    # dash
+    (200, 204, "K_s"),        # havadaysa slam
+]
+INPUT_TAPS = [                # (frame, tuş) — tek KEYDOWN/KEYUP
+    (20,  "K_j"), (40, "K_j"), (60, "K_k"),
+    (120, "K_j"), (140, "K_k"), (220, "K_j"),
+]
+MOUSE_HOLDS = [(100, 170)]    # sol tık basılı (ateş)
+AIM_POINT   = (1400, 600)     # mantıksal koordinat
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. SABİT ADIMLI SAAT + SENARYOLU GİRDİ
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SurfaceCounter:
+    """pygame.Surface kurucu çağrılarını sayar (install() main import'undan önce)."""
+
+    created = 0
+
+    @classmethod
+    def install(cls, pygame_mod):
+        base = pygame_mod.Surface
+
+        class CountingSurface(base):
+            def __init__(self, *args, **kwargs):
+                cls.created += 1
+                super().__init__(*args, **kwargs)
+
+        CountingSurface.__name__ = CountingSurface.__qualname__ = "Surface"
+        pygame_mod.Surface = CountingSurface
+
+
+class FixedStepClock:
+    """pygame.time.Clock yerine: tick() zamanı tam 1/fps ilerletir, beklemez."""
+
+    def __init__(self, fps: int = BENCH_FPS):
+        self.step_ms   = 1000.0 / fps
+        self.now_ms    = 0.0
+        self.frame     = 0
+        self.frame_times: list = []
+        self.block_deltas: list = []
+        self.surface_counts: list = []
+        self._t0       = time.perf_counter()
+        self._blocks0  = sys.getallocatedblocks()
+        self._surf0    = SurfaceCounter.created
+
+    def get_ticks(self) -> int:
+        return int(self.now_ms)
+
+    def tick(self, framerate: int = 0) -> int:
+        t1 = time.perf_counter()
+        blocks = sys.getallocatedblocks()
+        surfs  = SurfaceCounter.created
+        self.frame_times.append((t1 - self._t0) * 1000.0)
+        self.block_deltas.append(blocks - self._blocks0)
+        self.surface_counts.append(surfs - self._surf0)
+        self._t0, self._blocks0, self._surf0 = t1, blocks, surfs
+        self.now_ms += self.step_ms
+        self.frame  += 1
+        return int(self.step_ms)
+
+    def get_fps(self) -> float:
+        return 1000.0 / self.step_ms
+
+    def get_time(self) -> int:
+        return int(self.step_ms)
+
+
+class ScriptedKeys:
+    """pygame.key.get_pressed() dönüşü gibi indekslenebilir tuş durumu."""
+
+    def __init__(self, held: set):
+        self._held = held
+
+    def __getitem__(self, key) -> bool:
+        return key in self._held
+
+    def __len__(self) -> int:
+        return 512
+
+
+class ScriptedInput:
+    """Frame numarasına göre event / tuş / fare durumu üretir."""
+
+    def __init__(self, pygame_mod, clock: FixedStepClock, total_frames: int):
+        self.pg     = pygame_mod
+        self.clock  = clock
+        self.total  = total_frames
+        self.holds  = [(a, b, getattr(pygame_mod, k)) for a, b, k in INPUT_HOLDS]
+        self.taps   = [(f, getattr(pygame_mod, k)) for f, k in INPUT_TAPS]
+        self._held: set = set()
+        self._mouse_down = False
+        self._real_pump = pygame_mod.event.pump
+        self.game = None
+        self.left_playing = None          # (frame, state) — PLAYING'den ilk çıkış
+
+    def watch(self, game):
+        """Oyun modülü; get_events her frame GAME_STATE'i denetler."""
+        self.game = game
+
+    def _key_event(self, etype, key):
+        return self.pg.event.Event(etype, key=key, mod=0, unicode="", scancode=0)
+
+    def _mouse_event(self, etype):
+        return self.pg.event.Event(etype, button=1, pos=self.mouse_pos())
+
+    def get_events(self, *args, **kwargs) -> list:
+        self._real_pump()
+        pg     = self.pg
+        frame  = self.clock.frame
+        if frame >= self.total:
+            return [pg.event.Event(pg.QUIT)]
+        if self.game is not None and self.game.GAME_STATE != "PLAYING":
+            if self.left_playing is None:
+                self.left_playing = (frame, self.game.GAME_STATE)
+            return [pg.event.Event(pg.QUIT)]
+        phase  = frame % INPUT_CYCLE
+        events = []
+
+        held_now = {key for a, b, key in self.holds if a <= phase < b}
+        for key in held_now - self._held:
+            events.append(self._key_event(pg.KEYDOWN, key))
+        for key in self._held - held_now:
+            events.append(self._key_event(pg.KEYUP, key))
+        self._held = held_now
+
+        for f, key in self.taps:
+            if f == phase:
+                events.append(self._key_event(pg.KEYDOWN, key))
+                events.append(self._key_event(pg.KEYUP, key))
+
+        mouse_now = any(a <= phase < b for a, b in MOUSE_HOLDS)
+        if mouse_now and not self._mouse_down:
+            events.append(self._mouse_event(pg.MOUSEBUTTONDOWN))
+        elif self._mouse_down and not mouse_now:
+            events.append(self._mouse_event(pg.MOUSEBUTTONUP))
+        self._mouse_down = mouse_now
+        return events
+
+    def get_pressed(self, *args, **kwargs) -> ScriptedKeys:
+        return ScriptedKeys(self._held)
+
+    def mouse_pressed(self, *args, **kwargs) -> tuple:
+        return (self._mouse_down, False, False)
+
+    def mouse_pos(self) -> tuple:
+        from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT
+        sw, sh = self.pg.display.get_surface().get_size()
+        return (int(AIM_POINT[0] * sw / LOGICAL_WIDTH),
+                int(AIM_POINT[1] * sh / LOGICAL_HEIGHT))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. TEK BÖLÜM (alt süreç)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _percentile(vals, pct):
+    if not vals:
+        return 0.0
+    s = sorted(vals)
+    return s[min(len(s) - 1, int(round((len(s) - 1) * pct / 100.0)))]
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: bayt
+    return rss / (1024.0 * 1024.0) if sys.platform == "darwin" else rss / 1024.0
+
+
+def _use_fixture_save():
+    """Kaydı fixture'ın geçici kopyasına yönlendirir (main import'undan önce)."""
+    import atexit
+    import shutil
+    import tempfile
+    tmp_dir = tempfile.mkdtemp(prefix="fragmentia_bench_")
+    save_path = os.path.join(tmp_dir, "save_data.json")
+    shutil.copyfile(os.path.join(os.path.dirname(os.path.abspath(__file__)), BENCH_SAVE),
+                    save_path)
+    os.environ["FRAGMENTIA_SAVE_FILE"] = save_path
+    # atexit LIFO: SaveManager.close() son yazımı yaptıktan sonra silinir
+    atexit.register(shutil.rmtree, tmp_dir, True)
+
+
+def run_level(level_idx: int, frames: int, seed: int, profile: bool = False) -> dict:
+    _use_fixture_save()
+    import random
+    import numpy as np
+    random.seed(seed)
+    np.random.seed(seed)
+
+    import pygame
+    SurfaceCounter.install(pygame)
+    import main as game
+
+    clock  = FixedStepClock(BENCH_FPS)
+    script = ScriptedInput(pygame, clock, frames)
+    script.watch(game)
+
+    # Zaman + girdi kaynağını senaryoya bağla
+    pygame.time.get_ticks   = clock.get_ticks
+    pygame.event.get        = script.get_events
+    pygame.key.get_pressed  = script.get_pressed
+    pygame.mouse.get_pressed = script.mouse_pressed
+    pygame.mouse.get_pos    = script.mouse_pos
+    game.clock              = clock
+
+    if profile:
+        from profiler import profiler
+        profiler.toggle()
+
+    # Yükleme maliyeti ölçüme girmesin
+    random.seed(seed)
+    np.random.seed(seed)
+    wall0 = time.perf_counter()
+    game.run_game_loop(start_level=level_idx, god_mode=True)
+    wall = time.perf_counter() - wall0
+
+    if profile:
+        from profiler import profiler
+        profiler.dump()
+
+    # İlk frame init_game() maliyetini içerir — istatistikten çıkar.
+    # PLAYING'den çıkıldıysa o frame ve sonrası (çıkış ekranı) da dışarıda.
+    left = script.left_playing
+    end = left[0] if left else clock.frame
+    ft = clock.frame_times[1:end] or clock.frame_times[:end]
+    bd = clock.block_deltas[1:end] or clock.block_deltas[:end]
+    sc = clock.surface_counts[1:end] or clock.surface_counts[:end]
+    measured_wall = sum(ft) / 1000.0
+    return {
+        "level":        level_idx,
+        "type":         game.EASY_MODE_LEVELS.get(level_idx, {}).get("type", "?"),
+        "frames":       len(ft),
+        "frames_requested": frames,
+        "valid":        left is None,
+        "left_playing": {"frame": left[0], "state": left[1]} if left else None,
+        "wall_s":       round(wall, 3),
+        "fps":          round(len(ft) / measured_wall, 1) if measured_wall > 0 else 0.0,
+        "frame_ms_mean": round(sum(ft) / len(ft), 3) if ft else 0.0,
+        "frame_ms_p95": round(_percentile(ft, 95), 3),
+        "frame_ms_max": round(max(ft), 3) if ft else 0.0,
+        "surfaces_per_frame": round(sum(sc) / len(sc), 2) if sc else 0.0,
+        "surfaces_p95": _percentile(sc, 95),
+        "live_blocks_delta_per_frame": round(sum(bd) / len(bd), 1) if bd else 0.0,
+        "peak_rss_mb":  round(_peak_rss_mb() or 0.0, 1),
+        "final_state":  game.GAME_STATE,
+        "score":        int(game.score),      # determinizm kontrolü için
+    }
+
+
+def _legacy_present(pygame, screen, canvas, low_res):
+    """present_pipeline öncesi main.py sunum adımı (karşılaştırma için)."""
+    if low_res is not None and low_res != canvas.get_size():
+        small = pygame.transform.scale(canvas, low_res)
+        image = pygame.transform.scale(small, screen.get_size())
+    else:
+        image = pygame.transform.scale(canvas, screen.get_size())
+    screen.blit(image, (0, 0))
+
+
+def run_present(frames: int, seed: int) -> list:
+    """Sunum adımını eski yöntem / present_pipeline / integer_scale ile ölçer."""
+    import random
+    import pygame
+    from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT
+    from present_pipeline import PresentPipeline
+
+    pygame.display.init()
+    rng = random.Random(seed)
+    results = []
+    for label, window, low_res in PRESENT_TARGETS:
+        screen = pygame.display.set_mode(window)
+        canvas = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+        for _ in range(200):
+            canvas.fill((rng.randrange(256), rng.randrange(256), rng.randrange(256)),
+                        (rng.randrange(LOGICAL_WIDTH), rng.randrange(LOGICAL_HEIGHT), 120, 80))
+
+        pipe = PresentPipeline()
+        pipe.prepare(canvas, low_res)
+        modes = [("legacy",  lambda: _legacy_present(pygame, screen, canvas, low_res)),
+                 ("pipeline", lambda: pipe.present(screen, canvas, low_res)),
+                 ("integer",  lambda: pipe.present(screen, canvas, low_res))]
+        row = {"target": label, "window": list(window)}
+        for mode, fn in modes:
+            pipe.integer_scale = (mode == "integer")
+            fn()                                    # ısınma
+            blocks0 = sys.getallocatedblocks()
+            t0 = time.perf_counter()
+            for _ in range(frames):
+                fn()
+            row[mode + "_ms"] = round((time.perf_counter() - t0) * 1000.0 / frames, 3)
+            row[mode + "_blocks"] = round((sys.getallocatedblocks() - blocks0) / frames, 2)
+        results.append(row)
+    return results
+
+
+def _print_present_table(results: list):
+    hdr = (f"{'HEDEF':<18} {'PENCERE':>11} {'ESKİ ms':>9} {'YENİ ms':>9} "
+           f"{'TAMSAYI ms':>11} {'HIZLANMA':>9}")
+    print(hdr)
+    print("-" * len(hdr))
+    for r in results:
+        speedup = r["legacy_ms"] / r["pipeline_ms"] if r["pipeline_ms"] > 0 else 0.0
+        print(f"{r['target']:<18} {r['window'][0]:>5}x{r['window'][1]:<5} "
+              f"{r['legacy_ms']:>9.3f} {r['pipeline_ms']:>9.3f} {r['integer_ms']:>11.3f} "
+              f"{speedup:>8.2f}x")
+
+
+AI_STUB_LATENCY = 0.25    # sn — simüle ağ gidiş-dönüşü
+AI_MESSAGES     = 12
+
+
+def run_ai(messages: int = AI_MESSAGES, latency: float = AI_STUB_LATENCY) -> dict:
+    """
+    Stub backend ile NPC mesaj akışını 60 FPS'lik sahte döngüde oynatır.
+    Oyun thread'inde geçen süre (submit + poll) ile uçtan uca gecikmeyi ayırır.
+    """
+    from ai_worker import AIRequestWorker, StubBackend, KIND_GENERATE
+
+    worker = AIRequestWorker(StubBackend(latency))
+    frame_dt = 1.0 / BENCH_FPS
+    game_ms, latencies = [], []
+    sent = received = dropped = 0
+    while received + dropped < messages:
+        t0 = time.perf_counter()
+        if sent < messages and worker.in_flight("NPC") == 0:
+            if worker.submit("NPC", KIND_GENERATE, f"mesaj {sent}") is None:
+                dropped += 1
+            sent += 1
+        for req in worker.poll():
+            received += 1
+            latencies.append(req.latency * 1000.0)
+        game_ms.append((time.perf_counter() - t0) * 1000.0)
+        time.sleep(frame_dt)
+    return {
+        "messages":        messages,
+        "stub_latency_ms": latency * 1000.0,
+        "game_thread_ms_max": round(max(game_ms), 3),
+        "game_thread_ms_p95": round(_percentile(game_ms, 95), 3),
+        "reply_latency_ms_mean": round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+        "reply_latency_ms_p95": round(_percentile(latencies, 95), 1),
+        "dropped":         dropped,
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 4. KOORDİNATÖR
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _run_child(level_idx: int, args) -> dict:
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", str(level_idx),
+           "--frames", str(args.frames), "--seed", str(args.seed)]
+    if args.profile:
+        cmd.append("--profile")
+    proc = subprocess.run(cmd, capture_output=True, text=True,
+                          cwd=os.path.dirname(os.path.abspath(__file__)))
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    tail = (proc.stderr or proc.stdout).strip().splitlines()[-5:]
+    return {"level": level_idx, "error": " | ".join(tail) or f"exit {proc.returncode}"}
+
+
+def _print_table(results: list):
+    hdr = (f"{'BÖLÜM':>6} {'TİP':<15} {'FRAME':>6} {'FPS':>8} {'ORT ms':>8} "
+           f"{'P95 ms':>8} {'MAX ms':>8} {'YÜZEY/F':>8} {'NETBLOK':>8} {'RSS MB':>8}")
+    print(hdr)
+    print("-" * len(hdr))
+    for r in results:
+        if "error" in r:
+            print(f"{r['level']:>6} HATA: {r['error']}")
+            continue
+        print(f"{r['level']:>6} {r['type']:<15} {r['frames']:>6} {r['fps']:>8.1f} "
+              f"{r['frame_ms_mean']:>8.2f} {r['frame_ms_p95']:>8.2f} {r['frame_ms_max']:>8.2f} "
+              f"{r['surfaces_per_frame']:>8.2f} {r['live_blocks_delta_per_frame']:>8.1f} "
+              f"{r['peak_rss_mb']:>8.1f}")
+        if not r.get("valid", True):
+            lp = r["left_playing"]
+            print(f"{'':>6} GEÇERSİZ: frame {lp['frame']}'de {lp['state']} durumuna geçti "
+                  f"({r['frames']}/{r['frames_requested']} frame ölçüldü)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fragmentia headless benchmark")
+    parser.add_argument("--levels", type=int, nargs="*",
+                        help="Bölüm id listesi (varsayılan: BENCH_LEVELS)")
+    parser.add_argument("--frames", type=int, default=BENCH_FRAMES)
+    parser.add_argument("--seed", type=int, default=BENCH_SEED)
+    parser.add_argument("--out", type=str, default=None, help="Sonuç JSON dosyası")
+    parser.add_argument("--profile", action="store_true",
+                        help="profiler kovalarını profiles/ altına dök")
+    parser.add_argument("--present", action="store_true",
+                        help="sadece sunum adımını (scale+blit) 4K / 640x360 hedeflerinde ölç")
+    parser.add_argument("--ai", action="store_true",
+                        help="AI işçisinin gecikme yolunu stub backend ile ölç")
+    parser.add_argument("--child", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.ai:
+        result = run_ai()
+        for key, val in result.items():
+            print(f"{key:<24} {val}")
+        return
+
+    if args.present:
+        frames = min(args.frames, 300)
+        print(f"[BENCH] Sunum ölçümü ({frames} frame / hedef)...", flush=True)
+        results = run_present(frames, args.seed)
+        print()
+        _print_present_table(results)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump({"frames": frames, "present": results}, f, indent=4, ensure_ascii=False)
+            print(f"\n[BENCH] Sonuçlar yazıldı: {args.out}")
+        return
+
+    if args.child is not None:
+        result = run_level(args.child, args.frames, args.seed, args.profile)
+        sys.stdout.flush()
+        print(RESULT_PREFIX + json.dumps(result), flush=True)
+        return
+
+    levels  = args.levels if args.levels else BENCH_LEVELS
+    results = []
+    for lvl in levels:
+        print(f"[BENCH] Bölüm {lvl} koşuyor ({args.frames} frame, seed={args.seed})...", flush=True)
+        results.append(_run_child(lvl, args))
+    print()
+    _print_table(results)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"frames": args.frames, "seed": args.seed, "results": results},
+                      f, indent=4, ensure_ascii=False)
+        print(f"\n[BENCH] Sonuçlar yazıldı: {args.out}")
+
+    bad = [r["level"] for r in results if "error" in r or not r.get("valid", True)]
+    if bad:
+        print(f"\n[BENCH] GEÇERSİZ / HATALI bölümler: {bad}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
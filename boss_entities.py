@@ -2,11 +2,14 @@ import pygame
 import random
 import math
 from settings import LOGICAL_HEIGHT, LOGICAL_WIDTH
+from glow_atlas import glow_atlas
+from text_cache import get_font
+from viewport import world_camera
 
 # Boss Sabitleri
 BULLET_SPEED = 8
 BOSS_HEALTH = 1000
-BOSS_DAMAGE = 10
+BOSS_DAMAGE = 30   # mermi isabeti başına oyuncu hasarı
 BOSS_FIRE_RATE = 60
 BOSS_INVULNERABILITY_TIME = 30
 
@@ -52,17 +55,9 @@ def _draw_zigzag_line(surface, color, x1, y1, x2, y2, amplitude, segments, width
 def _draw_glow_circle(surface, color, cx, cy, radius, layers=3):
     """
     İç içe geçen şeffaf halkalarla glow etkisi.
-    Surface tahsisatı draw() çağrısına bırakılmıştır; pool'da değil.
+    Katmanlar glow_atlas'ta bir kez birleştirilir; burada tek blit.
     """
-    for i in range(layers, 0, -1):
-        alpha = int(60 * (i / layers))
-        r = radius + (layers - i) * 6
-        try:
-            s = pygame.Surface((r * 2 + 2, r * 2 + 2), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*color, alpha), (r + 1, r + 1), r)
-            surface.blit(s, (cx - r - 1, cy - r - 1))
-        except Exception:
-            pass
+    glow_atlas.blit(surface, color, cx, cy, radius, 60, layers=layers, spread=6)
 
 
 def _draw_energy_core(surface, color, cx, cy, radius, pulse, width=2):
@@ -105,9 +100,7 @@ class BossSpike(pygame.sprite.Sprite):
         self._pulse = 0.0
 
     # ── MANTIK (değişmedi) ────────────────────────────────────
-    def update(self, camera_speed):
-        self.rect.x -= camera_speed
-        self.x      -= camera_speed
+    def update(self):
         self._pulse += 0.25
         self.timer  += 1
 
@@ -121,7 +114,8 @@ class BossSpike(pygame.sprite.Sprite):
                 self.kill()
 
     # ── ÇİZİM (güçlendirildi) ────────────────────────────────
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
+        rect     = self.rect.move(camera_offset)
         col_main = (0, 255, 255) if self.karma < 0 else (200, 0, 255)
         col_core = (200, 255, 255) if self.karma < 0 else (255, 180, 255)
         col_dark = (0, 30, 40)    if self.karma < 0 else (20, 0, 40)
@@ -130,11 +124,11 @@ class BossSpike(pygame.sprite.Sprite):
             # Flaş ritmi
             if (self.timer // 3) % 2 == 0:
                 # Zemin uyarı çizgisi — kalın + titreyen
-                line_y = self.rect.bottom - 3
+                line_y = rect.bottom - 3
                 pygame.draw.rect(surface, col_main,
-                                 (self.rect.x, line_y - 4, self.width, 6))
+                                 (rect.x, line_y - 4, self.width, 6))
                 pygame.draw.rect(surface, col_core,
-                                 (self.rect.x, line_y - 1, self.width, 2))
+                                 (rect.x, line_y - 1, self.width, 2))
 
                 # Kazık silueti (yarı-saydam)
                 tip_count = max(1, self.width // 28)
@@ -148,7 +142,7 @@ class BossSpike(pygame.sprite.Sprite):
                                (tx, 8)]
                         pygame.draw.polygon(ghost, (*col_main, 45), pts)
                         pygame.draw.polygon(ghost, (*col_main, 120), pts, 1)
-                    surface.blit(ghost, (self.rect.x, self.rect.y))
+                    surface.blit(ghost, (rect.x, rect.y))
                 except Exception:
                     pass
 
@@ -158,13 +152,13 @@ class BossSpike(pygame.sprite.Sprite):
             tip_w     = self.width // tip_count
             tip_h     = int(self.height * progress)
 
-            base_y = self.rect.bottom
+            base_y = rect.bottom
 
             for i in range(tip_count):
-                tx = self.rect.x + i * tip_w + tip_w // 2
+                tx = rect.x + i * tip_w + tip_w // 2
 
                 # Gölge gövde
-                body_rect = pygame.Rect(self.rect.x + i * tip_w + 2,
+                body_rect = pygame.Rect(rect.x + i * tip_w + 2,
                                         base_y - tip_h, tip_w - 4, tip_h)
                 pygame.draw.rect(surface, col_dark, body_rect)
 
@@ -182,14 +176,14 @@ class BossSpike(pygame.sprite.Sprite):
                                  (tx, base_y - tip_h - int(18 * progress)), 2)
 
             # Dış kenar (tüm genişlik)
-            border = pygame.Rect(self.rect.x, base_y - tip_h,
+            border = pygame.Rect(rect.x, base_y - tip_h,
                                  self.width, tip_h)
             pygame.draw.rect(surface, col_main, border, 2)
 
             # Taban nabzı
             pulse_w = int(4 + 2 * math.sin(self._pulse * 2))
             pygame.draw.rect(surface, col_core,
-                             (self.rect.x, base_y - 4, self.width, pulse_w))
+                             (rect.x, base_y - 4, self.width, pulse_w))
 
 
 class BossLightning(pygame.sprite.Sprite):
@@ -211,9 +205,7 @@ class BossLightning(pygame.sprite.Sprite):
         self._pulse = 0.0
 
     # ── MANTIK (değişmedi) ────────────────────────────────────
-    def update(self, camera_speed):
-        self.x      -= camera_speed
-        self.rect.x -= camera_speed
+    def update(self):
         self.timer  += 1
         self._pulse += 0.3
 
@@ -227,7 +219,8 @@ class BossLightning(pygame.sprite.Sprite):
                 self.kill()
 
     # ── ÇİZİM (güçlendirildi) ────────────────────────────────
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
+        x        = int(self.x) + camera_offset[0]   # tam ekran sütunu: yalnızca yatay
         warn_col = (0, 255, 255) if self.karma < 0 else (200, 0, 255)
         core_col = (220, 255, 255) if self.karma < 0 else (255, 220, 255)
 
@@ -237,35 +230,35 @@ class BossLightning(pygame.sprite.Sprite):
                 try:
                     band = pygame.Surface((self.width + 20, LOGICAL_HEIGHT), pygame.SRCALPHA)
                     band.fill((*warn_col, 18))
-                    surface.blit(band, (int(self.x) - self.width // 2 - 10, 0))
+                    surface.blit(band, (x - self.width // 2 - 10, 0))
                 except Exception:
                     pass
 
                 # İnce önizleme yıldırım
                 _draw_zigzag_line(surface, (*warn_col, 100),
-                                  self.x, 0, self.x, LOGICAL_HEIGHT,
+                                  x, 0, x, LOGICAL_HEIGHT,
                                   amplitude=12, segments=14, width=1)
 
                 # Uyarı ! işareti
                 warn_radius = int(18 + 3 * math.sin(self._pulse))
                 pygame.draw.circle(surface, warn_col,
-                                   (int(self.x), 45), warn_radius, 2)
+                                   (x, 45), warn_radius, 2)
                 try:
-                    font = pygame.font.Font(None, 32)
+                    font = get_font(32)
                     txt  = font.render("!", True, warn_col)
-                    surface.blit(txt, (int(self.x) - 5, 32))
+                    surface.blit(txt, (x - 5, 32))
                 except Exception:
                     pass
 
                 # Altta hedef elipsi
-                target_rect = pygame.Rect(int(self.x) - 20,
+                target_rect = pygame.Rect(x - 20,
                                           LOGICAL_HEIGHT - 55, 40, 18)
                 pygame.draw.ellipse(surface, warn_col, target_rect, 2)
                 # Nabız halkaları
                 for r in range(3):
                     er = 22 + r * 10 + int(5 * math.sin(self._pulse + r))
                     pygame.draw.ellipse(surface, warn_col,
-                                        pygame.Rect(int(self.x) - er // 2,
+                                        pygame.Rect(x - er // 2,
                                                     LOGICAL_HEIGHT - 10 - er // 4,
                                                     er, er // 2), 1)
 
@@ -275,7 +268,7 @@ class BossLightning(pygame.sprite.Sprite):
                 glow_w = 40
                 glow = pygame.Surface((glow_w * 2, LOGICAL_HEIGHT), pygame.SRCALPHA)
                 glow.fill((*warn_col, 35))
-                surface.blit(glow, (int(self.x) - glow_w, 0))
+                surface.blit(glow, (x - glow_w, 0))
             except Exception:
                 pass
 
@@ -286,15 +279,15 @@ class BossLightning(pygame.sprite.Sprite):
                 ( 6, 12, 1, (255, 255, 255)),
             ]):
                 _draw_zigzag_line(surface, alpha_col,
-                                  self.x, 0, self.x, LOGICAL_HEIGHT,
+                                  x, 0, x, LOGICAL_HEIGHT,
                                   amplitude=amp, segments=segs, width=lw)
 
             # Zemin çarpma efekti
             impact_r = int(18 + 6 * math.sin(self._pulse * 4))
             pygame.draw.circle(surface, warn_col,
-                                (int(self.x), LOGICAL_HEIGHT - 4), impact_r, 2)
+                                (x, LOGICAL_HEIGHT - 4), impact_r, 2)
             pygame.draw.circle(surface, (255, 255, 255),
-                                (int(self.x), LOGICAL_HEIGHT - 4), impact_r // 2)
+                                (x, LOGICAL_HEIGHT - 4), impact_r // 2)
 
 
 class BossGiantArrow(pygame.sprite.Sprite):
@@ -316,9 +309,7 @@ class BossGiantArrow(pygame.sprite.Sprite):
         self._pulse = 0.0
 
     # ── MANTIK (değişmedi) ────────────────────────────────────
-    def update(self, camera_speed):
-        self.x      -= camera_speed
-        self.rect.x -= camera_speed
+    def update(self):
         self.timer  += 1
         self._pulse += 0.18
 
@@ -332,10 +323,11 @@ class BossGiantArrow(pygame.sprite.Sprite):
                 self.kill()
 
     # ── ÇİZİM (güçlendirildi) ────────────────────────────────
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
+        rect     = self.rect.move(camera_offset)
         col      = (255, 40,  40)  if self.karma < 0 else (160, 0, 255)
         col_core = (255, 200, 200) if self.karma < 0 else (220, 180, 255)
-        cx       = self.rect.x + self.width // 2
+        cx       = rect.x + self.width // 2
 
         if self.state == 'WARNING':
             if (self.timer // 8) % 2 == 0:
@@ -344,23 +336,23 @@ class BossGiantArrow(pygame.sprite.Sprite):
                     s = pygame.Surface((self.width, LOGICAL_HEIGHT), pygame.SRCALPHA)
                     alpha = int(30 + 20 * math.sin(self._pulse))
                     s.fill((*col, alpha))
-                    surface.blit(s, (self.rect.x, 0))
+                    surface.blit(s, (rect.x, 0))
                 except Exception:
                     pass
 
                 # Altta yoğunlaşan enerji çubuğu
                 bar_h = int(18 + 4 * math.sin(self._pulse * 2))
                 pygame.draw.rect(surface, col,
-                                 (self.rect.x, LOGICAL_HEIGHT - bar_h,
+                                 (rect.x, LOGICAL_HEIGHT - bar_h,
                                   self.width, bar_h))
                 pygame.draw.rect(surface, col_core,
-                                 (self.rect.x + 4, LOGICAL_HEIGHT - bar_h + 3,
+                                 (rect.x + 4, LOGICAL_HEIGHT - bar_h + 3,
                                   self.width - 8, bar_h - 6))
 
                 # Yükselen ince çizgiler (şarj hissi)
                 stripe_count = 5
                 for i in range(stripe_count):
-                    sx = self.rect.x + (i + 1) * (self.width // (stripe_count + 1))
+                    sx = rect.x + (i + 1) * (self.width // (stripe_count + 1))
                     line_h = int(LOGICAL_HEIGHT * 0.3 * ((self.timer / self.warning_duration)))
                     alpha_stripe = int(80 + 60 * math.sin(self._pulse + i))
                     try:
@@ -380,17 +372,17 @@ class BossGiantArrow(pygame.sprite.Sprite):
                 glow_extra = 20
                 gs = pygame.Surface((self.width + glow_extra * 2, h), pygame.SRCALPHA)
                 gs.fill((*col, 25))
-                surface.blit(gs, (self.rect.x - glow_extra, top_y))
+                surface.blit(gs, (rect.x - glow_extra, top_y))
             except Exception:
                 pass
 
             # Koyu dolgu gövde
             pygame.draw.rect(surface, (10, 5, 15),
-                             (self.rect.x, top_y, self.width, h))
+                             (rect.x, top_y, self.width, h))
 
             # Dış kenar
             pygame.draw.rect(surface, col,
-                             (self.rect.x, top_y, self.width, h), 3)
+                             (rect.x, top_y, self.width, h), 3)
 
             # İç parlak hat (orta sütun)
             core_w = max(6, int(self.width * 0.15 * (1 + 0.2 * math.sin(self._pulse * 3))))
@@ -405,7 +397,7 @@ class BossGiantArrow(pygame.sprite.Sprite):
                 try:
                     bs = pygame.Surface((self.width - 6, 2), pygame.SRCALPHA)
                     bs.fill((*col, 80))
-                    surface.blit(bs, (self.rect.x + 3, by))
+                    surface.blit(bs, (rect.x + 3, by))
                 except Exception:
                     pass
 
@@ -438,8 +430,7 @@ class BossOrbitalStrike(pygame.sprite.Sprite):
         self._orbit_angle = 0.0
 
     # ── MANTIK (değişmedi) ────────────────────────────────────
-    def update(self, camera_speed):
-        self.x     -= camera_speed
+    def update(self):
         self.timer += 1
         self._pulse       += 0.2
         self._orbit_angle += 0.08
@@ -458,10 +449,11 @@ class BossOrbitalStrike(pygame.sprite.Sprite):
                 self.kill()
 
     # ── ÇİZİM (güçlendirildi) ────────────────────────────────
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
+        ox, oy   = camera_offset
         col      = (0, 220, 220) if self.karma < 0 else (220, 0, 220)
         col_core = (200, 255, 255) if self.karma < 0 else (255, 200, 255)
-        cx, cy   = int(self.x), int(self.y)
+        cx, cy   = int(self.x) + ox, int(self.y) + oy
 
         if self.state == 'CHARGING':
             charge_pct = min(1.0, self.timer / 60.0)
@@ -484,9 +476,9 @@ class BossOrbitalStrike(pygame.sprite.Sprite):
             orbit_r = int(self.radius) + 12
             for i in range(3):
                 a = self._orbit_angle + i * (math.pi * 2 / 3)
-                ox = cx + int(orbit_r * math.cos(a))
-                oy = cy + int(orbit_r * math.sin(a))
-                pygame.draw.circle(surface, col_core, (ox, oy), 3)
+                px = cx + int(orbit_r * math.cos(a))
+                py = cy + int(orbit_r * math.sin(a))
+                pygame.draw.circle(surface, col_core, (px, py), 3)
 
             # Merkez çekirdek
             core_r = max(3, int(self.radius * 0.4))
@@ -540,7 +532,7 @@ class BossOrbitalStrike(pygame.sprite.Sprite):
 
             # Her ışın (merkez → zemin)
             for bx in self.beams:
-                ibx = int(bx)
+                ibx = int(bx) + ox
 
                 # Glow gövde
                 try:
@@ -593,8 +585,7 @@ class NexusBoss(pygame.sprite.Sprite):
         self._pulse        = 0.0
         self._spin         = 0.0
 
-    def update(self, camera_speed, dt, player_pos):
-        self.x          -= camera_speed
+    def update(self, dt, player_pos):
         self.fire_timer += 1
         self._pulse     += 0.07
         self._spin      += 0.04
@@ -621,10 +612,11 @@ class NexusBoss(pygame.sprite.Sprite):
         global BOSS_FIRE_RATE
         BOSS_FIRE_RATE = max(20, BOSS_FIRE_RATE - 20)
 
-    def draw(self, surface, theme):
+    def draw(self, surface, theme=None, camera_offset=(0, 0)):
         col  = (255, 80, 80) if self.invulnerable_timer > 0 else (0, 220, 255)
         col2 = (255, 255, 255) if self.invulnerable_timer > 0 else (180, 255, 255)
-        cx, cy = int(self.x), int(self.y)
+        ox, oy = camera_offset
+        cx, cy = int(self.x) + ox, int(self.y) + oy
         bw = 80
 
         # Dış glow halkalar
@@ -660,14 +652,14 @@ class NexusBoss(pygame.sprite.Sprite):
         if self.phase == 2:
             for i in range(4):
                 a = self._spin * 1.5 + i * (math.pi / 2)
-                ox = cx + int(35 * math.cos(a))
-                oy = cy + int(35 * math.sin(a))
-                pygame.draw.circle(surface, col, (ox, oy), 4)
-                pygame.draw.circle(surface, col2, (ox, oy), 2)
+                px = cx + int(35 * math.cos(a))
+                py = cy + int(35 * math.sin(a))
+                pygame.draw.circle(surface, col, (px, py), 4)
+                pygame.draw.circle(surface, col2, (px, py), 2)
 
         # İsim etiketi
         try:
-            font = pygame.font.Font(None, 20)
+            font = get_font(20)
             lbl  = font.render("NEXUS", True, col)
             surface.blit(lbl, (cx - lbl.get_width() // 2, cy - bw // 2 - 18))
         except Exception:
@@ -710,8 +702,7 @@ class AresBoss(pygame.sprite.Sprite):
         self._pulse        = 0.0
         self._rage_flicker = 0
 
-    def update(self, camera_speed, dt, player_pos):
-        self.x          -= camera_speed
+    def update(self, dt, player_pos):
         self.fire_timer += 1
         self._pulse     += 0.06
         if self.invulnerable_timer > 0:
@@ -745,11 +736,12 @@ class AresBoss(pygame.sprite.Sprite):
         global BOSS_FIRE_RATE
         BOSS_FIRE_RATE = max(15, BOSS_FIRE_RATE - 25)
 
-    def draw(self, surface, theme):
+    def draw(self, surface, theme=None, camera_offset=(0, 0)):
         is_hit = self.invulnerable_timer > 0
         col    = (255, 80, 80) if is_hit else (255, 215, 0)
         col2   = (255, 255, 200) if not is_hit else (255, 180, 180)
-        cx, cy = int(self.x), int(self.y)
+        ox, oy = camera_offset
+        cx, cy = int(self.x) + ox, int(self.y) + oy
         bw, bh = 100, 100
 
         # Dış ateş halkası (glow)
@@ -799,7 +791,7 @@ class AresBoss(pygame.sprite.Sprite):
 
         # İsim
         try:
-            font = pygame.font.Font(None, 22)
+            font = get_font(22)
             lbl  = font.render("ARES", True, col)
             surface.blit(lbl, (cx - lbl.get_width() // 2, cy - bh // 2 - 20))
         except Exception:
@@ -840,8 +832,7 @@ class VasilBoss(pygame.sprite.Sprite):
         self._pulse        = 0.0
         self._wave         = 0.0
 
-    def update(self, camera_speed, dt, player_pos):
-        self.x          -= camera_speed
+    def update(self, dt, player_pos):
         self.fire_timer += 1
         self._pulse     += 0.05
         self._wave      += 0.12
@@ -868,11 +859,12 @@ class VasilBoss(pygame.sprite.Sprite):
         global BOSS_FIRE_RATE
         BOSS_FIRE_RATE = max(10, BOSS_FIRE_RATE - 30)
 
-    def draw(self, surface, theme):
+    def draw(self, surface, theme=None, camera_offset=(0, 0)):
         is_hit = self.invulnerable_timer > 0
         col    = (255, 80, 80) if is_hit else (180, 0, 220)
         col2   = (255, 200, 255) if not is_hit else (255, 180, 180)
-        cx, cy = int(self.x), int(self.y)
+        ox, oy = camera_offset
+        cx, cy = int(self.x) + ox, int(self.y) + oy
         bw, bh = 100, 110
 
         # Dalgalanma efekti (mor enerji halkası)
@@ -898,9 +890,9 @@ class VasilBoss(pygame.sprite.Sprite):
         orbit_pts = []
         for i in range(12):
             a = self._wave + i * (math.pi * 2 / 12)
-            ox = cx + int((bw // 2 - 5) * math.cos(a))
-            oy = cy + int((bh // 2 - 5) * math.sin(a))
-            orbit_pts.append((ox, oy))
+            px = cx + int((bw // 2 - 5) * math.cos(a))
+            py = cy + int((bh // 2 - 5) * math.sin(a))
+            orbit_pts.append((px, py))
         if len(orbit_pts) >= 2:
             pygame.draw.lines(surface, (*col2, 80) if False else col2,
                               True, orbit_pts, 1)
@@ -908,10 +900,10 @@ class VasilBoss(pygame.sprite.Sprite):
         # Yörüngede parlayan enerji noktaları (3 adet)
         for i in range(3):
             a = self._wave * 1.3 + i * (math.pi * 2 / 3)
-            ox = cx + int((bw // 2) * math.cos(a))
-            oy = cy + int((bh // 2) * math.sin(a))
-            pygame.draw.circle(surface, col2, (ox, oy), 4)
-            pygame.draw.circle(surface, col,  (ox, oy), 6, 1)
+            px = cx + int((bw // 2) * math.cos(a))
+            py = cy + int((bh // 2) * math.sin(a))
+            pygame.draw.circle(surface, col2, (px, py), 4)
+            pygame.draw.circle(surface, col,  (px, py), 6, 1)
 
         # Nabız çekirdek
         _draw_energy_core(surface, col, cx, cy, radius=15, pulse=self._pulse)
@@ -920,13 +912,13 @@ class VasilBoss(pygame.sprite.Sprite):
         if self.phase == 2:
             for i in range(4):
                 a = -self._wave * 0.8 + i * (math.pi / 2)
-                ox = cx + int(25 * math.cos(a))
-                oy = cy + int(25 * math.sin(a))
-                pygame.draw.circle(surface, col, (ox, oy), 3)
+                px = cx + int(25 * math.cos(a))
+                py = cy + int(25 * math.sin(a))
+                pygame.draw.circle(surface, col, (px, py), 3)
 
         # İsim
         try:
-            font = pygame.font.Font(None, 22)
+            font = get_font(22)
             lbl  = font.render("VASİL", True, col)
             surface.blit(lbl, (cx - lbl.get_width() // 2, cy - bh // 2 - 20))
         except Exception:
@@ -970,10 +962,9 @@ class EnemyBullet(pygame.sprite.Sprite):
         self._spin  = random.uniform(0, math.pi * 2)
         self._trail = []   # (x, y) geçmiş konumları — max 5 kayıt
 
-    def update(self, camera_speed, dt, player_pos=None):
+    def update(self, dt, player_pos=None):
         self.x     += self.vx
         self.y     += self.vy
-        self.x     -= camera_speed
         self._spin += 0.18
 
         # Trail güncelle — max 5 nokta (FIFO, listte)
@@ -981,12 +972,13 @@ class EnemyBullet(pygame.sprite.Sprite):
         if len(self._trail) > 5:
             self._trail.pop(0)
 
-        if (self.x < -100 or self.x > LOGICAL_WIDTH + 100 or
+        if (self.x < world_camera.left - 100 or self.x > world_camera.right + 100 or
                 self.y < -100 or self.y > LOGICAL_HEIGHT + 100):
             self.kill()
 
-    def draw(self, surface, theme):
-        cx, cy = int(self.x), int(self.y)
+    def draw(self, surface, theme=None, camera_offset=(0, 0)):
+        ox, oy = camera_offset
+        cx, cy = int(self.x) + ox, int(self.y) + oy
         col    = self.color
         bright = (min(255, col[0] + 80),
                   min(255, col[1] + 80),
@@ -1001,7 +993,7 @@ class EnemyBullet(pygame.sprite.Sprite):
                 ts = pygame.Surface((r * 2 + 2, r * 2 + 2), pygame.SRCALPHA)
                 pygame.draw.circle(ts, (*col, int(60 * frac)),
                                    (r + 1, r + 1), r)
-                surface.blit(ts, (int(tx) - r - 1, int(ty) - r - 1))
+                surface.blit(ts, (int(tx) + ox - r - 1, int(ty) + oy - r - 1))
             except Exception:
                 pass
 
@@ -1045,7 +1037,7 @@ class VasilCompanion(pygame.sprite.Sprite):
         self.eye_color = (255, 0, 0)
         self._pulse    = 0.0
 
-    def update(self, player_x, player_y, all_enemies, boss_manager_system, camera_speed):
+    def update(self, player_x, player_y, all_enemies, boss_manager_system):
         target_dest_x = player_x - 40
         target_dest_y = player_y - 40
         self.x += (target_dest_x - self.x) * 0.1
@@ -1072,9 +1064,10 @@ class VasilCompanion(pygame.sprite.Sprite):
 
         return None
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
         draw_y = self.y + math.sin(self.float_offset) * 4
-        cx, cy = int(self.x), int(draw_y)
+        ox, oy = camera_offset
+        cx, cy = int(self.x) + ox, int(draw_y) + oy
         w, h   = 24, 24
 
         # Glow
@@ -2,7 +2,10 @@ import pygame
 import random
 from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT
 from boss_entities import BossSpike, BossLightning, BossGiantArrow, BossOrbitalStrike, NexusBoss, AresBoss, VasilBoss, EnemyBullet
-from vfx import ScreenFlash, ParticleExplosion, Shockwave
+from vfx import ScreenFlash
+from particle_system import particle_system
+from spatial_index import SpatialHashGrid
+from viewport import world_camera
 
 class BossManager:
     def __init__(self):
@@ -11,6 +14,9 @@ class BossManager:
         self.lightning = pygame.sprite.Group()
         self.giant_arrows = pygame.sprite.Group()
         self.orbitals = pygame.sprite.Group()
+
+        # Rect tabanlı saldırılar için broad-phase (kazık / yıldırım / ok)
+        self._hazard_grid = SpatialHashGrid()
         
         # Zamanlayıcılar
         self.timers = {
@@ -27,10 +33,13 @@ class BossManager:
         self.orbitals.empty()
         self.timers = {key: 0 for key in self.timers}
 
-    def update_logic(self, level_idx, platforms, player_x, player_karma, camera_speed, frame_mul, is_weakened=False):
+    def update_logic(self, level_idx, platforms, player_x, player_karma, is_weakened=False):
         
         if level_idx not in [10, 30]: return
 
+        # Saldırılar dünya uzayında doğar: ekran aralıkları kamera soluna göre
+        cam_x = int(world_camera.left)
+
         # ZAYIFLAMA ÇARPANLARI
         time_mult = 0.25 if is_weakened else 1.0  # Zaman yavaşlar
         spawn_mult = 0.25 if is_weakened else 1.0 # Mermi sayısı azalır
@@ -45,7 +54,7 @@ class BossManager:
         self.timers['spike'] += 1 * time_mult
         if self.timers['spike'] > 10:
             self.timers['spike'] = 0
-            visible_platforms = [p for p in platforms if 0 < p.rect.centerx < 1920]
+            visible_platforms = [p for p in platforms if cam_x < p.rect.centerx < cam_x + LOGICAL_WIDTH]
             
             if visible_platforms:
                 max_targets = 1 if is_weakened else 3
@@ -63,47 +72,56 @@ class BossManager:
             if count < 1 and not is_weakened: count = 1
             
             for _ in range(max(1, count)):
-                tx = player_x + random.randint(-100, 300) if random.random() < 0.7 else random.randint(50, 1800)
+                tx = player_x + random.randint(-100, 300) if random.random() < 0.7 else cam_x + random.randint(50, 1800)
                 self.lightning.add(BossLightning(tx, player_karma))
 
         # 3. DEV OKLAR
         if current_difficulty >= 2 and int(self.timers['difficulty']) % 60 == 0:
             arrow_count = 1 if is_weakened else random.randint(2, 4)
             for _ in range(arrow_count):
-                gx = max(50, min(1800, player_x + random.randint(-200, 800)))
+                gx = max(cam_x + 50, min(cam_x + 1800, player_x + random.randint(-200, 800)))
                 self.giant_arrows.add(BossGiantArrow(gx, player_karma))
 
         # 4. ORBITAL STRIKE
         if current_difficulty >= 3 and int(self.timers['difficulty']) % 120 == 0:
             orb_count = 1 if is_weakened else random.randint(2, 3)
             for _ in range(orb_count):
-                self.orbitals.add(BossOrbitalStrike(random.randint(100, 1800), random.randint(50, 150), player_karma))
+                self.orbitals.add(BossOrbitalStrike(cam_x + random.randint(100, 1800), random.randint(50, 150), player_karma))
 
-        self.spikes.update(camera_speed * frame_mul)
-        self.lightning.update(camera_speed * frame_mul)
-        self.giant_arrows.update(camera_speed * frame_mul)
-        self.orbitals.update(camera_speed * frame_mul)
+        self.spikes.update()
+        self.lightning.update()
+        self.giant_arrows.update()
+        self.orbitals.update()
 
     def check_collisions(self, player_rect, player_obj, all_vfx, save_manager):
         """Oyuncu ile boss saldırılarının çarpışmasını kontrol eder"""
         hit_occurred = False
         
-        # 1. Kazıklar
-        for spike in self.spikes:
-            if spike.state == 'ACTIVE' and player_rect.colliderect(spike.rect):
-                spike.kill()
-                hit_occurred = True
-
-        # 2. Yıldırımlar
+        # Kazık / yıldırım / ok: sadece oyuncunun hücrelerindeki adaylar
+        grid = self._hazard_grid
+        grid.rebuild(self.spikes)
         for bolt in self.lightning:
-            if bolt.state == 'ACTIVE' and player_rect.colliderect(bolt.rect):
-                bolt.state = 'DONE'
-                bolt.kill()
-                hit_occurred = True
-
-        # 3. Dev Oklar
+            grid.insert(bolt)
         for arrow in self.giant_arrows:
-            if arrow.state == 'ACTIVE' and arrow.rect.colliderect(player_rect):
+            grid.insert(arrow)
+        candidates = grid.query_rect(player_rect)
+
+        for hazard in candidates:
+            # 1. Kazıklar
+            if self.spikes.has(hazard):
+                if hazard.state == 'ACTIVE' and player_rect.colliderect(hazard.rect):
+                    hazard.kill()
+                    hit_occurred = True
+
+            # 2. Yıldırımlar
+            elif self.lightning.has(hazard):
+                if hazard.state == 'ACTIVE' and player_rect.colliderect(hazard.rect):
+                    hazard.state = 'DONE'
+                    hazard.kill()
+                    hit_occurred = True
+
+            # 3. Dev Oklar
+            elif hazard.state == 'ACTIVE' and hazard.rect.colliderect(player_rect):
                 hit_occurred = True
 
         # 4. Orbitals
@@ -116,7 +134,7 @@ class BossManager:
         if hit_occurred:
             # Efektler
             all_vfx.add(ScreenFlash((255, 255, 255), 150, 5))
-            all_vfx.add(ParticleExplosion(player_obj['x'] + 15, player_obj['y'] + 15, (255, 0, 0), 15))
+            particle_system.emit_explosion(player_obj['x'] + 15, player_obj['y'] + 15, (255, 0, 0), 15)
             
             # Karma İşlemleri
             current_k = save_manager.get_karma()
@@ -135,8 +153,8 @@ class BossManager:
                 
         return hit_occurred
 
-    def draw(self, surface):
-        """Tüm saldırıları çizer"""
+    def draw(self, surface, camera_offset=(0, 0)):
+        """Tüm saldırıları çizer (dünya → ekran: camera_offset)"""
         for group in [self.spikes, self.lightning, self.giant_arrows, self.orbitals]:
             for entity in group:
-                entity.draw(surface)
\ No newline at end of file
+                entity.draw(surface, camera_offset)
\ No newline at end of file
@@ -1,5 +1,6 @@
 import pygame
 import math
+from glow_atlas import glow_atlas
 
 # ============================================================
 #  bullet_visuals.py
@@ -12,9 +13,9 @@ import math
 #  Çözüm: rect merkezinden vx/vy alıp yönü hesapla,
 #  mermiye o yönde uzayan kapsül/çizgi çiz.
 #
-#  API: draw_player_bullet(surface, proj, theme_color)
+#  API: draw_player_bullet(surface, proj, weapon_type, camera_offset)
 #  main.py'de:
-#    _p.draw(game_canvas)  →  draw_player_bullet(game_canvas, _p, BULLET_COLOR)
+#    _p.draw(game_canvas)  →  draw_player_bullet(game_canvas, _p, wtype, viewport)
 # ============================================================
 
 # Silah tipine göre renk tablosu (fallback: beyaz)
@@ -46,13 +47,15 @@ def _get_direction(proj):
     return math.atan2(vy, vx)
 
 
-def draw_player_bullet(surface, proj, weapon_type='default'):
+def draw_player_bullet(surface, proj, weapon_type='default', camera_offset=(0, 0)):
     """
     Merminin gerçek hareket yönüne hizalanmış kapsül çizer.
     weapon_type: 'revolver' | 'smg' | 'shotgun' | 'default'
+    camera_offset: dünya → ekran ofseti (ekran = dünya + ofset)
     """
-    cx = proj.rect.centerx
-    cy = proj.rect.centery
+    ox, oy = camera_offset
+    cx = proj.rect.centerx + ox
+    cy = proj.rect.centery + oy
     angle = _get_direction(proj)
 
     col_main  = BULLET_COLORS.get(weapon_type, BULLET_COLORS['default'])
@@ -84,13 +87,8 @@ def draw_player_bullet(surface, proj, weapon_type='default'):
     tail_x = cx - cos_a * body_len
     tail_y = cy - sin_a * body_len
 
-    # ── Dış glow (şeffaf halo) ────────────────────────────────
-    try:
-        glow_surf = pygame.Surface((glow_r * 2 + 2, glow_r * 2 + 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*col_main, 55), (glow_r + 1, glow_r + 1), glow_r)
-        surface.blit(glow_surf, (int(cx) - glow_r - 1, int(cy) - glow_r - 1))
-    except Exception:
-        pass
+    # ── Dış glow (şeffaf halo — glow_atlas önbelleği) ──────────
+    glow_atlas.blit(surface, col_main, int(cx), int(cy), glow_r, 55)
 
     # ── Gövde çizgisi (kalın — mermi bedeni) ─────────────────
     pygame.draw.line(surface, col_main,
@@ -0,0 +1,122 @@
+# ccd_kernel.py — FRAGMENTIA: SÜPÜRÜLMÜŞ DAİRE ↔ AABB ÇARPIŞMA ÇEKİRDEĞİ
+# =============================================================================
+# Mermi CCD (continuous collision detection) için kesin ve vektörel test.
+#
+# Eski yöntem: eski→yeni konum arasında en fazla 8 örnek nokta alıp her
+# birinde yeni bir pygame.Rect ile tarama yapıyordu; yüksek hızda ince
+# hedefleri atlayabiliyordu.
+#
+# Bu modül mermiyi BULLET_RADIUS yarıçaplı bir daire olarak ele alır ve
+# A→B doğru parçası boyunca süpürür. Düşman rect'i dairenin yarıçapı kadar
+# "yuvarlatılarak" şişirilir (Minkowski toplamı) ve doğru parçasının bu
+# yuvarlatılmış kutuya İLK giriş anı (t ∈ [0, 1]) hesaplanır.
+#
+# MİMARİ KURALLARI:
+#   • Tek çağrı = tüm mermiler × tüm hedefler (N×M NumPy dizisi).
+#   • Çarpışma yoksa TOI = +inf.
+#   • Başlangıç noktası zaten hedefin içindeyse TOI = 0 (shotgun namlu ağzı).
+# =============================================================================
+
+from __future__ import annotations
+import numpy as np
+
+
+NO_HIT = np.inf
+
+
+def rects_to_array(sprites) -> np.ndarray:
+    """Sprite listesinden (M, 4) [left, top, right, bottom] float dizisi."""
+    arr = np.empty((len(sprites), 4), dtype=np.float64)
+    for i, spr in enumerate(sprites):
+        r = spr.rect
+        arr[i, 0] = r.left
+        arr[i, 1] = r.top
+        arr[i, 2] = r.right
+        arr[i, 3] = r.bottom
+    return arr
+
+
+def swept_circle_aabb_toi(starts, ends, radius: float, rects) -> np.ndarray:
+    """
+    starts, ends : (N, 2) mermi başlangıç / bitiş noktaları
+    radius       : mermi yarıçapı (px)
+    rects        : (M, 4) [left, top, right, bottom]
+
+    Döndürür: (N, M) çarpışma zamanı matrisi. t ∈ [0, 1], çarpışma yoksa inf.
+    """
+    starts = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+    ends   = np.asarray(ends,   dtype=np.float64).reshape(-1, 2)
+    rects  = np.asarray(rects,  dtype=np.float64).reshape(-1, 4)
+    n, m   = len(starts), len(rects)
+    if n == 0 or m == 0:
+        return np.full((n, m), NO_HIT)
+
+    r  = float(radius)
+    sx = starts[:, 0:1]; sy = starts[:, 1:2]            # (N, 1)
+    dx = ends[:, 0:1] - sx; dy = ends[:, 1:2] - sy      # (N, 1)
+    left, top    = rects[:, 0], rects[:, 1]             # (M,)
+    right, bottom = rects[:, 2], rects[:, 3]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # ── 1) Kare şişirilmiş kutu ile slab testi ─────────────────
+        tx_enter, tx_exit = _slab(sx, dx, left - r, right + r)
+        ty_enter, ty_exit = _slab(sy, dy, top - r, bottom + r)
+        t_enter = np.maximum(tx_enter, ty_enter)
+        t_exit  = np.minimum(tx_exit, ty_exit)
+        box_hit = (t_enter <= t_exit) & (t_exit >= 0.0) & (t_enter <= 1.0)
+
+        t  = np.maximum(t_enter, 0.0)
+        px = sx + dx * t
+        py = sy + dy * t
+
+        # ── 2) Giriş noktası köşe bölgesindeyse → köşe dairesi testi ──
+        out_x = (px < left) | (px > right)
+        out_y = (py < top)  | (py > bottom)
+        corner = box_hit & out_x & out_y
+
+        cx = np.where(px < left, left, right)
+        cy = np.where(py < top, top, bottom)
+        ox = sx - cx
+        oy = sy - cy
+        a  = dx * dx + dy * dy                           # (N, 1)
+        b  = dx * ox + dy * oy                           # (N, M)
+        c  = ox * ox + oy * oy - r * r
+        disc = b * b - a * c
+        t_circ = (-b - np.sqrt(np.maximum(disc, 0.0))) / a
+        # Başlangıç dairenin içindeyse → anında çarpışma
+        t_circ = np.where(c <= 0.0, 0.0, t_circ)
+        circ_ok = (c <= 0.0) | ((disc >= 0.0) & (a > 0.0) & (t_circ >= 0.0) & (t_circ <= 1.0))
+
+    toi = np.where(box_hit & ~corner, t, NO_HIT)
+    toi = np.where(corner & circ_ok, t_circ, toi)
+    return toi
+
+
+def _slab(s, d, lo, hi):
+    """Tek eksen slab aralığı; d == 0 ise içerideyse (-inf, inf), değilse boş."""
+    inv = 1.0 / d
+    t1  = (lo - s) * inv
+    t2  = (hi - s) * inv
+    t_lo = np.minimum(t1, t2)
+    t_hi = np.maximum(t1, t2)
+    still  = (d == 0.0)
+    inside = (s >= lo) & (s <= hi)
+    t_lo = np.where(still, np.where(inside, -np.inf, np.inf), t_lo)
+    t_hi = np.where(still, np.where(inside, np.inf, -np.inf), t_hi)
+    return t_lo, t_hi
+
+
+def earliest_hit(toi_row, alive_mask=None):
+    """
+    Bir merminin TOI satırından en erken vurulan hedefin indeksi ve zamanı.
+    Eşitlikte düşük indeks (grup iterasyon sırası) kazanır. Yoksa (-1, inf).
+    """
+    if alive_mask is not None:
+        toi_row = np.where(alive_mask, toi_row, NO_HIT)
+    if toi_row.size == 0:
+        return -1, NO_HIT
+    j = int(np.argmin(toi_row))
+    t = float(toi_row[j])
+    if not np.isfinite(t):
+        return -1, NO_HIT
+    return j, t
@@ -36,6 +36,7 @@ from settings import (
     CURSED_PURPLE, CURSED_RED, GLITCH_BLACK,
     PLAYER_SPEED, GRAVITY, WHITE
 )
+from text_cache import get_font
 
 # ────────────────────────────────────────────────
 # SABITLER
@@ -127,16 +128,8 @@ ARENA_SHIELD_COLOR  = ( 80,  80, 220)
 # ────────────────────────────────────────────────
 # YARDIMCI: basit etiket çizici
 # ────────────────────────────────────────────────
-_FONT_CACHE: dict = {}
-
-def _get_font(size: int) -> pygame.font.Font:
-    if size not in _FONT_CACHE:
-        _FONT_CACHE[size] = pygame.font.Font(None, size)
-    return _FONT_CACHE[size]
-
-
 def _draw_label(surface, text, x, y, color, size=18):
-    font = _get_font(size)
+    font = get_font(size)
     surf = font.render(text, True, color)
     surface.blit(surf, (x - surf.get_width() // 2, y))
 
@@ -287,16 +280,22 @@ class ComboSystem:
         return None
 
     # ── Çarpışma Tespiti ───────────────────────────────────
-    def check_hits(self, enemies_group) -> list[dict]:
+    def check_hits(self, enemies_group, spatial_index=None) -> list[dict]:
         """
         Aktif hitbox ile düşmanlara çarptı mı kontrol eder.
         Her çarpışma için {'enemy': ..., 'damage': int, 'combo': dict|None}
         listesi döndürür.  Hasar hesabı main.py'e bırakılmıştır.
+
+        spatial_index verilirse (enemies_group ile aynı sırada kurulmuş
+        SpatialHashGrid) sadece hitbox'ın değdiği hücrelerdeki adaylar taranır.
         """
         hits = []
         if not self.current_hitbox or not self.current_hitbox.active:
             return hits
 
+        if spatial_index is not None:
+            enemies_group = spatial_index.query_rect(self.current_hitbox.rect)
+
         for enemy in enemies_group:
             if id(enemy) in self.current_hitbox.hit_set:
                 continue
@@ -445,12 +444,10 @@ class ArenaEnemy(pygame.sprite.Sprite):
 
     # ── Güncelleme ─────────────────────────────────────────
     def update(self, dt: float, player_x: float, player_y: float,
-               camera_speed: float = 0.0, frame_mul: float = 1.0):
+               frame_mul: float = 1.0):
         if not self.is_active:
             return
 
-        # Kamera kayması
-        self.x -= camera_speed * frame_mul
         self.rect.x = int(self.x)
 
         # Stun
@@ -580,11 +577,10 @@ class ArenaDropReward(pygame.sprite.Sprite):
         self.rect  = pygame.Rect(int(x) - self.size, int(y) - self.size,
                                  self.size * 2, self.size * 2)
 
-    def update(self, camera_speed: float, frame_mul: float = 1.0):
+    def update(self, frame_mul: float = 1.0):
         if self.collected:
             self.kill()
             return
-        self.x   -= camera_speed * frame_mul
         self.vy  += 0.4 * frame_mul
         if self.vy > 0 and self.y > LOGICAL_HEIGHT - 100:   # zemin = -80, biraz tolerans
             self.vy = -abs(self.vy) * 0.5     # Basit zıplama
@@ -618,7 +614,7 @@ class BeatArenaManager:
     "beat_arena" tipi bölümlerin tüm mantığını yönetir.
 
     Bölüm yapısı:
-      • Kamera DURUR (camera_speed = 0 olmalı, main.py'e bırakıldı).
+      • Kamera DURUR (world_camera ilerlemez; her şey dünya koordinatında).
       • Girişte "ARENA BAŞLIYOR" banner gösterilir.
       • ARENA_WAVES listesi sırayla işlenir.
         Her dalga: belirli sayı/tip ArenaEnemy sahneye girer.
@@ -629,8 +625,7 @@ class BeatArenaManager:
         if lvl_config.get('type') == 'beat_arena':
             if not beat_arena.active:
                 beat_arena.start(level_idx)
-            beat_arena.update(dt, frame_mul, player_x, player_y, camera_speed,
-                              all_enemies, score, save_manager, all_vfx)
+            beat_arena.update(dt, frame_mul, player_x, player_y)
             if beat_arena.is_complete:
                 camera_speed = INITIAL_CAMERA_SPEED   # Kamerayı serbest bırak
                 score += beat_arena.total_bonus
@@ -825,23 +820,22 @@ class BeatArenaManager:
 
     # ── Güncelleme ─────────────────────────────────────────
     def update(self, dt: float, frame_mul: float,
-               player_x: float, player_y: float,
-               camera_speed: float):
+               player_x: float, player_y: float):
         if not self.active or self.is_complete:
             return
 
         if self.banner_timer > 0:
             self.banner_timer -= dt
 
-        # Arena düşmanları güncelle (camera_speed = 0 beklenir)
+        # Arena düşmanları güncelle
         for enemy in list(self.arena_enemies):
-            enemy.update(dt, player_x, player_y, camera_speed, frame_mul)
+            enemy.update(dt, player_x, player_y, frame_mul)
             if not enemy.is_active:
                 enemy.kill()
 
         # Ödüller güncelle
         for drop in list(self.drops):
-            drop.update(camera_speed, frame_mul)
+            drop.update(frame_mul)
 
         # Dalga bitti mi?
         if len(self.arena_enemies) == 0:
@@ -1093,7 +1087,7 @@ class CombatHUD:
         for i, inp in enumerate(chain):
             col = (255, 100, 100) if inp == "H" else (100, 200, 255)
             lbl = "AĞIR" if inp == "H" else "HAFİF"
-            f   = _get_font(20)
+            f   = get_font(20)
             s   = f.render(f"[{lbl}]", True, col)
             surface.blit(s, (cx + i * 90, by + 32))
 
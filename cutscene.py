@@ -8,6 +8,8 @@ import pygame
 import random
 import math
 import sys
+from text_cache import get_font
+from glyph_atlas import glyph_atlas, quantize_alpha
 
 # --- RENK PALETİ ---
 CYBER_GREEN = (0, 255, 100)
@@ -19,6 +21,9 @@ PURE_BLACK = (0, 0, 0)
 DATA_BLUE = (0, 200, 255)
 WARNING_YELLOW = (255, 200, 0)
 
+# HexDumpView satırlarında geçebilecek tüm karakterler (glif atlası kümesi)
+HEX_DUMP_CHARS = "0123456789ABCDEFx |..*!?#"
+
 # --- EKSİK OLAN FONKSİYON BURAYA EKLENDİ ---
 def draw_cyber_revolver(surface, x, y, color, scale=1.0):
     """
@@ -35,41 +40,63 @@ def draw_cyber_revolver(surface, x, y, color, scale=1.0):
     # Kabza
     pygame.draw.line(surface, color, (x - s(15), y + s(10)), (x - s(20), y + s(40)), 3)
     # Etiket
-    font = pygame.font.Font(None, int(18 * scale))
+    font = get_font(int(18 * scale))
     lbl  = font.render("[SİLAH]", True, color)
     surface.blit(lbl, (x - lbl.get_width() // 2, y - s(35)))
 
 
 class MatrixRain:
-    """Matrix tarzı akan kod efekti"""
-    def __init__(self, width, height, font_size=20):
+    """
+    Matrix tarzı akan kod efekti.
+
+    Karakterler glyph_atlas'tan kaynak-dikdörtgenli blit ile, frame başına
+    tek Surface.blits çağrısında basılır — font.render yalnızca atlas
+    kurulurken çalışır. layers > 1: arka katmanlar yarım hücre kaydırılmış,
+    daha yavaş ve daha soluk akar (yoğun yağmur).
+    """
+    LAYER_FALLOFF = 0.6     # her arka katmanda hız / parlaklık çarpanı
+
+    def __init__(self, width, height, font_size=20, layers=1):
         self.width = width
         self.height = height
         self.font_size = font_size
         self.cols = width // font_size
-        self.drops = [random.randint(-50, 0) for _ in range(self.cols)]
+        self.layers = [[random.randint(-50, 0) for _ in range(self.cols)]
+                       for _ in range(max(1, layers))]
+        self.drops = self.layers[0]
         self.chars = ["0", "1", "X", "Z", "A", "Ω", "Σ", "π", "¥", "$", "∆", "∇"]
         self.speed_mult = 1.0
 
     def update(self):
-        for i in range(len(self.drops)):
-            self.drops[i] += 1 * self.speed_mult
-            if self.drops[i] * self.font_size > self.height and random.random() > 0.975:
-                self.drops[i] = 0
+        for k, drops in enumerate(self.layers):
+            step = self.speed_mult * self.LAYER_FALLOFF ** k
+            for i in range(len(drops)):
+                drops[i] += step
+                if drops[i] * self.font_size > self.height and random.random() > 0.975:
+                    drops[i] = 0
 
     def draw(self, surface, font, color=HACKER_GREEN):
-        for i in range(len(self.drops)):
-            char = random.choice(self.chars)
-            x = i * self.font_size
-            y = int(self.drops[i] * self.font_size)
-            
-            char_surf = font.render(char, True, color)
-            surface.blit(char_surf, (x, y))
-            
-            if y > self.font_size * 2:
-                tail_color = (0, 100, 0) if color == HACKER_GREEN else (100, 0, 0)
-                tail_surf = font.render(char, True, tail_color)
-                surface.blit(tail_surf, (x, y - self.font_size))
+        fs = self.font_size
+        tail_color = (0, 100, 0) if color == HACKER_GREEN else (100, 0, 0)
+        cells = []
+        # Arkadan öne: en soluk katman önce
+        for k in range(len(self.layers) - 1, -1, -1):
+            fade = self.LAYER_FALLOFF ** k
+            head = glyph_atlas.get(font, _scaled(color, fade), self.chars)
+            tail = glyph_atlas.get(font, _scaled(tail_color, fade), self.chars)
+            x0 = (fs // 2) * (k % 2)
+            for i, d in enumerate(self.layers[k]):
+                char = random.choice(self.chars)
+                x = x0 + i * fs
+                y = int(d * fs)
+                cells.append(head.cell(char, (x, y)))
+                if y > fs * 2:
+                    cells.append(tail.cell(char, (x, y - fs)))
+        surface.blits(cells, False)
+
+
+def _scaled(color, f):
+    return color if f == 1 else tuple(int(c * f) for c in color[:3])
 
 class CRTOverlay:
     def __init__(self, width, height):
@@ -117,9 +144,12 @@ class HexDumpView:
                 self.lines.pop(0)
 
     def draw(self, surface, x, y, color=DATA_BLUE):
+        cells = []
         for i, line in enumerate(self.lines):
-            text = self.font.render(line, True, color)
-            surface.blit(text, (x, y + i * 20))
+            # Satırdaki her karakter atlasta olsun (eksikse atlas genişler)
+            strip = glyph_atlas.get(self.font, color, HEX_DUMP_CHARS + line)
+            cells.extend(strip.line(line, x, y + i * 20))
+        surface.blits(cells, False)
 
 class LoadingBar:
     def __init__(self, width, height):
@@ -149,7 +179,7 @@ class LoadingBar:
                 block_w = min(10, fill_w - i)
                 pygame.draw.rect(surface, CYBER_GREEN, (x + i + 2, y + 4, block_w, self.height - 8))
 
-        font = pygame.font.SysFont("consolas", 20)
+        font = get_font(20, "consolas")
         msg_surf = font.render(f"{self.message}... {int(self.progress*100)}%", True, PURE_WHITE)
         surface.blit(msg_surf, (x, y - 25))
 
@@ -195,7 +225,7 @@ class DigitalEye:
                                   (rect.left, rect.bottom, 1, -1), (rect.right, rect.bottom, -1, -1)]:
             pygame.draw.line(surface, GOLD, (cx2, cy2), (cx2 + dx * cl, cy2), 2)
             pygame.draw.line(surface, GOLD, (cx2, cy2), (cx2, cy2 + dy * cl), 2)
-        font = pygame.font.Font(None, 20)
+        font = get_font(20)
         lbl  = font.render("SAVAŞÇI", True, GOLD)
         surface.blit(lbl, (x - lbl.get_width() // 2, y - 10))
 
@@ -215,7 +245,7 @@ class DigitalEye:
                                   (rect.left, rect.bottom, 1, -1), (rect.right, rect.bottom, -1, -1)]:
             pygame.draw.line(surface, PURP, (cx2, cy2), (cx2 + dx * cl, cy2), 2)
             pygame.draw.line(surface, PURP, (cx2, cy2), (cx2, cy2 + dy * cl), 2)
-        font = pygame.font.Font(None, 20)
+        font = get_font(20)
         lbl  = font.render("VASİ", True, PURP)
         surface.blit(lbl, (x - lbl.get_width() // 2, y - 10))
         # Tarama çizgisi (scanning efekti korundu — gameplay işareti)
@@ -232,15 +262,15 @@ class AICutscene:
         self.running = True
 
         try:
-            self.font_main = pygame.font.SysFont("consolas", 24)
-            self.font_large = pygame.font.SysFont("consolas", 60, bold=True)
-            self.font_matrix = pygame.font.SysFont("consolas", 16)
-            self.font_bios = pygame.font.SysFont("lucidaconsole", 18)
+            self.font_main = get_font(24, "consolas")
+            self.font_large = get_font(60, "consolas", bold=True)
+            self.font_matrix = get_font(16, "consolas")
+            self.font_bios = get_font(18, "lucidaconsole")
         except:
-            self.font_main = pygame.font.Font(None, 32)
-            self.font_large = pygame.font.Font(None, 48)
-            self.font_matrix = pygame.font.Font(None, 20)
-            self.font_bios = pygame.font.Font(None, 20)
+            self.font_main = get_font(32)
+            self.font_large = get_font(48)
+            self.font_matrix = get_font(20)
+            self.font_bios = get_font(20)
 
         self.matrix_rain = MatrixRain(self.width, self.height, 16)
         self.crt_effect = CRTOverlay(self.width, self.height)
@@ -526,9 +556,9 @@ class AICutscene:
             
             # Teknik Yazı
             try:
-                font_tech = pygame.font.SysFont("consolas", 20)
+                font_tech = get_font(20, "consolas")
             except:
-                font_tech = pygame.font.Font(None, 24)
+                font_tech = get_font(24)
                 
             tech_text = font_tech.render("[WEAPON_CLASS: LEGENDARY]", True, self.text_color)
             self.screen.blit(tech_text, (cx - tech_text.get_width()//2, cy + 100))
@@ -594,17 +624,19 @@ class IntroCutscene:
     _VOID_PURP  = (30,  0,   55)    # Derin mor
     _SICK_GREEN = (20,  60,  30)    # Hastalıklı yeşil
 
+    _PARTICLE_CHARS = "#01X!?%"     # parçacık glifleri (glyph_atlas kümesi)
+
     def __init__(self, screen, clock):
         self.screen = screen
         self.clock  = clock
         self.W, self.H = screen.get_size()
 
         try:
-            self.font_main  = pygame.font.SysFont("consolas", 22)
-            self.font_small = pygame.font.SysFont("consolas", 16)
+            self.font_main  = get_font(22, "consolas")
+            self.font_small = get_font(16, "consolas")
         except Exception:
-            self.font_main  = pygame.font.Font(None, 26)
-            self.font_small = pygame.font.Font(None, 20)
+            self.font_main  = get_font(26)
+            self.font_small = get_font(20)
 
         self._build_heap()
         self._build_crack_pts()
@@ -1095,17 +1127,22 @@ class IntroCutscene:
         return {"x":float(x),"y":float(y),
                 "vx":math.cos(ang)*spd, "vy":math.sin(ang)*spd - random.uniform(0,60),
                 "life":random.uniform(0.5,1.6), "maxl":1.0,
-                "char":random.choice(["#","0","1","X","!","?","%"]),
+                "char":random.choice(self._PARTICLE_CHARS),
                 "type":ptype,
                 "size":random.randint(3,9) if ptype=="chunk" else 1}
 
     def _draw_particles(self, surf):
-        try: f = pygame.font.SysFont("consolas", 14)
+        try: f = get_font(14, "consolas")
         except: f = self.font_small
+        glyphs = []
         for p in self._particles:
             ratio  = p["life"] / max(0.01, p.get("maxl", 1.0))
             alpha  = max(0, min(255, int(220 * ratio)))   # CLAMP 0-255
             ptype  = p.get("type", "char")
+            if ptype != "char" and glyphs:
+                # Çizim sırası korunur: önceki karakter gliflerini önce bas
+                surf.blits(glyphs, False)
+                glyphs.clear()
             if ptype == "chunk":
                 sz = p.get("size", 4)
                 cs = pygame.Surface((sz*2+2, sz*2+2), pygame.SRCALPHA)
@@ -1128,9 +1165,13 @@ class IntroCutscene:
             else:
                 # Char: mor veya yeşil tint
                 tcol = self._GLITCH_G if int(p["x"]+p["y"])%3==0 else self._DIM_WHITE
-                c = f.render(p["char"], True, tcol)
-                c.set_alpha(alpha)
-                surf.blit(c, (int(p["x"]), int(p["y"])))
+                # Alfa kademesi pişmiş atlas hücresi (set_alpha'lı kopya yok)
+                a = quantize_alpha(alpha)
+                if a:
+                    glyphs.append(glyph_atlas.get(f, tcol, self._PARTICLE_CHARS, a)
+                                  .cell(p["char"], (int(p["x"]), int(p["y"]))))
+        if glyphs:
+            surf.blits(glyphs, False)
 
     def _draw_scene(self, name):
         self.screen.fill(self._SKY_COL)
@@ -1398,13 +1439,13 @@ class VasilIntroScene:
         self.W, self.H = screen.get_size()
 
         try:
-            self.font_title  = pygame.font.SysFont("consolas", 48, bold=True)
-            self.font_main   = pygame.font.SysFont("consolas", 26)
-            self.font_small  = pygame.font.SysFont("consolas", 18)
+            self.font_title  = get_font(48, "consolas", bold=True)
+            self.font_main   = get_font(26, "consolas")
+            self.font_small  = get_font(18, "consolas")
         except Exception:
-            self.font_title  = pygame.font.Font(None, 56)
-            self.font_main   = pygame.font.Font(None, 32)
-            self.font_small  = pygame.font.Font(None, 22)
+            self.font_title  = get_font(56)
+            self.font_main   = get_font(32)
+            self.font_small  = get_font(22)
 
         self.matrix_rain = MatrixRain(self.W, self.H, 18)
         self.line_idx    = 0
@@ -1478,7 +1519,7 @@ class VasilIntroScene:
                     gs = pygame.Surface((gw, 4), pygame.SRCALPHA)
                     gs.fill((*self._VASIL_COL, random.randint(80, 200)))
                     self.screen.blit(gs, (gx, gy))
-                warn = self.font_title.render("SAVAŞ BAŞLIYOR", True, self._WARN_COL)
+                warn = self.font_title.font.render("SAVAŞ BAŞLIYOR", True, self._WARN_COL)
                 wa   = min(255, int(self.glitch_t * 200))
                 warn.set_alpha(wa)
                 self.screen.blit(warn, (self.W // 2 - warn.get_width() // 2, self.H // 2 - 30))
@@ -1572,13 +1613,13 @@ class VasilDefeatScene:
         self.W, self.H = screen.get_size()
 
         try:
-            self.font_main  = pygame.font.SysFont("consolas", 28)
-            self.font_small = pygame.font.SysFont("consolas", 18)
-            self.font_big   = pygame.font.SysFont("consolas", 52, bold=True)
+            self.font_main  = get_font(28, "consolas")
+            self.font_small = get_font(18, "consolas")
+            self.font_big   = get_font(52, "consolas", bold=True)
         except Exception:
-            self.font_main  = pygame.font.Font(None, 34)
-            self.font_small = pygame.font.Font(None, 22)
-            self.font_big   = pygame.font.Font(None, 60)
+            self.font_main  = get_font(34)
+            self.font_small = get_font(22)
+            self.font_big   = get_font(60)
 
         self._t         = 0.0
         self._phase     = "DIALOGUE"   # DIALOGUE → TILT → FALL → DARK → WAKE
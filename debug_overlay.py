@@ -0,0 +1,87 @@
+# debug_overlay.py — FRAGMENTIA: KALICI DEBUG KATMANI
+# =============================================================================
+# DEBUG_SPRITE açıkken (run_game_loop varsayılanı) spread konisi bloğu her
+# frame iki yeni LOGICAL_WIDTH × LOGICAL_HEIGHT SRCALPHA yüzey ayırıyordu
+# (_max_surf, _cur_surf) — sadece birer küçük poligon için. Trajectory
+# ızgarası önceden ayrılmış _traj_surface'i kullansa da her frame tam ekran
+# fill + tam ekran alfa blit yapıyordu.
+#
+# DebugOverlay tek, kalıcı bir SRCALPHA katman tutar:
+#   • Her çizim ilkeli (poligon, çizgi, daire, dikdörtgen) pygame.draw'un
+#     döndürdüğü etkilenen dikdörtgeni kirli kutuya (bbox) ekler.
+#   • flush(hedef) yalnızca kirli kutuyu hedefe blit eder ve yalnızca o
+#     kutuyu temizler — katman her flush sonrası yine tamamen şeffaftır.
+#
+# MİMARİ KURALLARI:
+#   • Koordinatlar hedef yüzeyin (game_canvas) ekran koordinatlarıdır.
+#   • SRCALPHA üzerine pygame.draw piksel yazar, karıştırmaz. Üst üste
+#     binip birbirine karışması gereken katmanlar (maks. koni → mevcut
+#     koni) arasında flush() çağrılır; çizim sırası eskisiyle aynı kalır.
+#   • Katman mantıksal tuval boyutundadır (game_canvas ile aynı).
+# =============================================================================
+
+from __future__ import annotations
+from typing import Optional
+
+import pygame
+
+from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. DebugOverlay
+# ─────────────────────────────────────────────────────────────────────────────
+
+class DebugOverlay:
+    """
+    Kullanım (main.py):
+        debug_overlay.polygon((180, 180, 180, 18), max_pts)
+        debug_overlay.flush(game_canvas)             # maks. koni
+        debug_overlay.line((r, g, 20, 200), pivot, tip, 2)
+        debug_overlay.flush(game_canvas)             # mevcut koni
+    """
+
+    def __init__(self, width: int = LOGICAL_WIDTH, height: int = LOGICAL_HEIGHT):
+        self.layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._bounds = self.layer.get_rect()
+        self._dirty: Optional[pygame.Rect] = None
+
+    def _mark(self, rect: pygame.Rect):
+        if rect.width and rect.height:
+            self._dirty = rect if self._dirty is None else self._dirty.union(rect)
+
+    # ── Çizim ilkelleri ────────────────────────────────────
+    def polygon(self, color, points, width: int = 0):
+        if len(points) >= 3:
+            self._mark(pygame.draw.polygon(self.layer, color, points, width))
+
+    def lines(self, color, closed: bool, points, width: int = 1):
+        if len(points) >= 2:
+            self._mark(pygame.draw.lines(self.layer, color, closed, points, width))
+
+    def line(self, color, start, end, width: int = 1):
+        self._mark(pygame.draw.line(self.layer, color, start, end, width))
+
+    def circle(self, color, center, radius, width: int = 0):
+        self._mark(pygame.draw.circle(self.layer, color, center, radius, width))
+
+    def rect(self, color, rect, width: int = 0):
+        self._mark(pygame.draw.rect(self.layer, color, rect, width))
+
+    # ── Birleştirme ────────────────────────────────────────
+    def flush(self, target: pygame.Surface):
+        """Kirli kutuyu hedefe basar ve yalnızca o kutuyu temizler."""
+        dirty = self._dirty
+        if dirty is None:
+            return
+        self._dirty = None
+        dirty = dirty.clip(self._bounds)
+        if dirty.width and dirty.height:
+            target.blit(self.layer, dirty.topleft, dirty)
+            self.layer.fill((0, 0, 0, 0), dirty)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+debug_overlay = DebugOverlay()
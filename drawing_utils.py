@@ -2,6 +2,7 @@ import pygame
 import math
 import random
 from utils import wrap_text, draw_text_with_shadow
+from text_cache import get_font
 
 # Silah görsel sınıfları — weapon_entities.py'den
 try:
@@ -57,7 +58,7 @@ def _draw_placeholder_box(surface, cx, cy, w, h, border_color, label, intensity=
         pygame.draw.line(surface, c, (cx2, cy2), (cx2, cy2 + dy * corner), 2)
 
     # Etiket metni
-    font = pygame.font.Font(None, 20)
+    font = get_font(20)
     lbl = font.render(label, True, border_color)
     lbl_rect = lbl.get_rect(center=(cx, cy))
     surface.blit(lbl, lbl_rect)
@@ -263,13 +264,13 @@ def draw_cinematic_overlay(surface, manager, time_ms, mouse_pos):
     pygame.draw.line(surface, line_color, (0, h - bar_height), (w, h - bar_height), 2)
 
     if manager.speaker:
-        font_title = pygame.font.Font(None, 55)
+        font_title = get_font(55)
         icon_rect = pygame.Rect(50, bar_height // 2 - 20, 40, 40)
         pygame.draw.rect(surface, line_color, icon_rect, 2)
         pygame.draw.rect(surface, (*line_color, 100), icon_rect.inflate(-4, -4))
         draw_text_with_shadow(surface, manager.speaker, font_title, (110, bar_height // 2), line_color, align="midleft")
 
-    font_text = pygame.font.Font(None, 36)
+    font_text = get_font(36)
     text_area_rect = pygame.Rect(60, h - bar_height + 30, w - 120, bar_height - 60)
 
     if manager.is_cutscene:
@@ -294,7 +295,7 @@ def draw_cinematic_overlay(surface, manager, time_ms, mouse_pos):
     if manager.waiting_for_click and manager.state != "WAITING_CHOICE":
         blink = (time_ms // 500) % 2 == 0
         if blink:
-            draw_text_with_shadow(surface, "DEVAM ETMEK İÇİN TIKLA >", pygame.font.Font(None, 24),
+            draw_text_with_shadow(surface, "DEVAM ETMEK İÇİN TIKLA >", get_font(24),
                                   (w - 50, h - 30), line_color, align="bottomright")
 
     if manager.state == "WAITING_CHOICE":
@@ -302,7 +303,7 @@ def draw_cinematic_overlay(surface, manager, time_ms, mouse_pos):
         btn_width = 800
         start_y = h // 2 - (len(manager.current_choices) * 110) // 2 + 30
 
-        draw_text_with_shadow(surface, "BİR SEÇİM YAP", pygame.font.Font(None, 60), (w // 2, start_y - 70), (255, 255, 0), align="center")
+        draw_text_with_shadow(surface, "BİR SEÇİM YAP", get_font(60), (w // 2, start_y - 70), (255, 255, 0), align="center")
 
         for i, choice in enumerate(manager.current_choices):
             rect = pygame.Rect(w // 2 - btn_width // 2, start_y + i * 110, btn_width, btn_height)
@@ -326,8 +327,9 @@ def draw_cinematic_overlay(surface, manager, time_ms, mouse_pos):
 # ═══════════════════════════════════════════════════════════════════════════
 # NPC SOHBET EKRANI — Değişmedi
 # ═══════════════════════════════════════════════════════════════════════════
-def draw_npc_chat(surface, current_npc, chat_history, chat_input, show_cursor, logical_width, logical_height):
-    """NPC sohbet ekranını çiz"""
+def draw_npc_chat(surface, current_npc, chat_history, chat_input, show_cursor, logical_width, logical_height,
+                  thinking=False):
+    """NPC sohbet ekranını çiz (thinking: AI cevabı yolda → 'düşünüyor' satırı)"""
     if not current_npc:
         return
 
@@ -343,11 +345,11 @@ def draw_npc_chat(surface, current_npc, chat_history, chat_input, show_cursor, l
     pygame.draw.rect(surface, (20, 20, 30), (chat_x, chat_y, chat_width, chat_height), border_radius=15)
     pygame.draw.rect(surface, current_npc.color, (chat_x, chat_y, chat_width, chat_height), 3, border_radius=15)
 
-    title_font = pygame.font.Font(None, 40)
+    title_font = get_font(40)
     title = title_font.render(f"KONUŞUYOR: {current_npc.name}", True, current_npc.color)
     surface.blit(title, (chat_x + 20, chat_y + 20))
 
-    type_font = pygame.font.Font(None, 24)
+    type_font = get_font(24)
     status_text = "AI AKTİF" if current_npc.ai_active else "MANUEL MOD"
     status_color = (0, 255, 100) if current_npc.ai_active else (200, 200, 200)
     type_text = type_font.render(f"Kişilik: {current_npc.personality_type} | {status_text}", True, status_color)
@@ -357,7 +359,7 @@ def draw_npc_chat(surface, current_npc, chat_history, chat_input, show_cursor, l
     history_rect = pygame.Rect(chat_x + 20, chat_y + 80, chat_width - 40, history_height)
     pygame.draw.rect(surface, (10, 10, 15), history_rect, border_radius=10)
 
-    font = pygame.font.Font(None, 28)
+    font = get_font(28)
     y_offset = history_rect.y + 20
 
     for msg in chat_history[-8:]:
@@ -378,19 +380,24 @@ def draw_npc_chat(surface, current_npc, chat_history, chat_input, show_cursor, l
             y_offset += 35
         y_offset += 10
 
+    if thinking:
+        dots = "." * (int(pygame.time.get_ticks() / 400) % 4)
+        think_surf = font.render(f"{current_npc.name} düşünüyor{dots}", True, (150, 150, 150))
+        surface.blit(think_surf, (history_rect.x + 20, y_offset))
+
     input_y = chat_y + history_height + 100
     input_rect = pygame.Rect(chat_x + 20, input_y, chat_width - 40, 50)
     pygame.draw.rect(surface, (30, 30, 40), input_rect, border_radius=8)
     pygame.draw.rect(surface, (100, 100, 150), input_rect, 2, border_radius=8)
 
-    input_font = pygame.font.Font(None, 32)
+    input_font = get_font(32)
     display_text = chat_input
     if show_cursor:
         display_text += "|"
     input_text = input_font.render(display_text, True, (220, 220, 220))
     surface.blit(input_text, (input_rect.x + 15, input_rect.centery - 10))
 
-    instruct_font = pygame.font.Font(None, 24)
+    instruct_font = get_font(24)
     instruct1 = instruct_font.render("ENTER: Gönder | ESC: Çık | TAB: AI Modu Aç/Kapa", True, (150, 150, 150))
 
     if current_npc.ai_active:
@@ -407,7 +414,7 @@ def draw_npc_chat(surface, current_npc, chat_history, chat_input, show_cursor, l
     avatar_y = chat_y + 30
     pygame.draw.rect(surface, (30, 30, 40), (avatar_x, avatar_y, avatar_size, avatar_size))
     pygame.draw.rect(surface, current_npc.color, (avatar_x, avatar_y, avatar_size, avatar_size), 2)
-    lbl_f = pygame.font.Font(None, 18)
+    lbl_f = get_font(18)
     lbl_s = lbl_f.render("NPC", True, current_npc.color)
     surface.blit(lbl_s, (avatar_x + avatar_size // 2 - lbl_s.get_width() // 2,
                           avatar_y + avatar_size // 2 - lbl_s.get_height() // 2))
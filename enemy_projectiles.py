@@ -0,0 +1,222 @@
+# enemy_projectiles.py — FRAGMENTIA: HAVUZLU DÜŞMAN MERMİ SİSTEMİ
+# =============================================================================
+# Boss'lar (NexusBoss / AresBoss / VasilBoss) her atışta yeni bir EnemyBullet
+# sprite'ı oluşturup spawn_queue → all_enemies yoluyla gruba ekliyordu.
+# Her mermi ayrı update() / draw() / spritecollide maliyeti demekti.
+#
+# Bu modül mermileri NumPy dizilerinde tutar:
+#   • x, y, vx, vy, damage, renk indeksi — sabit kapasiteli, gerekince büyür
+#   • update() tek vektör işlemiyle ilerletir ve ekran dışını ayıklar
+#   • collide_rect() oyuncu dikdörtgeniyle vektörel çarpışma yapar
+#   • draw() önceden çizilmiş mermi sprite'larını tek Surface.blits ile basar
+#   • emit_aimed / emit_spiral / emit_ring — boss atış desenleri
+#
+# MİMARİ KURALLARI:
+#   • Davranış eski EnemyBullet ile aynıdır: frame başına vx/vy kadar hareket,
+#     16×16 hitbox, ekrandan 100px taşınca silinir. Konumlar dünya uzayındadır;
+#     ekran testi world_camera'ya göre, kayma yalnızca draw(offset) ile yapılır.
+#   • Aktif mermiler dizilerin ilk n elemanıdır; silme = maske ile sıkıştırma.
+#   • Bölüm değişiminde / all_enemies boşaltılırken clear() çağrılır.
+# =============================================================================
+
+from __future__ import annotations
+import math
+from typing import List, Tuple
+
+import numpy as np
+import pygame
+
+from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT
+from viewport import world_camera
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+ENEMY_BULLET_RADIUS   = 8
+ENEMY_BULLET_CAPACITY = 256        # başlangıç kapasitesi (dolunca ikiye katlanır)
+ENEMY_BULLET_MARGIN   = 100        # ekran dışı silme payı (px)
+
+BULLET_FILL    = (220, 30, 30)
+BULLET_OUTLINE = (255, 200, 0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. EnemyProjectilePool
+# ─────────────────────────────────────────────────────────────────────────────
+
+class EnemyProjectilePool:
+    """
+    Kullanım:
+        enemy_projectiles.emit_ring(boss.x, boss.y, 10, speed, BOSS_DAMAGE)   # boss
+        enemy_projectiles.update()                                            # main
+        for x, y, dmg in enemy_projectiles.collide_rect(player_rect): ...
+        enemy_projectiles.draw(game_canvas, viewport)
+    """
+
+    def __init__(self, capacity: int = ENEMY_BULLET_CAPACITY):
+        self.n = 0
+        self._alloc(capacity)
+        self._colors: List[Tuple[int, int, int]] = []
+        self._sprites: List[pygame.Surface] = []
+        self.spawned = 0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _alloc(self, capacity: int):
+        self.x   = np.zeros(capacity, dtype=np.float64)
+        self.y   = np.zeros(capacity, dtype=np.float64)
+        self.vx  = np.zeros(capacity, dtype=np.float64)
+        self.vy  = np.zeros(capacity, dtype=np.float64)
+        self.dmg = np.zeros(capacity, dtype=np.float64)
+        self.col = np.zeros(capacity, dtype=np.int16)
+
+    def _reserve(self, extra: int):
+        need = self.n + extra
+        cap = len(self.x)
+        if need <= cap:
+            return
+        while cap < need:
+            cap *= 2
+        n = self.n
+        old = (self.x, self.y, self.vx, self.vy, self.dmg, self.col)
+        self._alloc(cap)
+        for dst, src in zip((self.x, self.y, self.vx, self.vy, self.dmg, self.col), old):
+            dst[:n] = src[:n]
+
+    def clear(self):
+        self.n = 0
+
+    # ── Renk / sprite ──────────────────────────────────────
+    def _color_index(self, color) -> int:
+        color = tuple(color[:3])
+        try:
+            return self._colors.index(color)
+        except ValueError:
+            pass
+        r = ENEMY_BULLET_RADIUS
+        s = pygame.Surface((r * 2 + 1, r * 2 + 1), pygame.SRCALPHA)
+        outline = BULLET_OUTLINE if color == BULLET_FILL else tuple(min(255, c + 80) for c in color)
+        # [PLACEHOLDER] Mermi — dolu daire + ince çerçeve (eski EnemyBullet.draw)
+        pygame.draw.circle(s, color,   (r, r), r)
+        pygame.draw.circle(s, outline, (r, r), r, 1)
+        self._colors.append(color)
+        self._sprites.append(s)
+        return len(self._colors) - 1
+
+    # ── Üretim ─────────────────────────────────────────────
+    def spawn(self, x: float, y: float, vx: float, vy: float, damage: float,
+              color=BULLET_FILL):
+        self._reserve(1)
+        i = self.n
+        self.x[i], self.y[i], self.vx[i], self.vy[i] = x, y, vx, vy
+        self.dmg[i] = damage
+        self.col[i] = self._color_index(color)
+        self.n += 1
+        self.spawned += 1
+
+    def emit_angles(self, x: float, y: float, angles, speed: float, damage: float,
+                    color=BULLET_FILL):
+        """Aynı noktadan, verilen açılarla (rad) sabit hızda mermi demeti."""
+        angles = np.asarray(angles, dtype=np.float64)
+        k = len(angles)
+        if k == 0:
+            return
+        self._reserve(k)
+        s = slice(self.n, self.n + k)
+        self.x[s] = x
+        self.y[s] = y
+        self.vx[s] = np.cos(angles) * speed
+        self.vy[s] = np.sin(angles) * speed
+        self.dmg[s] = damage
+        self.col[s] = self._color_index(color)
+        self.n += k
+        self.spawned += k
+
+    # ── Desenler ───────────────────────────────────────────
+    def emit_aimed(self, x: float, y: float, target, count: int, spread: float,
+                   speed: float, damage: float, color=BULLET_FILL):
+        """Hedefe nişanlı yelpaze; count tekse ortadaki mermi tam hedefe gider."""
+        base = math.atan2(target[1] - y, target[0] - x)
+        half = (count - 1) / 2.0
+        self.emit_angles(x, y, base + (np.arange(count) - half) * spread,
+                         speed, damage, color)
+
+    def emit_spiral(self, x: float, y: float, base_angle: float, arms: int,
+                    speed: float, damage: float, color=BULLET_FILL):
+        """Eşit aralıklı kollar; base_angle her atışta ilerletilirse sarmal olur."""
+        self.emit_angles(x, y, base_angle + (math.pi * 2 / arms) * np.arange(arms),
+                         speed, damage, color)
+
+    def emit_ring(self, x: float, y: float, count: int, speed: float, damage: float,
+                  offset: float = 0.0, color=BULLET_FILL):
+        self.emit_spiral(x, y, offset, count, speed, damage, color)
+
+    # ── Simülasyon ─────────────────────────────────────────
+    def update(self):
+        n = self.n
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        m = ENEMY_BULLET_MARGIN
+        cam = world_camera.left
+        keep = ((x >= cam - m) & (x <= cam + LOGICAL_WIDTH + m) &
+                (y >= -m) & (y <= LOGICAL_HEIGHT + m))
+        if not keep.all():
+            self._compact(keep)
+
+    def _compact(self, keep: np.ndarray):
+        n = self.n
+        k = int(keep.sum())
+        for arr in (self.x, self.y, self.vx, self.vy, self.dmg, self.col):
+            arr[:k] = arr[:n][keep]
+        self.n = k
+
+    def _hitboxes(self):
+        """Eski rect.center = (int(x), int(y)) ile aynı 16×16 kutunun sol/üst kenarı."""
+        n = self.n
+        r = ENEMY_BULLET_RADIUS
+        return np.trunc(self.x[:n]) - r, np.trunc(self.y[:n]) - r
+
+    def collide_rect(self, rect) -> List[Tuple[float, float, float]]:
+        """rect ile çakışan mermileri siler; [(x, y, damage)] döndürür."""
+        if self.n == 0:
+            return []
+        rect = pygame.Rect(rect)
+        size = ENEMY_BULLET_RADIUS * 2
+        left, top = self._hitboxes()
+        hit = ((left < rect.right) & (left + size > rect.left) &
+               (top < rect.bottom) & (top + size > rect.top))
+        if not hit.any():
+            return []
+        n = self.n
+        out = list(zip(self.x[:n][hit].tolist(), self.y[:n][hit].tolist(),
+                       self.dmg[:n][hit].tolist()))
+        self._compact(~hit)
+        return out
+
+    def positions(self) -> List[Tuple[float, float]]:
+        n = self.n
+        return list(zip(self.x[:n].tolist(), self.y[:n].tolist()))
+
+    # ── Çizim ──────────────────────────────────────────────
+    def draw(self, surface, offset=(0, 0)):
+        n = self.n
+        if n == 0:
+            return
+        ox, oy = offset
+        left, top = self._hitboxes()
+        sprites = self._sprites
+        surface.blits([(sprites[c], (l + ox, t + oy)) for c, l, t in
+                       zip(self.col[:n].tolist(), left.astype(np.int32).tolist(),
+                           top.astype(np.int32).tolist())], False)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+enemy_projectiles = EnemyProjectilePool()
@@ -11,6 +11,9 @@ import random
 import math
 from settings import *
 from drawing_utils import draw_warrior_silhouette, draw_vasi_silhouette
+from glow_atlas import glow_atlas
+from text_cache import get_font
+from viewport import world_camera
 # Sprite araçları — utils'ten alınıyor (önbellek + SpriteSheet)
 try:
     from utils import get_image, SpriteSheet, FrameAnimator
@@ -43,7 +46,7 @@ def _hitbox_rect(surface, rect, border_color, label, extra_info=""):
     surface.blit(s, rect.topleft)
     pygame.draw.rect(surface, border_color, rect, 2)
 
-    font = pygame.font.Font(None, 18)
+    font = get_font(18)
     lbl  = font.render(label, True, border_color)
     surface.blit(lbl, (rect.x + 3, rect.y + 3))
     if extra_info:
@@ -67,7 +70,7 @@ class EnemyBase(pygame.sprite.Sprite):
         self.speech_text     = ""
         self.speech_timer    = 0
         self.speech_duration = 0
-        self.speech_font     = pygame.font.Font(None, 24)
+        self.speech_font     = get_font(24)
         self.spawn_queue     = []
 
     def take_damage(self, amount):
@@ -115,6 +118,12 @@ class Platform(pygame.sprite.Sprite):
 
     # Tema başına tile önbelleği — aynı tile'ı defalarca diskten yükleme
     _tile_cache: dict = {}
+    # Pişirilmiş platform görüntüleri — (theme_index, width, height) → Surface.
+    # Genişlikler PLATFORM_MIN_WIDTH..PLATFORM_MAX_WIDTH aralığında olduğundan
+    # aynı boyutlu platformlar tek yüzeyi paylaşır. Tema değişiminde
+    # clear_render_cache() ile boşaltılır (yaşayan platformlar kendi
+    # referanslarını korur).
+    _render_cache: dict = {}
 
     def __init__(self, x, y, width, height, theme_index=0):
         super().__init__()
@@ -126,9 +135,20 @@ class Platform(pygame.sprite.Sprite):
         # Tile resimleri yükle (veya None — fallback çizer)
         self._load_tiles(theme_index)
 
-        # Fallback için düz renk yüzeyi hazırla
-        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-        self.generate_texture()
+        # Tile'lı ya da düz renk görüntü bir kez pişirilir; draw() tek blit
+        key = (theme_index, width, height)
+        self.image = Platform._render_cache.get(key)
+        if self.image is None:
+            self.image = pygame.Surface((width, height), pygame.SRCALPHA)
+            if self._use_tiles:
+                self._draw_sliced(self.image, 0, 0)
+            else:
+                self.generate_texture()
+            Platform._render_cache[key] = self.image
+
+    @classmethod
+    def clear_render_cache(cls):
+        cls._render_cache.clear()
 
     # ------------------------------------------------------------------
     def _load_tiles(self, theme_index: int):
@@ -159,51 +179,28 @@ class Platform(pygame.sprite.Sprite):
         pygame.draw.rect(self.image, platform_color, (0, 0, self.width, self.height))
         pygame.draw.rect(self.image, border_color,   (0, 0, self.width, self.height), 2)
 
-    # ------------------------------------------------------------------
-    def update(self, camera_speed, dt=0.016):
-        self.rect.x -= camera_speed
-        if self.rect.right < 0:
-            self.kill()
-
     # ------------------------------------------------------------------
     def draw(self, surface, theme=None, camera_offset=(0, 0)):
         ox, oy = camera_offset
-        blit_x = self.rect.x + ox
-        blit_y = self.rect.y + oy
-
-        if self._use_tiles:
-            self._draw_sliced(surface, blit_x, blit_y)
-        else:
-            surface.blit(self.image, (blit_x, blit_y))
+        surface.blit(self.image, (self.rect.x + ox, self.rect.y + oy))
 
     # ------------------------------------------------------------------
     def _draw_sliced(self, surface, blit_x: int, blit_y: int):
         """
-        3-Parçalı Slice Çizimi
+        3-Parçalı Slice Çizimi (pişirme sırasında bir kez çağrılır)
         Sol uç  → tekrarlanan orta → sağ uç
 
         Platformun yüksekliği tile yüksekliğiyle eşleşmiyorsa
         tile dikey olarak ölçeklenir.
         """
-        l_w = self._tile_left.get_width()
-        r_w = self._tile_right.get_width()
-        m_w = self._tile_mid.get_width()
-        t_h = self._tile_left.get_height()
-
+        tl, tm, tr = self._tile_left, self._tile_mid, self._tile_right
         # Dikey ölçekleme gerekiyorsa (platform yüksekliği farklıysa)
-        if t_h != self.height:
-            scale_y = self.height / t_h
-            def _scale(surf):
-                return pygame.transform.scale(
-                    surf, (surf.get_width(), self.height))
-            tl = _scale(self._tile_left)
-            tm = _scale(self._tile_mid)
-            tr = _scale(self._tile_right)
-            l_w = tl.get_width()
-            r_w = tr.get_width()
-            m_w = tm.get_width()
-        else:
-            tl, tm, tr = self._tile_left, self._tile_mid, self._tile_right
+        if tl.get_height() != self.height:
+            tl, tm, tr = (pygame.transform.scale(t, (t.get_width(), self.height))
+                          for t in (tl, tm, tr))
+        l_w = tl.get_width()
+        r_w = tr.get_width()
+        m_w = tm.get_width()
 
         # Orta alanın genişliği
         inner_w = self.width - l_w - r_w
@@ -215,17 +212,10 @@ class Platform(pygame.sprite.Sprite):
 
         # Sol uç
         surface.blit(tl, (blit_x, blit_y))
-        # Orta kısım — döşe
-        cur_x = blit_x + l_w
-        while cur_x < blit_x + l_w + inner_w:
-            chunk_w = min(m_w, (blit_x + l_w + inner_w) - cur_x)
-            if chunk_w == m_w:
-                surface.blit(tm, (cur_x, blit_y))
-            else:
-                # Son parça: kırparak blit
-                sub = tm.subsurface(pygame.Rect(0, 0, chunk_w, self.height))
-                surface.blit(sub, (cur_x, blit_y))
-            cur_x += chunk_w
+        # Orta kısım — döşe; son parça area ile kırpılır
+        x0 = blit_x + l_w
+        for cur_x in range(x0, x0 + inner_w, m_w):
+            surface.blit(tm, (cur_x, blit_y), (0, 0, min(m_w, x0 + inner_w - cur_x), self.height))
         # Sağ uç
         surface.blit(tr, (blit_x + self.width - r_w, blit_y))
 
@@ -278,14 +268,13 @@ class EnemyProjectile(pygame.sprite.Sprite):
         self.color = (255, 0, 0)
         self.timer = 0
 
-    def update(self, camera_speed, dt=0.016, player_pos=None):
-        self.rect.x -= camera_speed
+    def update(self, dt=0.016, player_pos=None):
         self.rect.x += self.vx
         self.rect.y += self.vy
         self.timer  += dt
 
         # Renk titremesi kaldırıldı — tek renk, sade
-        if self.rect.right < 0 or self.rect.y > LOGICAL_HEIGHT or self.rect.y < 0:
+        if self.rect.right < world_camera.left or self.rect.y > LOGICAL_HEIGHT or self.rect.y < 0:
             self.kill()
 
     def draw(self, surface, camera_offset=(0, 0), theme=None):
@@ -319,10 +308,9 @@ class CursedEnemy(EnemyBase):
         self.direction = random.choice([-1, 1])
         self.timer     = 0
 
-    def update(self, camera_speed, dt=0.016, player_pos=None):
+    def update(self, dt=0.016, player_pos=None):
         if not self.is_active: return
         self.update_speech(dt)
-        self.rect.x -= camera_speed
         self.rect.x += self.speed * self.direction
 
         if self.rect.right > self.platform.rect.right:
@@ -331,7 +319,7 @@ class CursedEnemy(EnemyBase):
             self.direction = 1
 
         self.timer += dt
-        if self.rect.right < 0:        self.kill()
+        if self.rect.right < world_camera.left: self.kill()
         if not self.platform.alive():  self.kill()
 
     def draw(self, surface, camera_offset=(0, 0), theme=None):
@@ -384,13 +372,10 @@ class DroneEnemy(EnemyBase):
         self.move_timer   = 0
         self.recoil_x     = 0
 
-    def update(self, camera_speed, dt=0.016, player_pos=None):
+    def update(self, dt=0.016, player_pos=None):
         if not self.is_active: return
         self.update_speech(dt)
 
-        self.rect.x   -= camera_speed
-        self.target_x -= camera_speed
-
         self.move_timer -= dt
         if self.move_timer <= 0:
             self.move_timer = random.uniform(1.0, 2.5)
@@ -420,7 +405,7 @@ class DroneEnemy(EnemyBase):
             for group in self.groups():
                 group.add(projectile)
 
-        if self.rect.right < 0: self.kill()
+        if self.rect.right < world_camera.left: self.kill()
 
     def draw(self, surface, camera_offset=(0, 0), theme=None):
         if not self.is_active: return
@@ -477,11 +462,10 @@ class TankEnemy(EnemyBase):
         self.shoot_timer   = 0
         self.muzzle_flash  = 0
 
-    def update(self, camera_speed, dt=0.016, player_pos=None):
+    def update(self, dt=0.016, player_pos=None):
         if not self.is_active: return
         self.update_speech(dt)
 
-        self.rect.x -= camera_speed
         self.move_timer += dt
         self.vy += 0.8
         self.rect.y += self.vy
@@ -530,7 +514,7 @@ class TankEnemy(EnemyBase):
             for group in self.groups():
                 group.add(projectile)
 
-        if self.rect.right < 0:            self.kill()
+        if self.rect.right < world_camera.left: self.kill()
         if not self.platform.alive():      self.kill()
 
     def draw(self, surface, camera_offset=(0, 0), theme=None):
@@ -607,7 +591,7 @@ class NPC:
         surface.blit(box, rect.topleft)
         pygame.draw.rect(surface, self.color, rect, 2)
 
-        font  = pygame.font.Font(None, 17)
+        font  = get_font(17)
         label = font.render(self.name[:8], True, self.color)
         surface.blit(label, (rect.x + 2, rect.y + 2))
 
@@ -615,7 +599,7 @@ class NPC:
         if self.can_talk:
             bubble = pygame.Rect(draw_x + 10, draw_y - h - 20, 20, 16)
             pygame.draw.rect(surface, (240, 240, 240), bubble, border_radius=3)
-            ef   = pygame.font.Font(None, 18)
+            ef   = get_font(18)
             etxt = ef.render("E", True, (0, 0, 0))
             surface.blit(etxt, (bubble.x + 5, bubble.y + 1))
             # Talk radius çemberi — ince, yarı saydamlık ile
@@ -651,7 +635,7 @@ class AresBoss(EnemyBase):
         self.target_x   = x
         self.vy         = 0
 
-    def update(self, camera_speed, dt=0.016, player_pos=None):
+    def update(self, dt=0.016, player_pos=None):
         if not self.is_active: return
         self.update_speech(dt)
         px, py = 0, 0
@@ -728,7 +712,7 @@ class VasilBoss(EnemyBase):
         self.max_health = 3000
         self.state      = "IDLE"; self.timer = 0; self.angle_cnt = 0
 
-    def update(self, camera_speed, dt=0.016, player_pos=None):
+    def update(self, dt=0.016, player_pos=None):
         if not self.is_active: return
         self.update_speech(dt)
         self.rect.y = self.y + math.sin(pygame.time.get_ticks() * 0.002) * 30
@@ -802,7 +786,7 @@ class NexusBoss(EnemyBase):
         self.max_health  = 2000
         self.state       = "IDLE"; self.timer = 0; self.float_offset = 0
 
-    def update(self, camera_speed, dt=0.016, player_pos=None):
+    def update(self, dt=0.016, player_pos=None):
         if not self.is_active: return
         self.update_speech(dt)
         self.timer += dt
@@ -964,8 +948,7 @@ class HealthOrb(pygame.sprite.Sprite):
         self.life   = 8.0           # 8 saniye sonra kaybolur
         self._pulse = 0.0
 
-    def update(self, camera_speed, dt=0.016, player_pos=None):
-        self.rect.x -= camera_speed
+    def update(self, dt=0.016, player_pos=None):
         self.vy     += 0.3          # Yerçekimi
         self.rect.y += int(self.vy)
         if self.vy > 0 and self.rect.bottom >= LOGICAL_HEIGHT - 80:
@@ -973,7 +956,7 @@ class HealthOrb(pygame.sprite.Sprite):
             self.vy = -1.0          # Hafif sekme
         self.life   -= dt
         self._pulse += dt * 5
-        if self.life <= 0 or self.rect.right < 0:
+        if self.life <= 0 or self.rect.right < world_camera.left:
             self.kill()
 
     def draw(self, surface, camera_offset=(0, 0), theme=None):
@@ -982,9 +965,7 @@ class HealthOrb(pygame.sprite.Sprite):
         cy = self.rect.centery + oy
         radius = 8 + int(math.sin(self._pulse) * 2)
         # Dış parıltı
-        glow = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
-        pygame.draw.circle(glow, (0, 255, 80, 60), (radius * 2, radius * 2), radius * 2)
-        surface.blit(glow, (cx - radius * 2, cy - radius * 2))
+        glow_atlas.blit(surface, (0, 255, 80), cx, cy, radius * 2, 60)
         # Küre
         pygame.draw.circle(surface, (0, 220, 80),  (cx, cy), radius)
         pygame.draw.circle(surface, (150, 255, 180), (cx - 2, cy - 2), radius // 3)
@@ -1028,7 +1009,7 @@ class PlayerProjectile(pygame.sprite.Sprite):
         self._trail: list = [(self.rect.centerx, self.rect.centery)] * 4
 
     # ------------------------------------------------------------------
-    def update(self, camera_speed=0, dt: float = 0.016):
+    def update(self, dt: float = 0.016):
         """Mermiyi hareket ettir; ekran dışına çıkınca kendini yok et."""
         # Rule 1: frame_mul ile dt bazlı hareket — FPS'ten bağımsız
         frame_mul = dt * 60.0
@@ -1041,8 +1022,8 @@ class PlayerProjectile(pygame.sprite.Sprite):
         self.rect.x += int(self.vx * frame_mul)
         self.rect.y += int(self.vy * frame_mul)
 
-        # Ekran dışı kontrolü (yatay + dikey)
-        if (self.rect.left > LOGICAL_WIDTH or self.rect.right < 0
+        # Ekran dışı kontrolü (yatay kamerayla + dikey)
+        if (self.rect.left > world_camera.right or self.rect.right < world_camera.left
                 or self.rect.top > LOGICAL_HEIGHT or self.rect.bottom < 0):
             self.kill()
 
@@ -1144,7 +1125,7 @@ class Door:
                         0, math.pi, 2)
 
         # "KİLİTLİ" etiketi — dikey (kapı dar olduğu için döndürülür)
-        _font = pygame.font.Font(None, 15)
+        _font = get_font(15)
         _lbl  = _font.render("KİLİTLİ", True, self._COL_LABEL)
         _lbl  = pygame.transform.rotate(_lbl, 90)
         surface.blit(_lbl, (draw_r.x + 1, draw_r.y + 6))
@@ -1261,7 +1242,7 @@ class InteractiveTerminal:
         dist = math.sqrt((player_px - self.rect.centerx) ** 2 +
                          (player_py - self.rect.centery) ** 2)
         if dist < self._PROXIMITY_RADIUS:
-            _font = pygame.font.Font(None, 20)
+            _font = get_font(20)
             hint  = _font.render(self.prompt_text, True, prompt_col)
             hx    = draw_r.centerx - hint.get_width() // 2
             hy    = draw_r.top - 24
@@ -1306,7 +1287,7 @@ class WeaponChest(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(
             midbottom=(center_x, platform_rect.top)
         )
-        # Platform referansını sakla — kamera kaymasında birlikte hareket eder
+        # Platform referansını sakla — sandık konumunu platformdan okur
         # (float vs int drift'ini önler)
         self._platform_rect = platform_rect
         # Platformun solundan sandığın göreli X offseti
@@ -1314,18 +1295,13 @@ class WeaponChest(pygame.sprite.Sprite):
 
         self.is_open    = False    # True olunca sprite silinir
         self._pulse_t   = 0
-        self._font      = pygame.font.Font(None, 20)
+        self._font      = get_font(20)
         # Rastgele bir silah türü seç
         import random as _r
         self.weapon_type = _r.choice(self.WEAPON_POOL)
 
-    def update(self, camera_speed_px, dt):
-        """
-        Kamera hareketiyle birlikte kaydır — platformun üstünde sabit kal.
-        Platform.update() rect.x'i zaten güncelliyor; sandık ondan okur.
-        """
-        # platform_rect Platform.update() tarafından zaten kaydırıldı —
-        # burada tekrar kaydırmıyoruz, sadece pozisyonu okuyoruz.
+    def update(self, dt):
+        """Platformun üstünde sabit kal — konum platform rect'inden okunur."""
         self.rect.x      = self._platform_rect.x + self._rel_x
         self.rect.bottom = self._platform_rect.top
         self._pulse_t    = (self._pulse_t + 1) % 60
@@ -1374,7 +1350,7 @@ class WeaponChest(pygame.sprite.Sprite):
         surface.blit(lbl, (draw_r.centerx - lbl.get_width() // 2,
                            draw_r.bottom + 2))
 
-    def draw_prompt(self, surface, player_x, player_y):
+    def draw_prompt(self, surface, player_x, player_y, camera_offset=(0, 0)):
         """Oyuncu yakınsa 'E: SİLAHI AL' ipucunu göster."""
         dist = math.sqrt((player_x - self.rect.centerx) ** 2 +
                          (player_y - self.rect.centery) ** 2)
@@ -1382,12 +1358,12 @@ class WeaponChest(pygame.sprite.Sprite):
             return
 
         prompt_text = f"E: {self.weapon_type.upper()} AL"
-        font = pygame.font.Font(None, 26)
+        font = get_font(26)
         txt  = font.render(prompt_text, True, self._COL_PROMPT)
         bg   = pygame.Surface((txt.get_width() + 10, txt.get_height() + 6), pygame.SRCALPHA)
         bg.fill((0, 0, 0, 180))
-        px = self.rect.centerx - txt.get_width() // 2
-        py = self.rect.top - 32
+        px = self.rect.centerx - txt.get_width() // 2 + camera_offset[0]
+        py = self.rect.top - 32 + camera_offset[1]
         surface.blit(bg, (px - 5, py - 3))
         surface.blit(txt, (px, py))
 
@@ -1431,8 +1407,7 @@ class AmmoPickup(pygame.sprite.Sprite):
         else:
             self._color = self._COL_GENERIC
 
-    def update(self, camera_speed_px, dt):
-        self.rect.x -= int(camera_speed_px)
+    def update(self, dt):
         # Yerçekimi (yerden yüksek değil, kısa bir fırlama)
         self._vy = min(self._vy + 0.4, 6.0)
         self.rect.y += int(self._vy)
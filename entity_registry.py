@@ -0,0 +1,129 @@
+# entity_registry.py — FRAGMENTIA: KATEGORİLİ VARLIK KAYDI
+# =============================================================================
+# Boss mermileri all_enemies grubuna CursedEnemy / DroneEnemy / TankEnemy ve
+# boss'larla birlikte ekleniyordu; main.py'deki her düşman döngüsü (CCD,
+# spritecollide, çizim, slam/dash AOE) mermileri de gezip
+# isinstance(EnemyBullet) ile ayıklıyordu.
+#
+# Bu modül varlıkları türlerine göre ayrı koleksiyonlarda tutar:
+#
+#   KATEGORİ              TÜR (grup)                    main.py takma adı
+#   hostile_actors        enemies                       all_enemies
+#   hostile_projectiles   enemy_shots (+ NumPy havuzu)  hostile_shots
+#   pickups               health_orbs, ammo_pickups     all_health_orbs, all_ammo_pickups
+#   interactables         weapon_chests                 all_weapon_chests
+#
+# MİMARİ KURALLARI:
+#   • Her tür bir pygame.sprite.Group'tur → üyelik O(1), sıralı iterasyon.
+#   • add(entity) türü sınıf tablosundan (MRO) bulur; register() ile tanıtılır.
+#     Tanınmayan sınıflar eski davranış gereği düşman grubuna düşer.
+#   • Sprite olmayan havuzlar (enemy_projectiles) attach() ile kategoriye
+#     bağlanır; empty() onları da temizler.
+# =============================================================================
+
+from __future__ import annotations
+from itertools import chain
+from typing import Dict, Iterator, List, Tuple
+
+import pygame
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+HOSTILE_ACTORS      = "hostile_actors"
+HOSTILE_PROJECTILES = "hostile_projectiles"
+PICKUPS             = "pickups"
+INTERACTABLES       = "interactables"
+
+KIND_ENEMIES       = "enemies"
+KIND_ENEMY_SHOTS   = "enemy_shots"
+KIND_HEALTH_ORBS   = "health_orbs"
+KIND_AMMO_PICKUPS  = "ammo_pickups"
+KIND_WEAPON_CHESTS = "weapon_chests"
+
+CATEGORY_KINDS: Dict[str, Tuple[str, ...]] = {
+    HOSTILE_ACTORS:      (KIND_ENEMIES,),
+    HOSTILE_PROJECTILES: (KIND_ENEMY_SHOTS,),
+    PICKUPS:             (KIND_HEALTH_ORBS, KIND_AMMO_PICKUPS),
+    INTERACTABLES:       (KIND_WEAPON_CHESTS,),
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. EntityRegistry
+# ─────────────────────────────────────────────────────────────────────────────
+
+class EntityRegistry:
+    """
+    Kullanım:
+        all_enemies = entity_registry.group(KIND_ENEMIES)
+        entity_registry.register(EnemyBullet, KIND_ENEMY_SHOTS)
+        entity_registry.add(projectile)                      # türü tablodan
+        for e in entity_registry.iter(HOSTILE_ACTORS): ...
+        entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
+    """
+
+    def __init__(self):
+        self._groups: Dict[str, pygame.sprite.Group] = {
+            kind: pygame.sprite.Group()
+            for kinds in CATEGORY_KINDS.values() for kind in kinds
+        }
+        self._pools: Dict[str, List] = {cat: [] for cat in CATEGORY_KINDS}
+        self._types: Dict[type, str] = {}
+        self._kind_cache: Dict[type, str] = {}
+
+    # ── Kayıt ──────────────────────────────────────────────
+    def register(self, cls: type, kind: str):
+        if kind not in self._groups:
+            raise KeyError(f"Bilinmeyen varlık türü: {kind}")
+        self._types[cls] = kind
+        self._kind_cache.clear()
+
+    def attach(self, category: str, pool):
+        """clear() metodu olan sprite dışı havuzu kategoriye bağlar."""
+        self._pools[category].append(pool)
+
+    def kind_of(self, entity) -> str:
+        cls = type(entity)
+        kind = self._kind_cache.get(cls)
+        if kind is None:
+            kind = next((self._types[c] for c in cls.__mro__ if c in self._types),
+                        KIND_ENEMIES)
+            self._kind_cache[cls] = kind
+        return kind
+
+    # ── Erişim ─────────────────────────────────────────────
+    def group(self, kind: str) -> pygame.sprite.Group:
+        return self._groups[kind]
+
+    def add(self, entity, kind: str = None):
+        self._groups[kind or self.kind_of(entity)].add(entity)
+
+    def __contains__(self, entity) -> bool:
+        return self._groups[self.kind_of(entity)].has(entity)
+
+    def iter(self, category: str) -> Iterator:
+        kinds = CATEGORY_KINDS[category]
+        if len(kinds) == 1:
+            return iter(self._groups[kinds[0]])
+        return chain.from_iterable(self._groups[k] for k in kinds)
+
+    def count(self, category: str) -> int:
+        return (sum(len(self._groups[k]) for k in CATEGORY_KINDS[category])
+                + sum(len(p) for p in self._pools[category]))
+
+    def empty(self, *categories: str):
+        """Verilen kategorileri (boşsa hepsini) temizler."""
+        for cat in categories or tuple(CATEGORY_KINDS):
+            for kind in CATEGORY_KINDS[cat]:
+                self._groups[kind].empty()
+            for pool in self._pools[cat]:
+                pool.clear()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+entity_registry = EntityRegistry()
@@ -3,7 +3,7 @@ from settings import EASY_MODE_LEVELS
 # --- BOSS SABİTLERİ ---
 BULLET_SPEED = 8
 BOSS_HEALTH = 1000
-BOSS_DAMAGE = 10
+BOSS_DAMAGE = 30   # mermi isabeti başına oyuncu hasarı
 BOSS_FIRE_RATE = 60
 BOSS_INVULNERABILITY_TIME = 30
 
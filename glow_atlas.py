@@ -0,0 +1,100 @@
+# glow_atlas.py — FRAGMENTIA: IŞIMA (GLOW / HALO) ATLASI
+# =============================================================================
+# Mermi, boss ve enerji küresi çizimlerindeki yarı saydam halolar her frame
+# yeni bir SRCALPHA yüzey ayırıp üzerine daire çiziyordu (_draw_glow_circle
+# katman başına bir yüzey, draw_player_bullet mermi başına bir yüzey...).
+#
+# Bu modül her (renk, yarıçap, alfa, katman, aralık) anahtarı için haloyu
+# BİR KEZ çizer ve önbellekten blit eder. Önbellek LRU ile sınırlıdır.
+#
+# MİMARİ KURALLARI:
+#   • Katmanlar tek yüzeyde birleştirilir; i. katmanın alfası
+#     alpha * i / layers, yarıçapı radius + (layers - i) * spread.
+#   • Halo merkezi (cx, cy)'ye oturur — eski "yüzey + blit" hesabıyla aynı.
+#   • Alfa çok değerli animasyonlarda (titreşim) çağıran taraf alfayı
+#     kademelendirmeli (quantize_alpha) — aksi halde LRU boşuna döner.
+# =============================================================================
+
+from __future__ import annotations
+from collections import OrderedDict
+
+import pygame
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+GLOW_ATLAS_CAPACITY = 256
+GLOW_ALPHA_STEP     = 5      # quantize_alpha varsayılan adımı
+
+
+def quantize_alpha(alpha: int, step: int = GLOW_ALPHA_STEP) -> int:
+    return max(0, min(255, int(alpha) // step * step))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. GlowAtlas
+# ─────────────────────────────────────────────────────────────────────────────
+
+class GlowAtlas:
+    """
+    Kullanım:
+        glow_atlas.blit(surface, (0, 255, 80), cx, cy, radius=16, alpha=60)
+        glow_atlas.blit(surface, col, cx, cy, radius, alpha=60, layers=3)  # boss
+    """
+
+    def __init__(self, capacity: int = GLOW_ATLAS_CAPACITY):
+        self.capacity = capacity
+        self._cache: "OrderedDict[tuple, tuple]" = OrderedDict()   # key → (yüzey, yarım boy)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self):
+        self._cache.clear()
+
+    def get(self, color, radius: int, alpha: int, layers: int = 1, spread: int = 6):
+        """(yüzey, merkez ofseti) döndürür; yüzey merkez = (ofset, ofset)."""
+        key = (tuple(color[:3]), int(radius), int(alpha), int(layers), int(spread))
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = self._render(*key)
+        self._cache[key] = entry
+        if len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _render(color, radius, alpha, layers, spread):
+        outer = max(1, radius + (layers - 1) * spread)
+        half  = outer + 1
+        surf  = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        # Eski çoklu blit sırası: en içteki (en opak) katman önce
+        for i in range(layers, 0, -1):
+            r = radius + (layers - i) * spread
+            if r <= 0:
+                continue
+            layer = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            pygame.draw.circle(layer, (*color, int(alpha * i / layers)), (half, half), r)
+            surf.blit(layer, (0, 0))
+        return surf, half
+
+    def blit(self, surface, color, cx, cy, radius: int, alpha: int,
+             layers: int = 1, spread: int = 6):
+        if radius <= 0 or alpha <= 0:
+            return
+        surf, half = self.get(color, radius, alpha, layers, spread)
+        surface.blit(surf, (cx - half, cy - half))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+glow_atlas = GlowAtlas()
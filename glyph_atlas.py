@@ -0,0 +1,127 @@
+# glyph_atlas.py — FRAGMENTIA: GLİF ATLASI (MATRIX YAĞMURU / HEX DÖKÜMÜ)
+# =============================================================================
+# cutscene.MatrixRain.draw her sütun için her frame iki font.render çağırıyor
+# (baş + kuyruk, rastgele karakter) — 1920 / 20 genişlikte ~192 rasterize.
+# HexDumpView her satırı, IntroCutscene parçacık karakterleri her parçacığı
+# ayrı render ediyordu.
+#
+# Bu modül karakter kümesini (font, renk, alfa) başına BİR KEZ tek satırlık
+# bir atlas yüzeyine çizer; hücreler kaynak-dikdörtgenli blit ile, tercihen
+# tek Surface.blits çağrısında basılır.
+#
+# MİMARİ KURALLARI:
+#   • Glif = font.render(ch) çıktısının birebir kopyası → blit sonucu eski
+#     "render + blit" ile aynı pikselleri verir.
+#   • Atlasta olmayan karakter istenirse atlas birleşik kümeyle yeniden
+#     kurulur (nadir; karakter kümeleri sabit).
+#   • Alfa < 255 atlaslar piksel alfası çarpılarak pişirilir (set_alpha
+#     eşdeğeri); çağıran taraf alfayı kademelendirir (quantize_alpha).
+#   • Önbellek LRU ile sınırlıdır (GLYPH_ATLAS_CAPACITY).
+# =============================================================================
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+import pygame
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+GLYPH_ATLAS_CAPACITY = 64
+ALPHA_STEP           = 16     # pişmiş alfa kademesi (parçacık solması)
+
+
+def quantize_alpha(alpha: int) -> int:
+    """Alfayı ALPHA_STEP kademesine yuvarlar; (font, renk) başına ≤ 17 atlas."""
+    a = max(0, min(255, int(alpha)))
+    return 255 if a >= 255 - ALPHA_STEP // 2 else (a + ALPHA_STEP // 2) // ALPHA_STEP * ALPHA_STEP
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. GlyphStrip — tek (font, renk, alfa) atlası
+# ─────────────────────────────────────────────────────────────────────────────
+
+class GlyphStrip:
+    __slots__ = ("surface", "rects", "chars")
+
+    def __init__(self, font, color, chars: str, alpha: int = 255):
+        self.chars = "".join(dict.fromkeys(chars))
+        raw = getattr(font, "font", font)     # CachedFont → metin LRU'sunu doldurma
+        glyphs = [raw.render(ch, True, color) for ch in self.chars]
+        w = sum(g.get_width() for g in glyphs)
+        h = max((g.get_height() for g in glyphs), default=0)
+        self.surface = pygame.Surface((max(1, w), max(1, h)), pygame.SRCALPHA)
+        self.rects: Dict[str, pygame.Rect] = {}
+        x = 0
+        for ch, g in zip(self.chars, glyphs):
+            self.surface.blit(g, (x, 0))
+            self.rects[ch] = pygame.Rect(x, 0, g.get_width(), g.get_height())
+            x += g.get_width()
+        if alpha < 255:
+            self.surface.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+
+    def cell(self, ch: str, pos) -> Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]:
+        """Surface.blits için (kaynak, hedef, alan) üçlüsü."""
+        return (self.surface, pos, self.rects[ch])
+
+    def line(self, text: str, x: int, y: int) -> List[tuple]:
+        """Metni glif genişlikleriyle soldan sağa dizen blits girdileri."""
+        out = []
+        rects, surf = self.rects, self.surface
+        for ch in text:
+            r = rects[ch]
+            out.append((surf, (x, y), r))
+            x += r.width
+        return out
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. GlyphAtlas
+# ─────────────────────────────────────────────────────────────────────────────
+
+class GlyphAtlas:
+    """
+    Kullanım:
+        head = glyph_atlas.get(font, HACKER_GREEN, rain.chars)
+        cells.append(head.cell(ch, (x, y)))
+        surface.blits(cells, False)
+
+        glyph_atlas.draw_text(surface, font, DATA_BLUE, "0x00FF  A0 B1", x, y)
+    """
+
+    def __init__(self, capacity: int = GLYPH_ATLAS_CAPACITY):
+        self.capacity = capacity
+        self._cache: "OrderedDict[tuple, GlyphStrip]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self):
+        self._cache.clear()
+
+    def get(self, font, color, chars: Iterable[str], alpha: int = 255) -> GlyphStrip:
+        key = (font, tuple(color[:3]), int(alpha))
+        strip = self._cache.get(key)
+        if strip is not None:
+            self._cache.move_to_end(key)
+            missing = [ch for ch in chars if ch not in strip.rects]
+            if not missing:
+                return strip
+            chars = strip.chars + "".join(missing)
+        strip = GlyphStrip(font, color, "".join(chars), int(alpha))
+        self._cache[key] = strip
+        if len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+        return strip
+
+    def draw_text(self, surface, font, color, text: str, x: int, y: int):
+        surface.blits(self.get(font, color, text).line(text, x, y), False)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 4. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+glyph_atlas = GlyphAtlas()
@@ -0,0 +1,220 @@
+# hud_compositor.py — FRAGMENTIA: KATMANLI HUD BİRLEŞTİRİCİ
+# =============================================================================
+# Eski yöntem: skor her değiştiğinde (koşarken neredeyse her frame)
+# 1920×1080 SRCALPHA bir yüzey ayrılıyor ve render_ui tüm HUD'u baştan
+# çiziyordu.
+#
+# Bu modül PLAYING HUD'unu bağımsız widget'lara böler (HP/stamina, karma,
+# skor, silah, sandık ipucu, görevler, karma bildirimi). Her widget kendi
+# küçük yüzeyini ve içerik anahtarını tutar; anahtar değişmedikçe yeniden
+# çizilmez, sadece önbellekteki yüzey blit edilir.
+#
+# MİMARİ KURALLARI:
+#   • Çizim kodu ui_system.draw_hud_*() fonksiyonlarındadır — render_ui ile
+#     ortak. Burada sadece önbellek + yerleşim vardır.
+#   • İçerik anahtarı, widget'ın piksellerini belirleyen değerlerin tuple'ıdır.
+#     Anahtar None ise widget gizlidir.
+#   • Tam ekran ara yüzey YOK. PLAYING dışındaki state'ler (menü, envanter,
+#     duraklatma...) render_ui ile doğrudan hedef yüzeye çizilir.
+#   • Bölüm değişiminde invalidate() çağrılır (init_game).
+# =============================================================================
+
+from __future__ import annotations
+import math
+from typing import Callable, Dict, Optional
+
+import pygame
+
+from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT, THEMES
+from utils import draw_text_with_shadow
+from text_cache import get_font
+from ui_system import (render_ui, draw_hud_vitals, draw_hud_karma, draw_hud_score,
+                       draw_hud_weapon, draw_hud_chest_prompt, draw_hud_objectives,
+                       hud_objectives_size, karma_notification_color,
+                       HUD_VITALS_RECT, HUD_KARMA_RECT, HUD_OBJECTIVES_POS,
+                       HUD_SCORE_W, HUD_SCORE_H, HUD_WEAPON_W, HUD_WEAPON_H)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+NOTIFY_FONT_SIZE = 40
+NOTIFY_CENTER    = (LOGICAL_WIDTH // 2, LOGICAL_HEIGHT // 2 - 100)
+SHADOW_OFFSET    = 2     # draw_text_with_shadow varsayılan gölge kayması
+# Silah bekleme süresi anahtara bu adımla girer: ateş ederken her frame
+# değil en fazla ~20 Hz yeniden çizim (dolum çubukları adım başına ≤ birkaç px)
+HUD_COOLDOWN_STEP = 0.05   # sn
+
+_CLEAR = (0, 0, 0, 0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. HUDWidget
+# ─────────────────────────────────────────────────────────────────────────────
+
+class HUDWidget:
+    """
+    Tek bir HUD parçası: ekran rect'i + önbellek yüzeyi + içerik anahtarı.
+
+    draw_fn(surface, origin) widget'ı mantıksal ekran koordinatlarında çizer;
+    origin = rect.topleft olduğu için çizim küçük yüzeye oturur.
+    """
+
+    def __init__(self, name: str, rect, draw_fn: Callable):
+        self.name    = name
+        self.rect    = pygame.Rect(rect)
+        self.draw_fn = draw_fn
+        self.key     = None
+        self.surface: Optional[pygame.Surface] = None
+        self.renders = 0          # Kaç kez yeniden çizildi (profil/debug)
+
+    def resize(self, rect):
+        """Boyut değişirse yüzey yeniden ayrılır; sadece konum değişirse korunur."""
+        rect = pygame.Rect(rect)
+        if rect.size != self.rect.size:
+            self.surface = None
+            self.key = None
+        self.rect = rect
+
+    def update(self, key, *args) -> bool:
+        """Anahtar değiştiyse yeniden çizer. Çizim yapıldıysa True."""
+        if key == self.key:
+            return False
+        self.key = key
+        if key is None:
+            return False
+        if self.surface is None:
+            self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        else:
+            self.surface.fill(_CLEAR)
+        self.draw_fn(self.surface, self.rect.topleft, *args)
+        self.renders += 1
+        return True
+
+    def blit(self, target):
+        if self.key is not None and self.surface is not None:
+            target.blit(self.surface, self.rect.topleft)
+
+    def invalidate(self):
+        self.key = None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. HUDCompositor
+# ─────────────────────────────────────────────────────────────────────────────
+
+class HUDCompositor:
+    """
+    Kullanım (main.py, çizim adımı 12):
+        active_ui_elements = hud_compositor.compose(game_canvas, GAME_STATE,
+                                                    ui_data, mouse_pos)
+
+    Karma bildirimi kendi katman sırasında çizilir:
+        hud_compositor.draw_notification(game_canvas, karma_notification_text)
+    """
+
+    def __init__(self, screen_w: int = LOGICAL_WIDTH, screen_h: int = LOGICAL_HEIGHT):
+        self.screen_w = screen_w
+        self.screen_h = screen_h
+        w, h = screen_w, screen_h
+
+        self.vitals = HUDWidget("vitals", HUD_VITALS_RECT,
+                                lambda s, o, d: draw_hud_vitals(s, d, o))
+        self.karma = HUDWidget("karma", HUD_KARMA_RECT,
+                               lambda s, o, d: draw_hud_karma(s, d, o))
+        self.score = HUDWidget("score", (w - HUD_SCORE_W, 0, HUD_SCORE_W, HUD_SCORE_H),
+                               lambda s, o, d: draw_hud_score(s, d, w, o))
+        # Silah HUD'u yüzeyin sağ/alt kenarına göre yerleşir → origin gerekmez
+        self.weapon = HUDWidget("weapon", (w - HUD_WEAPON_W, h - HUD_WEAPON_H,
+                                           HUD_WEAPON_W, HUD_WEAPON_H),
+                                lambda s, o, d: draw_hud_weapon(s, d))
+        self.chest_prompt = HUDWidget("chest_prompt", (w // 2 - 150, h - 210, 300, 50),
+                                      lambda s, o: draw_hud_chest_prompt(s, w, h, o))
+        self.objectives = HUDWidget("objectives", (*HUD_OBJECTIVES_POS, 0, 0),
+                                    lambda s, o, objs: draw_hud_objectives(s, objs, o))
+        self.notification = HUDWidget("notification", (0, 0, 0, 0), self._draw_notification)
+
+        self.widgets: Dict[str, HUDWidget] = {
+            wd.name: wd for wd in (self.vitals, self.karma, self.objectives,
+                                   self.score, self.weapon, self.chest_prompt)
+        }
+        self._notify_font: Optional[pygame.font.Font] = None
+
+    # ── Önbellek ───────────────────────────────────────────
+    def invalidate(self):
+        """Tüm widget'ları bir sonraki frame'de yeniden çizdirir."""
+        for wd in self.widgets.values():
+            wd.invalidate()
+        self.notification.invalidate()
+
+    # ── Ana giriş ──────────────────────────────────────────
+    def compose(self, target, state, data, mouse_pos=(0, 0)):
+        """HUD'u target'a çizer; render_ui gibi tıklanabilir alanları döndürür."""
+        if state != 'PLAYING':
+            return render_ui(target, state, data, mouse_pos)
+
+        theme = data.get('theme') or THEMES[0]
+        hp_max = data.get('player_hp_max', 100) or 1
+        st_max = data.get('stamina_max', 100) or 1
+        hp_cur = data.get('player_hp', 100)
+        st_cur = data.get('stamina', 100)
+        self.vitals.update(
+            (data['level_idx'], tuple(theme["border_color"]),
+             max(0, int(hp_cur)), hp_max, int(220 * max(0.0, min(1.0, hp_cur / hp_max))),
+             int(st_cur), st_max, int(220 * max(0.0, min(1.0, st_cur / st_max)))),
+            data)
+
+        self.karma.update((data.get('karma', 0), data.get('kills', 0)), data)
+
+        goal = data['level_data'].get('goal_score', 0)
+        self.score.update((int(data['score']), goal), data)
+
+        if data.get('active_weapon') is None:
+            weapon_key = None
+        else:
+            weapon_key = (data['active_weapon'], data.get('player_bullets', 0),
+                          data.get('mag_size', 6), data.get('spare_mags', 0),
+                          math.ceil(data.get('gun_cooldown', 0.0) / HUD_COOLDOWN_STEP),
+                          data.get('is_reloading', False),
+                          tuple(data.get('inventory_weapons', ())))
+        self.weapon.update(weapon_key, data)
+
+        self.chest_prompt.update(True if data.get('chest_prompt') else None)
+
+        objectives = tuple(data.get('objectives', ()))
+        if objectives != self.objectives.key:
+            if objectives:
+                self.objectives.resize((*HUD_OBJECTIVES_POS, *hud_objectives_size(objectives)))
+            self.objectives.update(objectives or None, objectives)
+
+        for wd in self.widgets.values():
+            wd.blit(target)
+        return {}
+
+    # ── Karma bildirimi ────────────────────────────────────
+    def draw_notification(self, target, text: str):
+        """Ekran ortasındaki kısa bildirim; metin değişmedikçe yeniden çizilmez."""
+        if not text:
+            return
+        wd = self.notification
+        if text != wd.key:
+            if self._notify_font is None:
+                self._notify_font = get_font(NOTIFY_FONT_SIZE)
+            tw, th = self._notify_font.size(text)
+            cx, cy = NOTIFY_CENTER
+            wd.resize((cx - tw // 2, cy - th // 2, tw + SHADOW_OFFSET, th + SHADOW_OFFSET))
+            wd.update(text, text)
+        wd.blit(target)
+
+    def _draw_notification(self, surface, origin, text):
+        ox, oy = origin
+        cx, cy = NOTIFY_CENTER
+        draw_text_with_shadow(surface, text, self._notify_font, (cx - ox, cy - oy),
+                              karma_notification_color(text), align="center")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 4. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+hud_compositor = HUDCompositor()
@@ -4,6 +4,10 @@ from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT
 from game_config import BULLET_SPEED, BOSS_HEALTH, BOSS_DAMAGE, BOSS_FIRE_RATE, BOSS_INVULNERABILITY_TIME
 from vfx import Shockwave
 from drawing_utils import draw_warrior_silhouette, draw_vasi_silhouette
+from glow_atlas import glow_atlas, quantize_alpha
+from enemy_projectiles import enemy_projectiles
+from text_cache import get_font
+from viewport import world_camera
 
 # ═══════════════════════════════════════════════════════════════════════════
 # LOCAL BOSS SINIFLARI — PLACEHOLDER GÖRSELLEŞTİRME
@@ -17,6 +21,108 @@ from drawing_utils import draw_warrior_silhouette, draw_vasi_silhouette
 # Mantıksal (update/shoot/take_damage) hiçbir şey değişmedi.
 # ═══════════════════════════════════════════════════════════════════════════
 
+# ── Vasil arena arka planı: statik sis bir kez pişirilir ─────────────────
+# Eski çizim her frame ~180 sis şeridi + 9 çizgi için yeni SRCALPHA yüzey
+# ayırıyordu. Sis zamandan bağımsız → tek yüzeye pişirilir. Sütun / uçurum
+# çizgileri tek renkli → havuzdaki yüzeyler sadece alfa değişince yeniden doldurulur.
+
+_PILLAR_COLOR   = (160, 0, 200)
+_PILLAR_GLOW    = (180, 0, 220)
+_PIT_COLOR      = (220, 0, 30)
+_PIT_EDGE_COLOR = (180, 0, 25)
+_PIT_HALF       = 230
+_FOG_STRIP      = 6
+
+
+class VasilArenaBackground:
+    """
+    Kullanım:
+        vasil_arena_bg.prepare(LOGICAL_WIDTH, LOGICAL_HEIGHT)   # bölüm kurulumu
+        vasil_arena_bg.draw(game_canvas, fight_timer)           # her frame
+    prepare() aynı boyutla tekrar çağrılırsa hiçbir şey yapmaz.
+    """
+
+    def __init__(self):
+        self.size = None
+        self._fog = None
+        self._pillars = []
+        self._pit = None
+        self._pit_edge = None
+
+    def prepare(self, logical_w: int, logical_h: int):
+        if self.size == (logical_w, logical_h):
+            return
+        self.size = (logical_w, logical_h)
+
+        # Gradyan zemin sisi (şeritler örtüşmez → tek yüzeyde aynı sonuç)
+        fog = pygame.Surface((logical_w, logical_h), pygame.SRCALPHA)
+        for row in range(0, logical_h, _FOG_STRIP):
+            ratio = row / logical_h
+            fog.fill((int(6 + ratio * 18), int(ratio * 2), int(10 + ratio * 22),
+                      max(0, int(110 - ratio * 80))),
+                     (0, row, logical_w, _FOG_STRIP))
+        self._fog = fog
+
+        self._pillars  = [self._solid((2, logical_h), _PILLAR_COLOR) for _ in range(6)]
+        self._pit      = self._solid((_PIT_HALF * 2, 4), _PIT_COLOR)
+        self._pit_edge = self._solid((2, logical_h - 100), _PIT_EDGE_COLOR)
+
+    @staticmethod
+    def _solid(size, color):
+        return [pygame.Surface(size, pygame.SRCALPHA), color, -1]
+
+    @staticmethod
+    def _blit_solid(surface, entry, alpha, pos):
+        """Havuzdaki yüzeyi sadece alfa değişince yeniden doldurur."""
+        s, color, last = entry
+        if alpha != last:
+            s.fill((*color, alpha))
+            entry[2] = alpha
+        surface.blit(s, pos)
+
+    def draw(self, surface, fight_timer: float):
+        if self.size is None:
+            self.prepare(*surface.get_size())
+        logical_w, logical_h = self.size
+        surface.blit(self._fog, (0, 0))
+
+        # ── Hareketli dikey enerji sütunları ─────────────────────────────
+        pulse_base = fight_timer * 1.4
+        glow_y = logical_h - 105
+        for col_i, col_x in enumerate([100, 260, 480, logical_w - 480,
+                                        logical_w - 260, logical_w - 100]):
+            flicker = abs(math.sin(pulse_base + col_i * 1.1))
+            self._blit_solid(surface, self._pillars[col_i], int(flicker * 55 + 5), (col_x, 0))
+            # Alt parlama noktası
+            glow_atlas.blit(surface, _PILLAR_GLOW, col_x, glow_y, int(8 + flicker * 12),
+                            quantize_alpha(flicker * 60 + 10))
+
+        # ── Zemin uçurum çizgisi (orta boşluğun kırmızı uyarısı) ─────────
+        pit_cx = logical_w // 2
+        pit_a  = int(abs(math.sin(fight_timer * 2.2)) * 130 + 40)
+        self._blit_solid(surface, self._pit, pit_a, (pit_cx - _PIT_HALF, logical_h - 100))
+        # Uçurum altına inen kırmızı "sonsuzluk" çizgileri
+        edge_a = int(pit_a * 0.55)
+        for edge_x in (pit_cx - _PIT_HALF, pit_cx + _PIT_HALF - 2):
+            self._blit_solid(surface, self._pit_edge, edge_a, (edge_x, 100))
+
+        # ── Köşe arena çerçevesi ──────────────────────────────────────────
+        arm = 60
+        cf  = int(abs(math.sin(fight_timer * 0.9)) * 40 + 80)
+        corner_col = (cf, 0, int(cf * 1.3))
+        for cx2, cy2, sx, sy in [
+            (0,           0,            1,  1),
+            (logical_w-1, 0,           -1,  1),
+            (0,           logical_h-1,  1, -1),
+            (logical_w-1, logical_h-1, -1, -1),
+        ]:
+            pygame.draw.line(surface, corner_col, (cx2, cy2), (cx2 + sx * arm, cy2), 2)
+            pygame.draw.line(surface, corner_col, (cx2, cy2), (cx2, cy2 + sy * arm), 2)
+
+
+vasil_arena_bg = VasilArenaBackground()
+
+
 def draw_vasil_arena_bg(surface, fight_timer: float, logical_w: int, logical_h: int):
     """
     Level 0 Vasil intro fight için özel arena arka plan katmanı.
@@ -24,67 +130,13 @@ def draw_vasil_arena_bg(surface, fight_timer: float, logical_w: int, logical_h:
     current_level_idx == 0 iken çağrılır.
 
     Çizer:
-      - Koyu kırmızı-mor gradyan zemin sis katmanı
+      - Koyu kırmızı-mor gradyan zemin sis katmanı (pişirilmiş)
       - Hareketli enerji çizgileri (dikey, pillar efekti)
-      - Dönen sinirsel bağlantı ağı (background pulse)
       - Zemin ortasındaki "uçurum" görsel uyarısı (kırmızı parlayan çizgi)
       - Köşe çerçeve çizgileri (arena sınırı hissi)
     """
-    # ── Gradyan zemin sisi ────────────────────────────────────────────────
-    for row in range(0, logical_h, 6):
-        ratio   = row / logical_h
-        r_val   = int(6  + ratio * 18)
-        g_val   = int(0  + ratio * 2)
-        b_val   = int(10 + ratio * 22)
-        alpha   = max(0, int(110 - ratio * 80))
-        strip_s = pygame.Surface((logical_w, 6), pygame.SRCALPHA)
-        strip_s.fill((r_val, g_val, b_val, alpha))
-        surface.blit(strip_s, (0, row))
-
-    # ── Hareketli dikey enerji sütunları ─────────────────────────────────
-    import math as _m
-    pulse_base = fight_timer * 1.4
-    for col_i, col_x in enumerate([100, 260, 480, logical_w - 480,
-                                    logical_w - 260, logical_w - 100]):
-        flicker = abs(_m.sin(pulse_base + col_i * 1.1))
-        a_line  = int(flicker * 55 + 5)
-        ls      = pygame.Surface((2, logical_h), pygame.SRCALPHA)
-        ls.fill((160, 0, 200, a_line))
-        surface.blit(ls, (col_x, 0))
-        # Alt parlama noktası
-        glow_y  = logical_h - 105
-        glow_r  = int(8 + flicker * 12)
-        gs2     = pygame.Surface((glow_r * 2, glow_r * 2), pygame.SRCALPHA)
-        pygame.draw.circle(gs2, (180, 0, 220, int(flicker * 60 + 10)),
-                           (glow_r, glow_r), glow_r)
-        surface.blit(gs2, (col_x - glow_r, glow_y - glow_r))
-
-    # ── Zemin uçurum çizgisi (orta boşluğun kırmızı uyarısı) ─────────────
-    pit_cx     = logical_w // 2
-    pit_half   = 230
-    pit_pulse  = abs(_m.sin(fight_timer * 2.2))
-    pit_a      = int(pit_pulse * 130 + 40)
-    pit_s      = pygame.Surface((pit_half * 2, 4), pygame.SRCALPHA)
-    pit_s.fill((220, 0, 30, pit_a))
-    surface.blit(pit_s, (pit_cx - pit_half, logical_h - 100))
-    # Uçurum altına inen kırmızı "sonsuzluk" çizgileri
-    for edge_x in (pit_cx - pit_half, pit_cx + pit_half - 2):
-        ls2 = pygame.Surface((2, logical_h - 100), pygame.SRCALPHA)
-        ls2.fill((180, 0, 25, int(pit_a * 0.55)))
-        surface.blit(ls2, (edge_x, 100))
-
-    # ── Köşe arena çerçevesi ──────────────────────────────────────────────
-    arm = 60
-    cf  = int(abs(_m.sin(fight_timer * 0.9)) * 40 + 80)
-    corner_col = (cf, 0, int(cf * 1.3))
-    for cx2, cy2, sx, sy in [
-        (0,           0,            1,  1),
-        (logical_w-1, 0,           -1,  1),
-        (0,           logical_h-1,  1, -1),
-        (logical_w-1, logical_h-1, -1, -1),
-    ]:
-        pygame.draw.line(surface, corner_col, (cx2, cy2), (cx2 + sx * arm, cy2), 2)
-        pygame.draw.line(surface, corner_col, (cx2, cy2), (cx2, cy2 + sy * arm), 2)
+    vasil_arena_bg.prepare(logical_w, logical_h)
+    vasil_arena_bg.draw(surface, fight_timer)
 
 
 def _boss_hitbox(surface, x, y, w, h, border_color, label, health, max_health):
@@ -111,7 +163,7 @@ def _boss_hitbox(surface, x, y, w, h, border_color, label, health, max_health):
         pygame.draw.line(surface, border_color, (cx, cy), (cx, cy + dy * corner), 2)
 
     # Etiket
-    font = pygame.font.Font(None, 22)
+    font = get_font(22)
     lbl  = font.render(label, True, border_color)
     surface.blit(lbl, (rect.x + 4, rect.y + 4))
 
@@ -125,6 +177,8 @@ def _boss_hitbox(surface, x, y, w, h, border_color, label, health, max_health):
 
 
 # ─── ENEMY BULLET ───────────────────────────────────────────────────────────
+# Boss atışları artık enemy_projectiles havuzundan gider; sprite sürümü tekil
+# kullanım için duruyor.
 class EnemyBullet(pygame.sprite.Sprite):
     def __init__(self, x, y, vx, vy, damage):
         super().__init__()
@@ -136,19 +190,20 @@ class EnemyBullet(pygame.sprite.Sprite):
         self.radius = 8
         self.rect   = pygame.Rect(int(x) - 8, int(y) - 8, 16, 16)
 
-    def update(self, camera_speed, dt, player_pos=None):
+    def update(self, dt, player_pos=None):
         self.x += self.vx
         self.y += self.vy
-        self.x -= camera_speed
         self.rect.center = (int(self.x), int(self.y))
-        if (self.x < -100 or self.x > LOGICAL_WIDTH + 100
+        if (self.x < world_camera.left - 100 or self.x > world_camera.right + 100
                 or self.y < -100 or self.y > LOGICAL_HEIGHT + 100):
             self.kill()
 
-    def draw(self, surface, theme):
+    def draw(self, surface, theme=None, camera_offset=(0, 0)):
         # [PLACEHOLDER] Mermi — kırmızı dolu daire
-        pygame.draw.circle(surface, (220, 30,  30), (int(self.x), int(self.y)), self.radius)
-        pygame.draw.circle(surface, (255, 200,   0), (int(self.x), int(self.y)), self.radius, 1)
+        ox, oy = camera_offset
+        c = (int(self.x) + ox, int(self.y) + oy)
+        pygame.draw.circle(surface, (220, 30,  30), c, self.radius)
+        pygame.draw.circle(surface, (255, 200,   0), c, self.radius, 1)
 
 
 # ─── NEXUS BOSS (local) ─────────────────────────────────────────────────────
@@ -167,9 +222,7 @@ class NexusBoss(pygame.sprite.Sprite):
         self.phase              = 1
         self.rect               = pygame.Rect(int(x) - 40, int(y) - 40, 80, 80)
 
-    def update(self, camera_speed, dt, player_pos):
-        if not getattr(self, 'ignore_camera_speed', False):
-            self.x -= camera_speed
+    def update(self, dt, player_pos):
         self.fire_timer += 1
         if self.fire_timer >= BOSS_FIRE_RATE:
             self.fire_timer = 0
@@ -182,21 +235,18 @@ class NexusBoss(pygame.sprite.Sprite):
         self.rect.center = (int(self.x), int(self.y))
 
     def shoot(self, player_pos):
-        dx = player_pos[0] - self.x
-        dy = player_pos[1] - self.y
-        dist = max(0.1, math.sqrt(dx * dx + dy * dy))
-        dx /= dist; dy /= dist
-        bullet = EnemyBullet(self.x, self.y, dx * BULLET_SPEED, dy * BULLET_SPEED, BOSS_DAMAGE)
-        self.spawn_queue.append(bullet)
+        enemy_projectiles.emit_aimed(self.x, self.y, player_pos, 1, 0.0,
+                                     BULLET_SPEED, BOSS_DAMAGE)
 
     def enter_phase2(self):
         pass
 
-    def draw(self, surface, theme):
+    def draw(self, surface, theme=None, camera_offset=(0, 0)):
+        ox, oy = camera_offset
         label = f"NEXUS  P{self.phase}"
         if self.invulnerable_timer > 0:
             label += "  [INV]"
-        _boss_hitbox(surface, int(self.x), int(self.y),
+        _boss_hitbox(surface, int(self.x) + ox, int(self.y) + oy,
                      80, 80, self.BORDER, label,
                      self.health, self.max_health)
 
@@ -226,9 +276,7 @@ class AresBoss(pygame.sprite.Sprite):
         self.phase              = 1
         self.rect               = pygame.Rect(int(x) - 40, int(y) - 55, 80, 110)
 
-    def update(self, camera_speed, dt, player_pos):
-        if not getattr(self, 'ignore_camera_speed', False):
-            self.x -= camera_speed
+    def update(self, dt, player_pos):
         self.fire_timer += 1
         if self.fire_timer >= BOSS_FIRE_RATE:
             self.fire_timer = 0
@@ -241,26 +289,21 @@ class AresBoss(pygame.sprite.Sprite):
         self.rect.center = (int(self.x), int(self.y))
 
     def shoot(self, player_pos):
-        for angle in [-0.2, 0, 0.2]:
-            dx = player_pos[0] - self.x
-            dy = player_pos[1] - self.y
-            dist = max(0.1, math.sqrt(dx * dx + dy * dy))
-            dx /= dist; dy /= dist
-            new_dx = dx * math.cos(angle) - dy * math.sin(angle)
-            new_dy = dx * math.sin(angle) + dy * math.cos(angle)
-            bullet = EnemyBullet(self.x, self.y, new_dx * BULLET_SPEED, new_dy * BULLET_SPEED, BOSS_DAMAGE)
-            self.spawn_queue.append(bullet)
+        # -0.2 / 0 / +0.2 rad yelpaze
+        enemy_projectiles.emit_aimed(self.x, self.y, player_pos, 3, 0.2,
+                                     BULLET_SPEED, BOSS_DAMAGE)
 
     def enter_phase2(self):
         pass
 
-    def draw(self, surface, theme):
+    def draw(self, surface, theme=None, camera_offset=(0, 0)):
+        ox, oy = camera_offset
         label = f"ARES  P{self.phase}"
         if self.invulnerable_timer > 0:
             label += "  [INV]"
         # [PLACEHOLDER] — Savaşçı boyutunda kutu (55*1.4 ≈ 77 → 80px)
         # Pixel artist: draw_warrior_silhouette çağrısını burada kullanacak
-        _boss_hitbox(surface, int(self.x), int(self.y),
+        _boss_hitbox(surface, int(self.x) + ox, int(self.y) + oy,
                      80, 110, self.BORDER, label,
                      self.health, self.max_health)
 
@@ -319,11 +362,7 @@ class VasilBoss(pygame.sprite.Sprite):
         self._pattern_cycle     = 0     # Hangi atış deseni aktif
 
     # ── GÜNCELLEME ──────────────────────────────────────────────────────────
-    def update(self, camera_speed, dt, player_pos):
-        # Kamera
-        if not getattr(self, 'ignore_camera_speed', False):
-            self.x -= camera_speed
-
+    def update(self, dt, player_pos):
         # Süre sayaçları
         self._float_timer += dt * self._HOVER_SPEED
         self._fight_timer += dt
@@ -384,36 +423,16 @@ class VasilBoss(pygame.sprite.Sprite):
             self._shoot_ring(count=6 if self.phase == 1 else 10)
 
     def _shoot_aimed(self, player_pos, spread_count=3, spread_angle=0.22):
-        dx   = player_pos[0] - self.x
-        dy   = player_pos[1] - self.y
-        dist = max(0.1, math.sqrt(dx * dx + dy * dy))
-        dx  /= dist
-        dy  /= dist
-        base = math.atan2(dy, dx)
-        half = (spread_count - 1) / 2.0
-        spd  = BULLET_SPEED * (1.25 if self.phase == 2 else 1.0)
-        for i in range(spread_count):
-            a = base + (i - half) * spread_angle
-            self.spawn_queue.append(
-                EnemyBullet(self.x, self.y, math.cos(a) * spd, math.sin(a) * spd, BOSS_DAMAGE)
-            )
+        spd = BULLET_SPEED * (1.25 if self.phase == 2 else 1.0)
+        enemy_projectiles.emit_aimed(self.x, self.y, player_pos, spread_count,
+                                     spread_angle, spd, BOSS_DAMAGE)
 
     def _shoot_spiral(self, arms=2):
-        base = self.fire_timer * 0.14
-        spd  = BULLET_SPEED
-        for i in range(arms):
-            a = base + (math.pi * 2 / arms) * i
-            self.spawn_queue.append(
-                EnemyBullet(self.x, self.y, math.cos(a) * spd, math.sin(a) * spd, BOSS_DAMAGE)
-            )
+        enemy_projectiles.emit_spiral(self.x, self.y, self.fire_timer * 0.14, arms,
+                                      BULLET_SPEED, BOSS_DAMAGE)
 
     def _shoot_ring(self, count=6):
-        spd = BULLET_SPEED * 0.9
-        for i in range(count):
-            a = (math.pi * 2 / count) * i
-            self.spawn_queue.append(
-                EnemyBullet(self.x, self.y, math.cos(a) * spd, math.sin(a) * spd, BOSS_DAMAGE)
-            )
+        enemy_projectiles.emit_ring(self.x, self.y, count, BULLET_SPEED * 0.9, BOSS_DAMAGE)
 
     # ── YARDIMCILAR ─────────────────────────────────────────────────────────
     def say(self, text, duration=3.0):
@@ -467,12 +486,13 @@ class VasilBoss(pygame.sprite.Sprite):
         return False   # Vasil hiçbir zaman "öldü" sinyali vermez
 
     # ── ÇİZİM ───────────────────────────────────────────────────────────────
-    def draw(self, surface, theme):
-        cx = int(self.x)
-        cy = int(self.y)
+    def draw(self, surface, theme=None, camera_offset=(0, 0)):
+        ox, oy = camera_offset
+        cx = int(self.x) + ox
+        cy = int(self.y) + oy
 
         # 1. Zemin gölgesi (boss havada, gölge aşağıda küçülür)
-        shadow_y = LOGICAL_HEIGHT - 108
+        shadow_y = LOGICAL_HEIGHT - 108 + oy
         dist_to_floor = max(1, shadow_y - cy)
         shadow_w = max(10, int(65 - dist_to_floor * 0.06))
         shadow_h = max(3, int(shadow_w * 0.18))
@@ -506,25 +526,25 @@ class VasilBoss(pygame.sprite.Sprite):
 
         # 5. Konuşma balonu
         if self._speech_timer > 0 and self._speech_text:
-            self._draw_speech_bubble(surface)
+            self._draw_speech_bubble(surface, cx, cy)
 
-    def _draw_speech_bubble(self, surface):
+    def _draw_speech_bubble(self, surface, cx, cy):
         try:
-            font = pygame.font.Font(None, 22)
+            font = get_font(22)
         except Exception:
             return
         pad = 10
         txt = font.render(self._speech_text, True, (220, 210, 255))
         bw  = txt.get_width()  + pad * 2
         bh  = txt.get_height() + pad * 2
-        bx  = int(self.x) - bw // 2
-        by  = int(self.y) - 62 - bh - 18
+        bx  = cx - bw // 2
+        by  = cy - 62 - bh - 18
         bg  = pygame.Surface((bw, bh), pygame.SRCALPHA)
         bg.fill((10, 0, 20, 210))
         surface.blit(bg, (bx, by))
         pygame.draw.rect(surface, self.BORDER, pygame.Rect(bx, by, bw, bh), 2)
-        tip_x = int(self.x)
-        tip_y = int(self.y) - 62 - 4
+        tip_x = cx
+        tip_y = cy - 62 - 4
         pygame.draw.polygon(surface, self.BORDER, [
             (tip_x - 6, by + bh),
             (tip_x + 6, by + bh),
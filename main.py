@@ -1,5 +1,5 @@
 # main.py
-from entities import BlankBackground, ParallaxBackground, Platform, Star, CursedEnemy, NPC, DroneEnemy, TankEnemy, HealthOrb
+from entities import BlankBackground, ParallaxBackground, Platform, CursedEnemy, NPC, DroneEnemy, TankEnemy, HealthOrb
 from boss_entities import VasilCompanion, BossSpike, BossLightning
 from boss_manager import BossManager
 import pygame
@@ -30,17 +30,30 @@ from auxiliary_systems import CombatPhilosophySystem, LivingSoundtrack, EndlessF
 from auxiliary_systems import FragmentiaDistrict, PhilosophicalTitan, WarpLine
 from drawing_utils import rotate_point, draw_legendary_revolver, draw_smg_placeholder, draw_cinematic_overlay, draw_background_hero, get_weapon_muzzle_point
 from drawing_utils import draw_background_boss_silhouette, draw_npc_chat
-from local_bosses import NexusBoss, AresBoss, VasilBoss, EnemyBullet, draw_vasil_arena_bg
+from local_bosses import (NexusBoss, AresBoss, VasilBoss, EnemyBullet,
+                          draw_vasil_arena_bg, vasil_arena_bg)
 
 # --- GÜNCEL UTILS IMPORT (audio_manager eklendi) ---
-from utils import generate_sound_effect, generate_ambient_fallback, generate_calm_ambient, load_sound_asset, draw_text, draw_animated_player, wrap_text, draw_text_with_shadow, get_silent_sound, audio_manager
-from vfx import LightningBolt, FlameSpark, GhostTrail, SpeedLine, Shockwave, EnergyOrb, ParticleExplosion, ScreenFlash, SavedSoul
+from utils import generate_sound_effect, generate_ambient_fallback, generate_calm_ambient, generate_door_bump, load_sound_asset, load_music_asset, draw_text, draw_animated_player, wrap_text, draw_text_with_shadow, get_silent_sound, audio_manager
+from vfx import LightningBolt, GhostTrail, EnergyOrb, ScreenFlash, SavedSoul
+from particle_system import particle_system
+from enemy_projectiles import enemy_projectiles
+from entity_registry import (entity_registry, HOSTILE_ACTORS, HOSTILE_PROJECTILES,
+                             KIND_ENEMIES, KIND_ENEMY_SHOTS, KIND_HEALTH_ORBS,
+                             KIND_AMMO_PICKUPS, KIND_WEAPON_CHESTS)
 from bullet_visuals import draw_player_bullet
 # YENİ: ParallaxBackground eklendi (BlankBackground yerine)
-from entities import BlankBackground, ParallaxBackground, Platform, Star, CursedEnemy, NPC, DroneEnemy, TankEnemy, HealthOrb, PlayerProjectile, WeaponChest, AmmoPickup
+from entities import BlankBackground, ParallaxBackground, Platform, CursedEnemy, NPC, DroneEnemy, TankEnemy, HealthOrb, PlayerProjectile, WeaponChest, AmmoPickup, EnemyProjectile
 from ui_system import render_ui
+from hud_compositor import hud_compositor
+from starfield import starfield
+from text_cache import get_font
+from debug_overlay import debug_overlay
+from viewport import viewport, world_camera, WorldGroup
+from platform_index import platform_index, LANE_WALLS, LANE_FLOORS, LANE_WIDE
+from mission_system import mission_manager
 from animations import CharacterAnimator, TrailEffect
-from save_system import SaveManager
+from save_system import save_manager
 from story_system import StoryManager
 from cutscene import AICutscene, IntroCutscene, VasilDefeatScene
 
@@ -56,6 +69,14 @@ from inventory_manager import inventory_manager  # Merkezi envanter sistemi
 # --- GİZLİLİK SİSTEMİ ---
 from stealth_system import stealth_system
 
+# --- PROFİLLEYİCİ (F3 ile aç/kapa) ---
+from profiler import profiler
+from present_pipeline import present_pipeline
+
+# --- UZAMSAL İNDEKS (broad-phase çarpışma) ---
+from spatial_index import SpatialHashGrid
+from ccd_kernel import swept_circle_aabb_toi, rects_to_array, earliest_hit
+
 # --- Asset Paths Tanımı ---
 asset_paths = {
     'font': 'assets/fonts/VCR_OSD_MONO.ttf',
@@ -73,16 +94,16 @@ beat_arena    = BeatArenaManager()
 player_hp     = PlayerHealth(ARENA_PLAYER_HP)
 combat_hud    = CombatHUD()
 
-# --- OPTİMİZASYON 1: UI CACHE DEĞİŞKENLERİ ---
-cached_ui_surface = None
-last_score = -1
-last_active_ui_elements = {}
+# --- ÇARPIŞMA GRID'İ (her frame yeniden kurulur) ---
+melee_grid    = SpatialHashGrid()   # melee hedefleri (normal + arena)
+
+# --- OPTİMİZASYON 1: UI CACHE → hud_compositor (widget başına önbellek) ---
 
 def trigger_guardian_interruption():
     """Karma sıfırlandığında Vasi'nin araya girip savaşı durdurması."""
     global GAME_STATE, story_manager, all_enemies
     boss_manager_system.clear_all_attacks()
-    all_enemies.empty()
+    entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
     GAME_STATE = 'CHAT'
     story_manager.set_dialogue("VASI", "SİSTEM UYARISI: İrade bütünlüğü kritik seviyenin altında... Müdahale ediliyor.", is_cutscene=True)
 
@@ -99,7 +120,6 @@ clock = pygame.time.Clock()
 
 game_canvas = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
 vfx_surface = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT), pygame.SRCALPHA)
-_traj_surface = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT), pygame.SRCALPHA)  # Trajectory ızgara
 
 # --- 2. SES AYARLARI ---
 # Ses kanalları artık audio_manager üzerinden yönetiliyor.
@@ -110,9 +130,12 @@ SLAM_SOUND = load_sound_asset("assets/sfx/slam.wav")
 EXPLOSION_SOUND = get_silent_sound()
 GUN_SHOT_SOUND = load_sound_asset("assets/sfx/gun_shot.wav")
 RELOAD_SOUND   = load_sound_asset("assets/sfx/reload.wav")
+DOOR_BUMP_SOUND = generate_door_bump()   # Malikane kilitli kapı (sound_cache)
 
 current_level_music = None
 # --- OPTİMİZASYON 3: VFX Limiti Azaltıldı ---
+# Kıvılcım / patlama / şok dalgası / hız çizgisi artık particle_system'de
+# (PARTICLE_CAPACITY). Bu limit sadece kalan sprite efektleri içindir.
 MAX_VFX_COUNT = 100 # 200'den 100'e çekildi (CPU rahatlatma)
 MAX_DASH_VFX_PER_FRAME = 5
 METEOR_CORE = (255, 255, 200)
@@ -132,15 +155,18 @@ game_settings = {
     'fps_index': 1,
     'sound_volume': 0.7,
     'music_volume': 0.5,
-    'effects_volume': 0.8
+    'effects_volume': 0.8,
+    'integer_scale': False
 }
 current_fps = 60
 
 # --- SAVE VE AYAR YÜKLEME ---
-save_manager = SaveManager()
+# save_manager: save_system'in tek global örneği (tek yazıcı thread, tek atexit)
 game_settings = save_manager.get_settings()
 # SES SİSTEMİNİ BAŞLAT VE AYARLARI UYGULA
 audio_manager.update_settings(game_settings) 
+# Sunum hedefi sadece seçili çözünürlük için bir kez ayrılır (frame başına allocation yok)
+present_pipeline.prepare(game_canvas, AVAILABLE_RESOLUTIONS[game_settings['res_index']])
 # ---------------------------------------------------
 
 story_manager = StoryManager()
@@ -207,13 +233,22 @@ trail_effects = []
 last_trail_time = 0.0
 TRAIL_INTERVAL = 3
 
-all_platforms = pygame.sprite.Group()
-all_enemies = pygame.sprite.Group()
-all_vfx = pygame.sprite.Group()
-all_health_orbs = pygame.sprite.Group()  # Can küreleri
+all_platforms = platform_index     # x-sıralı Group: zemin/duvar şeritleri + en sağ kenar
+all_vfx = WorldGroup()  # Dünya uzayı — kayma çizimde uygulanır
 all_player_projectiles = pygame.sprite.Group()  # Oyuncu mermileri (altıpatar)
-all_weapon_chests = pygame.sprite.Group()  # Silah sandıkları
-all_ammo_pickups  = pygame.sprite.Group()  # Cephane pickup'ları
+
+# Düşman / mermi / pickup grupları entity_registry'de kategorilere ayrılır
+all_enemies       = entity_registry.group(KIND_ENEMIES)        # Düşmanlar + boss'lar
+hostile_shots     = entity_registry.group(KIND_ENEMY_SHOTS)    # Sprite düşman mermileri
+all_health_orbs   = entity_registry.group(KIND_HEALTH_ORBS)    # Can küreleri
+all_weapon_chests = entity_registry.group(KIND_WEAPON_CHESTS)  # Silah sandıkları
+all_ammo_pickups  = entity_registry.group(KIND_AMMO_PICKUPS)   # Cephane pickup'ları
+entity_registry.register(EnemyBullet, KIND_ENEMY_SHOTS)
+entity_registry.register(EnemyProjectile, KIND_ENEMY_SHOTS)
+entity_registry.register(HealthOrb, KIND_HEALTH_ORBS)
+entity_registry.register(AmmoPickup, KIND_AMMO_PICKUPS)
+entity_registry.register(WeaponChest, KIND_WEAPON_CHESTS)
+entity_registry.attach(HOSTILE_PROJECTILES, enemy_projectiles)
 
 # --- AKTİF SİLAH SİSTEMİ ---
 # active_weapon_obj : Weapon alt sınıfı nesnesi (Revolver / SMG) veya None
@@ -225,7 +260,6 @@ _death_inventory_snapshot: list = []   # [(weapon_type, bullets, spare_mags), ..
 _death_active_type: str | None  = None
 weapon_shoot_timer = 0.0       # Çizim için atış zamanı sayacı (sn)
 aim_angle          = 0.0       # Fare nişangah açısı (radyan) — her frame güncellenir
-stars = [Star(LOGICAL_WIDTH, LOGICAL_HEIGHT) for _ in range(120)]
 
 npcs = []
 current_npc = None
@@ -274,15 +308,15 @@ def apply_display_settings():
         flags = pygame.DOUBLEBUF | pygame.HWSURFACE
     # Vsync=1 her zaman aktif
     screen = pygame.display.set_mode((current_display_w, current_display_h), flags, vsync=1)
+    present_pipeline.prepare(game_canvas, target_res)
 
 def add_new_platform(start_x=None):
     if start_x is None:
         if len(all_platforms) > 0:
-            rightmost = max(all_platforms, key=lambda p: p.rect.right)
             gap = random.randint(GAP_MIN, GAP_MAX)
-            start_x = rightmost.rect.right + gap
+            start_x = all_platforms.right_edge() + gap
         else:
-            start_x = LOGICAL_WIDTH
+            start_x = int(world_camera.right)
 
     width = random.randint(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH)
     y = random.choice(PLATFORM_HEIGHTS)
@@ -345,9 +379,12 @@ def start_story_chapter(chapter_id):
     GAME_STATE = 'CHAT'
 
     if chapter_id == 0:
+        Platform.clear_render_cache()
         all_platforms.empty()
-        all_enemies.empty()
+        world_camera.reset()
+        entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
         all_vfx.empty()
+        particle_system.clear()
         base_plat = Platform(0, LOGICAL_HEIGHT - 100, LOGICAL_WIDTH, 100, theme_index=2)
         all_platforms.add(base_plat)
         bed1 = Platform(400, LOGICAL_HEIGHT - 180, 200, 30, theme_index=2)
@@ -367,6 +404,7 @@ def init_rest_area():
     camera_speed = 0
     CURRENT_THEME = THEMES[4]
     all_platforms.empty()
+    world_camera.reset()
     platform_width = 400
     gap = 200
     npc_spawn_index = 0
@@ -408,9 +446,12 @@ def init_vasil_intro_fight():
     camera_speed = 0
     y_velocity   = 0
 
+    Platform.clear_render_cache()
     all_platforms.empty()
-    all_enemies.empty()
+    world_camera.reset()
+    entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
     all_vfx.empty()
+    particle_system.clear()
     npcs.clear()
 
     CURRENT_THEME = THEMES[1]
@@ -430,6 +471,7 @@ def init_vasil_intro_fight():
     all_platforms.add(Platform(-LW * 3, LH - 80, LW * 6, 80, theme_index=TH))
 
     active_background = ParallaxBackground(f"{BG_DIR}/gutter_far.png", speed_mult=0.0)
+    vasil_arena_bg.prepare(LW, LH)   # Arena sisi bir kez pişirilir
 
     player_x, player_y = 180.0, float(LOGICAL_HEIGHT - 80 - 42)  # Düz zemin üstü
     # ── VASIL INTRO: Tüm silahları 5'er yedek şarjörle ver ──────────────────
@@ -447,11 +489,10 @@ def init_vasil_intro_fight():
     player_bullets    = active_weapon_obj.bullets if active_weapon_obj else 0
 
     vasil = VasilBoss(LOGICAL_WIDTH // 2, LOGICAL_HEIGHT - 80 - 130)  # Düz zemin üstünde hover
-    vasil.ignore_camera_speed = True
     all_enemies.add(vasil)
     vasil_intro_kill_pending = False
 
-    music = load_sound_asset("assets/music/final_boss.mp3", generate_ambient_fallback, 0.8)
+    music = load_music_asset("assets/music/final_boss.mp3", generate_ambient_fallback, 0.8)
     audio_manager.play_music(music)
 
 
@@ -463,9 +504,12 @@ def init_limbo():
 
     boss_manager_system.reset()
     current_level_idx = 99
+    Platform.clear_render_cache()
     all_platforms.empty()
-    all_enemies.empty()
+    world_camera.reset()
+    entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
     all_vfx.empty()
+    particle_system.clear()
     npcs.clear()
     camera_speed = 0
     y_velocity = 0
@@ -516,9 +560,12 @@ def init_redemption_mode():
 
     current_level_idx = 11
     has_talisman = True
+    Platform.clear_render_cache()
     all_platforms.empty()
-    all_enemies.empty()
+    world_camera.reset()
+    entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
     all_vfx.empty()
+    particle_system.clear()
     npcs.clear()
     boss_manager_system.reset()
     CURRENT_THEME = THEMES[0]
@@ -529,7 +576,7 @@ def init_redemption_mode():
     camera_speed = INITIAL_CAMERA_SPEED * 1.5
     y_velocity = 0
     
-    sound = load_sound_asset("assets/music/cyber_chase.mp3", generate_ambient_fallback, 0.8)
+    sound = load_music_asset("assets/music/cyber_chase.mp3", generate_ambient_fallback, 0.8)
     audio_manager.play_music(sound)
 
 def init_genocide_mode():
@@ -538,9 +585,12 @@ def init_genocide_mode():
     global vasil_companion, boss_manager_system
 
     current_level_idx = 11
+    Platform.clear_render_cache()
     all_platforms.empty()
-    all_enemies.empty()
+    world_camera.reset()
+    entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
     all_vfx.empty()
+    particle_system.clear()
     npcs.clear()
     boss_manager_system.reset()
     CURRENT_THEME = THEMES[1]
@@ -552,10 +602,31 @@ def init_genocide_mode():
     y_velocity = 0
     vasil_companion = None
     
-    sound = load_sound_asset("assets/music/final_ascension.mp3", generate_ambient_fallback, 0.8)
+    sound = load_music_asset("assets/music/final_ascension.mp3", generate_ambient_fallback, 0.8)
     audio_manager.play_music(sound)
 
 
+def god_respawn():
+    """
+    god_mode (bench.py): düşme / sol kenardan çıkma ölümü yerine oyuncuyu
+    ekrandaki en soldaki zemin platformunun üstüne ışınlar.
+    """
+    global player_x, player_y, y_velocity, is_jumping, is_dashing, is_slamming, jumps_left
+    cam = int(world_camera.left)
+    screen_rect = pygame.Rect(cam, 0, LOGICAL_WIDTH, LOGICAL_HEIGHT)
+    floors = [p for p in all_platforms.collide(screen_rect, LANE_FLOORS, LANE_WIDE)
+              if p.rect.right > cam + 150 + 28]
+    if floors:
+        p = min(floors, key=lambda p: p.rect.left)
+        player_x = float(max(p.rect.left, cam + 150))
+        player_y = float(p.rect.top - 42)
+    else:
+        player_x, player_y = cam + 150.0, float(LOGICAL_HEIGHT - 300)
+    y_velocity = 0
+    is_jumping = is_dashing = is_slamming = False
+    jumps_left = MAX_JUMPS
+
+
 def start_npc_conversation(npc):
     global current_npc, npc_conversation_active, npc_chat_history, GAME_STATE
     current_npc = npc
@@ -578,7 +649,6 @@ def init_game():
     global boss_manager_system, vasil_companion
     global level_15_timer, finisher_active, finisher_state_timer, finisher_type, level_15_cutscene_played
     global active_background # Global active_background
-    global cached_ui_surface, last_score # UI Cache
     global combo_system, beat_arena, player_hp
     global all_health_orbs
     global all_player_projectiles, all_weapon_chests, all_ammo_pickups
@@ -587,12 +657,19 @@ def init_game():
 
     # --- OPTİMİZASYON: Oyun sırasında GC'yi kapat ---
     gc.disable()
-    
-    cached_ui_surface = None
-    last_score = -1
+
+    # Bölüm geçişi: önceki bölümün karma / mermi değişiklikleri diske (arka planda)
+    save_manager.request_flush()
+    hud_compositor.invalidate()
+    Platform.clear_render_cache()
 
     lvl_config = EASY_MODE_LEVELS.get(current_level_idx, EASY_MODE_LEVELS[1])
 
+    # Sonraki bölümün müziği arka planda belleğe okunur (geçişte disk beklemesi yok)
+    _next_cfg = EASY_MODE_LEVELS.get(current_level_idx + 1)
+    if _next_cfg and _next_cfg.get('music_file'):
+        audio_manager.preload_music(f"assets/music/{_next_cfg['music_file']}")
+
     # --- ARKA PLAN SEÇİMİ ---
     # Tema indeksine göre parallax katman dosyası belirlenir.
     # Dosya yoksa ParallaxBackground sessizce boş çizer (fallback).
@@ -649,7 +726,7 @@ def init_game():
         y_velocity = 0
         music_file = random.choice(REST_AREA_MUSIC) if REST_AREA_MUSIC else "calm_ambient.mp3"
         
-        current_level_music = load_sound_asset(f"assets/music/{music_file}", generate_calm_ambient, 0.6)
+        current_level_music = load_music_asset(f"assets/music/{music_file}", generate_calm_ambient, 0.6)
         audio_manager.play_music(current_level_music)
 
     elif lvl_config.get('type') == 'beat_arena':
@@ -659,10 +736,11 @@ def init_game():
         player_x, player_y = 200.0, float(LOGICAL_HEIGHT - 180)
         y_velocity = 0
         music_file = lvl_config.get('music_file', 'dark_ambient.mp3')
-        current_level_music = load_sound_asset(f"assets/music/{music_file}", generate_ambient_fallback, 1.0)
+        current_level_music = load_music_asset(f"assets/music/{music_file}", generate_ambient_fallback, 1.0)
         audio_manager.play_music(current_level_music)
         # Düz zemin + yan duvar platformları
         all_platforms.empty()
+        world_camera.reset()
         floor_plat = Platform(0, LOGICAL_HEIGHT - 80, LOGICAL_WIDTH, 80, theme_index=theme_idx)
         all_platforms.add(floor_plat)
         # Arena henüz başlatılmadı — PLAYING loop içinde start() çağrılacak
@@ -680,7 +758,7 @@ def init_game():
         player_x, player_y = 120.0, float(LOGICAL_HEIGHT - 110)
         y_velocity = 0
         music_file = lvl_config.get('music_file', 'dark_ambient.mp3')
-        current_level_music = load_sound_asset(
+        current_level_music = load_music_asset(
             f"assets/music/{music_file}", generate_ambient_fallback, 0.5
         )
         audio_manager.play_music(current_level_music)
@@ -702,6 +780,7 @@ def init_game():
         #  Harita: 3200px geniş; dikey span 730px → kamera Y ofseti = 0
         # ══════════════════════════════════════════════════════════════════
         all_platforms.empty()
+        world_camera.reset()
         _ti = theme_idx
         _LH = LOGICAL_HEIGHT   # 1080
 
@@ -776,8 +855,10 @@ def init_game():
         camera_speed = 0
         CURRENT_THEME = THEMES[theme_idx]
         all_platforms.empty()
-        all_enemies.empty()
+        world_camera.reset()
+        entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
         all_vfx.empty()
+        particle_system.clear()
         # Tam ekran genişliğinde zemin platformu
         _debug_floor = Platform(0, LOGICAL_HEIGHT - 80, LOGICAL_WIDTH, 80, theme_index=theme_idx)
         all_platforms.add(_debug_floor)
@@ -809,7 +890,7 @@ def init_game():
         karma_notification_text  = "DEBUG ARENA | 1:Revolver 2:SMG 3:Pompalı | T:Terminal | Num1-3:Spawn"
         karma_notification_timer = 180
         music_file = lvl_config.get('music_file', 'calm_ambient.mp3')
-        current_level_music = load_sound_asset(
+        current_level_music = load_music_asset(
             f"assets/music/{music_file}", generate_calm_ambient, 0.5
         )
         audio_manager.play_music(current_level_music)
@@ -821,10 +902,11 @@ def init_game():
         player_x, player_y = 150.0, float(LOGICAL_HEIGHT - 300)
         music_file = lvl_config.get('music_file', 'dark_ambient.mp3')
         
-        current_level_music = load_sound_asset(f"assets/music/{music_file}", generate_ambient_fallback, 1.0)
+        current_level_music = load_music_asset(f"assets/music/{music_file}", generate_ambient_fallback, 1.0)
         audio_manager.play_music(current_level_music)
         
         all_platforms.empty()
+        world_camera.reset()
         start_plat = Platform(0, LOGICAL_HEIGHT - 50, 400, 50)
         all_platforms.add(start_plat)
 
@@ -839,7 +921,6 @@ def init_game():
             boss = NexusBoss(boss_spawn_x, LOGICAL_HEIGHT - 400)
 
         if boss:
-            boss.ignore_camera_speed = True
             all_enemies.add(boss)
     else:
         mult = lvl_config.get('speed_mult', 1.0)
@@ -850,17 +931,18 @@ def init_game():
         player_x, player_y = 150.0, float(LOGICAL_HEIGHT - 300)
         music_file = lvl_config.get('music_file', 'dark_ambient.mp3')
         
-        current_level_music = load_sound_asset(f"assets/music/{music_file}", generate_ambient_fallback, 1.0)
+        current_level_music = load_music_asset(f"assets/music/{music_file}", generate_ambient_fallback, 1.0)
         audio_manager.play_music(current_level_music)
 
         all_platforms.empty()
+        world_camera.reset()
         start_plat = Platform(0, LOGICAL_HEIGHT - 50, 400, 50)
         all_platforms.add(start_plat)
         current_right = 400
         while current_right < LOGICAL_WIDTH + 200:
             add_new_platform()
             if len(all_platforms) > 0:
-                current_right = max(p.rect.right for p in all_platforms)
+                current_right = all_platforms.right_edge()
             else:
                 current_right += 200
 
@@ -874,7 +956,6 @@ def init_game():
             else:
                 boss = NexusBoss(LOGICAL_WIDTH - 300, LOGICAL_HEIGHT - 400)
             if boss:
-                boss.ignore_camera_speed = True
                 all_enemies.add(boss)
 
     if current_level_idx == 30:
@@ -898,8 +979,9 @@ def init_game():
     enemies_killed_current_level = 0
     karma_notification_timer = 0
     CURRENT_SHAPE = random.choice(PLAYER_SHAPES)
-    all_enemies.empty()
+    entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
     all_vfx.empty()
+    particle_system.clear()
     character_animator.__init__()
 
     # ── Silah sistemi sıfırla ─────────────────────────────────────────────────
@@ -937,15 +1019,26 @@ def init_game():
     # goal_score=0 olan manor_stealth bölümlerinde önceki çalışmadan kalan
     # "area_secret_safe" bayrağı anlık kazanmayı tetikleyebilir.
     if lvl_config.get('type') == 'manor_stealth':
-        from mission_system import mission_manager
         mission_manager.set_flag("area_secret_safe", False)
 
 def main():
     global GAME_STATE
     GAME_STATE = 'MENU'
-    run_game_loop()
-
-def run_game_loop():
+    try:
+        run_game_loop()
+    finally:
+        save_manager.flush()
+        profiler.dump()
+
+def run_game_loop(start_level=None, god_mode=False):
+    """
+    Ana oyun döngüsü.
+    start_level: verilirse menü atlanır ve o bölüm doğrudan PLAYING
+                 durumunda başlar (bench.py / headless ölçüm için).
+    god_mode:    can / stamina her kare dolar, karma hasarı yok, düşme ve
+                 sol kenar ölümü yerine god_respawn(), bölüm tamamlanmaz —
+                 ölçüm baştan sona PLAYING'de kalsın diye.
+    """
     dragging_slider = None
     global GAME_STATE, loading_timer, loading_logs, loading_stage, target_state_after_load
     global score, camera_speed, player_x, player_y, y_velocity, is_jumping, is_dashing, is_slamming
@@ -965,7 +1058,6 @@ def run_game_loop():
     global level_15_timer, finisher_active, finisher_state_timer, finisher_type, level_15_cutscene_played
     global game_settings
     global active_background
-    global cached_ui_surface, last_score, last_active_ui_elements
     global combo_system, beat_arena, player_hp, combat_hud
     global vasil_intro_kill_pending
     global player_bullets, gun_cooldown, is_reloading, all_player_projectiles
@@ -974,8 +1066,8 @@ def run_game_loop():
     global aim_angle
 
     is_super_mode  = False
-    is_god_hp      = False   # "god hp on"   → her kare canı tam doldur
-    is_god_stamina = False   # "god stam on" → her kare staminayı tam doldur
+    is_god_hp      = god_mode   # "god hp on"   → her kare canı tam doldur
+    is_god_stamina = god_mode   # "god stam on" → her kare staminayı tam doldur
     # Malikane bölümü için kamera X ve Y ofseti (oyuncuyu ekranın ortasında tutar)
     manor_camera_offset_x = 0
     manor_camera_offset_y = 0
@@ -1020,7 +1112,7 @@ def run_game_loop():
     # Oyun esnasında sol alt köşede küçük buton.
     # Tıklanınca DEBUG_SPRITE ve DIRECT_SPRITE_TEST birlikte toggle edilir.
     _DEBUG_BTN_RECT  = pygame.Rect(10, LOGICAL_HEIGHT - 36, 120, 26)
-    _debug_btn_font  = pygame.font.Font(None, 20)
+    _debug_btn_font  = get_font(20)
     _debug_btn_hover = False
     # ────────────────────────────────────────────────────────────────────────
 
@@ -1068,7 +1160,17 @@ def run_game_loop():
     vasil_companion = None
     active_background = None
 
+    # ── Doğrudan bölüm başlatma (bench.py) ───────────────────────────────
+    if start_level is not None:
+        current_level_idx = start_level
+        if start_level == 0:
+            init_vasil_intro_fight()
+        else:
+            init_game()
+        GAME_STATE = 'PLAYING'
+
     while running:
+        profiler.frame_begin()
         current_time = pygame.time.get_ticks()
         dt = (current_time - last_time) / 1000.0
         dt = min(dt, 1.0 / 30.0)
@@ -1084,10 +1186,10 @@ def run_game_loop():
         _debug_btn_hover = _DEBUG_BTN_RECT.collidepoint(mouse_pos)
 
         # ── AİM ANGLE — her frame, event'lerden ÖNCE hesapla ──────────────
-        # player_x/y bu oyunda dünya koordinatı = ekran koordinatı
-        # (kamera platformları kaydırır, oyuncuyu değil)
-        _aim_px = player_x + 14   # hitbox merkezi X
-        _aim_py = player_y + 21   # omuz hizası Y
+        # player_x/y dünya koordinatıdır; fare ekran koordinatı → oyuncuyu
+        # son çizim karesinin viewport'uyla ekrana taşı
+        _aim_px, _aim_py = viewport.to_screen(player_x + 14,   # hitbox merkezi X
+                                              player_y + 21)   # omuz hizası Y
         _aim_dx = mouse_pos[0] - _aim_px
         _aim_dy = mouse_pos[1] - _aim_py
         aim_angle = math.atan2(_aim_dy, _aim_dx)
@@ -1104,6 +1206,7 @@ def run_game_loop():
                  for sprite in sprites[:20]:
                      sprite.kill()
 
+        profiler.begin("events")
         events = pygame.event.get()
 
         if GAME_STATE == 'SETTINGS':
@@ -1173,6 +1276,15 @@ def run_game_loop():
                 start_loading_sequence('PLAYING')
                 print("[DEBUG] F12 → Debug Arena (ID:999) yükleniyor...")
 
+            # ── F3: Frame profilleyici aç/kapa (her state'den çalışır) ───
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle()
+
+            # ── F4: Tam sayı ölçekleme (keskin piksel) aç/kapa ───────────
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                game_settings['integer_scale'] = not game_settings.get('integer_scale', False)
+                save_manager.update_settings(game_settings)
+
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 # ── DEBUG BUTONU — her game state'de çalışır ────────────
                 if _DEBUG_BTN_RECT.collidepoint(mouse_pos):
@@ -1268,9 +1380,9 @@ def run_game_loop():
                                     screen_shake = max(screen_shake, 2)
                                 if GUN_SHOT_SOUND:
                                     audio_manager.play_sfx(GUN_SHOT_SOUND)
-                                all_vfx.add(ParticleExplosion(
+                                particle_system.emit_explosion(
                                     int(_px_proj), int(_py_proj), (255, 220, 80), 5
-                                ))
+                                )
                         elif gun_cooldown <= 0 and player_bullets > 0 and not is_reloading:
                             # Eski uyumluluk kodu — silahsız iken çalışmasın
                             # (player_bullets = REVOLVER_MAX_BULLETS init değeri bug'a yol açıyordu)
@@ -1451,10 +1563,10 @@ def run_game_loop():
                                                 karma_notification_text = f"+1 ŞARJÖR ({_wtype.upper()})"
                                         karma_notification_timer = 60
                                         save_manager.unlock_weapon(_wtype)
-                                        all_vfx.add(ParticleExplosion(
+                                        particle_system.emit_explosion(
                                             _chest.rect.centerx, _chest.rect.centery,
                                             (255, 215, 0), 12
-                                        ))
+                                        )
                                 break
 
                 # --- DÖVÜŞ TUŞLARI (tüm bölümlerde aktif) ---
@@ -1464,17 +1576,17 @@ def run_game_loop():
                     if event.key == pygame.K_j:   # Hafif vuruş
                         if player_hp.consume_stamina(COST_LIGHT):
                             combo_system.input_light(player_x, player_y, player_direction)
-                            all_vfx.add(ParticleExplosion(
+                            particle_system.emit_explosion(
                                 px_c + player_direction * 40, py_c,
                                 (255, 150, 50), 8
-                            ))
+                            )
                     elif event.key == pygame.K_k:  # Ağır vuruş
                         if player_hp.consume_stamina(COST_HEAVY):
                             combo_system.input_heavy(player_x, player_y, player_direction)
-                            all_vfx.add(Shockwave(
+                            particle_system.emit_shockwave(
                                 px_c + player_direction * 50, py_c,
                                 CURSED_RED, max_radius=60, speed=12
-                            ))
+                            )
                             screen_shake = 6
 
                 elif GAME_STATE == 'TERMINAL':
@@ -1595,12 +1707,12 @@ def run_game_loop():
 
                             elif _cmd == "clear enemies":
                                 _count = len(all_enemies)
-                                all_enemies.empty()
+                                entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
                                 terminal_status = f"TEMİZLENDİ — {_count} düşman silindi"
 
                             elif _cmd == "clear all":
                                 _ec = len(all_enemies)
-                                all_enemies.empty()
+                                entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
                                 all_weapon_chests.empty()
                                 all_ammo_pickups.empty()
                                 all_health_orbs.empty()
@@ -1624,14 +1736,16 @@ def run_game_loop():
                     if event.key == pygame.K_RETURN:
                         if npc_chat_input.strip():
                             npc_chat_history.append({"speaker": "Oyuncu", "text": npc_chat_input})
-                            npc_response = "..."
                             if current_npc:
                                 if current_npc.ai_active:
-                                    npc_response = story_manager.generate_npc_response(current_npc, npc_chat_input, npc_chat_history[:-1])
+                                    # Bloklamaz — cevap poll_ai() ile gelir
+                                    npc_response = story_manager.request_npc_response(
+                                        current_npc, npc_chat_input, npc_chat_history[:-1])
                                 else:
                                     game_context = f"Skor: {int(score)}, Bölüm: {current_level_idx}"
                                     npc_response = current_npc.send_message(npc_chat_input, game_context)
-                                npc_chat_history.append({"speaker": current_npc.name, "text": npc_response})
+                                if npc_response is not None:
+                                    npc_chat_history.append({"speaker": current_npc.name, "text": npc_response})
                             npc_chat_input = ""
                     elif event.key == pygame.K_BACKSPACE:
                         npc_chat_input = npc_chat_input[:-1]
@@ -1641,6 +1755,7 @@ def run_game_loop():
                     elif event.key == pygame.K_ESCAPE:
                         GAME_STATE = 'PLAYING'
                         if current_npc:
+                            story_manager.cancel_npc_requests(current_npc.name)
                             current_npc.end_conversation()
                             current_npc = None
                     else:
@@ -1675,7 +1790,7 @@ def run_game_loop():
                         is_slamming = False
                         y_velocity = -JUMP_POWER
                         character_state = 'jumping'
-                        all_vfx.add(ParticleExplosion(px, py, CURRENT_THEME["player_color"], 6))
+                        particle_system.emit_explosion(px, py, CURRENT_THEME["player_color"], 6)
                         for _ in range(2):
                             all_vfx.add(EnergyOrb(px + random.randint(-10, 10),
                                                     py + random.randint(-10, 10),
@@ -1690,7 +1805,7 @@ def run_game_loop():
                         if SLAM_SOUND:
                             audio_manager.play_sfx(SLAM_SOUND)
                         all_vfx.add(ScreenFlash(PLAYER_SLAM, 80, 8))
-                        all_vfx.add(Shockwave(px, py, PLAYER_SLAM, max_radius=200, rings=3, speed=25))
+                        particle_system.emit_shockwave(px, py, PLAYER_SLAM, max_radius=200, rings=3, speed=25)
                         for _ in range(3):
                             all_vfx.add(LightningBolt(px, py,
                                                         px + random.randint(-60, 60),
@@ -1715,12 +1830,11 @@ def run_game_loop():
                                 enemies_killed_current_level += 1
                                 karma_notification_text  = f"SESSİZ SUİKAST! KARMA +{STEALTH_KILL_KARMA}"
                                 karma_notification_timer = 80
-                                all_vfx.add(ParticleExplosion(_gx, _gy, (0, 200, 100), 14))
-                                all_vfx.add(Shockwave(_gx, _gy, (0, 180, 80),
-                                                      max_radius=60, rings=1, speed=10))
+                                particle_system.emit_explosion(_gx, _gy, (0, 200, 100), 14)
+                                particle_system.emit_shockwave(_gx, _gy, (0, 180, 80),
+                                                               max_radius=60, rings=1, speed=10)
                                 screen_shake = max(screen_shake, 3)
                                 if stealth_system.active_guard_count() == 0:
-                                    from mission_system import mission_manager
                                     mission_manager.complete_objective("eliminate_guards")
                             else:
                                 _reason = _sk_result.get("reason", "BAŞARISIZ")
@@ -1792,7 +1906,7 @@ def run_game_loop():
                         if DASH_SOUND:
                             audio_manager.play_sfx(DASH_SOUND)
                         all_vfx.add(ScreenFlash(METEOR_CORE, 80, 6))
-                        all_vfx.add(Shockwave(px, py, METEOR_FIRE, max_radius=120, rings=2, speed=15))
+                        particle_system.emit_shockwave(px, py, METEOR_FIRE, max_radius=120, rings=2, speed=15)
                         keys = pygame.key.get_pressed()
                         dx = (keys[pygame.K_d] - keys[pygame.K_a])
                         dy = (keys[pygame.K_s] - keys[pygame.K_w])
@@ -1833,6 +1947,13 @@ def run_game_loop():
                             all_enemies.add(_dbg_enemy)
                             print(f"[DBG SPAWN] DroneEnemy → ({_dbg_spawn_x}, {_dbg_y})")
 
+        profiler.end("events")
+
+        # ── AI yanıtları (arka plan işçisi) — her frame yokla ───────────
+        for _npc_name, _npc_reply in story_manager.poll_ai():
+            if current_npc and current_npc.name == _npc_name:
+                npc_chat_history.append({"speaker": _npc_name, "text": _npc_reply})
+
         if GAME_STATE == 'LOADING':
             loading_timer += 1
             if loading_timer % 10 == 0 and loading_stage < len(fake_log_messages):
@@ -1907,7 +2028,8 @@ def run_game_loop():
             # ═════════════════════════════════════════════════════════════
             # GİZLİLİK SİSTEMİ — Her karede çalışır
             # ═════════════════════════════════════════════════════════════
-            stealth_system.update(dt, player_x, player_y)
+            with profiler.scope("stealth"):
+                stealth_system.update(dt, player_x, player_y)
 
             # Stealth olaylarını oku (tespitler, karma bonusları, uyarılar)
             for stealth_event in stealth_system.poll_events():
@@ -1950,7 +2072,8 @@ def run_game_loop():
             # Hedef havuzu: normal düşmanlar + arena düşmanları (eğer aktifse)
             _arena_targets = list(beat_arena.arena_enemies) if beat_arena.active else []
             _all_targets   = list(all_enemies) + _arena_targets
-            melee_hits = combo_system.check_hits(_all_targets)
+            melee_grid.rebuild(_all_targets)
+            melee_hits = combo_system.check_hits(_all_targets, spatial_index=melee_grid)
             for hit in melee_hits:
                 _enemy  = hit["enemy"]
                 _damage = hit["damage"]
@@ -1996,15 +2119,15 @@ def run_game_loop():
 
                 # VFX
                 if _vfx == "explosion":
-                    all_vfx.add(ParticleExplosion(_hx, _hy, CURSED_PURPLE, 18))
+                    particle_system.emit_explosion(_hx, _hy, CURSED_PURPLE, 18)
                 elif _vfx == "shockwave":
-                    all_vfx.add(Shockwave(_hx, _hy, CURSED_RED, max_radius=80, speed=12))
+                    particle_system.emit_shockwave(_hx, _hy, CURSED_RED, max_radius=80, speed=12)
                 elif _vfx == "lightning":
                     all_vfx.add(LightningBolt(int(player_x + 15), int(player_y + 15),
                                               _hx, _hy, (100, 200, 255), life=8))
                 else:
-                    all_vfx.add(FlameSpark(_hx, _hy, random.uniform(0, math.pi * 2),
-                                           random.uniform(4, 10), (255, 150, 50), life=15))
+                    particle_system.emit_spark(_hx, _hy, random.uniform(0, math.pi * 2),
+                                               random.uniform(4, 10), (255, 150, 50), life=15)
 
                 if _killed:
                     enemies_killed_current_level += 1
@@ -2033,9 +2156,9 @@ def run_game_loop():
                         score += _DASH_DMG * 8
                         save_manager.update_karma(-8)
                         player_karma = save_manager.get_karma()
-                        all_vfx.add(ParticleExplosion(_ae.rect.centerx, _ae.rect.centery, METEOR_FIRE, 15))
-                        all_vfx.add(Shockwave(_ae.rect.centerx, _ae.rect.centery,
-                                              (255, 120, 0), max_radius=70, speed=14))
+                        particle_system.emit_explosion(_ae.rect.centerx, _ae.rect.centery, METEOR_FIRE, 15)
+                        particle_system.emit_shockwave(_ae.rect.centerx, _ae.rect.centery,
+                                                       (255, 120, 0), max_radius=70, speed=14)
                         if _dk:
                             enemies_killed_current_level += 1
                             screen_shake = max(screen_shake, 10)
@@ -2051,8 +2174,6 @@ def run_game_loop():
                 _SLAM_RADIUS = 140
                 # Normal düşmanlar
                 for _ne in list(all_enemies):
-                    if isinstance(_ne, EnemyBullet):
-                        continue
                     _ds = math.sqrt((_ne.rect.centerx - _px_s)**2 + (_ne.rect.centery - _py_s)**2)
                     if _ds < _SLAM_RADIUS:
                         _slam_killed = False
@@ -2068,7 +2189,7 @@ def run_game_loop():
                         save_manager.update_karma(-10)
                         player_karma = save_manager.get_karma()
                         enemies_killed_current_level += 1
-                        all_vfx.add(ParticleExplosion(_ne.rect.centerx, _ne.rect.centery, PLAYER_SLAM, 18))
+                        particle_system.emit_explosion(_ne.rect.centerx, _ne.rect.centery, PLAYER_SLAM, 18)
                 # Arena düşmanları
                 for _ae2 in _arena_targets:
                     if not _ae2.is_active:
@@ -2079,8 +2200,8 @@ def run_game_loop():
                         score += _SLAM_DMG * 8
                         save_manager.update_karma(-10)
                         player_karma = save_manager.get_karma()
-                        all_vfx.add(ParticleExplosion(_ae2.rect.centerx, _ae2.rect.centery, PLAYER_SLAM, 20))
-                        all_vfx.add(Shockwave(_px_s, _py_s, PLAYER_SLAM, max_radius=_SLAM_RADIUS, speed=18))
+                        particle_system.emit_explosion(_ae2.rect.centerx, _ae2.rect.centery, PLAYER_SLAM, 20)
+                        particle_system.emit_shockwave(_px_s, _py_s, PLAYER_SLAM, max_radius=_SLAM_RADIUS, speed=18)
                         if _sk:
                             enemies_killed_current_level += 1
                             screen_shake = max(screen_shake, 20)
@@ -2101,8 +2222,7 @@ def run_game_loop():
                 # Arena düşmanlarını güncelle
                 beat_arena.update(dt, frame_mul,
                                   player_x + 15,
-                                  player_y + 15,
-                                  0.0)
+                                  player_y + 15)
 
                 # Arena düşmanlarının oyuncuya saldırısı
                 for atk in beat_arena.get_enemy_attacks():
@@ -2113,12 +2233,13 @@ def run_game_loop():
                         _died = player_hp.take_damage(atk["damage"])
                         screen_shake = max(screen_shake, 12)
                         all_vfx.add(ScreenFlash((255, 0, 0), 100, 6))
-                        all_vfx.add(ParticleExplosion(int(player_x + 15), int(player_y + 15),
-                                                      (220, 0, 0), 12))
+                        particle_system.emit_explosion(int(player_x + 15), int(player_y + 15),
+                                                       (220, 0, 0), 12)
                         if _died:
                             if current_level_idx == 0:
-                                all_enemies.empty()
+                                entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
                                 all_vfx.empty()
+                                particle_system.clear()
                                 VasilDefeatScene(screen, clock).run()
                                 init_limbo()
                                 GAME_STATE = 'PLAYING'
@@ -2150,7 +2271,7 @@ def run_game_loop():
                                           (255, 215, 0), 8, 20))
 
                 # Tüm dalgalar temizlendi → bölüm geçişi
-                if beat_arena.is_complete:
+                if beat_arena.is_complete and not god_mode:
                     score += beat_arena.total_bonus
                     save_manager.update_karma(15)
                     player_karma = save_manager.get_karma()
@@ -2205,7 +2326,6 @@ def run_game_loop():
 
             for wave in active_damage_waves[:]:
                 wave['r'] += wave['speed'] * frame_mul
-                wave['x'] -= camera_speed * frame_mul
                 for enemy in list(all_enemies):
                     dist = math.sqrt((enemy.rect.centerx - wave['x'])**2 + (enemy.rect.centery - wave['y'])**2)
                     if dist < wave['r'] + 20 and dist > wave['r'] - 40:
@@ -2224,7 +2344,7 @@ def run_game_loop():
                         enemies_killed_current_level += 1
                         karma_notification_text = "KARMA DÜŞTÜ!"
                         karma_notification_timer = 60
-                        all_vfx.add(ParticleExplosion(enemy.rect.centerx, enemy.rect.centery, CURSED_PURPLE, 20))
+                        particle_system.emit_explosion(enemy.rect.centerx, enemy.rect.centery, CURSED_PURPLE, 20)
                         all_vfx.add(ScreenFlash(CURSED_PURPLE, 30, 2))
                 if wave['r'] > wave['max_r']:
                     active_damage_waves.remove(wave)
@@ -2236,16 +2356,14 @@ def run_game_loop():
                     inv_angle = dash_angle + math.pi + random.uniform(-0.5, 0.5)
                     spark_speed = random.uniform(5, 15)
                     color = random.choice([(255, 50, 0), (255, 150, 0), (255, 255, 100)])
-                    all_vfx.add(FlameSpark(px, py, inv_angle, spark_speed, color, life=20, size=random.randint(4, 8)))
+                    particle_system.emit_spark(px, py, inv_angle, spark_speed, color, life=20, size=random.randint(4, 8))
 
                 if int(dash_frame_counter) % 5 == 0:
-                    all_vfx.add(Shockwave(px, py, (255, 200, 100), max_radius=70, width=2, speed=10))
+                    particle_system.emit_shockwave(px, py, (255, 200, 100), max_radius=70, width=2, speed=10)
 
                 meteor_hit_radius = 120
                 enemy_hits_aoe = [e for e in all_enemies if math.sqrt((e.rect.centerx - px)**2 + (e.rect.centery - py)**2) < meteor_hit_radius]
                 for enemy in enemy_hits_aoe:
-                    if isinstance(enemy, EnemyBullet):
-                        continue
                     _dash_killed = False
                     if hasattr(enemy, 'take_damage'):
                         _dash_killed = enemy.take_damage(_DASH_DMG)
@@ -2265,8 +2383,8 @@ def run_game_loop():
                     screen_shake = 10
                     if EXPLOSION_SOUND:
                         audio_manager.play_sfx(EXPLOSION_SOUND)
-                    all_vfx.add(ParticleExplosion(enemy.rect.centerx, enemy.rect.centery, METEOR_FIRE, 25))
-                    all_vfx.add(Shockwave(enemy.rect.centerx, enemy.rect.centery, (255, 100, 0), max_radius=90, width=4))
+                    particle_system.emit_explosion(enemy.rect.centerx, enemy.rect.centery, METEOR_FIRE, 25)
+                    particle_system.emit_shockwave(enemy.rect.centerx, enemy.rect.centery, (255, 100, 0), max_radius=90, width=4)
 
                 if dash_particles_timer > 0:
                     dash_particles_timer -= frame_mul
@@ -2278,7 +2396,6 @@ def run_game_loop():
 
                 player_x += dash_vx * frame_mul
                 player_y += dash_vy * frame_mul
-                player_x -= camera_speed * frame_mul
                 
                 dash_timer -= frame_mul
                 if not vasil_companion:
@@ -2295,17 +2412,18 @@ def run_game_loop():
                         dist = random.randint(20, 40)
                         ex = player_x + 15 + math.cos(angle) * dist
                         ey = player_y + 15 + math.sin(angle) * dist
-                        all_vfx.add(FlameSpark(ex, ey, angle + math.pi, dist/10, PLAYER_SLAM, life=15))
+                        particle_system.emit_spark(ex, ey, angle + math.pi, dist/10, PLAYER_SLAM, life=15)
 
                 vibration = random.randint(-1, 1) if slam_stall_timer > 7 else 0
                 player_x += vibration
+                # Askıda kalış ekranda sabittir: kamera kayarken oyuncu da kayar
+                if GAME_STATE == 'PLAYING' and lvl_config.get('type') not in ('rest_area', 'beat_arena', 'manor_stealth', 'debug_arena'):
+                    player_x += camera_speed * frame_mul
                 if slam_stall_timer <= 0:
                     y_velocity = 30
                     screen_shake = 12
-                    all_vfx.add(ParticleExplosion(player_x+15, player_y+15, PLAYER_SLAM, 12))
+                    particle_system.emit_explosion(player_x+15, player_y+15, PLAYER_SLAM, 12)
             else:
-                if lvl_config.get('type') not in ('rest_area', 'manor_stealth', 'debug_arena'):
-                    player_x -= camera_speed * frame_mul
                 if keys[pygame.K_a]:
                     player_x -= active_player_speed * frame_mul
                 if keys[pygame.K_d]:
@@ -2392,10 +2510,10 @@ def run_game_loop():
                                     all_player_projectiles.add(proj)
                                     if GUN_SHOT_SOUND:
                                         audio_manager.play_sfx(GUN_SHOT_SOUND)
-                                    all_vfx.add(ParticleExplosion(
+                                    particle_system.emit_explosion(
                                         int(_px_proj + player_direction * 10), int(_py_proj),
                                         (0, 220, 255), 4
-                                    ))
+                                    )
                                     screen_shake = max(screen_shake, 1)
             else:
                 # Silah yok — eski altıpatar sayaç sistemi
@@ -2421,57 +2539,64 @@ def run_game_loop():
                     karma_notification_text  = "ŞARJÖR TAMAM!"
                     karma_notification_timer = 30
 
+            profiler.begin("bullet_ccd")
             # ── Oyuncu mermilerini güncelle (CCD: eski pos kaydet) ───────────
             for _proj in list(all_player_projectiles):
                 _proj._ccd_ox = _proj.rect.centerx
                 _proj._ccd_oy = _proj.rect.centery
-                _proj.update(camera_speed, dt)
-
-            # ── Mermi → düşman çarpışması (CCD + Fat Hitbox) ─────────────────
-            # groupcollide() sadece final rect'i test eder.
-            # Yüksek hızlı / yakın mesafe mermileri düşmandan atlayabilir.
-            # CCD: eski→yeni konum arası 4px adımlarla taranır.
-            # Fat hitbox: BULLET_RADIUS kadar genişletilir.
-            # Shotgun yakın mesafe: ilk frame'de zaten hedef içinde olabilir,
-            # bu yüzden substep 0'dan başlatılır (muzzle noktası da test edilir).
+                _proj.update(dt)
+
+            # ── Mermi → düşman çarpışması (süpürülmüş daire CCD) ─────────────
+            # groupcollide() sadece final rect'i test eder; yüksek hızlı
+            # mermiler ince hedeflerin içinden geçebilir.
+            # ccd_kernel: her mermi eski→yeni konum boyunca BULLET_RADIUS
+            # yarıçaplı daire olarak süpürülür, her hedef için kesin ilk
+            # çarpışma zamanı (TOI) hesaplanır. Tüm mermiler × tüm hedefler
+            # tek NumPy çağrısında. Başlangıç noktası hedefin içindeyse
+            # TOI = 0 (shotgun yakın mesafe / namlu ağzı).
             _lvl_cfg_revolver = EASY_MODE_LEVELS.get(current_level_idx, {})
-            if _lvl_cfg_revolver.get('type') != 'manor_stealth':
+            if _lvl_cfg_revolver.get('type') != 'manor_stealth' and all_player_projectiles:
 
                 _wpn_dmg  = active_weapon_obj.damage if active_weapon_obj else REVOLVER_DAMAGE
                 _bullet_r = getattr(active_weapon_obj, 'BULLET_RADIUS', 6) if active_weapon_obj else 6
 
-                for _proj in list(all_player_projectiles):
-                    if not _proj.alive():
-                        continue
-                    _ox       = getattr(_proj, '_ccd_ox', _proj.rect.centerx)
-                    _oy       = getattr(_proj, '_ccd_oy', _proj.rect.centery)
-                    _nx       = _proj.rect.centerx
-                    _ny       = _proj.rect.centery
-                    _substeps = min(8, max(1, int(math.hypot(_nx-_ox, _ny-_oy) / 4)))
-                    _hit_enemy = None
-                    _hit_cx, _hit_cy = _nx, _ny
-
-                    # range(0, ...) — substep 0 = muzzle noktası da test edilir
-                    # shotgun yakın mesafe için kritik
-                    for _si in range(0, _substeps + 1):
-                        _t  = _si / max(_substeps, 1)
-                        _ix = int(_ox + (_nx - _ox) * _t)
-                        _iy = int(_oy + (_ny - _oy) * _t)
-                        _tr = pygame.Rect(
-                            _ix - _bullet_r, _iy - _bullet_r,
-                            _bullet_r * 2,   _bullet_r * 2
-                        )
-                        for _en in all_enemies:
-                            if isinstance(_en, EnemyBullet):
-                                continue
-                            if _tr.colliderect(_en.rect):
-                                _hit_enemy = _en
-                                _hit_cx, _hit_cy = _ix, _iy
-                                break
-                        if _hit_enemy:
-                            break
+                # Hedef listesi: önce normal düşmanlar, sonra arena düşmanları
+                _ccd_targets = list(all_enemies)
+                _ccd_n_main  = len(_ccd_targets)
+                if lvl_config.get('type') == 'beat_arena':
+                    _ccd_targets.extend(beat_arena.arena_enemies)
+
+                _ccd_projs = [_p for _p in all_player_projectiles if _p.alive()]
+                if _ccd_targets and _ccd_projs:
+                    _ccd_starts = np.array(
+                        [(getattr(_p, '_ccd_ox', _p.rect.centerx),
+                          getattr(_p, '_ccd_oy', _p.rect.centery)) for _p in _ccd_projs],
+                        dtype=np.float64)
+                    _ccd_ends = np.array(
+                        [_p.rect.center for _p in _ccd_projs], dtype=np.float64)
+                    _ccd_toi = swept_circle_aabb_toi(
+                        _ccd_starts, _ccd_ends, _bullet_r, rects_to_array(_ccd_targets))
+                    _ccd_alive = np.ones(len(_ccd_targets), dtype=bool)
+
+                    for _pi, _proj in enumerate(_ccd_projs):
+                        _ti, _t = earliest_hit(_ccd_toi[_pi], _ccd_alive)
+                        if _ti < 0:
+                            continue
+                        _hit_enemy = _ccd_targets[_ti]
+                        _sx, _sy   = _ccd_starts[_pi]
+                        _ex, _ey   = _ccd_ends[_pi]
+                        _hit_cx    = int(_sx + (_ex - _sx) * _t)
+                        _hit_cy    = int(_sy + (_ey - _sy) * _t)
+
+                        if _ti >= _ccd_n_main:
+                            # Arena düşmanı
+                            if hasattr(_hit_enemy, 'take_damage'):
+                                _hit_enemy.take_damage(_wpn_dmg)
+                            score += 300
+                            particle_system.emit_explosion(_hit_cx, _hit_cy, (255, 100, 30), 10)
+                            _proj.kill()
+                            continue
 
-                    if _hit_enemy:
                         if hasattr(_hit_enemy, 'take_damage'):
                             _hit_enemy.take_damage(_wpn_dmg)
                         score += 300
@@ -2480,51 +2605,21 @@ def run_game_loop():
                         player_karma = save_manager.get_karma()
                         karma_notification_text  = f"İSABET! -{_wpn_dmg} HP"
                         karma_notification_timer = 30
-                        all_vfx.add(ParticleExplosion(_hit_cx, _hit_cy, (255, 100, 30), 10))
-                        all_vfx.add(Shockwave(
+                        particle_system.emit_explosion(_hit_cx, _hit_cy, (255, 100, 30), 10)
+                        particle_system.emit_shockwave(
                             _hit_cx, _hit_cy, (255, 150, 50), max_radius=50, rings=1, speed=10
-                        ))
+                        )
                         screen_shake = max(screen_shake, 3)
                         if hasattr(_hit_enemy, 'is_active') and not _hit_enemy.is_active:
                             _hit_enemy.kill()
-                            all_vfx.add(ParticleExplosion(_hit_cx, _hit_cy, CURSED_PURPLE, 20))
+                            particle_system.emit_explosion(_hit_cx, _hit_cy, CURSED_PURPLE, 20)
                         _proj.kill()
+                        # take_damage() veya kill() sonrası gruptan çıktıysa
+                        # sonraki mermiler onu artık hedef almamalı
+                        if not all_enemies.has(_hit_enemy):
+                            _ccd_alive[_ti] = False
 
-                # Arena düşmanlarına da mermi isabet (CCD)
-                if lvl_config.get('type') == 'beat_arena':
-                    for _ap in list(all_player_projectiles):
-                        if not _ap.alive():
-                            continue
-                        _ox2 = getattr(_ap, '_ccd_ox', _ap.rect.centerx)
-                        _oy2 = getattr(_ap, '_ccd_oy', _ap.rect.centery)
-                        _nx2 = _ap.rect.centerx
-                        _ny2 = _ap.rect.centery
-                        _ss2 = min(8, max(1, int(math.hypot(_nx2-_ox2, _ny2-_oy2) / 4)))
-                        _ae_hit = None
-                        _ae_cx, _ae_cy = _nx2, _ny2
-
-                        for _si2 in range(0, _ss2 + 1):
-                            _t2  = _si2 / max(_ss2, 1)
-                            _ix2 = int(_ox2 + (_nx2-_ox2) * _t2)
-                            _iy2 = int(_oy2 + (_ny2-_oy2) * _t2)
-                            _r2  = pygame.Rect(
-                                _ix2-_bullet_r, _iy2-_bullet_r,
-                                _bullet_r*2,    _bullet_r*2
-                            )
-                            for _ae in beat_arena.arena_enemies:
-                                if _r2.colliderect(_ae.rect):
-                                    _ae_hit = _ae
-                                    _ae_cx, _ae_cy = _ix2, _iy2
-                                    break
-                            if _ae_hit:
-                                break
-
-                        if _ae_hit:
-                            if hasattr(_ae_hit, 'take_damage'):
-                                _ae_hit.take_damage(_wpn_dmg)
-                            score += 300
-                            all_vfx.add(ParticleExplosion(_ae_cx, _ae_cy, (255, 100, 30), 10))
-                            _ap.kill()
+            profiler.end("bullet_ccd")
 
             PLAYER_W, PLAYER_H = 28, 42   # sprite boyutuyla eşleşir
             player_rect = pygame.Rect(int(player_x), int(player_y), PLAYER_W, PLAYER_H)
@@ -2536,8 +2631,8 @@ def run_game_loop():
                     enemy.kill()
                     saved_soul = SavedSoul(enemy.rect.centerx, enemy.rect.centery)
                     all_vfx.add(saved_soul)
-                    all_vfx.add(ParticleExplosion(enemy.rect.centerx, enemy.rect.centery, (255, 215, 0), 20))
-                    all_vfx.add(Shockwave(enemy.rect.centerx, enemy.rect.centery, (255, 255, 200), max_radius=120, width=5))
+                    particle_system.emit_explosion(enemy.rect.centerx, enemy.rect.centery, (255, 215, 0), 20)
+                    particle_system.emit_shockwave(enemy.rect.centerx, enemy.rect.centery, (255, 255, 200), max_radius=120, width=5)
                     save_manager.update_karma(25)
                     save_manager.add_saved_soul(1)
                     score += 1000
@@ -2546,18 +2641,6 @@ def run_game_loop():
                     karma_notification_timer = 40
                     continue
 
-                if isinstance(enemy, EnemyBullet):
-                    _bullet_died = player_hp.take_damage(30)
-                    screen_shake = max(screen_shake, 10)
-                    all_vfx.add(ScreenFlash((255, 0, 0), 80, 5))
-                    enemy.kill()
-                    if _bullet_died:
-                        GAME_STATE = 'GAME_OVER'
-                        high_score = max(high_score, int(score))
-                        save_manager.update_high_score('easy_mode', current_level_idx, score)
-                        audio_manager.stop_music()
-                    continue
-
                 if is_dashing or is_slamming or is_super_mode:
                     enemy.kill()
                     score += 500
@@ -2569,8 +2652,8 @@ def run_game_loop():
                     screen_shake = 15
                     if EXPLOSION_SOUND:
                         audio_manager.play_sfx(EXPLOSION_SOUND)
-                    all_vfx.add(ParticleExplosion(enemy.rect.centerx, enemy.rect.centery, CURSED_PURPLE, 20))
-                    all_vfx.add(Shockwave(enemy.rect.centerx, enemy.rect.centery, GLITCH_BLACK, max_radius=80, width=5))
+                    particle_system.emit_explosion(enemy.rect.centerx, enemy.rect.centery, CURSED_PURPLE, 20)
+                    particle_system.emit_shockwave(enemy.rect.centerx, enemy.rect.centery, GLITCH_BLACK, max_radius=80, width=5)
                     pygame.time.delay(30)
                 else:
                     if player_karma <= -90 and not has_revived_this_run:
@@ -2581,7 +2664,12 @@ def run_game_loop():
                         all_vfx.add(ScreenFlash((0, 0, 0), 150, 20))
                         for e in all_enemies:
                             e.kill()
-                            all_vfx.add(ParticleExplosion(e.rect.centerx, e.rect.centery, CURSED_RED, 20))
+                            particle_system.emit_explosion(e.rect.centerx, e.rect.centery, CURSED_RED, 20)
+                        for _s in hostile_shots:
+                            particle_system.emit_explosion(_s.rect.centerx, _s.rect.centery, CURSED_RED, 20)
+                        for _bx, _by in enemy_projectiles.positions():
+                            particle_system.emit_explosion(int(_bx), int(_by), CURSED_RED, 20)
+                        entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
                         active_damage_waves.append({'x': player_x + 15, 'y': player_y + 15, 'r': 10, 'max_r': 500, 'speed': 40})
                         y_velocity = -15
                         is_jumping = True
@@ -2590,7 +2678,7 @@ def run_game_loop():
                         _touch_died = player_hp.take_damage(20)
                         screen_shake = max(screen_shake, 12)
                         all_vfx.add(ScreenFlash((255, 0, 0), 80, 5))
-                        all_vfx.add(ParticleExplosion(int(player_x + 15), int(player_y + 15), CURSED_RED, 10))
+                        particle_system.emit_explosion(int(player_x + 15), int(player_y + 15), CURSED_RED, 10)
                         if _touch_died:
                             if current_level_idx == 10:
                                 init_limbo()
@@ -2602,10 +2690,36 @@ def run_game_loop():
                                 high_score = max(high_score, int(score))
                                 save_manager.update_high_score('easy_mode', current_level_idx, score)
                                 audio_manager.stop_music()
-                                all_vfx.add(ParticleExplosion(player_x, player_y, CURSED_RED, 30))
+                                particle_system.emit_explosion(player_x, player_y, CURSED_RED, 30)
+
+            # ── Düşman mermileri (sprite + havuz) — oyuncu çarpışması ────
+            _shot_hits = [(_s.rect.centerx, _s.rect.centery, getattr(_s, 'damage', BOSS_DAMAGE)) for _s in
+                          pygame.sprite.spritecollide(dummy_player, hostile_shots, True)]
+            for _bx, _by, _bdmg in _shot_hits + enemy_projectiles.collide_rect(player_rect):
+                if has_talisman:
+                    _bx, _by = int(_bx), int(_by)
+                    all_vfx.add(SavedSoul(_bx, _by))
+                    particle_system.emit_explosion(_bx, _by, (255, 215, 0), 20)
+                    particle_system.emit_shockwave(_bx, _by, (255, 255, 200), max_radius=120, width=5)
+                    save_manager.update_karma(25)
+                    save_manager.add_saved_soul(1)
+                    score += 1000
+                    enemies_killed_current_level += 1
+                    karma_notification_text = "RUH KURTARILDI! (+25)"
+                    karma_notification_timer = 40
+                    continue
+                _bullet_died = player_hp.take_damage(_bdmg)
+                screen_shake = max(screen_shake, 10)
+                all_vfx.add(ScreenFlash((255, 0, 0), 80, 5))
+                if _bullet_died:
+                    GAME_STATE = 'GAME_OVER'
+                    high_score = max(high_score, int(score))
+                    save_manager.update_high_score('easy_mode', current_level_idx, score)
+                    audio_manager.stop_music()
 
+            profiler.begin("platform_collision")
             move_rect = pygame.Rect(int(player_x), int(min(old_y, player_y)), PLAYER_W, int(abs(player_y - old_y)) + PLAYER_H)
-            collided_platforms = pygame.sprite.spritecollide(type('',(object,),{'rect':move_rect})(), all_platforms, False)
+            collided_platforms = all_platforms.collide(move_rect)
 
             for p in collided_platforms:
                 platform_top = p.rect.top
@@ -2616,11 +2730,10 @@ def run_game_loop():
                         screen_shake = 30
                         active_damage_waves.append({'x': player_x + 15, 'y': platform_top, 'r': 10, 'max_r': 250, 'speed': 25})
                         for i in range(2):
-                            wave = Shockwave(player_x+15, p.rect.top, (255, 180, 80), speed=25)
-                            wave.radius = 30 + i*30
-                            wave.max_radius = 200 + i*60
-                            all_vfx.add(wave)
-                        all_vfx.add(ParticleExplosion(player_x+15, p.rect.top, PLAYER_SLAM, 25))
+                            particle_system.emit_shockwave(player_x+15, p.rect.top, (255, 180, 80),
+                                                           max_radius=200 + i*60, speed=25,
+                                                           radius=30 + i*30)
+                        particle_system.emit_explosion(player_x+15, p.rect.top, PLAYER_SLAM, 25)
                         is_slamming = False
                         is_jumping = True
                         jumps_left = MAX_JUMPS - 1
@@ -2630,20 +2743,18 @@ def run_game_loop():
                         is_jumping = is_slamming = False
                         jumps_left = MAX_JUMPS
                         character_state = 'idle'
-                        all_vfx.add(ParticleExplosion(player_x+15, player_y+30, CURRENT_THEME["player_color"], 8))
+                        particle_system.emit_explosion(player_x+15, player_y+30, CURRENT_THEME["player_color"], 8)
                     break
 
             # ── MALİKANE: Yatay duvar + kapı çarpışması ──────────────────────
             if lvl_config.get('type') == 'manor_stealth':
                 # Dikey platform (duvar) çarpışması
                 _wall_rect = pygame.Rect(int(player_x), int(player_y) + 4, PLAYER_W, PLAYER_H - 8)
-                for _wp in all_platforms:
-                    if _wp.rect.height > _wp.rect.width:   # Dikey (duvar) platform
-                        if _wall_rect.colliderect(_wp.rect):
-                            if old_x + PLAYER_W <= _wp.rect.left + 6:
-                                player_x = float(_wp.rect.left - PLAYER_W)
-                            elif old_x >= _wp.rect.right - 6:
-                                player_x = float(_wp.rect.right)
+                for _wp in all_platforms.collide(_wall_rect, LANE_WALLS):
+                    if old_x + PLAYER_W <= _wp.rect.left + 6:
+                        player_x = float(_wp.rect.left - PLAYER_W)
+                    elif old_x >= _wp.rect.right - 6:
+                        player_x = float(_wp.rect.right)
 
                 # Kilitli kapı çarpışması — "CART CURT" sesi + geri it
                 try:
@@ -2655,21 +2766,7 @@ def run_game_loop():
                         if _door_rect_p.colliderect(_door.rect):
                             # Sese bas (sadece ilk çarpışmada, spam olmasın)
                             if not getattr(_door, '_bump_cooldown', 0):
-                                try:
-                                    import pygame as _pg
-                                    # Kısa metalik tıkırtı sesi — basit beep ile simüle
-                                    _bump_snd = _pg.sndarray.make_sound(
-                                        __import__('numpy').array(
-                                            [int(3000 * __import__('math').sin(
-                                                i * 0.8 + __import__('math').sin(i * 0.3) * 2
-                                            )) for i in range(4000)],
-                                            dtype=__import__('numpy').int16
-                                        ).reshape(-1, 1).repeat(2, axis=1)
-                                    )
-                                    _bump_snd.set_volume(0.4)
-                                    _bump_snd.play()
-                                except Exception:
-                                    pass   # numpy yoksa sessiz geç
+                                DOOR_BUMP_SOUND.play()   # Açılışta üretildi (sound_cache)
                                 _door._bump_cooldown = 20   # 20 kare bekleme
                             else:
                                 _door._bump_cooldown -= 1
@@ -2718,8 +2815,7 @@ def run_game_loop():
                 _safe_r = lvl_config.get("secret_safe_radius", 100)
                 _dx_safe = player_x - _safe_x
                 _dy_safe = player_y - _safe_y
-                if math.sqrt(_dx_safe * _dx_safe + _dy_safe * _dy_safe) < _safe_r:
-                    from mission_system import mission_manager
+                if math.sqrt(_dx_safe * _dx_safe + _dy_safe * _dy_safe) < _safe_r and not god_mode:
                     mission_manager.set_flag("area_secret_safe", True)
                     mission_manager.complete_objective("find_secret_safe")
                     if stealth_system.active_guard_count() == 0:
@@ -2735,10 +2831,12 @@ def run_game_loop():
                     save_manager.unlock_next_level('easy_mode', current_level_idx)
                     save_manager.update_high_score('easy_mode', current_level_idx, score)
 
+            profiler.end("platform_collision")
+
             # ── Can Küreleri (HealthOrb) güncelle + topla ─────────────────
             _player_rect_orb = pygame.Rect(int(player_x), int(player_y), PLAYER_W, PLAYER_H)
             for _orb in list(all_health_orbs):
-                _orb.update(camera_speed, dt)
+                _orb.update(dt)
                 if _player_rect_orb.colliderect(_orb.rect):
                     player_hp.heal(HealthOrb.HEAL_AMOUNT)
                     _orb.kill()
@@ -2748,13 +2846,13 @@ def run_game_loop():
 
             # ── Silah Sandıkları güncelle ─────────────────────────────────
             for _wc in list(all_weapon_chests):
-                _wc.update(camera_speed, dt)
-                if _wc.rect.right < -50:   # Ekran dışı → sil
+                _wc.update(dt)
+                if _wc.rect.right < world_camera.left - 50:   # Ekran dışı → sil
                     _wc.kill()
 
             # ── Cephane Pickup'ları güncelle + topla ─────────────────────
             for _ap in list(all_ammo_pickups):
-                _ap.update(camera_speed, dt)
+                _ap.update(dt)
                 if _player_rect_orb.colliderect(_ap.rect):
                     _added = 0
                     if active_weapon_obj is not None and _ap.weapon_type == active_weapon_obj.WEAPON_TYPE:
@@ -2776,13 +2874,13 @@ def run_game_loop():
 
             for npc in npcs:
                 npc.update(player_x, player_y, dt)
-                action = vasil_companion.update(player_x, player_y, all_enemies, boss_manager_system, camera_speed)
+                action = vasil_companion.update(player_x, player_y, all_enemies, boss_manager_system)
                 if action:
                     act_type, target = action
                     if act_type == "LASER":
                         pygame.draw.line(game_canvas, (0, 255, 100), (vasil_companion.x, vasil_companion.y), target.rect.center, 3)
                         target.kill()
-                        all_vfx.add(ParticleExplosion(target.rect.centerx, target.rect.centery, (0, 255, 100), 15))
+                        particle_system.emit_explosion(target.rect.centerx, target.rect.centery, (0, 255, 100), 15)
                         save_manager.update_karma(-5)
                         score += 1000
 
@@ -2790,14 +2888,15 @@ def run_game_loop():
                     vasil_companion.spike_timer += 1
                     if vasil_companion.spike_timer > 120:
                         vasil_companion.spike_timer = 0
-                        vis_plats = [p for p in all_platforms if 0 < p.rect.centerx < LOGICAL_WIDTH]
+                        vis_plats = [p for p in all_platforms
+                                     if world_camera.left < p.rect.centerx < world_camera.right]
                         if vis_plats:
                             p = random.choice(vis_plats)
-                            all_vfx.add(Shockwave(p.rect.centerx, p.rect.top, (0, 255, 100), max_radius=100, speed=15, rings=2))
+                            particle_system.emit_shockwave(p.rect.centerx, p.rect.top, (0, 255, 100), max_radius=100, speed=15, rings=2)
                             for e in all_enemies:
                                 if e.rect.colliderect(p.rect.inflate(0, -50)):
                                     e.kill()
-                                    all_vfx.add(ParticleExplosion(e.rect.centerx, e.rect.centery, (0, 255, 100), 20))
+                                    particle_system.emit_explosion(e.rect.centerx, e.rect.centery, (0, 255, 100), 20)
 
             if current_level_idx in [11, 12, 13, 14, 15, 30] and save_manager.get_karma() <= -100 and vasil_companion is None:
                 vasil_companion = VasilCompanion(player_x, player_y - 100)
@@ -2819,7 +2918,7 @@ def run_game_loop():
                     last_time = pygame.time.get_ticks()
                     level_15_timer = 0
                     
-                    sound = load_sound_asset("assets/music/final_boss.mp3", generate_ambient_fallback, 1.0)
+                    sound = load_music_asset("assets/music/final_boss.mp3", generate_ambient_fallback, 1.0)
                     audio_manager.play_music(sound)
 
                 if not finisher_active:
@@ -2847,6 +2946,7 @@ def run_game_loop():
                                 if frame_count % 2 == 0:
                                     start_x = random.choice([-100, LOGICAL_WIDTH + 100, random.randint(0, LOGICAL_WIDTH)])
                                     start_y = -100 if start_x > 0 and start_x < LOGICAL_WIDTH else random.randint(0, LOGICAL_HEIGHT)
+                                    start_x += world_camera.ix
                                     soul = SavedSoul(start_x, start_y)
                                     dx = boss_target.x - start_x
                                     dy = boss_target.y - start_y
@@ -2856,8 +2956,8 @@ def run_game_loop():
                                     all_vfx.add(soul)
                                     bx = boss_target.x + random.randint(-50, 50)
                                     by = boss_target.y + random.randint(-50, 50)
-                                    all_vfx.add(ParticleExplosion(bx, by, (0, 255, 255), 15))
-                                    all_vfx.add(Shockwave(bx, by, (255, 255, 100), max_radius=50, speed=10))
+                                    particle_system.emit_explosion(bx, by, (0, 255, 255), 15)
+                                    particle_system.emit_shockwave(bx, by, (255, 255, 100), max_radius=50, speed=10)
                                 karma_notification_text = "TÜM DOSTLAR SALDIRIYOR!"
                                 karma_notification_timer = 2
                             elif finisher_state_timer > 6.0:
@@ -2874,7 +2974,8 @@ def run_game_loop():
                                     dist = 300 - (finisher_state_timer * 100)
                                     px = center_x + math.cos(angle) * dist
                                     py = center_y + math.sin(angle) * dist
-                                    pygame.draw.line(vfx_surface, (255, 0, 0), (px, py), (center_x, center_y), 2)
+                                    pygame.draw.line(vfx_surface, (255, 0, 0), viewport.to_screen(px, py),
+                                                     viewport.to_screen(center_x, center_y), 2)
                                     all_vfx.add(EnergyOrb(px, py, (255, 50, 50), 4, 10))
                                 karma_notification_text = "VASİ: KIYAMET PROTOKOLÜ..."
                                 karma_notification_timer = 2
@@ -2882,17 +2983,18 @@ def run_game_loop():
                                 if int(finisher_state_timer * 10) % 5 == 0:
                                     screen_shake = 100
                                     all_vfx.add(ScreenFlash((255, 255, 255), 255, 60))
-                                    all_vfx.add(Shockwave(center_x, center_y, (255, 0, 0), max_radius=2000, width=50, speed=100))
+                                    particle_system.emit_shockwave(center_x, center_y, (255, 0, 0), max_radius=2000, width=50, speed=100)
                                     for _ in range(20):
-                                        rx = random.randint(0, LOGICAL_WIDTH)
+                                        rx = world_camera.ix + random.randint(0, LOGICAL_WIDTH)
                                         ry = random.randint(0, LOGICAL_HEIGHT)
-                                        all_vfx.add(ParticleExplosion(rx, ry, (255, 0, 0), 40))
+                                        particle_system.emit_explosion(rx, ry, (255, 0, 0), 40)
                             elif finisher_state_timer > 5.0:
                                 boss_target.health = 0
 
             if current_level_idx in [0, 10, 30]:
                 _bm_idx = current_level_idx if current_level_idx != 0 else 10  # Level 0 → level 10 saldırı seti
-                boss_manager_system.update_logic(_bm_idx, all_platforms, player_x, player_karma, camera_speed, frame_mul, is_weakened=False)
+                with profiler.scope("boss_logic"):
+                    boss_manager_system.update_logic(_bm_idx, all_platforms, player_x, player_karma, is_weakened=False)
 
                 # ── LEVEL 0 / INTRO: Boss player'ı smooth lerp ile takip eder ──
                 if current_level_idx == 0:
@@ -2911,7 +3013,7 @@ def run_game_loop():
                 if is_hit:
                     screen_shake = 20
                     all_vfx.add(ScreenFlash((255, 0, 0), 150, 5))
-                    all_vfx.add(ParticleExplosion(player_x + 15, player_y + 15, (200, 0, 0), 25))
+                    particle_system.emit_explosion(player_x + 15, player_y + 15, (200, 0, 0), 25)
                     player_x -= 40
                     y_velocity = -10
 
@@ -2922,14 +3024,15 @@ def run_game_loop():
                         karma_notification_timer = 40
                         if _died:
                             # Vasil yenilemez → ölünce defeat sahnesine geç
-                            all_enemies.empty()
+                            entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
                             all_vfx.empty()
+                            particle_system.clear()
                             VasilDefeatScene(screen, clock).run()
                             init_limbo()
                             GAME_STATE = 'PLAYING'
                             if npcs:
                                 start_npc_conversation(npcs[0])
-                    else:
+                    elif not god_mode:
                         # ── Level 10/30: Eski karma hasar sistemi ───────
                         current_k = save_manager.get_karma()
                         damage = 75
@@ -2971,7 +3074,7 @@ def run_game_loop():
                 lvl_goal = base_goal * 0.75
                 # goal_score=0 olan bölümleri de standart kontrolden dışla
                 # (Skor=0 → eşik=0 → ilk karede True → anlık kazanma hatası)
-                if current_level_idx < 30 and lvl_goal > 0 and score >= lvl_goal:
+                if current_level_idx < 30 and lvl_goal > 0 and score >= lvl_goal and not god_mode:
                     if enemies_killed_current_level == 0:
                         save_manager.update_karma(50)
                         karma_notification_text = "PASİFİST BONUSU! (+50 KARMA)"
@@ -2981,13 +3084,19 @@ def run_game_loop():
                     save_manager.unlock_next_level('easy_mode', current_level_idx)
                     save_manager.update_high_score('easy_mode', current_level_idx, score)
 
-                all_platforms.update(camera_speed * frame_mul)
+                # Kamera yalnızca eskiden platformların kaydığı yerde ilerler
+                world_camera.advance(camera_speed * frame_mul)
+                all_platforms.prune(world_camera.left)
 
-            all_enemies.update(camera_speed * frame_mul, dt, (player_x, player_y))
+            # Havuz boss'lardan önce ilerler: yeni atılan mermiler (eski
+            # spawn_queue gibi) ilk hareketini bir sonraki frame'de yapar
+            enemy_projectiles.update()
+            hostile_shots.update(dt, (player_x, player_y))
+            all_enemies.update(dt, (player_x, player_y))
             for enemy in all_enemies:
                 if hasattr(enemy, 'spawn_queue') and enemy.spawn_queue:
                     for projectile in enemy.spawn_queue:
-                        all_enemies.add(projectile)
+                        entity_registry.add(projectile)
                 enemy.spawn_queue = []
 
             # ── INTRO BOSS (Level 0) — Vasil yenilemez, kill_player sinyalini yakala ─
@@ -2998,8 +3107,9 @@ def run_game_loop():
                         break
                 if vasil_intro_kill_pending:
                     vasil_intro_kill_pending = False
-                    all_enemies.empty()
+                    entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
                     all_vfx.empty()
+                    particle_system.clear()
                     VasilDefeatScene(screen, clock).run()
                     init_limbo()
                     GAME_STATE = 'PLAYING'
@@ -3026,27 +3136,27 @@ def run_game_loop():
                     GAME_STATE = 'GAME_COMPLETE'
                     save_manager.update_high_score('easy_mode', current_level_idx, score)
 
-            for s in stars:
-                s.update(camera_speed * frame_mul)
-            all_vfx.update(camera_speed * frame_mul)
+            starfield.update(world_camera.x)
+            all_vfx.update()
+            particle_system.update()
 
             for trail in trail_effects[:]:
-                try:
-                    trail.update(camera_speed * frame_mul)
-                except:
-                    trail.update(camera_speed * frame_mul, dt)
+                trail.update()
                 if trail.life <= 0:
                     trail_effects.remove(trail)
 
             if lvl_config.get('type') not in ('rest_area', 'beat_arena', 'debug_arena') and current_level_idx not in (0, 99):
                 if current_level_idx <= 30:
-                    if len(all_platforms) > 0 and max(p.rect.right for p in all_platforms) < LOGICAL_WIDTH + 100:
+                    if len(all_platforms) > 0 and all_platforms.right_edge() < world_camera.right + 100:
                         add_new_platform()
 
             if player_y > LOGICAL_HEIGHT + 100:
-                if current_level_idx == 0:
-                    all_enemies.empty()
+                if god_mode and lvl_config.get('type') not in ('manor_stealth', 'debug_arena'):
+                    god_respawn()
+                elif current_level_idx == 0:
+                    entity_registry.empty(HOSTILE_ACTORS, HOSTILE_PROJECTILES)
                     all_vfx.empty()
+                    particle_system.clear()
                     VasilDefeatScene(screen, clock).run()
                     init_limbo()
                     GAME_STATE = 'PLAYING'
@@ -3083,10 +3193,12 @@ def run_game_loop():
                     high_score = max(high_score, int(score))
                     save_manager.update_high_score('easy_mode', current_level_idx, score)
                     audio_manager.stop_music()
-                    all_vfx.add(ParticleExplosion(player_x, player_y, (255, 0, 0), 30))
+                    particle_system.emit_explosion(player_x, player_y, (255, 0, 0), 30)
 
-            if player_x < -50:
-                if current_level_idx == 10:
+            if player_x < world_camera.left - 50:
+                if god_mode and lvl_config.get('type') != 'beat_arena':
+                    god_respawn()
+                elif current_level_idx == 10:
                     init_limbo()
                     GAME_STATE = 'PLAYING'
                     if npcs:
@@ -3100,7 +3212,7 @@ def run_game_loop():
                     high_score = max(high_score, int(score))
                     save_manager.update_high_score('easy_mode', current_level_idx, score)
                     audio_manager.stop_music()
-                    all_vfx.add(ParticleExplosion(player_x, player_y, (255, 0, 0), 30))
+                    particle_system.emit_explosion(player_x, player_y, (255, 0, 0), 30)
             
             # Arena sağ sınırı
             if lvl_config.get('type') == 'beat_arena' and player_x > LOGICAL_WIDTH - 50:
@@ -3163,14 +3275,16 @@ def run_game_loop():
                 < WeaponChest.INTERACT_RADIUS
                 for _c in all_weapon_chests
             ),
+            # --- GÖREV HEDEFLERİ (HUD widget'ı) ---
+            'objectives':     [(_o.text, _o.optional) for _o in mission_manager.get_active_objectives()],
         }
 
         if GAME_STATE in ['MENU', 'SETTINGS', 'LOADING', 'LEVEL_SELECT', 'ENDLESS_SELECT']:
             game_canvas.fill(DARK_BLUE)
-            for s in stars:
-                s.draw(game_canvas)
-                s.update(0.5)
-            active_ui_elements = render_ui(game_canvas, GAME_STATE, ui_data, mouse_pos)
+            starfield.draw(game_canvas)
+            starfield.drift(0.5)
+            with profiler.scope("render_ui"):
+                active_ui_elements = render_ui(game_canvas, GAME_STATE, ui_data, mouse_pos)
         else:
             # ════════════════════════════════════════════════════════════════
             # ÇİZİM SIRASI — Bu sıra kesinlikle değiştirilmemeli.
@@ -3216,10 +3330,16 @@ def run_game_loop():
                 render_offset[0] + _manor_draw_ox,
                 render_offset[1] + _manor_draw_oy
             )
+            # Dünya nesneleri viewport ile çizilir (rect'ler değiştirilmez;
+            # kayan bölümlerde world_camera.x de ofsete girer);
+            # sarsıntıyla çizilen katmanlar (küre, NPC) _shake_view kullanır.
+            viewport.set(_manor_draw_ox - world_camera.ix, _manor_draw_oy)
+            _shake_view = viewport.shifted(*render_offset)
 
             # Render pipeline boyunca güvenli erişim için lvl_config garantisi
             lvl_config = EASY_MODE_LEVELS.get(current_level_idx, EASY_MODE_LEVELS[1])
 
+            profiler.section("draw.01_clear")
             # ── 1. Ekranı temizle ────────────────────────────────────────
             if reality_shifter.current_reality != 0:
                 reality_effect = reality_shifter.get_visual_effect()
@@ -3230,14 +3350,16 @@ def run_game_loop():
             else:
                 game_canvas.fill(CURRENT_THEME["bg_color"])
 
+            profiler.section("draw.02_background")
             # ── 2. Uzak parallax arkaplan ────────────────────────────────
             if active_background:
                 active_background.draw(game_canvas)
 
+            profiler.section("draw.03_stars")
             # ── 3. Yıldızlar ─────────────────────────────────────────────
-            for s in stars:
-                s.draw(game_canvas)
+            starfield.draw(game_canvas)
 
+            profiler.section("draw.04_boss_bg")
             # ── 4. Boss arkaplan gölgesi ─────────────────────────────────
             if current_level_idx in [10, 30]:
                 current_k = save_manager.get_karma()
@@ -3254,49 +3376,42 @@ def run_game_loop():
             # ── VFX yüzeyini sıfırla (henüz game_canvas'a bitmeyecek) ───
             vfx_surface.fill((0, 0, 0, 0))
 
+            profiler.section("draw.05_platforms")
             # ── 5. Platformlar ───────────────────────────────────────────
-            for p in all_platforms:
-                # Malikane bölümünde kamera oyuncuyu 2D takip eder;
-                # platformlar X ve Y ofseti uygulanarak çizilir.
-                _p_draw_rect = p.rect.move(_manor_draw_ox, _manor_draw_oy)
-                _old_rect = p.rect
-                p.rect = _p_draw_rect
-                p.draw(game_canvas, CURRENT_THEME)
-                p.rect = _old_rect
+            # Malikane bölümünde kamera oyuncuyu 2D takip eder;
+            # ekran dışındaki platformlar hiç çizilmez (platform_index x-aralığı).
+            for p in all_platforms.visible(viewport, 0, "platforms"):
+                p.draw(game_canvas, CURRENT_THEME, viewport)
 
+            profiler.section("draw.06_enemies")
             # ── 6. Düşmanlar / Boss ──────────────────────────────────────
-            boss_manager_system.draw(game_canvas)
-            for e in all_enemies:
-                # Malikane kamera ofseti (X ve Y) uygulanır
-                if (_manor_draw_ox != 0 or _manor_draw_oy != 0) and hasattr(e, 'rect'):
-                    _e_ox, _e_oy = e.rect.x, e.rect.y
-                    e.rect.x += _manor_draw_ox
-                    e.rect.y += _manor_draw_oy
-                    e.draw(game_canvas, theme=CURRENT_THEME)
-                    e.rect.x = _e_ox
-                    e.rect.y = _e_oy
-                else:
-                    e.draw(game_canvas, theme=CURRENT_THEME)
+            boss_manager_system.draw(game_canvas, viewport)
+            # Boss etiketi / konuşma balonu rect dışına taşar → geniş pay
+            for e in viewport.cull(all_enemies, 200, "enemies"):
+                e.draw(game_canvas, camera_offset=viewport, theme=CURRENT_THEME)
+            for _s in viewport.cull(hostile_shots, name="enemy_shots"):
+                _s.draw(game_canvas, camera_offset=viewport, theme=CURRENT_THEME)
+            enemy_projectiles.draw(game_canvas, viewport)
 
             # ── 6b. Beat Arena Düşmanları + HUD ──────────────────────────
             if lvl_config.get('type') == 'beat_arena':
-                beat_arena.draw(game_canvas)
+                beat_arena.draw(game_canvas, viewport)
 
             # ── Can Kürelerini çiz ────────────────────────────────────────
-            for _orb in all_health_orbs:
-                _orb.draw(game_canvas, render_offset, CURRENT_THEME)
+            for _orb in viewport.cull(all_health_orbs, name="health_orbs"):
+                _orb.draw(game_canvas, _shake_view, CURRENT_THEME)
 
             # ── Silah Sandıkları çiz ──────────────────────────────────────
-            for _wc in all_weapon_chests:
-                _wc.draw(game_canvas)
-                _wc.draw_prompt(game_canvas, player_x + 14, player_y + 21)
+            for _wc in viewport.cull(all_weapon_chests, name="weapon_chests"):
+                _wc.draw(game_canvas, viewport)
+                _wc.draw_prompt(game_canvas, player_x + 14, player_y + 21, viewport)
 
             # ── Cephane Pickup'larını çiz ─────────────────────────────────
-            for _ap in all_ammo_pickups:
-                _ap.draw(game_canvas)
+            for _ap in viewport.cull(all_ammo_pickups, name="ammo_pickups"):
+                _ap.draw(game_canvas, viewport)
 
             # ── Kombo sistemi hitbox (her bölümde) ───────────────────────
-            combo_system.draw(vfx_surface)
+            combo_system.draw(vfx_surface, viewport)
 
             # ── Combat HUD (her bölümde) — kombo zinciri ────────────────
             # HP + Stamina barları ui_system.py içinde render edilir (Step 12).
@@ -3306,25 +3421,27 @@ def run_game_loop():
                 combat_hud.draw(game_canvas, hud_info)
 
             # VFX partikülleri ve trail'leri ayrı yüzeye çiz
-            for v in all_vfx:
-                v.draw(vfx_surface)
+            all_vfx.draw(vfx_surface, viewport)
+            particle_system.draw(vfx_surface, viewport)
             for trail in trail_effects:
-                trail.draw(vfx_surface)
+                trail.draw(vfx_surface, viewport)
 
             # ── Oyuncu mermilerini çiz (VFX yüzeyi üstünde) ──────────────
             _bullet_wtype = 'default'
             if active_weapon_obj is not None:
                 _bullet_wtype = getattr(active_weapon_obj, 'WEAPON_TYPE', 'default')
-            for _p in all_player_projectiles:
-                draw_player_bullet(game_canvas, _p, _bullet_wtype)
+            for _p in viewport.cull(all_player_projectiles, 32, "player_bullets"):
+                draw_player_bullet(game_canvas, _p, _bullet_wtype, viewport)
 
+            profiler.section("draw.07_npcs")
             # ── 7. NPC'ler ───────────────────────────────────────────────
-            for npc in npcs:
-                npc.draw(game_canvas, render_offset)
+            for npc in viewport.cull(npcs, name="npcs"):
+                npc.draw(game_canvas, _shake_view)
 
             # ── 7b. Gizlilik katmanı (kameralar, vizyon konileri, şüphe HUD) ──
-            stealth_system.draw(game_canvas, camera_offset=(_manor_draw_ox, _manor_draw_oy))
+            stealth_system.draw(game_canvas, camera_offset=viewport)
 
+            profiler.section("draw.08_player")
             # ── 8. OYUNCU ────────────────────────────────────────────────
             if GAME_STATE in ('PLAYING', 'PAUSED', 'GAME_OVER', 'LEVEL_COMPLETE',
                               'ENDLESS_PLAY', 'CHAT', 'CUTSCENE') and GAME_STATE != 'GAME_OVER':
@@ -3345,7 +3462,7 @@ def run_game_loop():
                 # Talisman halkası — oyuncunun etrafında altın çember
                 if has_talisman:
                     t = pygame.time.get_ticks() * 0.005
-                    px, py = int(player_x + 15) + render_offset[0], int(player_y + 15) + render_offset[1]
+                    px, py = _shake_view.to_screen(int(player_x + 15), int(player_y + 15))
                     radius = 35 + math.sin(t) * 5
                     pygame.draw.circle(game_canvas, (255, 215, 0), (px, py), int(radius), 2)
                     for i in range(3):
@@ -3359,8 +3476,7 @@ def run_game_loop():
                     dt, character_state, player_direction
                 )
 
-                _px = int(player_x) + render_offset[0] + int(-manor_camera_offset_x)
-                _py = int(player_y) + render_offset[1] + int(-manor_camera_offset_y)
+                _px, _py = _shake_view.to_screen(int(player_x), int(player_y))
 
                 # ── DEBUG: print + sheet görselleştirme ──────────────────
                 if DEBUG_SPRITE:
@@ -3412,7 +3528,7 @@ def run_game_loop():
                         game_canvas.blit(_preview, (100, 100))
 
                         # Etiket: dosya adı + boyut bilgisi
-                        _lbl_font = pygame.font.Font(None, 20)
+                        _lbl_font = get_font(20)
                         _lbl = _lbl_font.render(
                             f"SHEET TEST: {_ts_w}x{_ts_h}px  |  DEBUG_SPRITE=True kapat",
                             True, (255, 255, 0)
@@ -3524,7 +3640,7 @@ def run_game_loop():
                         else:
                             _fb = pygame.Surface((60, 90))
                             _fb.fill((255, 0, 100))
-                            _fb.blit(pygame.font.Font(None, 40).render("?", True, (255,255,255)), (18, 30))
+                            _fb.blit(get_font(40).render("?", True, (255,255,255)), (18, 30))
                             _direct_sprite = [_fb]
                             print("[WALK] ✗ Dosya bulunamadı! → assets/sprites/player_walk.png")
 
@@ -3551,8 +3667,8 @@ def run_game_loop():
                     _off_x = (_hitbox_w - _sprite_w) // 2   # Yatay ortala
                     _off_y = _hitbox_h - _sprite_h           # Alt kenar hizala
 
-                    _draw_x = int(player_x) + render_offset[0] + _off_x
-                    _draw_y = int(player_y) + render_offset[1] + _off_y
+                    _draw_x = _px + _off_x
+                    _draw_y = _py + _off_y
 
                     # ── KARAKTERİ HER ZAMAN ÇİZ ──────────────────────────
                     game_canvas.blit(_cur_frame, (_draw_x, _draw_y))
@@ -3560,17 +3676,16 @@ def run_game_loop():
                     # ── DEBUG KATMANI — sadece DEBUG_SPRITE açıksa ───────
                     if DEBUG_SPRITE:
                         game_canvas.blit(_cur_frame, (200, 200))
-                        _lf = pygame.font.Font(None, 20)
+                        _lf = get_font(20)
                         game_canvas.blit(
                             _lf.render(f"FRAME {_frame_idx+1}/{len(_frames_list)}  |  {character_state}", True, (255,255,0)),
                             (200, 185)
                         )
-                        pygame.draw.rect(game_canvas, (255, 255, 0),
+                        debug_overlay.rect((255, 255, 0),
                             (_draw_x, _draw_y, _sprite_w, _sprite_h), 2)
-                        pygame.draw.rect(game_canvas, (0, 255, 255),
-                            (int(player_x) + render_offset[0],
-                             int(player_y) + render_offset[1],
-                             _hitbox_w, _hitbox_h), 1)
+                        debug_overlay.rect((0, 255, 255),
+                            (_px, _py, _hitbox_w, _hitbox_h), 1)
+                        debug_overlay.flush(game_canvas)
 
                 elif current_sprite is not None:
                     # ── NORMAL SPRITE MODU ───────────────────────────────
@@ -3606,10 +3721,8 @@ def run_game_loop():
                     game_canvas.blit(current_sprite, (_blit_x, _blit_y))
 
                     if DEBUG_SPRITE:
-                        pygame.draw.rect(
-                            game_canvas, (255, 0, 0),
-                            (_px, _py, 28, 42), 2
-                        )
+                        debug_overlay.rect((255, 0, 0), (_px, _py, 28, 42), 2)
+                        debug_overlay.flush(game_canvas)
 
                 else:
                     # ── FALLBACK: Placeholder dikdörtgen ─────────────────
@@ -3620,18 +3733,16 @@ def run_game_loop():
                     pygame.draw.rect(game_canvas, modified_color, (_px, _py, _pw, _ph), 2)
 
                     if DEBUG_SPRITE:
-                        pygame.draw.rect(
-                            game_canvas, (255, 0, 0),
-                            (_px, _py, _pw, _ph), 2
-                        )
+                        debug_overlay.rect((255, 0, 0), (_px, _py, _pw, _ph), 2)
+                        debug_overlay.flush(game_canvas)
             # ── 8. OYUNCU SONU ───────────────────────────────────────────
 
+            profiler.section("draw.08b_weapon")
             # ── 8b. SİLAH ÇİZİMİ — oyuncunun üstünde, partiküllerin altında ──
             if (GAME_STATE in ('PLAYING', 'PAUSED', 'ENDLESS_PLAY', 'CHAT')
                     and active_weapon_obj is not None
                     and active_weapon_obj.visual is not None):
-                _wep_base_x = int(player_x) + render_offset[0] + int(-manor_camera_offset_x)
-                _wep_base_y = int(player_y) + render_offset[1] + int(-manor_camera_offset_y)
+                _wep_base_x, _wep_base_y = _shake_view.to_screen(int(player_x), int(player_y))
                 _wep_pivot_x = _wep_base_x + 14   # hitbox merkezi X
                 _wep_pivot_y = _wep_base_y + 22   # omuz hizası Y
                 active_weapon_obj.draw(
@@ -3660,14 +3771,11 @@ def run_game_loop():
                             int(_px0 + math.cos(_a) * _cone_r),
                             int(_py0 + math.sin(_a) * _cone_r)
                         ))
-                    _max_surf = pygame.Surface(
-                        (game_canvas.get_width(), game_canvas.get_height()), pygame.SRCALPHA
-                    )
                     if len(_max_pts) >= 3:
-                        pygame.draw.polygon(_max_surf, (180, 180, 180, 18), _max_pts)
-                        pygame.draw.lines(_max_surf, (180, 180, 180, 60), False,
-                                          [_max_pts[1], _max_pts[0], _max_pts[-1]], 1)
-                    game_canvas.blit(_max_surf, (0, 0))
+                        debug_overlay.polygon((180, 180, 180, 18), _max_pts)
+                        debug_overlay.lines((180, 180, 180, 60), False,
+                                            [_max_pts[1], _max_pts[0], _max_pts[-1]], 1)
+                    debug_overlay.flush(game_canvas)
 
                     # ── 2. DOLU MEVCUT KONİ (yeşil→turuncu→kırmızı renk geçişi) ─
                     if _sp_cur > 0.001:
@@ -3680,18 +3788,15 @@ def run_game_loop():
                                 int(_px0 + math.cos(_a) * _cone_r),
                                 int(_py0 + math.sin(_a) * _cone_r)
                             ))
-                        _cur_surf = pygame.Surface(
-                            (game_canvas.get_width(), game_canvas.get_height()), pygame.SRCALPHA
-                        )
                         _fill_alpha = int(30 + 60 * _sp_pct)
                         if len(_cur_pts) >= 3:
-                            pygame.draw.polygon(_cur_surf, (_r_col, _g_col, 20, _fill_alpha), _cur_pts)
+                            debug_overlay.polygon((_r_col, _g_col, 20, _fill_alpha), _cur_pts)
                             # Kenar çizgileri (pivot → iki uç nokta)
-                            pygame.draw.line(_cur_surf, (_r_col, _g_col, 20, 200),
-                                             (_px0, _py0), _cur_pts[1], 2)
-                            pygame.draw.line(_cur_surf, (_r_col, _g_col, 20, 200),
-                                             (_px0, _py0), _cur_pts[-1], 2)
-                        game_canvas.blit(_cur_surf, (0, 0))
+                            debug_overlay.line((_r_col, _g_col, 20, 200),
+                                               (_px0, _py0), _cur_pts[1], 2)
+                            debug_overlay.line((_r_col, _g_col, 20, 200),
+                                               (_px0, _py0), _cur_pts[-1], 2)
+                        debug_overlay.flush(game_canvas)
 
                     # ── 3. MERKEZ NİŞAN ÇİZGİSİ ─────────────────────────────
                     _aim_ex = int(_px0 + math.cos(aim_angle) * _cone_r)
@@ -3701,7 +3806,7 @@ def run_game_loop():
                     pygame.draw.circle(game_canvas, (0, 255, 120), (_aim_ex, _aim_ey), 3)
 
                     # ── 4. BİLGİ PANELİ ─────────────────────────────────────
-                    _pf = pygame.font.Font(None, 18)
+                    _pf = get_font(18)
                     _bar_x  = _px0 + 14
                     _bar_y  = _py0 - 58
                     _bar_w  = 90
@@ -3730,18 +3835,17 @@ def run_game_loop():
                                                 (int(50+205*_sp_pct), int(230-180*_sp_pct), 20)),
                                      (_bar_x + 68, _bar_y + 10))
 
+            profiler.section("draw.08c_trajectory")
             # ── 8c. TRAJECTORY IZGARA — Mermi yolu göstergesi ───────────────
             # DEBUG_SPRITE'dan bağımsız, her zaman gösterilir.
-            # Rule 3: _traj_surface pre-allocated, her frame sadece fill+draw.
+            # Rule 3: kalıcı debug_overlay katmanı — yalnızca kirli kutu basılıp temizlenir.
             if (GAME_STATE in ('PLAYING', 'ENDLESS_PLAY')
                     and active_weapon_obj is not None
                     and not active_weapon_obj.is_reloading
                     and active_weapon_obj.bullets > 0):
 
-                _traj_surface.fill((0, 0, 0, 0))
-
-                _tr_px = int(player_x) + render_offset[0] + int(-manor_camera_offset_x) + 14
-                _tr_py = int(player_y) + render_offset[1] + int(-manor_camera_offset_y) + 22
+                _tr_px = int(player_x) + _shake_view.ox + 14
+                _tr_py = int(player_y) + _shake_view.oy + 22
 
                 _tr_wtype = getattr(active_weapon_obj, 'WEAPON_TYPE', 'revolver')
                 if _tr_wtype == 'revolver':
@@ -3760,41 +3864,41 @@ def run_game_loop():
                 _tg_spread = _tgp['spread']
 
                 if _tg_steps >= 2:
-                    pygame.draw.line(_traj_surface, (*_tr_rgb, 30),
-                                     _tgp['center'][0], _tgp['center'][-1], 1)
+                    debug_overlay.line((*_tr_rgb, 30),
+                                       _tgp['center'][0], _tgp['center'][-1], 1)
 
                 for _tgi in range(1, _tg_steps):
                     _tg_alpha = int(160 * (1.0 - (_tgi / _tg_steps)))
-                    pygame.draw.circle(_traj_surface, (*_tr_rgb, _tg_alpha),
-                                       _tgp['center'][_tgi], 2)
+                    debug_overlay.circle((*_tr_rgb, _tg_alpha),
+                                         _tgp['center'][_tgi], 2)
                     if _tg_spread > 0.001:
                         _tu = _tgp['upper'][_tgi]
                         _tl = _tgp['lower'][_tgi]
                         _ra = max(25, _tg_alpha // 3)
-                        pygame.draw.circle(_traj_surface,
-                                           (*_tr_rgb, max(40, _tg_alpha-30)), _tu, 2)
-                        pygame.draw.circle(_traj_surface,
-                                           (*_tr_rgb, max(40, _tg_alpha-30)), _tl, 2)
+                        debug_overlay.circle((*_tr_rgb, max(40, _tg_alpha-30)), _tu, 2)
+                        debug_overlay.circle((*_tr_rgb, max(40, _tg_alpha-30)), _tl, 2)
                         if _tgi - 1 < len(_tgp['rungs']):
-                            pygame.draw.line(_traj_surface, (*_tr_rgb, _ra),
-                                             _tgp['rungs'][_tgi-1][0],
-                                             _tgp['rungs'][_tgi-1][1], 1)
+                            debug_overlay.line((*_tr_rgb, _ra),
+                                               _tgp['rungs'][_tgi-1][0],
+                                               _tgp['rungs'][_tgi-1][1], 1)
 
                 if _tg_spread > 0.001 and len(_tgp['upper']) >= 2:
                     for _tgi2 in range(1, _tg_steps, 2):
                         _ta2 = max(20, int(80 * (1.0 - (_tgi2 / _tg_steps))))
                         if _tgi2 < len(_tgp['upper']):
-                            pygame.draw.line(_traj_surface, (*_tr_rgb, _ta2),
-                                             _tgp['upper'][_tgi2-1], _tgp['upper'][_tgi2], 1)
-                            pygame.draw.line(_traj_surface, (*_tr_rgb, _ta2),
-                                             _tgp['lower'][_tgi2-1], _tgp['lower'][_tgi2], 1)
+                            debug_overlay.line((*_tr_rgb, _ta2),
+                                               _tgp['upper'][_tgi2-1], _tgp['upper'][_tgi2], 1)
+                            debug_overlay.line((*_tr_rgb, _ta2),
+                                               _tgp['lower'][_tgi2-1], _tgp['lower'][_tgi2], 1)
 
-                game_canvas.blit(_traj_surface, (0, 0))
+                debug_overlay.flush(game_canvas)
 
+            profiler.section("draw.09_companion")
             # ── 9. Yardımcı figür ────────────────────────────────────────
             if vasil_companion:
-                vasil_companion.draw(game_canvas)
+                vasil_companion.draw(game_canvas, viewport)
 
+            profiler.section("draw.10_vfx_blit")
             # ── 10. VFX partikülleri game_canvas üstüne blit ────────────
             # NOT: vfx_surface oyuncunun üstüne değil, render_offset ile
             # kamera sarsmasını yansıtarak blit edilir. Trail/partiküller
@@ -3826,14 +3930,9 @@ def run_game_loop():
             game_canvas.blit(_btn_txt, (_btn_txt_x, _btn_txt_y))
             # ─────────────────────────────────────────────────────────────
 
-            # Karma bildirimi
+            # Karma bildirimi (metin değişmedikçe önbellekten)
             if karma_notification_timer > 0:
-                font = pygame.font.Font(None, 40)
-                color = (255, 50, 50) if "DÜŞTÜ" in karma_notification_text else (0, 255, 100)
-                if "DİRİLİŞ" in karma_notification_text:
-                    color = (200, 50, 200)
-                draw_text_with_shadow(game_canvas, karma_notification_text, font,
-                                     (LOGICAL_WIDTH//2, LOGICAL_HEIGHT//2 - 100), color, align="center")
+                hud_compositor.draw_notification(game_canvas, karma_notification_text)
 
             # Bölüm 30 hayatta kalma sayacı
             if current_level_idx == 30 and not finisher_active:
@@ -3842,14 +3941,16 @@ def run_game_loop():
                 secs = int(remaining % 60)
                 time_str = f"HAYATTA KAL: {mins:02}:{secs:02}"
                 text_color = (255, 50, 50) if frame_count % 60 < 30 else (255, 255, 255)
-                font_timer = pygame.font.Font(None, 60)
+                font_timer = get_font(60)
                 draw_text_with_shadow(game_canvas, time_str, font_timer,
                                      (LOGICAL_WIDTH//2, 80), text_color, align="center")
 
+            profiler.section("draw.11_chat")
             # ── 11. NPC sohbet / sinematik katman ───────────────────────
             if GAME_STATE == 'NPC_CHAT':
                 draw_npc_chat(game_canvas, current_npc, npc_chat_history,
-                              npc_chat_input, npc_show_cursor, LOGICAL_WIDTH, LOGICAL_HEIGHT)
+                              npc_chat_input, npc_show_cursor, LOGICAL_WIDTH, LOGICAL_HEIGHT,
+                              thinking=bool(current_npc) and story_manager.is_npc_thinking(current_npc.name))
 
             if GAME_STATE in ['CHAT', 'CUTSCENE']:
                 active_ui_elements = draw_cinematic_overlay(
@@ -3860,7 +3961,7 @@ def run_game_loop():
             if GAME_STATE == 'PLAYING':
                 lvl_config = EASY_MODE_LEVELS.get(current_level_idx, EASY_MODE_LEVELS[1])
                 if lvl_config.get('type') == 'rest_area':
-                    font = pygame.font.Font(None, 24)
+                    font = get_font(24)
                     instructions = [
                         "E: NPC ile konuş", "T: Sonraki bölüme geç",
                         "WASD: Hareket et", "Sağa git → Otomatik geçiş"
@@ -3871,7 +3972,7 @@ def run_game_loop():
                         game_canvas.blit(text_surf, (40, y_offset))
                         y_offset += 25
                 elif lvl_config.get('type') == 'beat_arena':
-                    font = pygame.font.Font(None, 24)
+                    font = get_font(24)
                     instructions = [
                         "J: Hafif Vuruş    K: Ağır Vuruş",
                         "WASD: Hareket / Zıplama",
@@ -3885,7 +3986,7 @@ def run_game_loop():
                         y_offset += 25
                 elif lvl_config.get('type') == 'manor_stealth':
                     # Malikane özel HUD: suikast ipucu + aktif muhafız sayacı
-                    _mfont = pygame.font.Font(None, 24)
+                    _mfont = get_font(24)
                     _guard_count = stealth_system.active_guard_count()
                     _manor_hints = [
                         "F: Sessiz Suikast (Arkadan, Şüphe < %50)",
@@ -3900,7 +4001,7 @@ def run_game_loop():
                         _mhud_y += 24
                 elif lvl_config.get('type') == 'debug_arena':
                     # Debug Arena HUD: geliştirici ipuçları
-                    _db_font = pygame.font.Font(None, 24)
+                    _db_font = get_font(24)
                     _db_hints = [
                         "[ DEBUG ARENA - GELISTIRICI MODU ]",
                         "WASD: Hareket   W: Zipla   SPACE: Dash",
@@ -3913,11 +4014,11 @@ def run_game_loop():
                         game_canvas.blit(_dh_surf, (40, _db_y))
                         _db_y += 24
                     # Sağ üst köşeye kırmızı "DEBUG" etiketi
-                    _db_tag = pygame.font.Font(None, 26).render("[ DEBUG ARENA ]", True, (255, 50, 50))
+                    _db_tag = get_font(26).render("[ DEBUG ARENA ]", True, (255, 50, 50))
                     game_canvas.blit(_db_tag, (LOGICAL_WIDTH - _db_tag.get_width() - 12, 8))
                 else:
                     # Normal bölümlerde köşede kısa ipucu
-                    _hint_font = pygame.font.Font(None, 22)
+                    _hint_font = get_font(22)
                     _hint = _hint_font.render("J: Hafif  K: Ağır  SPACE: Dash  S↓: Slam", True, (180, 180, 180))
                     game_canvas.blit(_hint, (LOGICAL_WIDTH - _hint.get_width() - 12, LOGICAL_HEIGHT - 30))
 
@@ -3926,36 +4027,28 @@ def run_game_loop():
                 if abs(npc.x - player_x) < 500 and abs(npc.y - player_y) < 400:
                     npc.draw(game_canvas, render_offset)
 
+            profiler.section("draw.12_ui")
             # ── 12. UI / HUD (en üstte) ─────────────────────────────────
+            # PLAYING: widget başına önbellek (hud_compositor) — sadece
+            # içeriği değişen widget yeniden çizilir. Diğer state'ler
+            # render_ui ile doğrudan game_canvas'a çizilir.
             if GAME_STATE not in ['CHAT', 'CUTSCENE']:
-                current_score_int = int(score)
-                should_update_ui = (
-                    cached_ui_surface is None or
-                    current_score_int != last_score or
-                    frame_count % 10 == 0 or
-                    GAME_STATE == 'INVENTORY' or  # Envanter her frame güncellenir
-                    GAME_STATE == 'TERMINAL'    # Terminal her frame güncellenir (cursor blink)
-                )
-                if should_update_ui:
-                    last_score = current_score_int
-                    cached_ui_surface = pygame.Surface(
-                        (LOGICAL_WIDTH, LOGICAL_HEIGHT), pygame.SRCALPHA
-                    )
-                    last_active_ui_elements = render_ui(
-                        cached_ui_surface, GAME_STATE, ui_data, mouse_pos
+                with profiler.scope("render_ui"):
+                    active_ui_elements = hud_compositor.compose(
+                        game_canvas, GAME_STATE, ui_data, mouse_pos
                     )
-                game_canvas.blit(cached_ui_surface, (0, 0))
-                active_ui_elements = last_active_ui_elements
+            profiler.section(None)
+
+        profiler.draw_overlay(game_canvas)
 
+        # Tam ekranda target_res "düşük çözünürlük" görünümüdür; pencerede
+        # pencere zaten target_res boyutundadır.
+        profiler.begin("present.scale")
         target_res = AVAILABLE_RESOLUTIONS[game_settings['res_index']]
-        if game_settings['fullscreen']:
-            if target_res != (LOGICAL_WIDTH, LOGICAL_HEIGHT):
-                scaled_small = pygame.transform.scale(game_canvas, target_res)
-                final_game_image = pygame.transform.scale(scaled_small, screen.get_size())
-            else:
-                final_game_image = pygame.transform.scale(game_canvas, screen.get_size())
-        else:
-            final_game_image = pygame.transform.scale(game_canvas, screen.get_size())
+        present_pipeline.integer_scale = game_settings.get('integer_scale', False)
+        present_pipeline.present(screen, game_canvas,
+                                 target_res if game_settings['fullscreen'] else None)
+        profiler.end("present.scale")
 
         master_vol = game_settings.get("sound_volume", 0.7)
         music_vol = game_settings.get("music_volume", 0.5)
@@ -3973,8 +4066,10 @@ def run_game_loop():
             except Exception:
                 pass
 
-        screen.blit(final_game_image, (0, 0))
+        profiler.begin("present.flip")
         pygame.display.flip()
+        profiler.end("present.flip")
+        profiler.frame_end()
         clock.tick(current_fps)
 
 if __name__ == '__main__':
@@ -0,0 +1,224 @@
+# particle_system.py — FRAGMENTIA: SoA PARÇACIK MOTORU
+# =============================================================================
+# vfx.py'deki FlameSpark / SpeedLine / ParticleExplosion / Shockwave
+# sınıflarının her parçacık için ayrı Sprite + Python update() yükünü kaldırır.
+#
+# Tüm parçacıklar önceden ayrılmış NumPy dizilerinde (structure-of-arrays)
+# tutulur; update() tek vektörel adımda hepsini ilerletir. Boş slotlar bir
+# free-list yığınından alınır — spawn sırasında allocation yok.
+#
+# MİMARİ KURALLARI:
+#   • Görsel parametreler vfx.py sınıflarıyla BİREBİR aynı (hız, sürtünme,
+#     yerçekimi, ömür, boyut küçülmesi). Sadece depolama değişti.
+#   • Konumlar dünya uzayındadır: update() kamera kaymasını bilmez,
+#     draw(surface, camera_offset) all_vfx ile aynı ofseti alır.
+#   • Kapasite dolarsa en yeni istekler sessizce düşürülür (culling yok).
+# =============================================================================
+
+from __future__ import annotations
+import math
+import numpy as np
+import pygame
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+PARTICLE_CAPACITY = 4096   # Eski MAX_VFX_COUNT (100 sprite) yerine
+
+# Parçacık türleri (çizim biçimi)
+KIND_SPARK  = 0   # dolu daire, ömürle küçülür        (FlameSpark)
+KIND_SQUARE = 1   # dolu kare, ömürle küçülür         (ParticleExplosion)
+KIND_LINE   = 2   # hız yönünde kuyruklu çizgi        (SpeedLine)
+KIND_RING   = 3   # genişleyen halka                  (Shockwave)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. ParticleSystem
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ParticleSystem:
+    """
+    Kullanım (main.py):
+        particle_system.emit_explosion(x, y, color, 20)
+        particle_system.emit_spark(x, y, angle, speed, color, life=20)
+
+        # Her frame:
+        particle_system.update()
+        particle_system.draw(vfx_surface, viewport)
+    """
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY):
+        self.capacity = int(capacity)
+        n = self.capacity
+        self.x       = np.zeros(n, dtype=np.float32)
+        self.y       = np.zeros(n, dtype=np.float32)
+        self.vx      = np.zeros(n, dtype=np.float32)
+        self.vy      = np.zeros(n, dtype=np.float32)
+        self.life    = np.zeros(n, dtype=np.float32)
+        self.life0   = np.ones(n,  dtype=np.float32)
+        self.size    = np.zeros(n, dtype=np.float32)   # halka için yarıçap
+        self.size_max = np.zeros(n, dtype=np.float32)  # halka için max yarıçap
+        self.growth  = np.zeros(n, dtype=np.float32)   # halka büyüme hızı
+        self.g_pre   = np.zeros(n, dtype=np.float32)   # hareketten önce yerçekimi
+        self.g_post  = np.zeros(n, dtype=np.float32)   # hareketten sonra yerçekimi
+        self.drag    = np.ones(n,  dtype=np.float32)
+        self.color   = np.zeros((n, 3), dtype=np.uint8)
+        self.kind    = np.zeros(n, dtype=np.int8)
+        self.active  = np.zeros(n, dtype=bool)
+
+        # Free-list: yığının tepesi _free[:_free_top]
+        self._free     = np.arange(n - 1, -1, -1, dtype=np.int32)
+        self._free_top = n
+
+    # ── Slot yönetimi ──────────────────────────────────────
+    def _alloc(self, count: int) -> np.ndarray:
+        count = min(count, self._free_top)
+        if count <= 0:
+            return self._free[:0]
+        top = self._free_top
+        idx = self._free[top - count:top].copy()
+        self._free_top = top - count
+        self.active[idx] = True
+        return idx
+
+    def _release(self, idx: np.ndarray):
+        if idx.size == 0:
+            return
+        self.active[idx] = False
+        top = self._free_top
+        self._free[top:top + idx.size] = idx
+        self._free_top = top + idx.size
+
+    def clear(self):
+        self.active[:] = False
+        self._free[:]  = np.arange(self.capacity - 1, -1, -1, dtype=np.int32)
+        self._free_top = self.capacity
+
+    def __len__(self) -> int:
+        return self.capacity - self._free_top
+
+    # ── Ortak yazıcı ───────────────────────────────────────
+    def _write(self, idx, x, y, vx, vy, life, size, color, kind,
+               g_pre=0.0, g_post=0.0, drag=1.0, growth=0.0, size_max=0.0):
+        self.x[idx]      = x
+        self.y[idx]      = y
+        self.vx[idx]     = vx
+        self.vy[idx]     = vy
+        self.life[idx]   = life
+        self.life0[idx]  = life
+        self.size[idx]   = size
+        self.size_max[idx] = size_max
+        self.growth[idx] = growth
+        self.g_pre[idx]  = g_pre
+        self.g_post[idx] = g_post
+        self.drag[idx]   = drag
+        self.color[idx]  = color[:3]
+        self.kind[idx]   = kind
+
+    # ── Emitter'lar (vfx.py sınıflarıyla aynı parametreler) ─
+    def emit_spark(self, x, y, angle, speed, base_color, life=40, size=8):
+        """FlameSpark eşdeğeri."""
+        idx = self._alloc(1)
+        if idx.size:
+            self._write(idx, x, y, math.cos(angle) * speed, math.sin(angle) * speed,
+                        life, size, base_color, KIND_SPARK, g_pre=0.15, drag=0.97)
+
+    def emit_speed_line(self, x, y, angle, speed, color):
+        """SpeedLine eşdeğeri."""
+        idx = self._alloc(1)
+        if idx.size:
+            self._write(idx, x, y, math.cos(angle) * speed * 2.0,
+                        math.sin(angle) * speed * 2.0, 25, 1, color, KIND_LINE)
+
+    def emit_explosion(self, x, y, color, count=20, size_range=(3, 8), life_range=(20, 40)):
+        """ParticleExplosion eşdeğeri — count adet kare parçacık."""
+        idx = self._alloc(int(count))
+        k = idx.size
+        if not k:
+            return
+        angle = np.random.uniform(0.0, math.pi * 2, k)
+        speed = np.random.uniform(3.0, 8.0, k)
+        size  = np.random.uniform(size_range[0], size_range[1], k)
+        life  = np.random.randint(life_range[0], life_range[1] + 1, k)
+        self._write(idx, x, y, np.cos(angle) * speed, np.sin(angle) * speed,
+                    life, size, color, KIND_SQUARE, g_post=0.15, drag=0.94)
+
+    def emit_shockwave(self, x, y, color, max_radius=150, width=8, speed=10, rings=3,
+                       radius=5):
+        """Shockwave eşdeğeri — tek genişleyen halka (width/rings yok sayılır)."""
+        idx = self._alloc(1)
+        if idx.size:
+            self._write(idx, x, y, 0.0, 0.0, 1, radius, color, KIND_RING,
+                        growth=speed * 1.5, size_max=max_radius)
+
+    # ── Güncelleme (tek vektörel adım) ─────────────────────
+    def update(self):
+        act = np.flatnonzero(self.active)
+        if act.size == 0:
+            return
+        vx = self.vx[act]
+        vy = self.vy[act] + self.g_pre[act]
+        self.x[act] += vx
+        self.y[act] += vy
+        vy += self.g_post[act]
+        drag = self.drag[act]
+        self.vx[act] = vx * drag
+        self.vy[act] = vy * drag
+
+        kind = self.kind[act]
+        ring = kind == KIND_RING
+        self.life[act] -= np.where(ring, 0.0, 1.0).astype(np.float32)
+        self.size[act] += self.growth[act]
+
+        dead = np.where(ring, self.size[act] >= self.size_max[act], self.life[act] <= 0)
+        self._release(act[dead])
+
+    # ── Çizim ──────────────────────────────────────────────
+    def draw(self, surface, camera_offset=(0, 0)):
+        act = np.flatnonzero(self.active)
+        if act.size == 0:
+            return
+        ox, oy = camera_offset
+        kind  = self.kind[act]
+        frac  = self.life[act] / self.life0[act]
+        sizes = np.maximum(2, (self.size[act] * frac).astype(np.int32))
+        xs    = (self.x[act] + ox).astype(np.int32).tolist()
+        ys    = (self.y[act] + oy).astype(np.int32).tolist()
+        cols  = [tuple(c) for c in self.color[act].tolist()]
+
+        draw_circle = pygame.draw.circle
+        draw_line   = pygame.draw.line
+        fill        = surface.fill
+
+        for i in np.flatnonzero(kind == KIND_SQUARE).tolist():
+            s = int(sizes[i])
+            fill(cols[i], (xs[i], ys[i], s, s))
+
+        for i in np.flatnonzero(kind == KIND_SPARK).tolist():
+            draw_circle(surface, cols[i], (xs[i], ys[i]), int(sizes[i]))
+
+        line_i = np.flatnonzero(kind == KIND_LINE)
+        if line_i.size:
+            sel = act[line_i]
+            ex  = (self.x[sel] - self.vx[sel] * 3 + ox).astype(np.int32).tolist()
+            ey  = (self.y[sel] - self.vy[sel] * 3 + oy).astype(np.int32).tolist()
+            for k, i in enumerate(line_i.tolist()):
+                draw_line(surface, cols[i], (xs[i], ys[i]), (ex[k], ey[k]), 1)
+
+        ring_i = np.flatnonzero(kind == KIND_RING)
+        if ring_i.size:
+            sel   = act[ring_i]
+            radii = self.size[sel]
+            alpha = 255 * np.maximum(0.0, 1.0 - radii / self.size_max[sel])
+            radii = radii.astype(np.int32).tolist()
+            for k, i in enumerate(ring_i.tolist()):
+                if alpha[k] > 5:
+                    draw_circle(surface, cols[i], (xs[i], ys[i]), radii[k], 2)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+particle_system = ParticleSystem()
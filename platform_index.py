@@ -0,0 +1,212 @@
+# platform_index.py — FRAGMENTIA: PLATFORM UZAMSAL İNDEKSİ
+# =============================================================================
+# Oyuncu–platform çözümü her frame tek kullanımlık bir tip örneği üretip
+# pygame.sprite.spritecollide ile TÜM all_platforms'u geziyordu. Malikane
+# duvar geçişi ayrıca her platformda height > width kontrolü yapıyor,
+# add_new_platform her spawn'da max(all_platforms, key=...) ile en sağdaki
+# platformu arıyordu.
+#
+# PlatformIndex bir pygame.sprite.Group'tur (all_platforms'un yerine geçer);
+# üyeler eklenip çıkarılırken üç şerit güncel tutulur:
+#   • floors — yatay platformlar, dünya-x sol kenarına göre sıralı
+#   • walls  — dikey platformlar (height > width), aynı şekilde sıralı
+#   • wide   — WIDE_PLATFORM_W'den geniş zeminler (arena / malikane katları);
+#              ayrı tutulur ki sıralı şeritlerin "en geniş" payı küçük kalsın
+# Sorgu: bisect ile [sol - en geniş, sağ) aralığı → O(log n + k).
+#
+# MİMARİ KURALLARI:
+#   • Platformlar dünya uzayındadır ve kaymaz; kamera world_camera.x ile
+#     ilerler. Anahtar = rect.left → indeks hiç yeniden sıralanmaz.
+#   • Sağ kenarı kameranın solunda kalan platformlar prune(world_camera.x)
+#     ile silinir; sıralı olduğundan yalnızca sol uç taranır.
+#   • rect'i sonradan değiştirilen platform için reindex(p) çağrılır.
+#   • Sorgu sonuçları ekleme sırasında döner (spritecollide / çizim sırası).
+# =============================================================================
+
+from __future__ import annotations
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from viewport import CULL_MARGIN, Viewport, report_cull
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+WIDE_PLATFORM_W = 1024    # bundan geniş yatay platformlar "wide" şeridine gider
+
+LANE_FLOORS = "floors"
+LANE_WALLS  = "walls"
+LANE_WIDE   = "wide"
+
+
+def is_wall(rect) -> bool:
+    """Dikey (duvar) platform — malikane duvar geçişinin eski ölçütü."""
+    return rect.height > rect.width
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. _Lane — dünya-x'e göre sıralı tek şerit
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _Lane:
+    __slots__ = ("keys", "items", "max_w")
+
+    def __init__(self):
+        self.keys: List[Tuple[int, int]] = []     # (dünya sol kenarı, sıra no)
+        self.items: List = []
+        self.max_w = 0
+
+    def insert(self, key, sprite):
+        i = bisect_left(self.keys, key)
+        self.keys.insert(i, key)
+        self.items.insert(i, sprite)
+        self.max_w = max(self.max_w, sprite.rect.width)
+
+    def remove(self, key):
+        i = bisect_left(self.keys, key)
+        del self.keys[i]
+        del self.items[i]
+
+    def clear(self):
+        self.keys.clear()
+        self.items.clear()
+        self.max_w = 0
+
+    def span(self, left: int, right: int) -> range:
+        """Dünya-x [left, right) aralığına uzanabilecek adayların indeksleri."""
+        i = bisect_left(self.keys, (left - self.max_w,))
+        j = bisect_left(self.keys, (right,), i)
+        return range(i, j)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. PlatformIndex
+# ─────────────────────────────────────────────────────────────────────────────
+
+class PlatformIndex(pygame.sprite.Group):
+    """
+    Kullanım (main.py):
+        all_platforms = platform_index
+        all_platforms.add(Platform(...))                       # indekslenir
+        all_platforms.prune(world_camera.x)                    # kamera gerisini ayıkla
+        for p in all_platforms.collide(move_rect): ...         # zemin + duvar
+        for w in all_platforms.collide(wall_rect, LANE_WALLS): ...
+        start_x = all_platforms.right_edge() + gap
+        visible = all_platforms.visible(viewport, 0, "platforms")
+    """
+
+    def __init__(self, *sprites):
+        self._lanes: Dict[str, _Lane] = {
+            LANE_FLOORS: _Lane(), LANE_WALLS: _Lane(), LANE_WIDE: _Lane(),
+        }
+        self._entry: Dict = {}                # sprite → (şerit adı, anahtar)
+        self._seq = 0
+        self._right: Optional[int] = None     # en sağ dünya kenarı (None = kirli)
+        super().__init__(*sprites)
+
+    # ── Group kancaları ────────────────────────────────────
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        if sprite in self._entry:
+            return
+        r = sprite.rect
+        if is_wall(r):
+            lane = LANE_WALLS
+        elif r.width > WIDE_PLATFORM_W:
+            lane = LANE_WIDE
+        else:
+            lane = LANE_FLOORS
+        key = (r.left, self._seq)
+        self._seq += 1
+        self._entry[sprite] = (lane, key)
+        self._lanes[lane].insert(key, sprite)
+        if self._right is not None:
+            self._right = max(self._right, r.right)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        entry = self._entry.pop(sprite, None)
+        if entry is None:
+            return
+        lane, key = entry
+        self._lanes[lane].remove(key)
+        if self._right is not None and sprite.rect.right >= self._right:
+            self._right = None
+
+    def empty(self):
+        for lane in self._lanes.values():
+            lane.clear()
+        self._entry.clear()
+        self._right = None
+        super().empty()
+
+    def reindex(self, sprite):
+        """rect'i değişen platformun anahtarını yeniler."""
+        if sprite in self._entry:
+            self.remove_internal(sprite)
+            self.add_internal(sprite)
+
+    # ── Ayıklama ───────────────────────────────────────────
+    def prune(self, left):
+        """Sağ kenarı dünya-x left'in (kamera sol kenarı) solunda kalanları siler."""
+        dead = []
+        for lane in self._lanes.values():
+            # right < left ⇒ sol kenar < left
+            for k in range(bisect_left(lane.keys, (left,))):
+                p = lane.items[k]
+                if p.rect.right < left:
+                    dead.append(p)
+        for p in dead:
+            p.kill()
+
+    # ── Sorgular ───────────────────────────────────────────
+    def _candidates(self, left: int, right: int, lanes) -> List:
+        out = []
+        for name in lanes:
+            lane = self._lanes[name]
+            items = lane.items
+            out.extend(items[k] for k in lane.span(left, right))
+        return out
+
+    def _in_order(self, hits: List) -> List:
+        if len(hits) > 1:
+            entry = self._entry
+            hits.sort(key=lambda p: entry[p][1][1])
+        return hits
+
+    def collide(self, rect, *lanes: str) -> List:
+        """rect ile çakışan platformlar (ekleme sırasıyla). lanes boşsa hepsi."""
+        rect = pygame.Rect(rect)
+        lanes = lanes or (LANE_FLOORS, LANE_WALLS, LANE_WIDE)
+        return self._in_order([p for p in self._candidates(rect.left, rect.right, lanes)
+                               if rect.colliderect(p.rect)])
+
+    def visible(self, view: Viewport, margin: int = CULL_MARGIN,
+                name: Optional[str] = None) -> List:
+        """Viewport.cull ile aynı test; aday kümesi bisect ile daraltılır."""
+        w = view.world_rect
+        l, r = w.left - margin, w.right + margin
+        t, b = w.top - margin, w.bottom + margin
+        out = self._in_order([p for p in self._candidates(l, r, self._lanes)
+                              if p.rect.right > l and p.rect.bottom > t and p.rect.top < b])
+        if name is not None:
+            report_cull(name, len(out), len(self) - len(out))
+        return out
+
+    def right_edge(self) -> Optional[int]:
+        """En sağdaki platformun sağ kenarı (dünya-x); boşsa None."""
+        if not self._entry:
+            return None
+        if self._right is None:
+            self._right = max(p.rect.right for p in self._entry)
+        return self._right
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 4. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+platform_index = PlatformIndex()
@@ -0,0 +1,137 @@
+# present_pipeline.py — FRAGMENTIA: EKRANA SUNUM (SCALE + BLIT)
+# =============================================================================
+# game_canvas (1920×1080 mantıksal tuval) → pencere.
+#
+# Eski yöntem: her frame pygame.transform.scale() bir ya da iki kez çağrılıyor
+# ve her çağrı yeni bir tam ekran yüzey ayırıyordu. Düşük çözünürlük
+# seçiliyken görüntü önce target_res'e küçültülüp sonra pencereye geri
+# büyütülüyordu (iki tam frame resample).
+#
+# Bu modül:
+#   • Her hedef boyut için bir kez hedef yüzey ayırır ve
+#     pygame.transform.scale(src, size, dest) ile ONLARIN İÇİNE ölçekler.
+#     Açılışta yalnızca seçili çözünürlüğün hedefi açılır; diğerleri
+#     çözünürlük değiştiğinde (prepare) ya da ilk kullanımda kurulur.
+#   • Pencere tuvalle aynı boyuttaysa hiç ölçeklemez (doğrudan blit).
+#   • Ekran yüzeyi tuvalle aynı formattaysa doğrudan ekrana ölçekler.
+#   • target_res pencereden büyük/eşitse ara "düşük çözünürlük" adımını atlar
+#     (nearest ile büyütüp geri küçültmek aynı görüntüyü verir).
+#   • integer_scale modunda tuvali en büyük TAM SAYI katına ölçekleyip
+#     ortalar (kenarlar siyah). 4K'da 2×, 640×360'ta 1/3 — keskin piksel,
+#     tek resample.
+#
+# MİMARİ KURALLARI:
+#   • Hedef yüzeyler kaynakla aynı pixel formatında açılır (scale dest şartı).
+#   • present() sadece ekran yüzeyine yazar; flip çağıran tarafta kalır.
+# =============================================================================
+
+from __future__ import annotations
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT
+
+
+Size = Tuple[int, int]
+
+_BAR_COLOR = (0, 0, 0)
+
+
+class PresentPipeline:
+    """
+    Kullanım (main.py, frame sonu):
+        present_pipeline.present(screen, game_canvas, low_res)
+        pygame.display.flip()
+    """
+
+    def __init__(self, logical_size: Size = (LOGICAL_WIDTH, LOGICAL_HEIGHT)):
+        self.logical_size = tuple(logical_size)
+        self.integer_scale: bool = False
+        self._targets: Dict[Size, pygame.Surface] = {}
+        self._direct_ok: bool = True     # scale doğrudan ekran yüzeyine yazabiliyor mu
+
+    # ── Hedef yüzeyler ─────────────────────────────────────
+    def prepare(self, source: pygame.Surface, size: Optional[Size]):
+        """
+        Seçili çözünürlüğün hedefini önceden açar, diğer hedefleri bırakır.
+        Açılışta ve çözünürlük değişiminde çağrılır — kullanılmayan 4K
+        hedefi (~33 MB) bellekte tutulmaz. size None ise sadece temizler.
+        """
+        keep = tuple(size) if size is not None else None
+        for old in [s for s in self._targets if s != keep]:
+            del self._targets[old]
+        if keep is not None and keep != source.get_size():
+            self._target(keep, source)
+
+    def _target(self, size: Size, source: pygame.Surface) -> pygame.Surface:
+        surf = self._targets.get(size)
+        if surf is None or surf.get_bitsize() != source.get_bitsize():
+            surf = pygame.Surface(size, 0, source)
+            self._targets[size] = surf
+        return surf
+
+    def _scale(self, src: pygame.Surface, size: Size) -> pygame.Surface:
+        if src.get_size() == size:
+            return src
+        dest = self._target(size, src)
+        try:
+            pygame.transform.scale(src, size, dest)
+        except ValueError:
+            # Format uyuşmazlığı (ör. display değişti) → yüzeyi yenile
+            self._targets.pop(size, None)
+            dest = self._target(size, src)
+            pygame.transform.scale(src, size, dest)
+        return dest
+
+    # ── Yerleşim ───────────────────────────────────────────
+    def fit_rect(self, window: Size, src_size: Size) -> pygame.Rect:
+        """Kaynağın penceredeki yeri. integer_scale kapalıysa tüm pencere."""
+        ww, wh = window
+        if not self.integer_scale:
+            return pygame.Rect(0, 0, ww, wh)
+        sw, sh = src_size
+        k = min(ww // sw, wh // sh)
+        if k >= 1:
+            w, h = sw * k, sh * k
+        else:
+            # Pencere küçük → en küçük tam bölen (ceil)
+            d = max(-(-sw // ww), -(-sh // wh))
+            w, h = sw // d, sh // d
+        return pygame.Rect((ww - w) // 2, (wh - h) // 2, w, h)
+
+    # ── Sunum ──────────────────────────────────────────────
+    def present(self, screen: pygame.Surface, canvas: pygame.Surface,
+                low_res: Optional[Size] = None):
+        """
+        canvas'ı screen'e ölçekleyip blit eder.
+        low_res: tam ekran "düşük çözünürlük" ayarı (piksel görünümü); pencereden
+                 küçük değilse yok sayılır.
+        """
+        window = screen.get_size()
+        src = canvas
+        if low_res is not None and (low_res[0] < window[0] or low_res[1] < window[1]):
+            src = self._scale(canvas, tuple(low_res))
+
+        rect = self.fit_rect(window, src.get_size())
+        if rect.size == src.get_size():
+            if rect.size != window:
+                screen.fill(_BAR_COLOR)
+            screen.blit(src, rect.topleft)
+            return
+        if rect.size == window and self._direct_ok:
+            # Aynı pixel formatında ekran yüzeyine doğrudan ölçekle (ek blit yok)
+            try:
+                pygame.transform.scale(src, window, screen)
+                return
+            except ValueError:
+                self._direct_ok = False
+        if rect.size != window:
+            screen.fill(_BAR_COLOR)
+        screen.blit(self._scale(src, rect.size), rect.topleft)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+present_pipeline = PresentPipeline()
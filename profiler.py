@@ -0,0 +1,261 @@
+# profiler.py — FRAGMENTIA: FRAME SÜRESİ PROFİLLEYİCİ
+# =============================================================================
+# run_game_loop içindeki her alt sistemin (event, gizlilik, CCD, boss,
+# platform çarpışması, çizim adımları 1–12, render_ui, scale/flip) frame
+# başına harcadığı süreyi isimli kovalarda toplar.
+#
+# KULLANIM:
+#   • Varsayılan KAPALI — kapalıyken her çağrı tek bir bool kontrolüdür.
+#   • F3 tuşu (her state'de) ya da FRAGMENTIA_PROFILE=1 ortam değişkeni açar.
+#   • Açıkken ekranın sol üstünde p50/p95/p99 tablosu çizilir.
+#   • Oyun kapanırken profiles/ klasörüne CSV (frame başına) + JSON (özet).
+#
+#   profiler.frame_begin()
+#   with profiler.scope("stealth"):
+#       stealth_system.update(...)
+#   profiler.begin("ccd"); ...; profiler.end("ccd")
+#   profiler.section("draw.01_clear")   # önceki section'ı kapatıp yenisini açar
+#   profiler.frame_end()
+# =============================================================================
+
+from __future__ import annotations
+import csv
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import pygame
+
+from text_cache import get_font
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+PROFILE_WINDOW      = 240            # Yüzdelik hesabı için son N frame (~4 sn)
+PROFILE_HISTORY     = 60 * 60 * 10   # CSV için tutulan en fazla frame (~10 dk)
+PROFILE_DUMP_DIR    = "profiles"
+PROFILE_REFRESH     = 15             # Overlay tablosu kaç frame'de bir yenilenir
+FRAME_BUDGET_MS     = 1000.0 / 60.0  # 16.6 ms
+
+_OVERLAY_BG         = (0, 0, 0, 170)
+_OVERLAY_TEXT       = (200, 255, 200)
+_OVERLAY_WARN       = (255, 90, 90)
+
+
+def _percentile(sorted_vals: List[float], pct: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    k = (len(sorted_vals) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_vals) - 1)
+    return sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (k - lo)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. FrameProfiler
+# ─────────────────────────────────────────────────────────────────────────────
+
+class FrameProfiler:
+    """Frame başına isimli zamanlama kovaları + sayaçlar."""
+
+    def __init__(self):
+        self.enabled: bool = os.environ.get("FRAGMENTIA_PROFILE", "") not in ("", "0")
+        self.overlay_visible: bool = self.enabled
+
+        self._open: Dict[str, float] = {}          # isim → başlangıç zamanı
+        self._section: Optional[str] = None        # section() zinciri
+        self._frame_start: float = 0.0
+        self._current: Dict[str, float] = {}       # bu frame (ms)
+        self._counters: Dict[str, int] = {}        # bu frame sayaçları
+
+        self._windows: Dict[str, deque] = {}       # kova → son N değer
+        self._history: deque = deque(maxlen=PROFILE_HISTORY)
+        self._order: List[str] = []                # kovaların ilk görülme sırası
+
+        self._overlay_rows: List[tuple] = []
+        self._overlay_surf: Optional[pygame.Surface] = None
+        self._font: Optional[pygame.font.Font] = None
+        self._frames_seen: int = 0
+
+    # ── Açma / Kapama ──────────────────────────────────────
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.overlay_visible = self.enabled
+        self._open.clear()
+        self._section = None
+        # Frame ortasında açıldıysa bu yarım frame ölçülmez (frame_end atlar);
+        # yoksa önceki oturumun son frame_begin'inden süre yazılırdı
+        self._frame_start = 0.0
+        print(f"[PROFILER] {'AÇIK' if self.enabled else 'KAPALI'}")
+
+    # ── Frame sınırları ────────────────────────────────────
+    def frame_begin(self):
+        if not self.enabled:
+            return
+        self._frame_start = time.perf_counter()
+        self._current = {}
+        self._counters = {}
+        self._open.clear()
+        self._section = None
+
+    def frame_end(self):
+        if not self.enabled or not self._frame_start:
+            return
+        self.section(None)
+        self._record("frame", (time.perf_counter() - self._frame_start) * 1000.0)
+        for name, ms in self._current.items():
+            win = self._windows.get(name)
+            if win is None:
+                win = self._windows[name] = deque(maxlen=PROFILE_WINDOW)
+                self._order.append(name)
+            win.append(ms)
+        row = dict(self._current)
+        row.update({f"#{k}": v for k, v in self._counters.items()})
+        self._history.append(row)
+        self._frames_seen += 1
+        if self._frames_seen % PROFILE_REFRESH == 0:
+            self._overlay_rows = self.summary_rows()
+            self._overlay_surf = None
+
+    # ── Kapsamlar ──────────────────────────────────────────
+    def begin(self, name: str):
+        if self.enabled:
+            self._open[name] = time.perf_counter()
+
+    def end(self, name: str):
+        if not self.enabled:
+            return
+        t0 = self._open.pop(name, None)
+        if t0 is not None:
+            self._record(name, (time.perf_counter() - t0) * 1000.0)
+
+    @contextmanager
+    def scope(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, (time.perf_counter() - t0) * 1000.0)
+
+    def section(self, name: Optional[str]):
+        """Ardışık adımlar için: açık section'ı kapatır, `name` ile yenisini açar."""
+        if not self.enabled:
+            return
+        if self._section is not None:
+            self.end(self._section)
+        self._section = name
+        if name is not None:
+            self.begin(name)
+
+    def count(self, name: str, value: int = 1):
+        """Frame başına sayaç (ör. çizilen / elenen nesne sayısı)."""
+        if self.enabled:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def _record(self, name: str, ms: float):
+        self._current[name] = self._current.get(name, 0.0) + ms
+
+    # ── İstatistik ─────────────────────────────────────────
+    def summary_rows(self) -> List[tuple]:
+        """[(kova, p50, p95, p99, max), ...] — 'frame' en üstte."""
+        rows = []
+        names = ["frame"] + [n for n in self._order if n != "frame"]
+        for name in names:
+            win = self._windows.get(name)
+            if not win:
+                continue
+            vals = sorted(win)
+            rows.append((name,
+                         _percentile(vals, 50), _percentile(vals, 95),
+                         _percentile(vals, 99), vals[-1]))
+        return rows
+
+    # ── Overlay ────────────────────────────────────────────
+    def draw_overlay(self, surface: pygame.Surface, pos=(10, 10)):
+        if not (self.enabled and self.overlay_visible):
+            return
+        if self._overlay_surf is None:
+            self._overlay_surf = self._build_overlay()
+        if self._overlay_surf is not None:
+            surface.blit(self._overlay_surf, pos)
+
+    def _build_overlay(self) -> Optional[pygame.Surface]:
+        if not self._overlay_rows:
+            return None
+        if self._font is None:
+            self._font = get_font(20)
+        font = self._font
+        lines = [("KOVA                       p50     p95     p99   (ms)", _OVERLAY_TEXT)]
+        for name, p50, p95, p99, _mx in self._overlay_rows:
+            col = _OVERLAY_WARN if p95 > FRAME_BUDGET_MS else _OVERLAY_TEXT
+            lines.append((f"{name[:24]:<24} {p50:7.2f} {p95:7.2f} {p99:7.2f}", col))
+        if self._counters:
+            lines.append((" ".join(f"{k}={v}" for k, v in sorted(self._counters.items())),
+                          _OVERLAY_TEXT))
+        line_h = font.get_linesize()
+        rendered = [font.render(txt, True, col) for txt, col in lines]
+        w = max(r.get_width() for r in rendered) + 16
+        h = line_h * len(rendered) + 12
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        surf.fill(_OVERLAY_BG)
+        for i, r in enumerate(rendered):
+            surf.blit(r, (8, 6 + i * line_h))
+        return surf
+
+    # ── Dışa aktarma ───────────────────────────────────────
+    def dump(self, directory: str = PROFILE_DUMP_DIR) -> Optional[str]:
+        """profiles/frame_<zaman>.csv + .json yazar. Veri yoksa hiçbir şey yapmaz."""
+        if not self._history:
+            return None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            stamp = time.strftime("%Y%m%d_%H%M%S")
+            base  = os.path.join(directory, f"frame_{stamp}")
+
+            columns: List[str] = []
+            for row in self._history:
+                for key in row:
+                    if key not in columns:
+                        columns.append(key)
+            with open(base + ".csv", "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame_idx"] + columns)
+                for i, row in enumerate(self._history):
+                    writer.writerow([i] + [f"{row.get(c, 0):.4f}" if isinstance(row.get(c, 0), float)
+                                           else row.get(c, 0) for c in columns])
+
+            summary = {}
+            for key in columns:
+                if key.startswith("#"):
+                    continue
+                vals = sorted(row.get(key, 0.0) for row in self._history)
+                summary[key] = {
+                    "mean": sum(vals) / len(vals),
+                    "p50":  _percentile(vals, 50),
+                    "p95":  _percentile(vals, 95),
+                    "p99":  _percentile(vals, 99),
+                    "max":  vals[-1],
+                }
+            with open(base + ".json", "w", encoding="utf-8") as f:
+                json.dump({"frames": len(self._history),
+                           "budget_ms": FRAME_BUDGET_MS,
+                           "buckets": summary}, f, indent=4, ensure_ascii=False)
+            print(f"[PROFILER] Rapor yazıldı: {base}.csv / .json")
+            return base
+        except IOError as e:
+            print(f"[PROFILER] Rapor yazılamadı: {e}")
+            return None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+profiler = FrameProfiler()
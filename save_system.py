@@ -1,12 +1,41 @@
+import atexit
 import json
 import os
+import tempfile
+import threading
+
+# FRAGMENTIA_SAVE_FILE başka bir kayıt dosyası seçer (bench.py: geçici
+# fixture kopyası — geliştiricinin save_data.json'una dokunulmaz)
+SAVE_FILE_ENV = "FRAGMENTIA_SAVE_FILE"
+SAVE_FILE = os.environ.get(SAVE_FILE_ENV) or "save_data.json"
+
+# --- WRITE-BEHIND KAYIT ---
+# save_data() artık diske yazmaz; veriyi "kirli" işaretler. Arka plandaki
+# yazıcı thread en geç SAVE_FLUSH_INTERVAL saniyede bir (ya da bölüm
+# geçişinde request_flush() ile hemen) dosyayı atomik olarak yeniler:
+#   benzersiz temp dosyaya yaz → fsync → os.replace (rename) → klasörü fsync
+# Böylece yazma yarıda kesilse bile eski save_data.json sağlam kalır.
+# Tek örnek: modül sonundaki save_manager (main.py bunu import eder).
+SAVE_FLUSH_INTERVAL = 2.0
+SAVE_TEMP_SUFFIX = ".tmp"
 
-SAVE_FILE = "save_data.json"
 
 class SaveManager:
     def __init__(self):
+        self._lock = threading.RLock()       # data + nesil sayaçları
+        self._io_lock = threading.Lock()     # aynı anda tek dosya yazımı
+        self._wake = threading.Condition(self._lock)
+        self._dirty_gen = 0          # save_data() her çağrıda artırır
+        self._written_gen = 0        # diske yazılmış son nesil
+        self._flush_now = False
+        self._closed = False
         self.data = self.load_data()
 
+        self._writer = threading.Thread(target=self._writer_loop,
+                                        name="SaveWriter", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
     def load_data(self):
         """Kayıt dosyasını yükler, yoksa varsayılanı oluşturur."""
         if not os.path.exists(SAVE_FILE):
@@ -73,13 +102,95 @@ class SaveManager:
         return default_data
 
     def save_data(self, data=None):
-        if data is not None:
-            self.data = data
+        """Veriyi kirli işaretler; diske yazım arka planda yapılır."""
+        with self._lock:
+            if data is not None:
+                self.data = data
+            self._dirty_gen += 1
+
+    @property
+    def is_dirty(self):
+        return self._dirty_gen != self._written_gen
+
+    def request_flush(self):
+        """Yazıcı thread'i beklemeden uyandır (bölüm geçişleri)."""
+        with self._wake:
+            self._flush_now = True
+            self._wake.notify()
+
+    def flush(self):
+        """Bekleyen değişiklikleri şimdi, çağıran thread'de diske yazar."""
+        self._write_pending()
+
+    def close(self):
+        """Yazıcıyı durdurur ve son durumu diske yazar (atexit)."""
+        with self._wake:
+            self._closed = True
+            self._wake.notify()
+        self._write_pending()
+
+    # --- Yazıcı thread ---
+    def _writer_loop(self):
+        while True:
+            with self._wake:
+                if not self._flush_now and not self._closed:
+                    self._wake.wait(SAVE_FLUSH_INTERVAL)
+                self._flush_now = False
+                if self._closed:
+                    return
+            self._write_pending()
+
+    def _write_pending(self):
+        with self._io_lock:
+            with self._lock:
+                gen = self._dirty_gen
+                if gen == self._written_gen:
+                    return
+                try:
+                    # indent'siz dumps C kodlayıcıda tek seferde çalışır →
+                    # oyun thread'i araya giremez, tutarlı anlık görüntü.
+                    # (indent=4 saf Python kodlayıcıya düşer; tek geçiş için
+                    # dosya sıkışık JSON olarak yazılır.)
+                    payload = json.dumps(self.data, ensure_ascii=False)
+                except (RuntimeError, TypeError, ValueError) as e:
+                    print(f"Kayıt Hatası (serileştirme): {e}")
+                    return
+            # Disk I/O kilit dışında
+            if self._write_atomic(payload):
+                with self._lock:
+                    self._written_gen = max(self._written_gen, gen)
+
+    @staticmethod
+    def _write_atomic(payload):
+        save_dir = os.path.dirname(os.path.abspath(SAVE_FILE))
+        tmp_path = None
         try:
-            with open(SAVE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=4, ensure_ascii=False)
-        except IOError as e:
+            # Her yazım kendi geçici dosyasına: eşzamanlı yazıcılar çakışmaz
+            fd, tmp_path = tempfile.mkstemp(dir=save_dir, prefix=os.path.basename(SAVE_FILE) + ".",
+                                            suffix=SAVE_TEMP_SUFFIX)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, SAVE_FILE)
+            tmp_path = None
+            # Rename'in kendisi de kalıcı olsun (POSIX)
+            if hasattr(os, "O_DIRECTORY"):
+                dir_fd = os.open(save_dir, os.O_DIRECTORY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            return True
+        except OSError as e:
             print(f"Kayıt Hatası: {e}")
+            return False
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
 
     # --- SETTINGS YÖNETİMİ (BURASI HATAYI ÇÖZER) ---
     def get_settings(self):
@@ -93,7 +204,8 @@ class SaveManager:
             "fps_index": 1,
             "sound_volume": 0.7,
             "music_volume": 0.5,
-            "effects_volume": 0.8
+            "effects_volume": 0.8,
+            "integer_scale": False
         }
         
         # Eksik olanları tamamla
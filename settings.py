@@ -450,6 +450,7 @@ EASY_MODE_LEVELS[999] = {
 DARK_BLUE   = (5, 5, 10)
 WHITE       = (220, 220, 220)
 STAR_COLOR  = (100, 100, 100)
+STAR_COUNT  = 120   # starfield.py — vektörel; güçlü makinelerde binlerce olabilir
 NEON_GREEN  = (0, 220, 80)
 NEON_CYAN   = (0, 180, 220)
 DARK_METAL  = (20, 20, 25)
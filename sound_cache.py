@@ -0,0 +1,118 @@
+# sound_cache.py — FRAGMENTIA: PROSEDÜREL SES ÖNBELLEĞİ
+# =============================================================================
+# utils.generate_ambient_fallback / generate_calm_ambient / generate_sound_effect
+# bir asset eksik olduğunda dalga formunu NumPy ile sentezliyordu — her bölüm
+# yüklemesinde yeniden (10-15 sn'lik ambiyans = 440-660 bin örnek). main.py'deki
+# malikane kapı çarpma sesi ise çarpışma anında, Python list comprehension +
+# satır içi __import__ ile 4000 örneklik bir dizi kuruyordu.
+#
+# SoundSynthCache her prosedürel sesi (ad, parametreler) anahtarıyla BİR KEZ
+# üretir:
+#   • Bellek — üretilen Sound nesnesi oturum boyunca tutulur.
+#   • Disk   — WAV olarak SOUND_CACHE_DIR'e yazılır; sonraki açılışlarda
+#              sentez yerine dosya yüklenir.
+#
+# MİMARİ KURALLARI:
+#   • Sentez fonksiyonu yan etkisiz olmalı ve int16 (N, 2) dizi döndürmeli;
+#     aynı anahtar her zaman aynı dalgayı vermelidir.
+#   • Dalga formu değişirse SOUND_CACHE_VERSION artırılır (eski dosyalar
+#     farklı ada düşer, kullanılmaz).
+#   • Disk yazımı atomiktir (geçici dosya → os.replace); disk hatası sesi
+#     engellemez, yalnızca önbelleğe yazılmaz.
+# =============================================================================
+
+from __future__ import annotations
+import hashlib
+import os
+import wave
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+import pygame
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+SOUND_CACHE_DIR     = ".sound_cache"
+SOUND_CACHE_VERSION = 1
+SYNTH_SAMPLE_RATE   = 44100
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. SoundSynthCache
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SoundSynthCache:
+    """
+    Kullanım:
+        snd = sound_cache.get("ambient", (55.0, 10.0), _synth_ambient)
+        # ilk açılış: sentez + .sound_cache/ambient-<hash>.wav
+        # sonraki çağrılar: bellekteki aynı Sound
+    """
+
+    def __init__(self, directory: str = SOUND_CACHE_DIR):
+        self.directory = directory
+        self._sounds: Dict[Tuple, pygame.mixer.Sound] = {}
+
+    def __len__(self) -> int:
+        return len(self._sounds)
+
+    def path_for(self, name: str, params: Tuple) -> str:
+        digest = hashlib.sha1(repr((SOUND_CACHE_VERSION, name, params)).encode()).hexdigest()
+        return os.path.join(self.directory, f"{name}-{digest[:12]}.wav")
+
+    def get(self, name: str, params: Tuple,
+            synth: Callable[[], np.ndarray]) -> pygame.mixer.Sound:
+        key = (name, params)
+        snd = self._sounds.get(key)
+        if snd is not None:
+            return snd
+        path = self.path_for(name, params)
+        snd = None
+        if os.path.exists(path):
+            try:
+                snd = pygame.mixer.Sound(path)
+            except Exception:
+                snd = None
+        if snd is None:
+            samples = np.ascontiguousarray(synth(), dtype=np.int16)
+            snd = pygame.sndarray.make_sound(samples)
+            self._write_wav(path, samples)
+        self._sounds[key] = snd
+        return snd
+
+    def _write_wav(self, path: str, samples: np.ndarray):
+        tmp = path + ".tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with wave.open(tmp, "wb") as w:
+                w.setnchannels(samples.shape[1] if samples.ndim > 1 else 1)
+                w.setsampwidth(2)
+                w.setframerate(SYNTH_SAMPLE_RATE)
+                w.writeframes(samples.astype("<i2").tobytes())
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[sound_cache] WAV yazılamadı: {path} — {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def clear(self, disk: bool = False):
+        """Bellekteki sesleri boşaltır; disk=True ise WAV dosyalarını da siler."""
+        self._sounds.clear()
+        if disk and os.path.isdir(self.directory):
+            for fn in os.listdir(self.directory):
+                if fn.endswith(".wav"):
+                    try:
+                        os.remove(os.path.join(self.directory, fn))
+                    except OSError:
+                        pass
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+sound_cache = SoundSynthCache()
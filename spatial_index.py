@@ -0,0 +1,164 @@
+# spatial_index.py — FRAGMENTIA: UZAMSAL İNDEKS (BROAD-PHASE)
+# =============================================================================
+# Düzgün hücreli bir "spatial hash grid". Çarpışma testlerinden önce aday
+# nesneleri hızlıca daraltmak için kullanılır (mermi CCD, melee hitbox,
+# boss saldırıları).
+#
+# MİMARİ KURALLARI:
+#   • Grid sadece broad-phase'dir: kesin test (colliderect vb.) çağıranda kalır.
+#   • query_*() adayları EKLENME SIRASINDA döndürür. Böylece "ilk çarpan
+#     düşman" mantığı eski lineer tarama ile birebir aynı sonucu verir.
+#   • Her frame rebuild() ile yeniden kurulabilir ya da tek tek
+#     insert()/remove()/update_item() ile artımlı güncellenebilir.
+# =============================================================================
+
+from __future__ import annotations
+import pygame
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+SPATIAL_CELL_SIZE = 128   # px — tipik düşman boyunun ~2 katı
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. SpatialHashGrid
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SpatialHashGrid:
+    """
+    (cx, cy) hücre anahtarlı kova yapısı.
+
+    Kullanım (main.py):
+        enemy_grid.rebuild(all_enemies)
+        for enemy in enemy_grid.query_rect(bullet_sweep_rect):
+            if bullet_rect.colliderect(enemy.rect): ...
+
+    Nesnenin bir `rect` özniteliği olmalı (veya insert'e rect verilmeli).
+    """
+
+    def __init__(self, cell_size: int = SPATIAL_CELL_SIZE):
+        self.cell_size = max(1, int(cell_size))
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._items: List[Any] = []                 # sıra → nesne (silinen: None)
+        self._item_cells: List[Tuple[int, int, int, int]] = []
+        self._order: Dict[int, int] = {}            # id(nesne) → sıra
+
+    # ── Yardımcı ───────────────────────────────────────────
+    def _cell_span(self, rect) -> Tuple[int, int, int, int]:
+        cs = self.cell_size
+        # Sıfır genişlikli rect'ler de en az bir hücreye düşer
+        x0 = rect.left // cs
+        y0 = rect.top // cs
+        x1 = max(rect.left, rect.right - 1) // cs
+        y1 = max(rect.top, rect.bottom - 1) // cs
+        return x0, y0, x1, y1
+
+    # ── Kurulum / Güncelleme ───────────────────────────────
+    def clear(self):
+        self._cells.clear()
+        self._items.clear()
+        self._item_cells.clear()
+        self._order.clear()
+
+    def rebuild(self, objects: Iterable[Any]):
+        """Grid'i verilen nesnelerden (iterasyon sırasıyla) yeniden kurar."""
+        self.clear()
+        for obj in objects:
+            self.insert(obj)
+
+    def insert(self, obj: Any, rect: Optional[pygame.Rect] = None):
+        if id(obj) in self._order:
+            self.update_item(obj, rect)
+            return
+        if rect is None:
+            rect = obj.rect
+        idx  = len(self._items)
+        span = self._cell_span(rect)
+        self._items.append(obj)
+        self._item_cells.append(span)
+        self._order[id(obj)] = idx
+        self._add_to_cells(idx, span)
+
+    def remove(self, obj: Any):
+        idx = self._order.pop(id(obj), None)
+        if idx is None:
+            return
+        self._remove_from_cells(idx, self._item_cells[idx])
+        self._items[idx] = None
+
+    def update_item(self, obj: Any, rect: Optional[pygame.Rect] = None):
+        """Hareket eden nesnenin hücrelerini tazeler — sırası korunur."""
+        idx = self._order.get(id(obj))
+        if idx is None:
+            self.insert(obj, rect)
+            return
+        if rect is None:
+            rect = obj.rect
+        span = self._cell_span(rect)
+        if span == self._item_cells[idx]:
+            return
+        self._remove_from_cells(idx, self._item_cells[idx])
+        self._item_cells[idx] = span
+        self._add_to_cells(idx, span)
+
+    def _add_to_cells(self, idx: int, span):
+        x0, y0, x1, y1 = span
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [idx]
+                else:
+                    bucket.append(idx)
+
+    def _remove_from_cells(self, idx: int, span):
+        x0, y0, x1, y1 = span
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                try:
+                    bucket.remove(idx)
+                except ValueError:
+                    pass
+                if not bucket:
+                    del cells[(cx, cy)]
+
+    # ── Sorgular ───────────────────────────────────────────
+    def query_rect(self, rect) -> List[Any]:
+        """rect'in değdiği hücrelerdeki adaylar — eklenme sırasıyla."""
+        if not self._order:
+            return []
+        x0, y0, x1, y1 = self._cell_span(rect)
+        cells = self._cells
+        found: set = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        items = self._items
+        return [items[i] for i in sorted(found)]
+
+    def query_segment(self, x0: float, y0: float, x1: float, y1: float,
+                      radius: float = 0.0) -> List[Any]:
+        """(x0,y0)→(x1,y1) doğrusunun radius kadar şişirilmiş sınır kutusu."""
+        r    = int(radius) + 1
+        left = int(min(x0, x1)) - r
+        top  = int(min(y0, y1)) - r
+        w    = int(abs(x1 - x0)) + r * 2 + 1
+        h    = int(abs(y1 - y0)) + r * 2 + 1
+        return self.query_rect(pygame.Rect(left, top, w, h))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, obj: Any) -> bool:
+        return id(obj) in self._order
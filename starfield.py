@@ -0,0 +1,169 @@
+# starfield.py — FRAGMENTIA: VEKTÖREL YILDIZ ALANI
+# =============================================================================
+# main.py 120 adet entities.Star nesnesi tutuyordu. Her yıldız her frame
+# pygame.time.get_ticks() + math.sin ile parıltı hesaplıyor, ayrı bir
+# pygame.draw.circle çağrısıyla çiziliyordu (hem PLAYING hem menü yolunda).
+#
+# Starfield tüm yıldızları NumPy dizilerinde tutar:
+#   • update() konum + parıltı + ekran dışı sarmayı tek vektörel adımda yapar
+#   • draw() her yıldızın daire piksellerini (önceden çıkarılmış (dx, dy)
+#     ofset kümesi) pygame.surfarray.pixels2d görünümüne tek indeksli
+#     atamayla yazar; kenara değen birkaç yıldız draw.circle ile kırpılır
+#
+# MİMARİ KURALLARI:
+#   • Görünüm Star ile BİREBİR aynı: boyut 1-3, hız 0.5-1.5, parlaklık
+#     150 + parıltı * 105, x < 0 olunca sağdan rastgele y ile yeniden doğar.
+#   • Yıldızlar kare başına kaydırılmaz: ekran x'i kamera x'inden türetilir
+#     (x0 - hız * kamera_x / 3, ekran genişliğinde sarmalı). Sarma, yıldızın
+#     tur sayısı değişince algılanır. Menüde kamera yok → drift(dx).
+#   • Yıldız sayısı settings.STAR_COUNT — binlerce yıldız da tek atama
+#     maliyetindedir (Python döngüsü yok).
+#   • 32-bit olmayan yüzeylerde yıldız başına draw.circle yoluna düşülür.
+# =============================================================================
+
+from __future__ import annotations
+import random
+
+import numpy as np
+import pygame
+
+from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT, STAR_COUNT
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+STAR_MIN_BRIGHTNESS = 150
+STAR_TWINKLE_RANGE  = 105
+STAR_MAX_SIZE       = 3
+
+
+def _circle_offsets(radius: int):
+    """pygame.draw.circle'ın (0, 0) merkezli boyadığı piksellerin ofsetleri."""
+    d = STAR_MAX_SIZE * 2 + 1
+    s = pygame.Surface((d, d))
+    pygame.draw.circle(s, (255, 255, 255), (STAR_MAX_SIZE, STAR_MAX_SIZE), radius)
+    mask = pygame.surfarray.array2d(s) != 0
+    xs, ys = np.nonzero(mask)
+    return xs - STAR_MAX_SIZE, ys - STAR_MAX_SIZE
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. Starfield
+# ─────────────────────────────────────────────────────────────────────────────
+
+class Starfield:
+    """
+    Kullanım (main.py):
+        starfield.update(world_camera.x)
+        starfield.draw(game_canvas)
+
+    Menü yolunda (dünya kamerası durur):
+        starfield.drift(0.5)
+    """
+
+    def __init__(self, width: int = LOGICAL_WIDTH, height: int = LOGICAL_HEIGHT,
+                 count: int = STAR_COUNT):
+        self.width  = width
+        self.height = height
+        self._rng = np.random.default_rng(random.getrandbits(32))
+        self.resize(count)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def resize(self, count: int):
+        """Yıldız alanını count yıldızla yeniden üretir."""
+        rng = self._rng
+        n = self.count = int(count)
+        self.x0        = rng.integers(0, self.width, n).astype(np.float64)
+        self.x         = self.x0.copy()
+        self._lap      = np.zeros(n)      # kaçıncı sarmada (yeniden doğuşu algılar)
+        self.scroll    = 0.0              # son update'in kamera x'i
+        self.y         = rng.integers(0, self.height, n).astype(np.float64)
+        self.size      = rng.integers(1, STAR_MAX_SIZE + 1, n)
+        self.speed     = rng.uniform(0.5, 1.5, n)
+        self.tw_speed  = rng.uniform(0.5, 2.0, n)
+        self.tw_offset = rng.uniform(0, np.pi * 2, n)
+        self.bright    = rng.integers(STAR_MIN_BRIGHTNESS, 256, n).astype(np.uint8)
+
+        # Yıldız → piksel ofsetleri (yıldız sırasıyla; üst üste binmede
+        # sonraki yıldız kazanır, eski çizim sırası gibi)
+        offsets = {r: _circle_offsets(r) for r in range(1, STAR_MAX_SIZE + 1)}
+        counts = np.array([len(offsets[r][0]) for r in range(1, STAR_MAX_SIZE + 1)])
+        sizes = self.size.tolist()
+        self._counts = counts[self.size - 1]
+        self._dx = np.concatenate([offsets[r][0] for r in sizes] or [np.zeros(0, int)])
+        self._dy = np.concatenate([offsets[r][1] for r in sizes] or [np.zeros(0, int)])
+        self._lut_key = None
+        self._lut = None
+
+    # ── Simülasyon ─────────────────────────────────────────
+    def update(self, camera_x: float, dt: float = 0.016):
+        self.scroll = camera_x
+        pos = self.x0 - self.speed * (camera_x / 3)
+        lap = np.floor(pos / self.width)
+        self.x = pos - lap * self.width
+        wrapped = np.flatnonzero(lap != self._lap)
+        self._lap = lap
+        t = pygame.time.get_ticks() * 0.001
+        twinkle = (np.sin(t * self.tw_speed + self.tw_offset) + 1) / 2
+        self.bright = (STAR_MIN_BRIGHTNESS + twinkle * STAR_TWINKLE_RANGE).astype(np.uint8)
+        if len(wrapped):
+            k = len(wrapped)
+            self.y[wrapped] = self._rng.integers(0, self.height, k)
+            self.bright[wrapped] = self._rng.integers(STAR_MIN_BRIGHTNESS, 256, k)
+
+    def drift(self, dx: float, dt: float = 0.016):
+        """Kamerasız ekranlarda (menü) alanı kendi sanal kamerasıyla kaydırır."""
+        self.update(self.scroll + dx, dt)
+
+    # ── Çizim ──────────────────────────────────────────────
+    def _gray_lut(self, surface) -> np.ndarray:
+        key = (surface.get_bitsize(), surface.get_masks(), surface.get_shifts())
+        if key != self._lut_key:
+            # map_rgb SRCALPHA yüzeyde işaretli int döner (ör. -1) → 32 bite maskele
+            lut = np.array([surface.map_rgb((v, v, v)) for v in range(256)], dtype=np.int64)
+            self._lut = (lut & 0xFFFFFFFF).astype(np.uint32)
+            self._lut_key = key
+        return self._lut
+
+    def draw(self, surface):
+        if self.count == 0:
+            return
+        if surface.get_bitsize() != 32:
+            self._draw_circles(surface, np.arange(self.count))
+            return
+        w, h = surface.get_size()
+        xi = self.x.astype(np.int32)
+        yi = self.y.astype(np.int32)
+        m = STAR_MAX_SIZE
+        edge = (xi < m) | (xi >= w - m) | (yi < m) | (yi >= h - m)
+        if edge.any():
+            self._draw_circles(surface, np.flatnonzero(edge))
+        counts = self._counts
+        px = np.repeat(xi, counts) + self._dx
+        py = np.repeat(yi, counts) + self._dy
+        color = np.repeat(self._gray_lut(surface)[self.bright], counts)
+        # pixels2d (x, y) görünümüne doğrudan indeksle — pitch != 4*w olsa da
+        # yüzeye yazar (düz reshape sessizce kopyaya düşebilirdi)
+        pixels = pygame.surfarray.pixels2d(surface)
+        if edge.any():
+            keep = np.repeat(~edge, counts)
+            pixels[px[keep], py[keep]] = color[keep]
+        else:
+            pixels[px, py] = color
+        del pixels
+
+    def _draw_circles(self, surface, which):
+        for x, y, r, b in zip(self.x[which].astype(int).tolist(),
+                              self.y[which].astype(int).tolist(),
+                              self.size[which].tolist(), self.bright[which].tolist()):
+            pygame.draw.circle(surface, (b, b, b), (x, y), r)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+starfield = Starfield()
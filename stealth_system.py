@@ -16,6 +16,9 @@ import pygame
 import random
 from typing import Optional, List, Tuple, Dict, Any
 
+from viewport import Viewport, SortedXIndex
+from text_cache import get_font
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 1. SABİTLER
@@ -77,7 +80,7 @@ class HideSpot:
         s.fill(_COL_HIDE)
         surface.blit(s, draw_r.topleft)
         pygame.draw.rect(surface, (0, 200, 255), draw_r, 2)
-        font = pygame.font.Font(None, 18)
+        font = get_font(18)
         lbl  = font.render(self.label, True, (0, 200, 255))
         surface.blit(lbl, (draw_r.x + 3, draw_r.y + 3))
 
@@ -113,6 +116,10 @@ class SurveillanceCamera:
         # Nesne havuzu: görüş konisi köşe noktaları (GC kuralı)
         self._cone_pts: List[Tuple[float, float]] = [(0.0, 0.0)] * 7
 
+        # Kırpma kutusu: görüş konisinin ulaşabileceği tüm alan
+        vr = int(vision_range) + 1
+        self.rect = pygame.Rect(x - vr, y - vr, vr * 2, vr * 2)
+
     # ── GÜNCELLEME ────────────────────────────────────────────────────────
     def update(self, dt: float):
         # Sinüs tabanlı salınım — dt çarpımı (RULE 1)
@@ -181,12 +188,7 @@ class SurveillanceCamera:
         # Görüş konisi (dolgulu üçgen)
         half_fov = math.radians(VISION_ANGLE_DEFAULT / 2)
         mid_angle = self.sweep_left + (self.sweep_right - self.sweep_left) * 0.5
-        # 5 ara nokta ile yumuşak koni
-        cone_surf = pygame.Surface(
-            (int(self.vision_range * 2 + 4),
-             int(self.vision_range * 2 + 4)),
-            pygame.SRCALPHA
-        )
+        # 8 ara nokta ile yumuşak koni
         pts = [(cx, cy)]
         steps = 8
         for i in range(steps + 1):
@@ -248,7 +250,7 @@ class ChromeGuard:
         # Spawn kuyruğu — main.py bu listeyi her karede boşaltır
         self.spawn_queue: List[Dict] = []
 
-        self._font = pygame.font.Font(None, 18)
+        self._font = get_font(18)
 
     # ── GÜNCELLEME (her kare) ─────────────────────────────────────────────
     def update(self, dt: float, player_x: float, player_y: float,
@@ -491,6 +493,10 @@ class StealthSystem:
         # Event kuyruğu (GC: temizlenip doldurulur)
         self._event_queue: List[Dict[str, Any]] = []
 
+        # Çizim kırpması için hareketsiz nesnelerin x-aralık indeksleri
+        self._camera_index = SortedXIndex()
+        self._hide_index   = SortedXIndex()
+
         # Stealth karma bonusu sayacı (her 3 saniye gizli geçişe +1 karma)
         self._stealth_timer: float = 0.0
         self._stealth_karma_interval: float = 8.0
@@ -510,6 +516,8 @@ class StealthSystem:
         self._alert_cooldown = 0.0
         self._stealth_timer  = 0.0
         self._event_queue.clear()
+        self._camera_index.invalidate()
+        self._hide_index.invalidate()
 
         config = STEALTH_LEVEL_CONFIGS.get(level_idx)
         if not config:
@@ -709,16 +717,24 @@ class StealthSystem:
         """
         main.py Step 7 (VFX katmanı) içinde çağrılır.
         Sıra: kamera konileri → muhafızlar → saklanma noktaları → uyarı HUD.
+        Ekran dışındaki nesneler çizilmez; kameralar ve saklanma noktaları
+        hareketsiz olduğundan x-aralık indeksinden sorgulanır.
         """
-        for cam in self.cameras:
-            cam.draw(surface, self.global_alert, camera_offset)
+        if isinstance(camera_offset, Viewport):
+            view = camera_offset
+        else:
+            view = Viewport(surface.get_width(), surface.get_height(), *camera_offset)
+
+        self._camera_index.sync(self.cameras)
+        for cam in self._camera_index.query(view, 0, "stealth_cameras"):
+            cam.draw(surface, self.global_alert, view)
 
-        for g in self.guards:
-            if g.is_active:
-                g.draw(surface, camera_offset)
+        for g in view.cull([g for g in self.guards if g.is_active], name="stealth_guards"):
+            g.draw(surface, view)
 
-        for hs in self.hide_spots:
-            hs.draw(surface, camera_offset)
+        self._hide_index.sync(self.hide_spots)
+        for hs in self._hide_index.query(view, 0, "hide_spots"):
+            hs.draw(surface, view)
 
         # Üst HUD: alarm banner
         if self.global_alert == ALERT_DETECTED:
@@ -727,13 +743,13 @@ class StealthSystem:
             self._draw_suspicious_hud(surface)
 
     def _draw_alert_hud(self, surface: pygame.Surface):
-        font = pygame.font.Font(None, 52)
+        font = get_font(52)
         txt  = font.render("!! TESPİT EDİLDİN !!", True, (255, 30, 30))
         x    = (surface.get_width() - txt.get_width()) // 2
         surface.blit(txt, (x, 20))
 
     def _draw_suspicious_hud(self, surface: pygame.Surface):
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         txt  = font.render("! Şüphe !", True, (255, 180, 0))
         x    = (surface.get_width() - txt.get_width()) // 2
         surface.blit(txt, (x, 20))
@@ -755,6 +771,8 @@ class StealthSystem:
         self._alert_cooldown = 0.0
         self._stealth_timer  = 0.0
         self._event_queue.clear()
+        self._camera_index.invalidate()
+        self._hide_index.invalidate()
 
 
 # ─────────────────────────────────────────────────────────────────────────────
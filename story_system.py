@@ -1,10 +1,19 @@
 import pygame
 import json
+import os
 import re
 import math
 import random
 import warnings
 from settings import *  # <--- BU SATIR ÇOK ÖNEMLİ, UNUTMA!
+from ai_worker import (AIRequestWorker, GeminiBackend, StubBackend,
+                       KIND_CHAT, KIND_GENERATE, STATUS_DONE, STATUS_TIMEOUT)
+from ai_cache import NPCPromptTemplate, npc_cache_key, response_cache
+
+# Ağsız deterministik backend: FRAGMENTIA_AI_BACKEND=stub
+# (isteğe bağlı gecikme: FRAGMENTIA_AI_STUB_LATENCY=0.8)
+AI_BACKEND_ENV = "FRAGMENTIA_AI_BACKEND"
+VASI_KEY = "VASI"   # Vasi chat oturumunun işçi anahtarı
 
 # Gemini AI entegrasyonu için import
 try:
@@ -33,6 +42,8 @@ class StoryManager:
         self.chat_session = None
         self.model = None
         self.ai_thinking = False
+        self.ai_worker = None        # AIRequestWorker — setup_ai() kurar
+        self._npc_templates = {}     # npc adı → NPCPromptTemplate
         self.conversation_history = []
         
         # Bölüm sistemi
@@ -53,6 +64,12 @@ class StoryManager:
 
     def setup_ai(self):
         """Gemini API Bağlantısını Kurar"""
+        if os.environ.get(AI_BACKEND_ENV, "").lower() == "stub":
+            latency = float(os.environ.get("FRAGMENTIA_AI_STUB_LATENCY", "0") or 0)
+            self.set_backend(StubBackend(latency))
+            print("FRAGMENTIA VASI PROTOKOLÜ: STUB (ÇEVRİMDIŞI)")
+            return
+
         if not HAS_GENAI:
             self.ai_active = False
             return
@@ -70,12 +87,20 @@ class StoryManager:
             )
             # Vasi sohbeti için oturum başlat
             self.chat_session = self.model.start_chat(history=[])
-            self.ai_active = True
+            self.set_backend(GeminiBackend(self.model, self.chat_session))
             print("FRAGMENTIA VASI PROTOKOLÜ: AKTİF")
         except Exception as e:
             print(f"AI Bağlantı Hatası: {e}")
             self.ai_active = False
 
+    def set_backend(self, backend):
+        """AI backend'ini değiştirir (Gemini / Stub / özel). Eski işçi kapatılır."""
+        if self.ai_worker is not None:
+            self.ai_worker.shutdown()
+        self.ai_worker = AIRequestWorker(backend)
+        self.ai_active = True
+        self.ai_thinking = False
+
     def load_chapter(self, chapter_id):
         """Yeni bir bölüm yükler"""
         self.current_chapter = chapter_id
@@ -112,8 +137,11 @@ class StoryManager:
         self.is_cutscene = is_cutscene
 
     def send_ai_message(self, user_text, game_context=None):
-        """Oyuncunun mesajını AI'ya gönderir (Ana Hikaye/Vasi İçin)"""
-        if not self.ai_active or not self.chat_session:
+        """
+        Oyuncunun mesajını AI'ya gönderir (Ana Hikaye/Vasi İçin).
+        Bloklamaz: cevap poll_ai() ile gelince TYPING durumuna geçilir.
+        """
+        if not self.ai_active or self.ai_worker is None:
             self.speaker = "SİSTEM"
             self.current_text = "BAĞLANTI HATASI: Vasi'ye ulaşılamıyor (API Key veya Bağlantı Sorunu)."
             self.state = "TYPING"
@@ -127,73 +155,117 @@ class StoryManager:
 
         full_prompt = context_str + user_text
 
+        if self.ai_worker.submit(VASI_KEY, KIND_CHAT, full_prompt) is None:
+            # Önceki mesaj hâlâ yolda (ya da zaman aşımına uğrayan tur dönmedi)
+            self.speaker = "VASI"
+            self.current_text = "(Hâlâ önceki mesajını işliyor...)"
+            self.char_index = 0
+            self.state = "TYPING"
+            return
+
         self.ai_thinking = True
         self.speaker = "VASI"
         self.current_text = "Analiz ediliyor..."
         self.display_text = "Analiz ediliyor..."
         self.state = "THINKING"
 
-        try:
-            response = self.chat_session.send_message(full_prompt)
-            raw_text = response.text
-
+    def _finish_vasi_reply(self, req):
+        if req.status == STATUS_DONE:
             # JSON Komutlarını Ayıkla
-            clean_text, commands = self.extract_commands(raw_text)
+            clean_text, commands = self.extract_commands(req.result)
 
             # Komutları Uygula
             if commands:
                 self.apply_world_modifiers(commands)
-
             self.current_text = clean_text
-            self.char_index = 0
-            self.state = "TYPING"
-            self.ai_thinking = False
+        elif req.status == STATUS_TIMEOUT:
+            self.current_text = "SİSTEM HATASI: Vasi yanıt vermedi (zaman aşımı)."
+        else:
+            self.current_text = f"SİSTEM HATASI: {req.error}"
+        self.char_index = 0
+        self.state = "TYPING"
 
-        except Exception as e:
-            self.current_text = f"SİSTEM HATASI: {str(e)}"
-            self.state = "TYPING"
-            self.ai_thinking = False
+    def request_npc_response(self, npc, user_text, history):
+        """
+        NPC cevabını arka plan işçisine gönderir (bloklamaz).
+        Cevap poll_ai() ile (npc.name, metin) olarak döner.
+        Döndürür: anında gösterilecek metin (hata / meşgul) ya da None.
+        """
+        if not self.ai_active or self.ai_worker is None:
+            return "AI Sistemi çevrimdışı. Lütfen ayarlarınızı kontrol edin."
+        cache_key = npc_cache_key(npc, user_text, history)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        prompt = self.build_npc_prompt(npc, user_text, history)
+        if self.ai_worker.submit(npc.name, KIND_GENERATE, prompt, tag=cache_key) is None:
+            return "(Hâlâ önceki mesajını düşünüyor...)"
+        self.ai_thinking = True
+        return None
 
-    def generate_npc_response(self, npc, user_text, history):
+    def cancel_npc_requests(self, npc_name):
+        """Sohbet kapanınca bekleyen NPC isteklerini iptal eder."""
+        if self.ai_worker is not None:
+            self.ai_worker.cancel(npc_name)
+            self.ai_thinking = self.ai_worker.in_flight() > 0
+
+    def is_npc_thinking(self, npc_name):
+        return self.ai_worker is not None and self.ai_worker.in_flight(npc_name) > 0
+
+    def poll_ai(self):
         """
-        Belirli bir NPC için anlık AI yanıtı oluşturur.
-        Bu fonksiyon stateless çalışır (her seferinde bağlamı yeniden verir),
-        böylece her NPC'nin kendi oturumu varmış gibi davranır.
+        Her frame çağrılır. Vasi cevaplarını kendisi işler; NPC cevaplarını
+        [(npc_adı, metin), ...] olarak döndürür.
         """
-        if not self.ai_active:
-             return "AI Sistemi çevrimdışı. Lütfen ayarlarınızı kontrol edin."
-        
-        # Sohbet geçmişini metne dök (Son 5 mesaj)
-        history_text = ""
-        for msg in history[-5:]: 
-            history_text += f"{msg['speaker']}: {msg['text']}\n"
-            
-        # NPC'ye özel sistem promptu
-        system_prompt = f"""
-        Rol Yapma Oyunu Modu:
-        Senin Adın: {npc.name}
-        Kişilik Tipin: {npc.personality_type}
-        Görevin/Rolün: "{npc.prompt}"
-        
-        Bulunduğun Evren: Fragmentia (Siberpunk, distopik bir dijital dünya).
-        
-        Kural: Oyuncu ile konuşuyorsun. Rolünün dışına ASLA çıkma. 
-        Kısa, öz ve karakterine uygun cevaplar ver (Maksimum 2-3 cümle).
-        
-        Şu ana kadar konuşulanlar:
-        {history_text}
-        
-        Oyuncu son olarak dedi ki: "{user_text}"
-        
-        {npc.name} olarak cevabın:
+        if self.ai_worker is None:
+            return []
+        npc_replies = []
+        for req in self.ai_worker.poll():
+            if req.key == VASI_KEY:
+                self._finish_vasi_reply(req)
+            elif req.status == STATUS_DONE:
+                reply = req.result.strip()
+                if req.tag is not None:
+                    response_cache.put(req.tag, reply)
+                npc_replies.append((req.key, reply))
+            elif req.status == STATUS_TIMEOUT:
+                npc_replies.append((req.key, "Nöral Ağ Hatası: yanıt zaman aşımına uğradı."))
+            else:
+                npc_replies.append((req.key, f"Nöral Ağ Hatası: {req.error}"))
+        self.ai_thinking = self.ai_worker.in_flight() > 0
+        return npc_replies
+
+    def generate_npc_response(self, npc, user_text, history):
         """
-        
+        Belirli bir NPC için anlık AI yanıtı oluşturur (BLOKLAYAN, oyun
+        döngüsünde değil — araçlar / testler için). Oyun içi yol:
+        request_npc_response() + poll_ai().
+        """
+        if not self.ai_active or self.ai_worker is None:
+            return "AI Sistemi çevrimdışı. Lütfen ayarlarınızı kontrol edin."
+        cache_key = npc_cache_key(npc, user_text, history)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-             # GenerativeModel kullanarak tek seferlik içerik üretimi
-             response = self.model.generate_content(system_prompt)
-             return response.text.strip()
+            reply = self.ai_worker.backend.generate(
+                self.build_npc_prompt(npc, user_text, history)).strip()
         except Exception as e:
-             return f"Nöral Ağ Hatası: {str(e)}"
+            return f"Nöral Ağ Hatası: {str(e)}"
+        response_cache.put(cache_key, reply)
+        return reply
+
+    def build_npc_prompt(self, npc, user_text, history):
+        """
+        NPC rol yapma promptu. Stateless çalışır (her seferinde bağlamı
+        yeniden verir), böylece her NPC'nin kendi oturumu varmış gibi davranır.
+        Statik önek NPC başına bir kez kurulur (NPCPromptTemplate).
+        """
+        template = self._npc_templates.get(npc.name)
+        if template is None or not template.matches(npc):
+            template = NPCPromptTemplate(npc)
+            self._npc_templates[npc.name] = template
+        return template.render(user_text, history)
 
     def extract_commands(self, text):
         """Metin içindeki JSON bloklarını bulur ve ayırır"""
@@ -0,0 +1,135 @@
+# text_cache.py — FRAGMENTIA: ORTAK FONT / METİN ÖNBELLEĞİ
+# =============================================================================
+# Kod tabanında ~100 adet pygame.font.Font(None, N) / SysFont(...) çağrısı
+# vardı; çoğu draw fonksiyonlarının içinde her frame yeni Font nesnesi
+# oluşturuyor (render_loading_screen, render_level_select sekme başlıkları,
+# main.py ipucu / sayaç fontları, IntroCutscene._draw_particles'taki
+# SysFont("consolas", 14)...). Sabit etiketler de her frame yeniden
+# rasterize ediliyordu. combat_system.py'nin kendi _FONT_CACHE'i vardı.
+#
+# Bu modül iki katmanlı önbellek sunar:
+#   • Font  — (yüz, boyut, bold, italic) başına TEK pygame Font
+#   • Metin — (font, metin, antialias, renk, arka plan) başına render edilmiş
+#             yüzey; LRU ile sınırlı (TEXT_CACHE_CAPACITY)
+#
+# MİMARİ KURALLARI:
+#   • get_font() bir CachedFont döndürür: render() önbellekten gelir, diğer
+#     her şey (size, get_linesize, get_height...) gerçek Font'a devredilir —
+#     mevcut font.render(...) / wrap_text(font) çağrıları değişmeden çalışır.
+#   • Önbellekten dönen yüzeyler PAYLAŞILIR: üzerinde set_alpha / fill /
+#     blit yapılmaz. Değiştirilecek yüzey için font.font.render(...) kullanılır.
+#   • Değişken metinler (sayaç, skor) LRU'yu döndürür; sabit etiketler bir
+#     kez rasterize edilir.
+# =============================================================================
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+TEXT_CACHE_CAPACITY = 1024     # render edilmiş metin yüzeyi sayısı (LRU)
+
+FontKey = Tuple[Optional[str], int, bool, bool]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. CachedFont
+# ─────────────────────────────────────────────────────────────────────────────
+
+class CachedFont:
+    """pygame.font.Font sarmalayıcısı; render() TextCache üzerinden geçer."""
+
+    __slots__ = ("font", "key", "_cache")
+
+    def __init__(self, font: pygame.font.Font, key: FontKey, cache: "TextCache"):
+        self.font = font
+        self.key = key
+        self._cache = cache
+
+    def render(self, text, antialias, color, background=None) -> pygame.Surface:
+        return self._cache.render(self, text, antialias, color, background)
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. TextCache
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TextCache:
+    """
+    Kullanım:
+        font = get_font(24)                       # Font(None, 24)
+        font = get_font(16, "consolas")           # SysFont("consolas", 16)
+        surf = font.render("GERİ", True, WHITE)   # ilk çağrıda rasterize
+        surf = render_text("GERİ", 24, WHITE)     # kısayol
+    """
+
+    def __init__(self, capacity: int = TEXT_CACHE_CAPACITY):
+        self.capacity = capacity
+        self._fonts: Dict[FontKey, CachedFont] = {}
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def clear(self):
+        """Metin yüzeylerini boşaltır (fontlar korunur)."""
+        self._surfaces.clear()
+
+    # ── Font ───────────────────────────────────────────────
+    def font(self, size, face: Optional[str] = None,
+             bold: bool = False, italic: bool = False) -> CachedFont:
+        key = (face, int(size), bool(bold), bool(italic))
+        cf = self._fonts.get(key)
+        if cf is None:
+            if face is None or face.lower().endswith((".ttf", ".otf")):
+                font = pygame.font.Font(face, key[1])
+                font.set_bold(key[2])
+                font.set_italic(key[3])
+            else:
+                font = pygame.font.SysFont(face, key[1], key[2], key[3])
+            cf = self._fonts[key] = CachedFont(font, key, self)
+        return cf
+
+    # ── Metin ──────────────────────────────────────────────
+    def render(self, font: CachedFont, text, antialias, color,
+               background=None) -> pygame.Surface:
+        key = (font.key, text, bool(antialias), tuple(color),
+               None if background is None else tuple(background))
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.font.render(text, antialias, color, background)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surf
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 4. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+text_cache = TextCache()
+
+
+def get_font(size, face: Optional[str] = None,
+             bold: bool = False, italic: bool = False) -> CachedFont:
+    return text_cache.font(size, face, bold, italic)
+
+
+def render_text(text, size, color, antialias: bool = True,
+                face: Optional[str] = None) -> pygame.Surface:
+    return text_cache.font(size, face).render(text, antialias, color)
@@ -3,6 +3,7 @@ import math
 from settings import *
 from settings import REVOLVER_MAX_BULLETS, REVOLVER_COOLDOWN
 from utils import draw_text_with_shadow, wrap_text
+from text_cache import get_font
 from story_system import ai_chat_effect
 
 # ============================================================
@@ -29,7 +30,7 @@ def draw_glitch_text(surface, text, size, x, y, color, intensity=2):
     PLACEHOLDER: Glitch efekti kaldırıldı — düz metin.
     [TODO - UI ART]: Özel title font veya animasyonlu başlık ile değiştir.
     """
-    font = pygame.font.Font(None, size)
+    font = get_font(size)
     draw_text_with_shadow(surface, text, font, (x, y), color, align='center')
 
 
@@ -52,7 +53,7 @@ def draw_cyber_panel(surface, rect, color, title=""):
 
     # Başlık (varsa)
     if title:
-        title_font = pygame.font.Font(None, 24)
+        title_font = get_font(24)
         title_surf = title_font.render(f" {title} ", True, (0, 0, 0))
         title_w = title_surf.get_width()
         title_bg = pygame.Rect(rect.centerx - title_w // 2, rect.y - 12, title_w, 20)
@@ -77,7 +78,7 @@ def draw_button(surface, rect, text, is_hovered, color_theme=BUTTON_COLOR, locke
     pygame.draw.rect(surface, color, draw_rect)
     pygame.draw.rect(surface, border, draw_rect, 2)
 
-    font = pygame.font.Font(None, 30)
+    font = get_font(30)
     draw_text_with_shadow(surface, text, font, draw_rect.center, text_col)
 
 
@@ -126,13 +127,13 @@ def draw_level_card(surface, rect, level_num, level_info, status, high_score, is
     center_x = draw_rect.centerx
 
     # Bölüm numarası
-    num_font = pygame.font.Font(None, 36)
+    num_font = get_font(36)
     num_text = f"#{level_num}"
     draw_text_with_shadow(surface, num_text, num_font,
                           (center_x, draw_rect.y + 22), border_color, align='center')
 
     # Bölüm adı
-    name_font = pygame.font.Font(None, 22)
+    name_font = get_font(22)
     display_name = level_info['name']
     if status == "LOCKED":
         display_name = "ERİŞİM YOK"
@@ -143,7 +144,7 @@ def draw_level_card(surface, rect, level_num, level_info, status, high_score, is
 
     # High score
     if status != "LOCKED" and high_score > 0:
-        score_font = pygame.font.Font(None, 19)
+        score_font = get_font(19)
         draw_text_with_shadow(surface, f"* {high_score}", score_font,
                               (center_x, draw_rect.bottom - 18), (220, 200, 50), align='center')
 
@@ -159,7 +160,7 @@ def render_cutscene(surface, story_manager):
     text_box = pygame.Rect(w // 2 - 400, h // 2 - 100, 800, 200)
     draw_cyber_panel(surface, text_box, (120, 120, 120))
 
-    font = pygame.font.Font(None, 38)
+    font = get_font(38)
     lines = wrap_text(story_manager.display_text, font, 760)
     start_y = text_box.y + 30
     for i, line in enumerate(lines):
@@ -169,7 +170,7 @@ def render_cutscene(surface, story_manager):
     if story_manager.waiting_for_click:
         blink = (pygame.time.get_ticks() // 500) % 2 == 0
         if blink:
-            blink_font = pygame.font.Font(None, 24)
+            blink_font = get_font(24)
             draw_text_with_shadow(surface, "DEVAM ETMEK İÇİN TIKLA >", blink_font,
                                   (w - 220, h - 45), (160, 240, 240), align='center')
     return {}
@@ -195,14 +196,14 @@ def render_chat_interface(surface, story_manager):
     ai_chat_effect.draw_ai_avatar(surface, avatar_x, avatar_y, 40, thinking)
 
     # Konuşan isim
-    speaker_font = pygame.font.Font(None, 36)
+    speaker_font = get_font(36)
     draw_text_with_shadow(surface, speaker, speaker_font,
                           (avatar_x, avatar_y + 60), color, align='center')
 
     # Metin
     text_x = chat_rect.x + 140
     text_y = chat_rect.y + 40
-    font = pygame.font.Font(None, 33)
+    font = get_font(33)
     lines = wrap_text(story_manager.display_text, font, 620)
     for i, line in enumerate(lines):
         draw_text_with_shadow(surface, line, font,
@@ -212,7 +213,7 @@ def render_chat_interface(surface, story_manager):
     if story_manager.waiting_for_click:
         blink = (pygame.time.get_ticks() // 500) % 2 == 0
         if blink:
-            blink_font = pygame.font.Font(None, 28)
+            blink_font = get_font(28)
             draw_text_with_shadow(surface, "v", blink_font,
                                   (chat_rect.right - 35, chat_rect.bottom - 35), color, align='center')
     return {}
@@ -226,7 +227,7 @@ def render_loading_screen(surface, progress):
     bar_x = w // 2 - bar_w // 2
     bar_y = h // 2
 
-    title_font = pygame.font.Font(None, 48)
+    title_font = get_font(48)
     draw_text_with_shadow(surface, "YÜKLENİYOR...", title_font,
                           (w // 2, bar_y - 55), UI_BORDER_COLOR, align='center')
 
@@ -234,7 +235,7 @@ def render_loading_screen(surface, progress):
     pygame.draw.rect(surface, LOADING_BAR_FILL, (bar_x, bar_y, int(bar_w * progress), bar_h))
     pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_w, bar_h), 2)
 
-    pct_font = pygame.font.Font(None, 32)
+    pct_font = get_font(32)
     draw_text_with_shadow(surface, f"%{int(progress * 100)}", pct_font,
                           (w // 2, bar_y + 50), WHITE, align='center')
     return {}
@@ -260,9 +261,9 @@ def render_cheat_terminal(surface, input_text, status_msg, debug_mode=False):
     title = "DEBUG_ARENA_TERMINAL v2.0" if debug_mode else "ROOT_ACCESS_TERMINAL v1.0"
     draw_cyber_panel(surface, term_rect, (0, 220, 0), title)
 
-    font     = pygame.font.Font(None, 30)
-    sm_font  = pygame.font.Font(None, 22)
-    hint_font= pygame.font.Font(None, 21)
+    font     = get_font(30)
+    sm_font  = get_font(22)
+    hint_font= get_font(21)
 
     header_y = term_rect.y + 50
     if debug_mode:
@@ -332,7 +333,7 @@ def render_main_menu(surface, mouse_pos, buttons):
     # Başlık
     draw_glitch_text(surface, "NEON RUNNER", 130, w // 2, 140, UI_BORDER_COLOR)
 
-    subtitle_font = pygame.font.Font(None, 28)
+    subtitle_font = get_font(28)
     draw_text_with_shadow(surface, "NEXUS CHRONICLES (AI EDITION)", subtitle_font,
                           (w // 2, 220), (0, 200, 200), align='center')
 
@@ -410,7 +411,7 @@ def render_level_select(surface, mouse_pos, save_data, page_index=0):
         bg = act['color'] if is_active else (40, 40, 40)
         draw_cyber_rect(surface, tab_rect, bg, filled=True, alpha=200 if is_active else 80)
         pygame.draw.rect(surface, bg if is_active else (80, 80, 80), tab_rect, 2)
-        tab_font = pygame.font.Font(None, 26)
+        tab_font = get_font(26)
         draw_text_with_shadow(surface, act['title'], tab_font, tab_rect.center,
                               WHITE if is_active else (140, 140, 140), align='center')
 
@@ -423,7 +424,7 @@ def render_level_select(surface, mouse_pos, save_data, page_index=0):
         # Grup başlığı
         line_y = current_y + 18
         pygame.draw.line(surface, group['theme_col'], (50, line_y), (w - 50, line_y), 1)
-        hdr_font = pygame.font.Font(None, 32)
+        hdr_font = get_font(32)
         hdr_surf = hdr_font.render(f"  {group['name']}  ", True, group['theme_col'])
         hdr_rect = hdr_surf.get_rect(center=(w // 2, line_y))
         pygame.draw.rect(surface, UI_BG_COLOR, hdr_rect)
@@ -470,7 +471,7 @@ def render_level_select(surface, mouse_pos, save_data, page_index=0):
         is_h = btn_prev.collidepoint(mouse_pos)
         pygame.draw.rect(surface, BUTTON_HOVER_COLOR if is_h else (30, 30, 30), btn_prev)
         pygame.draw.rect(surface, UI_BORDER_COLOR, btn_prev, 2)
-        arr_font = pygame.font.Font(None, 55)
+        arr_font = get_font(55)
         draw_text_with_shadow(surface, "<", arr_font, btn_prev.center, WHITE, align='center')
         active_buttons['prev_page'] = btn_prev
 
@@ -479,14 +480,14 @@ def render_level_select(surface, mouse_pos, save_data, page_index=0):
         is_h = btn_next.collidepoint(mouse_pos)
         pygame.draw.rect(surface, BUTTON_HOVER_COLOR if is_h else (30, 30, 30), btn_next)
         pygame.draw.rect(surface, UI_BORDER_COLOR, btn_next, 2)
-        arr_font = pygame.font.Font(None, 55)
+        arr_font = get_font(55)
         draw_text_with_shadow(surface, ">", arr_font, btn_next.center, WHITE, align='center')
         active_buttons['next_page'] = btn_next
 
     btn_back = pygame.Rect(40, 40, 90, 38)
     pygame.draw.rect(surface, (60, 20, 20), btn_back)
     pygame.draw.rect(surface, (180, 50, 50), btn_back, 2)
-    back_font = pygame.font.Font(None, 24)
+    back_font = get_font(24)
     draw_text_with_shadow(surface, "GERİ", back_font, btn_back.center, WHITE, align='center')
     active_buttons['back'] = btn_back
 
@@ -503,15 +504,15 @@ def render_level_complete(surface, mouse_pos, level_data, score):
     panel_rect = pygame.Rect(w // 2 - 280, h // 2 - 190, 560, 380)
     draw_cyber_panel(surface, panel_rect, NEON_GREEN, "GÖREV TAMAMLANDI")
 
-    title_font = pygame.font.Font(None, 72)
+    title_font = get_font(72)
     draw_text_with_shadow(surface, "BÖLÜM GEÇİLDİ!", title_font,
                           (w // 2, h // 2 - 110), WHITE, align='center')
 
-    score_font = pygame.font.Font(None, 48)
+    score_font = get_font(48)
     draw_text_with_shadow(surface, f"SKOR: {int(score)}", score_font,
                           (w // 2, h // 2 - 30), (240, 220, 0), align='center')
 
-    msg_font = pygame.font.Font(None, 28)
+    msg_font = get_font(28)
     draw_text_with_shadow(surface, "Sonraki veri paketi yükleniyor...", msg_font,
                           (w // 2, h // 2 + 30), WHITE, align='center')
 
@@ -549,7 +550,7 @@ def render_settings_menu(surface, mouse_pos, settings_data):
         ("EFEKTLER",   "effects_volume", (0, 220, 80))
     ]
 
-    label_font = pygame.font.Font(None, 27)
+    label_font = get_font(27)
     for label, key, slider_color in volume_settings:
         draw_text_with_shadow(surface, label, label_font,
                               (btn_x, current_y), WHITE, align='midleft')
@@ -655,7 +656,7 @@ def draw_smg_hud(surface, bullets: int, mag_size: int, spare_mags: int,
     pygame.draw.rect(surface, border_c, panel_rect, 2)
 
     # Başlık
-    title_font = pygame.font.Font(None, 20)
+    title_font = get_font(20)
     title_txt  = "HAFİF MAKİNALI"
     if is_reloading:
         title_txt = "DOLDURULUYOR..."
@@ -682,7 +683,7 @@ def draw_smg_hud(surface, bullets: int, mag_size: int, spare_mags: int,
                      pygame.Rect(STRIP_X, STRIP_Y, STRIP_W, STRIP_H), 1)
 
     # Sayı ve yedek şarjör
-    cnt_font = pygame.font.Font(None, 28)
+    cnt_font = get_font(28)
     cnt_surf = cnt_font.render(f"{bullets}/{spare_mags} MAG", True, (220, 220, 220))
     surface.blit(cnt_surf, (PANEL_X + 8, PANEL_Y + PANEL_H - 28))
 
@@ -730,7 +731,7 @@ def draw_shotgun_hud(surface, bullets: int, mag_size: int, spare_mags: int,
     pygame.draw.rect(surface, border_c, panel_rect, 2)
 
     # Başlık
-    title_font = pygame.font.Font(None, 20)
+    title_font = get_font(20)
     title_txt  = "POMPALI TÜFEK"
     if is_reloading:
         title_txt = "DOLDURULUYOR..."
@@ -772,7 +773,7 @@ def draw_shotgun_hud(surface, bullets: int, mag_size: int, spare_mags: int,
     pygame.draw.rect(surface, border_c, (BAR_X, BAR_Y, BAR_W, BAR_H), 1)
 
     # ── Yedek şarjör ──────────────────────────────────────────────────────
-    spare_font = pygame.font.Font(None, 20)
+    spare_font = get_font(20)
     spare_txt  = f"YEDEK: {spare_mags}" if spare_mags < 9990 else "∞"
     surface.blit(spare_font.render(spare_txt, True, (180, 180, 180)),
                  (PANEL_X + 8, PANEL_Y + 86))
@@ -798,7 +799,7 @@ def draw_weapon_switch_ui(surface, active_weapon: str, inventory: list):
         "shotgun":  (220, 120,  30),
     }
     key_labels = {0: "1", 1: "2", 2: "3"}
-    font       = pygame.font.Font(None, 22)
+    font       = get_font(22)
 
     for idx, wtype in enumerate(inventory):
         ix = PANEL_X + ICON_GAP + idx * (ICON_SIZE + ICON_GAP)
@@ -864,7 +865,7 @@ def draw_revolver_hud(surface, bullets: int, gun_cooldown: float, is_reloading:
     pygame.draw.rect(surface, border_col, panel_rect, 2)
 
     # ── Başlık metni ─────────────────────────────────────────────────────
-    title_font = pygame.font.Font(None, 20)
+    title_font = get_font(20)
     title_surf = title_font.render("ALTIPATAR", True, border_col)
     surface.blit(title_surf, (PANEL_X + 8, PANEL_Y + 6))
 
@@ -914,12 +915,12 @@ def draw_revolver_hud(surface, bullets: int, gun_cooldown: float, is_reloading:
     pygame.draw.circle(surface, border_col,    (CX, CY), 10, 1)
 
     # ── Mermi sayısı metni (sol alt) ────────────────────────────────────
-    cnt_font = pygame.font.Font(None, 28)
+    cnt_font = get_font(28)
     cnt_surf = cnt_font.render(f"{bullets}/{REVOLVER_MAX_BULLETS}", True, (240, 230, 180))
     surface.blit(cnt_surf, (PANEL_X + 8, PANEL_Y + PANEL_H - 28))
 
     # ── Yedek mermi satırı ───────────────────────────────────────────────
-    spare_font = pygame.font.Font(None, 22)
+    spare_font = get_font(22)
     spare_col  = (200, 160, 40) if spare_mags > 0 else (120, 100, 60)
     spare_txt  = f"YEDEK: {spare_mags}" if spare_mags < 9990 else "YEDEK: ∞"
     spare_surf = spare_font.render(spare_txt, True, spare_col)
@@ -935,7 +936,7 @@ def draw_revolver_hud(surface, bullets: int, gun_cooldown: float, is_reloading:
         fill_pct = 1.0 - (gun_cooldown / max(REVOLVER_RELOAD_TIME, 0.001))
         bar_col  = (60, 200, 60)
         # "DOLDURULUYOR..." etiketi
-        rl_font = pygame.font.Font(None, 22)
+        rl_font = get_font(22)
         rl_surf = rl_font.render("DOLDURULUYOR...", True, (100, 255, 100))
         surface.blit(rl_surf, (PANEL_X + PANEL_W // 2 - rl_surf.get_width() // 2,
                                PANEL_Y + 6))
@@ -1002,10 +1003,10 @@ def render_inventory_screen(surface, data, mouse_pos=(0, 0)):
     pygame.draw.line(surface, _BORDER, (40, 70), (w - 40, 70), 2)
     pygame.draw.line(surface, _BORDER, (40, h - 40), (w - 40, h - 40), 2)
 
-    title_font  = pygame.font.Font(None, 62)
-    small_font  = pygame.font.Font(None, 28)
-    med_font    = pygame.font.Font(None, 36)
-    label_font  = pygame.font.Font(None, 22)
+    title_font  = get_font(62)
+    small_font  = get_font(28)
+    med_font    = get_font(36)
+    label_font  = get_font(22)
 
     # Başlık
     draw_text_with_shadow(surface, "ENVANTER", title_font, (w // 2, 42), _ACCENT, align='center')
@@ -1296,6 +1297,173 @@ def _draw_smg_icon(surface, rect, color):
     pygame.draw.rect(surface, color, pygame.Rect(cx - 34, cy - 4, 10, 10), 2)
 
 
+# ============================================================
+#  HUD WIDGET'LARI
+#  render_ui (PLAYING) ve hud_compositor aynı çizim kodunu kullanır.
+#  Koordinatlar mantıksal ekran (1920×1080) cinsindendir; `origin`
+#  çizilen yüzeyin ekrandaki sol üst köşesidir. Tam ekran yüzeye
+#  çizerken (0, 0), widget'ın kendi küçük yüzeyine çizerken widget
+#  rect'inin topleft'i verilir.
+# ============================================================
+
+HUD_VITALS_RECT     = pygame.Rect(28, 16, 264, 156)    # Sol panel + başlık
+HUD_KARMA_RECT      = pygame.Rect(306, 50, 200, 56)    # KARMA / ÖLÜM
+HUD_OBJECTIVES_POS  = (30, 190)                        # Görev listesi sol üstü
+HUD_SCORE_W         = 352                              # Sağ üst skor paneli genişliği
+HUD_SCORE_H         = 116
+HUD_WEAPON_W        = 300                              # Sağ alt silah HUD'u
+HUD_WEAPON_H        = 240
+
+
+def draw_hud_vitals(surface, data, origin=(0, 0)):
+    """Sol panel: bölüm başlığı + HP ve stamina barları."""
+    ox, oy = origin
+    current_theme = data.get('theme') or THEMES[0]
+    border_col    = current_theme["border_color"]
+
+    # Panel yüksekliği iki bar + etiket + marj = 140px
+    left_panel = pygame.Rect(30 - ox, 30 - oy, 260, 140)
+    draw_cyber_panel(surface, left_panel, border_col, f"BÖLÜM {data['level_idx']}")
+
+    BAR_X   = 50 - ox     # Sol kenar
+    BAR_W   = 220         # Bar genişliği
+    LABEL_F = get_font(18)
+
+    # ── HP Barı (y=55) ────────────────────────────────────────────────
+    hp_cur = data.get('player_hp',     100)
+    hp_max = data.get('player_hp_max', 100) or 1
+    hp_pct = max(0.0, min(1.0, hp_cur / hp_max))
+
+    HP_Y, HP_H = 55 - oy, 16
+    hp_fill_col = (220, 30, 30) if hp_pct > 0.3 else (255, 80, 0) if hp_pct > 0.15 else (255, 0, 0)
+
+    pygame.draw.rect(surface, (50, 0, 0),       (BAR_X, HP_Y, BAR_W, HP_H))
+    pygame.draw.rect(surface, hp_fill_col,       (BAR_X, HP_Y, int(BAR_W * hp_pct), HP_H))
+    pygame.draw.rect(surface, (180, 180, 180),   (BAR_X, HP_Y, BAR_W, HP_H), 1)
+
+    lbl_hp = LABEL_F.render(f"HP  {max(0, int(hp_cur))} / {hp_max}", True, (230, 230, 230))
+    surface.blit(lbl_hp, (BAR_X + BAR_W // 2 - lbl_hp.get_width() // 2, HP_Y + 1))
+
+    # ── Stamina Barı (y=95) ───────────────────────────────────────────
+    st_cur = data.get('stamina',     100)
+    st_max = data.get('stamina_max', 100) or 1
+    st_pct = max(0.0, min(1.0, st_cur / st_max))
+
+    ST_Y, ST_H = 95 - oy, 14
+    if st_pct > 0.60:
+        st_fill_col = (0, 210, 255)     # Dolu  → cyan
+    elif st_pct > 0.25:
+        st_fill_col = (220, 200, 0)     # Yarı  → sarı
+    else:
+        st_fill_col = (255, 60, 60)     # Boş   → kırmızı
+
+    pygame.draw.rect(surface, (10, 20, 35),     (BAR_X, ST_Y, BAR_W, ST_H))
+    pygame.draw.rect(surface, st_fill_col,       (BAR_X, ST_Y, int(BAR_W * st_pct), ST_H))
+    pygame.draw.rect(surface, (80, 160, 200),    (BAR_X, ST_Y, BAR_W, ST_H), 1)
+
+    lbl_st = LABEL_F.render(f"STAMINA  {int(st_cur)}/{st_max}", True, (160, 220, 255))
+    surface.blit(lbl_st, (BAR_X + BAR_W // 2 - lbl_st.get_width() // 2, ST_Y + 1))
+
+
+def draw_hud_karma(surface, data, origin=(0, 0)):
+    """Karma + ölüm sayacı (sol panelin sağında)."""
+    ox, oy = origin
+    karma = data.get('karma', 0)
+    kills = data.get('kills', 0)
+    karma_color = (0, 220, 80) if karma > 20 else ((220, 50, 50) if karma < -20 else WHITE)
+    karma_font  = get_font(24)
+    draw_text_with_shadow(surface, f"KARMA: {karma}", karma_font, (310 - ox, 55 - oy), karma_color)
+    draw_text_with_shadow(surface, f"ÖLÜM: {kills}",  karma_font, (310 - ox, 82 - oy), (200, 50, 50))
+
+
+def draw_hud_score(surface, data, screen_w, origin=(0, 0)):
+    """Sağ üst skor paneli — hedef skora göre ilerleme çubuğu."""
+    ox, oy = origin
+    w = screen_w - ox
+    goal = data['level_data'].get('goal_score', 0)
+    current_score = data['score']
+    progress = min(1.0, current_score / goal) if goal > 0 else 0.0
+    score_text = f"{int(current_score)} / {goal}" if goal > 0 else f"SKOR: {int(current_score)}"
+
+    score_rect = pygame.Rect(w - 340, 35 - oy, 305, 75)
+    draw_cyber_panel(surface, score_rect, WHITE, "VERİ YÜKLEMESİ")
+
+    pygame.draw.rect(surface, (35, 35, 35), (w - 320, 83 - oy, 265, 18))
+    if goal > 0:
+        pygame.draw.rect(surface, NEON_GREEN, (w - 320, 83 - oy, int(265 * progress), 18))
+
+    score_font = get_font(28)
+    draw_text_with_shadow(surface, score_text, score_font, (w - 188, 92 - oy), WHITE, align='center')
+
+
+def draw_hud_weapon(surface, data):
+    """
+    Silah HUD — Ammo Counter + Weapon Switch UI.
+    Sağ alt köşeye yaslıdır; yüzeyin sağ/alt kenarı ekranınkiyle aynı olmalı.
+    Anahtarlar: 'active_weapon', 'player_bullets', 'gun_cooldown',
+                'is_reloading', 'inventory_weapons'
+    """
+    _active_weapon = data.get('active_weapon', None)   # None → silah yok
+
+    # Gatekeeper: Aktif silah nesnesi yoksa HUD tamamen gizlenir.
+    # Eski kontrol (mermi >= 0) sifiri silahsiz durumla ayirt edemiyordu.
+    if _active_weapon is None:
+        return
+    draw_weapon_hud(
+        surface,
+        active_weapon   = _active_weapon,
+        bullets         = data.get('player_bullets', 0),
+        mag_size        = data.get('mag_size', 6),
+        spare_mags      = data.get('spare_mags', 0),
+        gun_cooldown    = data.get('gun_cooldown', 0.0),
+        is_reloading    = data.get('is_reloading', False),
+        inventory       = data.get('inventory_weapons', []),
+    )
+
+
+def draw_hud_chest_prompt(surface, screen_w, screen_h, origin=(0, 0)):
+    """Sandık etkileşim ipucu (ekran altı ortası)."""
+    ox, oy = origin
+    _cpfont = get_font(32)
+    _cp_txt = _cpfont.render("E: SİLAHI AL", True, (255, 255, 100))
+    cx_ = screen_w // 2 - _cp_txt.get_width() // 2 - ox
+    cy_ = screen_h - 200 - oy
+    _cp_bg = pygame.Surface((_cp_txt.get_width() + 20, _cp_txt.get_height() + 8), pygame.SRCALPHA)
+    _cp_bg.fill((0, 0, 0, 180))
+    surface.blit(_cp_bg, (cx_ - 10, cy_ - 4))
+    surface.blit(_cp_txt, (cx_, cy_))
+
+
+def hud_objectives_size(objectives):
+    """Görev listesi widget'ının (w, h) boyutu."""
+    return 380, 34 + 24 * len(objectives)
+
+
+def draw_hud_objectives(surface, objectives, origin=(0, 0)):
+    """
+    Aktif görev hedefleri (mission_system). `objectives` → [(metin, opsiyonel), ...]
+    Liste boşsa hiçbir şey çizilmez.
+    """
+    if not objectives:
+        return
+    ox, oy = origin
+    x, y = HUD_OBJECTIVES_POS[0] - ox, HUD_OBJECTIVES_POS[1] - oy
+    w, h = hud_objectives_size(objectives)
+    draw_cyber_panel(surface, pygame.Rect(x, y + 12, w - 4, h - 14), (0, 160, 240), "HEDEFLER")
+    font = get_font(22)
+    for i, (text, optional) in enumerate(objectives):
+        col = (150, 150, 150) if optional else (230, 230, 230)
+        prefix = "○ " if optional else "■ "
+        draw_text_with_shadow(surface, prefix + text, font, (x + 12, y + 28 + i * 24), col)
+
+
+def karma_notification_color(text):
+    """Karma bildirim metninin rengi (düşüş kırmızı, diriliş mor, diğerleri yeşil)."""
+    if "DİRİLİŞ" in text:
+        return (200, 50, 200)
+    return (255, 50, 50) if "DÜŞTÜ" in text else (0, 255, 100)
+
+
 def render_ui(surface, state, data, mouse_pos=(0, 0)):
     """Ana render yöneticisi — tüm state'leri karşılar."""
     time_ms = data.get('time_ms', pygame.time.get_ticks())
@@ -1335,7 +1503,7 @@ def render_ui(surface, state, data, mouse_pos=(0, 0)):
         draw_cyber_panel(surface, panel_rect, (0, 160, 240), "SİSTEM ASKIYA ALINDI")
 
         draw_glitch_text(surface, "DURAKLATILDI", 96, w // 2, h // 2 - 30, WHITE)
-        msg_font = pygame.font.Font(None, 32)
+        msg_font = get_font(32)
         draw_text_with_shadow(surface, "'P' İLE DEVAM ET", msg_font,
                               (w // 2, h // 2 + 60), (160, 160, 160), align='center')
 
@@ -1356,121 +1524,26 @@ def render_ui(surface, state, data, mouse_pos=(0, 0)):
         panel_rect = pygame.Rect(w // 2 - 240, h // 2 - 40, 480, 150)
         draw_cyber_panel(surface, panel_rect, (220, 50, 50), "HATA RAPORU")
 
-        score_font = pygame.font.Font(None, 52)
+        score_font = get_font(52)
         draw_text_with_shadow(surface, f"SKOR: {int(data['score'])}", score_font,
                               (w // 2, h // 2 + 10), WHITE, align='center')
-        goal_font = pygame.font.Font(None, 34)
+        goal_font = get_font(34)
         draw_text_with_shadow(surface, f"HEDEF: {data['level_data']['goal_score']}", goal_font,
                               (w // 2, h // 2 + 65), (240, 200, 0), align='center')
         if time_ms % 1000 < 500:
-            retry_font = pygame.font.Font(None, 42)
+            retry_font = get_font(42)
             draw_text_with_shadow(surface, "TEKRAR DENEMEK İÇİN 'R'", retry_font,
                                   (w // 2, h // 2 + 175), WHITE, align='center')
 
     elif state == 'PLAYING':
-        current_theme = data.get('theme') or THEMES[0]
-        border_col    = current_theme["border_color"]
-
-        # ── Sol Panel: HP + Stamina ───────────────────────────────────────
-        # Panel yüksekliği iki bar + etiket + marj = 140px
-        left_panel = pygame.Rect(30, 30, 260, 140)
-        draw_cyber_panel(surface, left_panel, border_col, f"BÖLÜM {data['level_idx']}")
-
-        BAR_X   = 50          # Sol kenar
-        BAR_W   = 220         # Bar genişliği
-        LABEL_F = pygame.font.Font(None, 18)
-
-        # ── HP Barı (y=55) ────────────────────────────────────────────────
-        hp_cur = data.get('player_hp',     100)
-        hp_max = data.get('player_hp_max', 100) or 1
-        hp_pct = max(0.0, min(1.0, hp_cur / hp_max))
-
-        HP_Y, HP_H = 55, 16
-        hp_fill_col = (220, 30, 30) if hp_pct > 0.3 else (255, 80, 0) if hp_pct > 0.15 else (255, 0, 0)
-
-        pygame.draw.rect(surface, (50, 0, 0),       (BAR_X, HP_Y, BAR_W, HP_H))
-        pygame.draw.rect(surface, hp_fill_col,       (BAR_X, HP_Y, int(BAR_W * hp_pct), HP_H))
-        pygame.draw.rect(surface, (180, 180, 180),   (BAR_X, HP_Y, BAR_W, HP_H), 1)
-
-        lbl_hp = LABEL_F.render(f"HP  {max(0, int(hp_cur))} / {hp_max}", True, (230, 230, 230))
-        surface.blit(lbl_hp, (BAR_X + BAR_W // 2 - lbl_hp.get_width() // 2, HP_Y + 1))
-
-        # ── Stamina Barı (y=90) ───────────────────────────────────────────
-        st_cur = data.get('stamina',     100)
-        st_max = data.get('stamina_max', 100) or 1
-        st_pct = max(0.0, min(1.0, st_cur / st_max))
-
-        ST_Y, ST_H = 95, 14
-        if st_pct > 0.60:
-            st_fill_col = (0, 210, 255)     # Dolu  → cyan
-        elif st_pct > 0.25:
-            st_fill_col = (220, 200, 0)     # Yarı  → sarı
-        else:
-            st_fill_col = (255, 60, 60)     # Boş   → kırmızı
-
-        pygame.draw.rect(surface, (10, 20, 35),     (BAR_X, ST_Y, BAR_W, ST_H))
-        pygame.draw.rect(surface, st_fill_col,       (BAR_X, ST_Y, int(BAR_W * st_pct), ST_H))
-        pygame.draw.rect(surface, (80, 160, 200),    (BAR_X, ST_Y, BAR_W, ST_H), 1)
-
-        lbl_st = LABEL_F.render(f"STAMINA  {int(st_cur)}/{st_max}", True, (160, 220, 255))
-        surface.blit(lbl_st, (BAR_X + BAR_W // 2 - lbl_st.get_width() // 2, ST_Y + 1))
-
-        # ── Karma + Ölüm sayacı (panel sağına, ayrı küçük kutu) ──────────
-        karma = data.get('karma', 0)
-        kills = data.get('kills', 0)
-        karma_color = (0, 220, 80) if karma > 20 else ((220, 50, 50) if karma < -20 else WHITE)
-        karma_font  = pygame.font.Font(None, 24)
-        draw_text_with_shadow(surface, f"KARMA: {karma}", karma_font, (310, 55), karma_color)
-        draw_text_with_shadow(surface, f"ÖLÜM: {kills}",  karma_font, (310, 82), (200, 50, 50))
-
-        # Skor paneli (sağ üst)
-        goal = data['level_data'].get('goal_score', 0)
-        current_score = data['score']
-        progress = min(1.0, current_score / goal) if goal > 0 else 0.0
-        score_text = f"{int(current_score)} / {goal}" if goal > 0 else f"SKOR: {int(current_score)}"
-
-        score_rect = pygame.Rect(w - 340, 35, 305, 75)
-        draw_cyber_panel(surface, score_rect, WHITE, "VERİ YÜKLEMESİ")
-
-        pygame.draw.rect(surface, (35, 35, 35), (w - 320, 83, 265, 18))
-        if goal > 0:
-            pygame.draw.rect(surface, NEON_GREEN, (w - 320, 83, int(265 * progress), 18))
-
-        score_font = pygame.font.Font(None, 28)
-        draw_text_with_shadow(surface, score_text, score_font, (w - 188, 92), WHITE, align='center')
-
-        # ── Silah HUD — Ammo Counter + Weapon Switch UI ───────────────────
-        # ui_data'dan gelen silah bilgilerini çiz.
-        # Anahtarlar: 'active_weapon', 'player_bullets', 'gun_cooldown',
-        #             'is_reloading', 'inventory_weapons'
-        _rev_bullets    = data.get('player_bullets', 0)
-        _active_weapon  = data.get('active_weapon', None)   # None → silah yok
-        _inventory      = data.get('inventory_weapons', [])
-
-        # Gatekeeper: Aktif silah nesnesi yoksa HUD tamamen gizlenir.
-        # Eski kontrol (mermi >= 0) sifiri silahsiz durumla ayirt edemiyordu.
-        if _active_weapon is not None:
-            draw_weapon_hud(
-                surface,
-                active_weapon   = _active_weapon,
-                bullets         = _rev_bullets,
-                mag_size        = data.get('mag_size', 6),
-                spare_mags      = data.get('spare_mags', 0),
-                gun_cooldown    = data.get('gun_cooldown', 0.0),
-                is_reloading    = data.get('is_reloading', False),
-                inventory       = _inventory,
-            )
-
-        # ── Sandık etkileşim ipucu ────────────────────────────────────────
-        # main.py'den 'chest_prompt' True gönderilirse gösterilir.
+        # Oyun içinde main.py hud_compositor kullanır; bu dal tam ekran
+        # yüzeye tek seferde çizim içindir (aynı widget fonksiyonları).
+        draw_hud_vitals(surface, data)
+        draw_hud_karma(surface, data)
+        draw_hud_objectives(surface, data.get('objectives', ()))
+        draw_hud_score(surface, data, w)
+        draw_hud_weapon(surface, data)
         if data.get('chest_prompt'):
-            _cpfont = pygame.font.Font(None, 32)
-            _cp_txt = _cpfont.render("E: SİLAHI AL", True, (255, 255, 100))
-            cx_ = w // 2 - _cp_txt.get_width() // 2
-            cy_ = h - 200
-            _cp_bg = pygame.Surface((_cp_txt.get_width() + 20, _cp_txt.get_height() + 8), pygame.SRCALPHA)
-            _cp_bg.fill((0, 0, 0, 180))
-            surface.blit(_cp_bg, (cx_ - 10, cy_ - 4))
-            surface.blit(_cp_txt, (cx_, cy_))
+            draw_hud_chest_prompt(surface, w, h)
 
     return interactive_elements
\ No newline at end of file
@@ -3,6 +3,10 @@ import random
 import math
 import numpy as np
 import os
+import io
+import threading
+from text_cache import get_font
+from sound_cache import sound_cache
 
 # ─── MERKEZI ASSET ÖNBELLEĞİ ────────────────────────────────────────────────
 # Aynı resmi defalarca diskten yüklemekten kaçınmak için global sözlük.
@@ -136,6 +140,30 @@ class FrameAnimator:
     def finished(self) -> bool:
         return self._finished
 
+# --- MÜZİK AKIŞI ---
+# Müzik parçaları (final_boss.mp3, cyber_chase.mp3...) artık mixer.Sound ile
+# PCM'e açılmaz: 200 sn'lik bir mp3 ~35 MB RAM ve bölüm başında ~0.3 sn
+# senkron decode demekti. MusicTrack yalnızca yolu taşır; AudioManager onu
+# pygame.mixer.music ile diskten (ya da preload edilmişse bellekteki
+# sıkıştırılmış bayttan) akışla çalar. Dosya yoksa prosedürel fallback
+# Sound'u eskisi gibi kanal 0'da çalınır; dosya var ama akış açılamıyorsa
+# (bozuk / desteklenmeyen biçim) MusicTrack'in taşıdığı fallback çalınır.
+MUSIC_CROSSFADE_MS  = 800   # parça geçişi (eski parça söner, yenisi girer)
+MUSIC_PRELOAD_SLOTS = 3     # bellekte tutulan sıkıştırılmış parça sayısı
+
+
+class MusicTrack:
+    """Akışla çalınacak müzik dosyası (decode edilmez) + akış hatası fallback'i."""
+    __slots__ = ("path", "fallback")
+
+    def __init__(self, path: str, fallback=None):
+        self.path = path
+        self.fallback = fallback      # () → Sound; yalnızca akış başarısızsa çağrılır
+
+    def __repr__(self):
+        return f"MusicTrack({self.path!r})"
+
+
 # --- GELİŞMİŞ SES YÖNETİCİSİ ---
 class AudioManager:
     def __init__(self):
@@ -146,6 +174,11 @@ class AudioManager:
             print("Ses kartı başlatılamadı.")
 
         self.music_channel = pygame.mixer.Channel(0)
+        self._streaming = False          # şu an mixer.music mi çalıyor
+
+        # preload_music: yol → sıkıştırılmış dosya baytları (arka plan thread)
+        self._preloaded: dict = {}
+        self._preload_lock = threading.Lock()
 
         self.master_vol = 1.0
         self.music_vol = 0.5
@@ -160,14 +193,100 @@ class AudioManager:
     def _apply_volumes(self):
         final_music_vol = self.master_vol * self.music_vol
         self.music_channel.set_volume(final_music_vol)
+        try:
+            pygame.mixer.music.set_volume(final_music_vol)
+        except pygame.error:
+            pass
 
-    def play_music(self, sound_obj, loops=-1):
+    # ── Müzik ──────────────────────────────────────────────
+    def preload_music(self, filepath):
+        """
+        İpucu: yakında çalınacak parçanın dosyasını arka planda belleğe okur.
+        play_music o parçayı diske dokunmadan başlatır. Dosya yoksa no-op.
+        """
+        if isinstance(filepath, MusicTrack):
+            filepath = filepath.path
+        with self._preload_lock:
+            if filepath in self._preloaded or not os.path.exists(filepath):
+                return
+            self._preloaded[filepath] = None          # okunuyor
+        threading.Thread(target=self._preload_worker, args=(filepath,),
+                         name="MusicPreload", daemon=True).start()
+
+    def _preload_worker(self, filepath):
+        try:
+            with open(filepath, "rb") as f:
+                data = f.read()
+        except OSError:
+            data = None
+        with self._preload_lock:
+            if data is None:
+                self._preloaded.pop(filepath, None)
+                return
+            self._preloaded[filepath] = data
+            while len(self._preloaded) > MUSIC_PRELOAD_SLOTS:
+                self._preloaded.pop(next(iter(self._preloaded)))
+
+    def _music_source(self, filepath):
+        with self._preload_lock:
+            data = self._preloaded.get(filepath)
+        if data is None:
+            return filepath, ""
+        return io.BytesIO(data), os.path.splitext(filepath)[1].lstrip(".")
+
+    def play_music(self, sound_obj, loops=-1, fade_ms=MUSIC_CROSSFADE_MS):
         if not sound_obj: return
+        if isinstance(sound_obj, MusicTrack):
+            if not self._play_stream(sound_obj.path, loops, fade_ms) and sound_obj.fallback:
+                # Dosya var ama çözülemedi → prosedürel parça kanal 0'da
+                self._play_channel(sound_obj.fallback(), loops, fade_ms)
+            return
+        self._play_channel(sound_obj, loops, fade_ms)
+
+    def _play_channel(self, sound_obj, loops, fade_ms):
+        # Prosedürel / Sound müzik → kanal 0 (akış varsa sönerek çekilir)
+        if self._streaming:
+            self._stop_stream(fade_ms)
         if self.music_channel.get_busy():
             self.music_channel.stop()
-        self.music_channel.play(sound_obj, loops=loops)
+        self.music_channel.play(sound_obj, loops=loops, fade_ms=fade_ms)
         self._apply_volumes()
 
+    def _play_stream(self, filepath, loops, fade_ms):
+        music = pygame.mixer.music
+        src, hint = self._music_source(filepath)
+        # Kanal 0'daki fallback Sound ile gerçek crossfade (iki kaynak üst üste)
+        if self.music_channel.get_busy():
+            if fade_ms:
+                self.music_channel.fadeout(fade_ms)
+            else:
+                self.music_channel.stop()
+        try:
+            if self._streaming and music.get_busy() and fade_ms:
+                # Tek akış: eski parça söner, kuyruktaki yenisi bitişte başlar
+                music.fadeout(fade_ms)
+                music.queue(src, hint, loops)
+            else:
+                music.load(src, hint)
+                music.play(loops, fade_ms=fade_ms)
+        except pygame.error as e:
+            print(f"[AudioManager] Müzik akışı başlatılamadı: {filepath} — {e}")
+            self._streaming = False
+            return False
+        self._streaming = True
+        self._apply_volumes()
+        return True
+
+    def _stop_stream(self, fade_ms=0):
+        try:
+            if fade_ms and pygame.mixer.music.get_busy():
+                pygame.mixer.music.fadeout(fade_ms)
+            else:
+                pygame.mixer.music.stop()
+        except pygame.error:
+            pass
+        self._streaming = False
+
     def play_sfx(self, sound_obj):
         if not sound_obj: return
         channel = pygame.mixer.find_channel(True)
@@ -178,14 +297,23 @@ class AudioManager:
             channel.set_volume(final_sfx_vol)
             channel.play(sound_obj)
 
-    def stop_music(self):
-        self.music_channel.stop()
+    def stop_music(self, fade_ms=0):
+        if fade_ms:
+            self.music_channel.fadeout(fade_ms)
+        else:
+            self.music_channel.stop()
+        if self._streaming:
+            self._stop_stream(fade_ms)
 
     def pause_all(self):
         pygame.mixer.pause()
+        if self._streaming:
+            pygame.mixer.music.pause()
 
     def unpause_all(self):
         pygame.mixer.unpause()
+        if self._streaming:
+            pygame.mixer.music.unpause()
 
 # Global Instance
 audio_manager = AudioManager()
@@ -193,68 +321,92 @@ audio_manager = AudioManager()
 
 # --- SES ÜRETİM FONKSİYONLARI (DEĞİŞMEDİ) ---
 
+def _synth_sound_effect(base_freq, duration):
+    sample_rate = 44100
+    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    wave = np.sin(2 * np.pi * base_freq * t)
+    envelope = np.ones_like(t)
+    attack_len = int(sample_rate * 0.01)
+    decay_len = int(sample_rate * (duration * 0.8))
+    if attack_len > 0:
+        envelope[:attack_len] = np.linspace(0, 1, attack_len)
+    if decay_len > 0:
+        envelope[-decay_len:] = np.linspace(1, 0, decay_len)
+    wave = wave * envelope
+    if base_freq > 100:
+        harmonic_1 = 0.3 * np.sin(2 * np.pi * base_freq * 2 * t)
+        harmonic_2 = 0.15 * np.sin(2 * np.pi * base_freq * 0.5 * t)
+        wave = wave + harmonic_1 + harmonic_2
+    wave = wave / np.max(np.abs(wave)) if np.max(np.abs(wave)) > 0 else wave
+    wave = (wave * 32767).astype(np.int16)
+    return np.repeat(wave.reshape(-1, 1), 2, axis=1)
+
+def _synth_ambient_fallback():
+    sample_rate = 44100
+    duration = 10.0
+    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    drone = 0.5 * np.sin(2 * np.pi * 55.0 * t)
+    envelope = np.ones_like(t)
+    fade = int(sample_rate * 2.0)
+    if fade > 0:
+        envelope[:fade] = np.linspace(0, 1, fade)
+        envelope[-fade:] = np.linspace(1, 0, fade)
+    wave = drone * envelope
+    wave = (wave * 32767 * 0.3).astype(np.int16)
+    return np.repeat(wave.reshape(-1, 1), 2, axis=1)
+
+def _synth_calm_ambient():
+    sample_rate = 44100
+    duration = 15.0
+    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    wave = 0.3 * np.sin(2 * np.pi * 110.0 * t)
+    wave += 0.2 * np.sin(2 * np.pi * 165.0 * t)
+    envelope = np.ones_like(t)
+    fade = int(sample_rate * 3.0)
+    if fade > 0:
+        envelope[:fade] = np.linspace(0, 1, fade)
+        envelope[-fade:] = np.linspace(1, 0, fade)
+    wave = wave * envelope
+    wave = (wave * 32767 * 0.25).astype(np.int16)
+    return np.repeat(wave.reshape(-1, 1), 2, axis=1)
+
+def _synth_door_bump():
+    # Kısa metalik tıkırtı — faz modülasyonlu sinüs, 4000 örnek
+    i = np.arange(4000)
+    wave = (3000 * np.sin(i * 0.8 + np.sin(i * 0.3) * 2)).astype(np.int16)
+    return wave.reshape(-1, 1).repeat(2, axis=1)
+
+# Üretilen sesler sound_cache'te (ad, parametre) başına bir kez sentezlenir,
+# bellekte tutulur ve .sound_cache/ altına WAV olarak yazılır.
+
 def generate_sound_effect(base_freq, duration, volume=1.0):
     try:
-        sample_rate = 44100
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        wave = np.sin(2 * np.pi * base_freq * t)
-        envelope = np.ones_like(t)
-        attack_len = int(sample_rate * 0.01)
-        decay_len = int(sample_rate * (duration * 0.8))
-        if attack_len > 0:
-            envelope[:attack_len] = np.linspace(0, 1, attack_len)
-        if decay_len > 0:
-            envelope[-decay_len:] = np.linspace(1, 0, decay_len)
-        wave = wave * envelope
-        if base_freq > 100:
-            harmonic_1 = 0.3 * np.sin(2 * np.pi * base_freq * 2 * t)
-            harmonic_2 = 0.15 * np.sin(2 * np.pi * base_freq * 0.5 * t)
-            wave = wave + harmonic_1 + harmonic_2
-        wave = wave / np.max(np.abs(wave)) if np.max(np.abs(wave)) > 0 else wave
-        wave = (wave * 32767).astype(np.int16)
-        wave = np.repeat(wave.reshape(-1, 1), 2, axis=1)
-        sound = pygame.sndarray.make_sound(wave)
-        return sound
+        return sound_cache.get("sfx", (float(base_freq), float(duration)),
+                               lambda: _synth_sound_effect(base_freq, duration))
     except Exception as e:
         return get_silent_sound()
 
 def generate_ambient_fallback():
     try:
-        sample_rate = 44100
-        duration = 10.0
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        drone = 0.5 * np.sin(2 * np.pi * 55.0 * t)
-        envelope = np.ones_like(t)
-        fade = int(sample_rate * 2.0)
-        if fade > 0:
-            envelope[:fade] = np.linspace(0, 1, fade)
-            envelope[-fade:] = np.linspace(1, 0, fade)
-        wave = drone * envelope
-        wave = (wave * 32767 * 0.3).astype(np.int16)
-        wave = np.repeat(wave.reshape(-1, 1), 2, axis=1)
-        return pygame.sndarray.make_sound(wave)
+        return sound_cache.get("ambient", (), _synth_ambient_fallback)
     except Exception:
         return get_silent_sound()
 
 def generate_calm_ambient():
     try:
-        sample_rate = 44100
-        duration = 15.0
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        wave = 0.3 * np.sin(2 * np.pi * 110.0 * t)
-        wave += 0.2 * np.sin(2 * np.pi * 165.0 * t)
-        envelope = np.ones_like(t)
-        fade = int(sample_rate * 3.0)
-        if fade > 0:
-            envelope[:fade] = np.linspace(0, 1, fade)
-            envelope[-fade:] = np.linspace(1, 0, fade)
-        wave = wave * envelope
-        wave = (wave * 32767 * 0.25).astype(np.int16)
-        wave = np.repeat(wave.reshape(-1, 1), 2, axis=1)
-        return pygame.sndarray.make_sound(wave)
+        return sound_cache.get("calm_ambient", (), _synth_calm_ambient)
     except:
         return generate_ambient_fallback()
 
+def generate_door_bump():
+    """Malikane kilitli kapı çarpma sesi (main.py açılışta bir kez üretir)."""
+    try:
+        snd = sound_cache.get("door_bump", (), _synth_door_bump)
+        snd.set_volume(0.4)
+        return snd
+    except Exception:
+        return get_silent_sound()
+
 def get_silent_sound():
     try:
         buffer = bytearray([0] * 200)
@@ -266,6 +418,17 @@ def get_silent_sound():
             def stop(self): pass
         return MockSound()
 
+def load_music_asset(filepath, fallback_generator=None, volume=1.0):
+    """
+    Müzik için load_sound_asset karşılığı: dosya varsa decode etmeden
+    MusicTrack döndürür (AudioManager.play_music akışla çalar), yoksa
+    fallback_generator'ın Sound'unu.
+    """
+    if os.path.exists(filepath):
+        return MusicTrack(filepath, fallback_generator)
+    if fallback_generator: return fallback_generator()
+    return get_silent_sound()
+
 def load_sound_asset(filepath, fallback_generator=None, volume=1.0):
     if not os.path.exists(filepath):
         if fallback_generator: return fallback_generator()
@@ -281,7 +444,7 @@ def load_sound_asset(filepath, fallback_generator=None, volume=1.0):
 
 def draw_text(surface, text, color, rect, font_size, aa=False, bkg=None):
     try:
-        font = pygame.font.Font(None, font_size)
+        font = get_font(font_size)
         text_surface = font.render(text, aa, color, bkg)
         text_rect = text_surface.get_rect()
         text_rect.center = (rect[0] + rect[2] // 2, rect[1] + rect[3] // 2)
@@ -350,7 +513,7 @@ def draw_animated_player(surface, shape, x, y, size, color, anim_params):
 
     # [DEBUG] Şekil adını küçük yazı ile göster (geliştirme aşamasında faydalı)
     # Üretimde kapatmak için bu bloğu yorum satırına al:
-    # debug_font = pygame.font.Font(None, 16)
+    # debug_font = get_font(16)
     # debug_surf = debug_font.render(shape[0].upper(), True, (0, 0, 0))
     # surface.blit(debug_surf, (body_rect.x + 2, body_rect.y + 2))
 
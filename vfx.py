@@ -13,6 +13,9 @@ from settings import *
 #  animasyon karesi entegrasyonu yapılacak.
 #
 #  API ve update() mantığı korundu — sadece draw() sadeleştirildi.
+#
+#  Konumlar dünya uzayındadır: kamera kayması update()'te x'ten
+#  düşülmez; all_vfx (viewport.WorldGroup) çizimde camera_offset verir.
 # ============================================================
 
 
@@ -31,17 +34,19 @@ class LightningBolt(pygame.sprite.Sprite):
         self.vx = 0
         self.vy = 0
 
-    def update(self, camera_speed):
-        self.segments = [(x - camera_speed + self.vx, y + self.vy) for x, y in self.segments]
+    def update(self, *args):
+        self.segments = [(x + self.vx, y + self.vy) for x, y in self.segments]
         self.vy += 0.5
         self.life -= 1
         self.alpha = int(255 * max(0, self.life / self.initial_life))
         if self.life <= 0:
             self.kill()
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
         if self.life > 0 and len(self.segments) >= 2:
-            pygame.draw.lines(surface, self.color, False, self.segments, 2)
+            ox, oy = camera_offset
+            pygame.draw.lines(surface, self.color, False,
+                              [(x + ox, y + oy) for x, y in self.segments], 2)
 
 
 class FlameSpark(pygame.sprite.Sprite):
@@ -59,8 +64,7 @@ class FlameSpark(pygame.sprite.Sprite):
         self.initial_life = life
         self.size = size
 
-    def update(self, camera_speed):
-        self.x -= camera_speed
+    def update(self, *args):
         self.vy += 0.15
         self.x += self.vx
         self.y += self.vy
@@ -70,11 +74,12 @@ class FlameSpark(pygame.sprite.Sprite):
         if self.life <= 0:
             self.kill()
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
         if self.life > 0:
+            ox, oy = camera_offset
             alpha = int(255 * max(0, self.life / self.initial_life))
             size = max(2, int(self.size * (self.life / self.initial_life)))
-            pygame.draw.circle(surface, self.base_color, (int(self.x), int(self.y)), size)
+            pygame.draw.circle(surface, self.base_color, (int(self.x + ox), int(self.y + oy)), size)
 
 
 class Shockwave(pygame.sprite.Sprite):
@@ -91,17 +96,17 @@ class Shockwave(pygame.sprite.Sprite):
         self.speed = speed * 1.5
         self.alpha = 255
 
-    def update(self, camera_speed):
-        self.x -= camera_speed
+    def update(self, *args):
         self.radius += self.speed
         progress = self.radius / self.max_radius
         self.alpha = int(255 * max(0, 1 - progress))
         if self.radius >= self.max_radius:
             self.kill()
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
         if self.alpha > 5:
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), int(self.radius), 2)
+            ox, oy = camera_offset
+            pygame.draw.circle(surface, self.color, (int(self.x + ox), int(self.y + oy)), int(self.radius), 2)
 
 
 class SpeedLine(pygame.sprite.Sprite):
@@ -118,20 +123,21 @@ class SpeedLine(pygame.sprite.Sprite):
         self.life = 25
         self.initial_life = 25
 
-    def update(self, camera_speed):
-        self.x -= camera_speed
+    def update(self, *args):
         self.x += self.vx
         self.y += self.vy
         self.life -= 1
         if self.life <= 0:
             self.kill()
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
         if self.life > 0:
-            end_x = self.x - self.vx * 3
-            end_y = self.y - self.vy * 3
+            ox, oy = camera_offset
+            x, y = self.x + ox, self.y + oy
+            end_x = x - self.vx * 3
+            end_y = y - self.vy * 3
             pygame.draw.line(surface, self.color,
-                             (int(self.x), int(self.y)),
+                             (int(x), int(y)),
                              (int(end_x), int(end_y)), 1)
 
 
@@ -148,18 +154,18 @@ class GhostTrail(pygame.sprite.Sprite):
         self.initial_life = life
         self.size = size
 
-    def update(self, camera_speed):
-        self.x -= camera_speed
+    def update(self, *args):
         self.life -= 1
         if self.life <= 0:
             self.kill()
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
         if self.life > 0:
+            ox, oy = camera_offset
             alpha = int(120 * (self.life / self.initial_life))
             # Oyuncuyla aynı dikdörtgen oranı (utils.draw_animated_player referansı)
-            rect = pygame.Rect(int(self.x) - self.size,
-                               int(self.y) - int(self.size * 2.5),
+            rect = pygame.Rect(int(self.x + ox) - self.size,
+                               int(self.y + oy) - int(self.size * 2.5),
                                self.size * 2,
                                int(self.size * 2.5))
             try:
@@ -184,16 +190,17 @@ class EnergyOrb(pygame.sprite.Sprite):
         self.life = life
         self.initial_life = life
 
-    def update(self, camera_speed):
-        self.x -= camera_speed
+    def update(self, *args):
         self.life -= 1
         if self.life <= 0:
             self.kill()
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
         if self.life > 0:
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.size)
-            pygame.draw.circle(surface, WHITE, (int(self.x), int(self.y)), self.size, 1)
+            ox, oy = camera_offset
+            pos = (int(self.x + ox), int(self.y + oy))
+            pygame.draw.circle(surface, self.color, pos, self.size)
+            pygame.draw.circle(surface, WHITE, pos, self.size, 1)
 
 
 class ParticleExplosion(pygame.sprite.Sprite):
@@ -221,12 +228,11 @@ class ParticleExplosion(pygame.sprite.Sprite):
             })
         self.alive = True
 
-    def update(self, camera_speed):
+    def update(self, *args):
         if not self.alive:
             return
         alive_count = 0
         for p in self.particles:
-            p['x'] -= camera_speed
             p['x'] += p['vx']
             p['y'] += p['vy']
             p['vy'] += 0.15
@@ -239,11 +245,12 @@ class ParticleExplosion(pygame.sprite.Sprite):
             self.kill()
             self.alive = False
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
+        ox, oy = camera_offset
         for p in self.particles:
             if p['life'] > 0:
                 size = max(2, int(p['size'] * (p['life'] / p['initial_life'])))
-                rect = pygame.Rect(int(p['x']), int(p['y']), size, size)
+                rect = pygame.Rect(int(p['x'] + ox), int(p['y'] + oy), size, size)
                 pygame.draw.rect(surface, p['color'], rect)
 
 
@@ -257,13 +264,14 @@ class ScreenFlash(pygame.sprite.Sprite):
         self.life = duration
         self.alpha = intensity
 
-    def update(self, camera_speed):
+    def update(self, *args):
         self.life -= 1
         self.alpha = int(self.intensity * (self.life / self.duration))
         if self.life <= 0:
             self.kill()
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
+        # Tam ekran overlay — kamera ofsetinden bağımsız
         if self.alpha > 0:
             flash_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
             flash_surf.fill((*self.color, self.alpha))
@@ -286,16 +294,16 @@ class VFXManager:
     def add(self, sprite):
         self.group.add(sprite)
 
-    def update(self, camera_speed):
+    def update(self):
         for sprite in self.group:
-            sprite.update(camera_speed)
+            sprite.update()
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
         for sprite in self.group:
             if hasattr(sprite, 'draw'):
-                sprite.draw(surface)
+                sprite.draw(surface, camera_offset)
             else:
-                surface.blit(sprite.image, sprite.rect)
+                surface.blit(sprite.image, sprite.rect.move(camera_offset))
 
 
 class SavedSoul(pygame.sprite.Sprite):
@@ -313,18 +321,19 @@ class SavedSoul(pygame.sprite.Sprite):
         self.size = 10
         self.wobble = random.uniform(0, 6.28)
 
-    def update(self, camera_speed):
+    def update(self, *args):
         self.life -= 1
         self.y += self.vy
         self.x += math.sin(self.wobble + self.life * 0.1) * 2
-        self.x -= camera_speed
         if self.life <= 0:
             self.kill()
 
-    def draw(self, surface):
+    def draw(self, surface, camera_offset=(0, 0)):
         if self.life > 0:
+            ox, oy = camera_offset
+            pos = (int(self.x + ox), int(self.y + oy))
             alpha = int(255 * (self.life / self.initial_life))
             # Gövde: altın sarısı dolu daire
-            pygame.draw.circle(surface, (255, 215, 0), (int(self.x), int(self.y)), self.size)
+            pygame.draw.circle(surface, (255, 215, 0), pos, self.size)
             # Çerçeve
-            pygame.draw.circle(surface, (255, 255, 200), (int(self.x), int(self.y)), self.size, 2)
\ No newline at end of file
+            pygame.draw.circle(surface, (255, 255, 200), pos, self.size, 2)
\ No newline at end of file
@@ -0,0 +1,265 @@
+# viewport.py — FRAGMENTIA: KAMERA / GÖRÜŞ ALANI
+# =============================================================================
+# Malikane (manor_stealth) kamerası uygulanırken main.py her frame her
+# platformun p.rect'ini (Rect.move ile yeni rect) ve her düşmanın
+# e.rect.x/y'sini geçici olarak değiştirip çizdikten sonra geri yazıyordu.
+# Çizim sırasında rect okuyan her şey yanlış konumu görüyordu.
+#
+# Viewport dünya → ekran ofsetini ve görünür dünya dikdörtgenini tutar:
+#   • draw(surface, camera_offset=viewport) — rect'lere dokunulmaz; nesne
+#     kendi çizim konumunu ofsetle hesaplar.
+#   • visible(rect) — görünür dünya dikdörtgeniyle kesişim testi; ekran
+#     dışındaki nesnelerin draw() çağrısı hiç yapılmaz.
+#
+# MİMARİ KURALLARI:
+#   • Ofset konvansiyonu mevcut draw() imzalarıyla aynıdır:
+#       ekran = dünya + (ox, oy)
+#   • Viewport bir (ox, oy) çifti gibi davranır (unpack / indeks), böylece
+#     camera_offset=(0, 0) bekleyen her draw() onu doğrudan kabul eder.
+#   • Kamera sarsıntısı (render_offset) ayrı tutulur; shifted() ile eklenir.
+#   • cull(..., name=) çizilen / elenen sayılarını profiler'a yazar
+#     (#draw.<name> / #cull.<name>). Hareket etmeyen büyük kümeler (gizlilik
+#     kameraları, saklanma noktaları) SortedXIndex ile lineer tarama
+#     yapılmadan sorgulanır; platformlar platform_index.py'de indekslenir.
+#   • Kayan bölümlerde tek bir world_camera.x skaleri ilerler. Oyuncu,
+#     platformlar, düşmanlar, mermiler, pickup'lar, partiküller ve VFX dünya
+#     uzayında yaşar; kayma yalnızca çizimde ofset olarak uygulanır
+#     (viewport.set(-world_camera.ix, ...)) — hiçbir nesne her frame
+#     "x -= camera_speed" yazmaz. Ekran kenarı testleri kamerayla yapılır
+#     (world_camera.left / right).
+# =============================================================================
+
+from __future__ import annotations
+from bisect import bisect_left
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
+
+import pygame
+
+from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT
+from profiler import profiler
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. SABİTLER
+# ─────────────────────────────────────────────────────────────────────────────
+
+CULL_MARGIN = 64      # rect dışına taşan çizimler (etiket, HP bar, aura) için pay
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. Viewport
+# ─────────────────────────────────────────────────────────────────────────────
+
+class Viewport:
+    """
+    Kullanım (main.py, çizim başı):
+        viewport.set(-manor_camera_offset_x, -manor_camera_offset_y)
+        for p in all_platforms:
+            if viewport.visible(p.rect):
+                p.draw(game_canvas, CURRENT_THEME, camera_offset=viewport)
+    """
+
+    __slots__ = ("ox", "oy", "width", "height", "world_rect")
+
+    def __init__(self, width: int = LOGICAL_WIDTH, height: int = LOGICAL_HEIGHT,
+                 ox: int = 0, oy: int = 0):
+        self.width = width
+        self.height = height
+        self.world_rect = pygame.Rect(0, 0, width, height)
+        self.set(ox, oy)
+
+    def set(self, ox, oy):
+        """Ofseti günceller; görünür dünya dikdörtgeni = ekran - ofset."""
+        self.ox = int(ox)
+        self.oy = int(oy)
+        self.world_rect.topleft = (-self.ox, -self.oy)
+
+    def shifted(self, dx: int, dy: int) -> "Viewport":
+        """Ek ekran kayması (sarsıntı) uygulanmış kopya."""
+        return Viewport(self.width, self.height, self.ox + dx, self.oy + dy)
+
+    # ── (ox, oy) çifti gibi davran ─────────────────────────
+    def __iter__(self) -> Iterator[int]:
+        yield self.ox
+        yield self.oy
+
+    def __getitem__(self, i: int) -> int:
+        return (self.ox, self.oy)[i]
+
+    def __len__(self) -> int:
+        return 2
+
+    @property
+    def offset(self):
+        return (self.ox, self.oy)
+
+    # ── Dönüşüm / kırpma ───────────────────────────────────
+    def to_screen(self, x, y):
+        return (x + self.ox, y + self.oy)
+
+    def visible(self, rect, margin: int = CULL_MARGIN) -> bool:
+        w = self.world_rect
+        return (rect.right > w.left - margin and rect.left < w.right + margin and
+                rect.bottom > w.top - margin and rect.top < w.bottom + margin)
+
+    def cull(self, items: Iterable, margin: int = CULL_MARGIN,
+             name: Optional[str] = None,
+             bounds: Optional[Callable] = None) -> List:
+        """
+        Görünür dünya dikdörtgenine değen nesneler (sıra korunur).
+        bounds: rect'i olmayan nesneler için nesne → Rect (varsayılan .rect).
+        """
+        w = self.world_rect
+        l, r = w.left - margin, w.right + margin
+        t, b = w.top - margin, w.bottom + margin
+        items = items if isinstance(items, (list, tuple)) else list(items)
+        if bounds is None:
+            out = [it for it in items
+                   if it.rect.right > l and it.rect.left < r
+                   and it.rect.bottom > t and it.rect.top < b]
+        else:
+            out = []
+            for it in items:
+                br = bounds(it)
+                if br.right > l and br.left < r and br.bottom > t and br.top < b:
+                    out.append(it)
+        if name is not None:
+            report_cull(name, len(out), len(items) - len(out))
+        return out
+
+
+def report_cull(name: str, drawn: int, culled: int):
+    profiler.count(f"draw.{name}", drawn)
+    profiler.count(f"cull.{name}", culled)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. SortedXIndex — hareketsiz kümeler için x-aralık listesi
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SortedXIndex:
+    """
+    Nesneleri sol kenara göre sıralı tutar. Sorgu: bisect ile [sol - en geniş,
+    sağ) aralığındaki adaylar, ardından y testi. Nesneler hareket ederse
+    geçersizdir; sync() küme değişince (uzunluk / uç nesneler) yeniden kurar.
+
+    Kullanım:
+        self._camera_index.sync(self.cameras)
+        visible = self._camera_index.query(view, 0, "stealth_cameras")
+    """
+
+    def __init__(self, bounds: Optional[Callable] = None):
+        self.bounds = bounds or (lambda it: it.rect)
+        self._items: List = []
+        self._order: List[int] = []          # ekleme sırası (çizim sırası korunur)
+        self._rects: List[pygame.Rect] = []
+        self._lefts: List[int] = []
+        self._max_w = 0
+        self._signature = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def invalidate(self):
+        """Nesneler hareket etti → bir sonraki sync() yeniden kurar."""
+        self._signature = None
+
+    def sync(self, items: Sequence):
+        sig = (len(items), id(items[0]) if items else 0, id(items[-1]) if items else 0)
+        if sig != self._signature:
+            self.rebuild(items)
+            self._signature = sig
+
+    def rebuild(self, items: Iterable):
+        pairs = sorted(((self.bounds(it), i, it) for i, it in enumerate(items)),
+                       key=lambda p: (p[0].left, p[1]))
+        self._items = [it for _, _, it in pairs]
+        self._order = [i for _, i, _ in pairs]
+        self._rects = [pygame.Rect(r) for r, _, _ in pairs]
+        self._lefts = [r.left for r in self._rects]
+        self._max_w = max((r.width for r in self._rects), default=0)
+        self._signature = None
+
+    def query(self, view: Viewport, margin: int = CULL_MARGIN,
+              name: Optional[str] = None) -> List:
+        w = view.world_rect
+        l, r = w.left - margin, w.right + margin
+        t, b = w.top - margin, w.bottom + margin
+        i = bisect_left(self._lefts, l - self._max_w)
+        j = bisect_left(self._lefts, r, i)
+        rects, order = self._rects, self._order
+        hits = [k for k in range(i, j)
+                if rects[k].right > l and rects[k].bottom > t and rects[k].top < b]
+        hits.sort(key=order.__getitem__)
+        items = self._items
+        out = [items[k] for k in hits]
+        if name is not None:
+            report_cull(name, len(out), len(items) - len(out))
+        return out
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 4. ScrollCamera / WorldGroup — kayan dünya
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ScrollCamera:
+    """
+    Kayan bölümlerin tek kamera skaleri (toplam camera_speed). Dünya-x'i
+    ekranın sol kenarıdır; bölüm başında reset() ile 0'a döner, böylece
+    init sırasındaki ekran konumları dünya konumlarıyla aynıdır.
+
+    Kullanım (main.py):
+        world_camera.reset()                          # bölüm init
+        world_camera.advance(camera_speed * frame_mul)  # frame başına bir kez
+        viewport.set(-world_camera.ix, 0)             # çizim başı
+        if e.rect.right < world_camera.left: e.kill()
+    """
+
+    __slots__ = ("x",)
+
+    def __init__(self):
+        self.x = 0.0
+
+    def reset(self):
+        self.x = 0.0
+
+    def advance(self, dx: float):
+        self.x += dx
+
+    @property
+    def ix(self) -> int:
+        """Çizimde kullanılan tam sayı kamera konumu."""
+        return int(round(self.x))
+
+    @property
+    def left(self) -> float:
+        return self.x
+
+    @property
+    def right(self) -> float:
+        return self.x + LOGICAL_WIDTH
+
+
+class WorldGroup(pygame.sprite.Group):
+    """
+    Üyeleri dünya uzayında çizilen Group: draw(surface, camera_offset) ofseti
+    her üyenin draw()'una iletir (pygame Group.draw image/rect bekler).
+
+    Kullanım:
+        all_vfx = WorldGroup()
+        all_vfx.add(EnergyOrb(px, py, ...))      # px, py dünya konumu
+        all_vfx.update()
+        all_vfx.draw(vfx_surface, viewport)
+    """
+
+    def draw(self, surface, camera_offset=(0, 0)):
+        offset = tuple(camera_offset)
+        for sprite in self.sprites():
+            sprite.draw(surface, offset)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 5. GLOBAL INSTANCE
+# ─────────────────────────────────────────────────────────────────────────────
+viewport     = Viewport()
+world_camera = ScrollCamera()